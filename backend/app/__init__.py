@@ -4,6 +4,8 @@ from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 
 from app.core.config import PROJECT_NAME, PROJECT_DESCRIPTION, PROJECT_VERSION, API_V1_STR
 from app.api.v1 import api_router
+from app.db.mongodb import close_async_client
+from app.utils.record_loader import RecordLoaderMiddleware
 
 def create_app() -> FastAPI:
     """
@@ -30,6 +32,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # 请求级的按ID批量加载与去重
+    app.add_middleware(RecordLoaderMiddleware)
+    
     # 自定义 API 文档路由
     @app.get("/api/docs", include_in_schema=False)
     async def custom_swagger_ui_html():
@@ -57,4 +62,9 @@ def create_app() -> FastAPI:
     # 包含 API 路由
     app.include_router(api_router, prefix=API_V1_STR)
     
+    # 关闭时释放异步数据库连接
+    @app.on_event("shutdown")
+    async def shutdown_database():
+        close_async_client()
+    
     return app
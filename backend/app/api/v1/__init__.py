@@ -2,7 +2,7 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import (
     artists, ai_interaction, ai_artists, data, test, artworks,
-    art_movements, data_generation, database_management
+    art_movements, data_generation, database_management, search
 )
 
 api_router = APIRouter()
@@ -16,4 +16,5 @@ api_router.include_router(database_management.router, prefix="/database", tags=[
 api_router.include_router(ai_interaction.router, prefix="/ai-interaction", tags=["ai-interaction"])
 api_router.include_router(ai_artists.router, prefix="/ai-artists", tags=["ai-artists"])
 api_router.include_router(data.router, prefix="/data", tags=["data"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
 api_router.include_router(test.router, prefix="/test", tags=["test"])
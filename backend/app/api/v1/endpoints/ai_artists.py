@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from typing import List
 from app.schemas.artist import Artist
-from app.services.artist_service import ArtistService
+from app.services.artist_service import AsyncArtistService
 
 router = APIRouter()
 
@@ -16,19 +16,20 @@ async def get_ai_artists():
     try:
         # 获取所有艺术家作为AI艺术家
         # 在实际应用中，可以添加一个字段来标识哪些艺术家支持AI交互
-        artists = ArtistService.get_all_artists()
+        response = await AsyncArtistService.get_all()
+        artists = response.data
         
         # 为每个艺术家添加AI相关的描述
         for artist in artists:
-            if hasattr(artist, 'bio'):
-                artist.bio = f"AI {artist.name} - {artist.bio}"
+            if artist.get('bio'):
+                artist['bio'] = f"AI {artist['name']} - {artist['bio']}"
         
         return artists
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching AI artists: {str(e)}")
 
 @router.get("/{artist_id}", response_model=Artist)
-async def get_ai_artist(artist_id: int):
+async def get_ai_artist(artist_id: str):
     """
     获取特定AI艺术家
     
@@ -38,14 +39,15 @@ async def get_ai_artist(artist_id: int):
         artist_id: 艺术家ID
     """
     try:
-        artist = ArtistService.get_artist_by_id(artist_id)
+        response = await AsyncArtistService.get_by_id(artist_id)
         
-        if not artist:
+        if not response.success:
             raise HTTPException(status_code=404, detail="AI Artist not found")
         
         # 为AI艺术家添加特殊标识
-        if hasattr(artist, 'bio'):
-            artist.bio = f"AI {artist.name} - {artist.bio}"
+        artist = response.data
+        if artist.get('bio'):
+            artist['bio'] = f"AI {artist['name']} - {artist['bio']}"
         
         return artist
     except HTTPException as e:
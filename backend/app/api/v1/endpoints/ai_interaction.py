@@ -18,10 +18,10 @@ async def ai_interaction(request: AIInteractionRequest):
         # 检查 OpenAI API 密钥是否已配置
         if not AIService.is_api_key_configured():
             # 在开发环境中使用模拟响应
-            response = AIService.interact(request.message, request.artist_id)
+            response = await AIService.interact(request.message, request.artist_id)
         else:
             # 在生产环境中使用 OpenAI API
-            response = AIService.interact(request.message, request.artist_id)
+            response = await AIService.interact(request.message, request.artist_id)
         
         return response
     except Exception as e:
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Header, Response
 from typing import List, Optional
 
 from app.schemas.art_movement import (
@@ -6,8 +6,10 @@ from app.schemas.art_movement import (
     ArtMovementStatistics, TimelineEntry, PeriodQuery, ArtistMovementRequest, ArtworkMovementRequest
 )
 from app.schemas.response import APIResponse, PaginatedResponse
-from app.services.art_movement_service import ArtMovementService
-from app.utils.query_params import QueryParams
+from app.services.art_movement_service import AsyncArtMovementService
+from app.utils.collection_versions import VersionedSnapshot
+from app.utils.json_response import model_response
+from app.utils.query_params import QueryParams, QueryParamsParser
 
 router = APIRouter()
 
@@ -17,17 +19,22 @@ async def get_art_movements(params: QueryParams = Depends()):
     """
     获取所有艺术运动
     
-    支持查询参数：project, fields, include, search, tags, yearFrom, yearTo, sortBy, order, page, pageSize
+    支持查询参数：project, fields, include, search, tags, yearFrom, yearTo, sortBy, order, page, pageSize, pagination, after
     """
     try:
-        response = ArtMovementService.get_all(params)
-        return response
+        response = await AsyncArtMovementService.get_all(params)
+        return model_response(response)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching art movements: {str(e)}")
 
 
 @router.get("/{movement_id}", response_model=APIResponse[ArtMovement])
-async def get_art_movement(movement_id: str = Path(..., description="艺术运动ID")):
+async def get_art_movement(
+    movement_id: str = Path(..., description="艺术运动ID"),
+    include: Optional[str] = Query(None, description="展开的关联，用逗号分隔，如 'keyArtists,representativeWorks'")
+):
     """
     获取特定艺术运动
     
@@ -35,10 +42,13 @@ async def get_art_movement(movement_id: str = Path(..., description="艺术运
     
     Args:
         movement_id: 艺术运动ID
+        include: 展开的关联
     """
     try:
-        response = ArtMovementService.get_by_id(movement_id)
+        response = await AsyncArtMovementService.get_by_id(movement_id, QueryParamsParser.parse_include(include))
         return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching art movement: {str(e)}")
 
@@ -54,7 +64,7 @@ async def create_art_movement(movement: ArtMovementCreate):
         movement: 艺术运动创建模式
     """
     try:
-        response = ArtMovementService.create(movement.dict())
+        response = await AsyncArtMovementService.create(movement.dict())
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating art movement: {str(e)}")
@@ -77,7 +87,7 @@ async def update_art_movement(
     try:
         # 过滤掉 None 值，只更新提供的字段
         update_data = {k: v for k, v in movement_update.dict().items() if v is not None}
-        response = ArtMovementService.update(movement_id, update_data)
+        response = await AsyncArtMovementService.update(movement_id, update_data)
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating art movement: {str(e)}")
@@ -94,7 +104,7 @@ async def delete_art_movement(movement_id: str = Path(..., description="艺术
         movement_id: 艺术运动ID
     """
     try:
-        response = ArtMovementService.delete(movement_id)
+        response = await AsyncArtMovementService.delete(movement_id)
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting art movement: {str(e)}")
@@ -103,7 +113,8 @@ async def delete_art_movement(movement_id: str = Path(..., description="艺术
 @router.get("/search/", response_model=APIResponse[List[ArtMovement]])
 async def search_art_movements(
     query: str = Query(..., description="搜索关键词"),
-    limit: int = Query(10, description="结果数量限制")
+    limit: int = Query(10, description="结果数量限制"),
+    mode: Optional[str] = Query(None, description="搜索模式：text（全文索引 + 名称前缀）、prefix（名称前缀）、regex（子串匹配）")
 ):
     """
     搜索艺术运动
@@ -113,11 +124,14 @@ async def search_art_movements(
     Args:
         query: 搜索关键词
         limit: 结果数量限制
+        mode: 搜索模式
     """
     try:
-        movements = ArtMovementService.search_movements(query, limit)
+        movements = await AsyncArtMovementService.search_movements(query, limit, mode)
         from app.schemas.response import create_success_response
         return create_success_response(data=movements, message=f"找到 {len(movements)} 个匹配的艺术运动")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching art movements: {str(e)}")
 
@@ -137,7 +151,7 @@ async def get_movements_by_period(
         end_year: 结束年份
     """
     try:
-        movements = ArtMovementService.get_movements_by_period(start_year, end_year)
+        movements = await AsyncArtMovementService.get_movements_by_period(start_year, end_year)
         from app.schemas.response import create_success_response
         return create_success_response(
             data=movements, 
@@ -156,7 +170,7 @@ async def get_active_movements(year: int = Path(..., description="指定年份")
         year: 指定年份
     """
     try:
-        movements = ArtMovementService.get_active_movements(year)
+        movements = await AsyncArtMovementService.get_active_movements(year)
         from app.schemas.response import create_success_response
         return create_success_response(
             data=movements, 
@@ -166,19 +180,30 @@ async def get_active_movements(year: int = Path(..., description="指定年份")
         raise HTTPException(status_code=500, detail=f"Error fetching active movements: {str(e)}")
 
 
-@router.get("/timeline/", response_model=APIResponse[List[ArtMovement]])
-async def get_movements_timeline():
+@router.get("/timeline/", response_model=APIResponse[List[TimelineEntry]])
+async def get_movements_timeline(
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     获取艺术运动时间线
     
-    按时间顺序返回所有艺术运动
+    按开始年份返回所有艺术运动的精简条目（名称、起止年份、成员数量）。
+    时间线在内存中物化，艺术运动写入后重新生成；响应带 ETag，
+    请求头 If-None-Match 与之匹配时返回 304。
     """
     try:
-        movements = ArtMovementService.get_movements_timeline()
-        from app.schemas.response import create_success_response
-        return create_success_response(data=movements, message=f"获取到 {len(movements)} 个艺术运动的时间线")
+        timeline, etag = await AsyncArtMovementService.get_timeline_snapshot()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching movements timeline: {str(e)}")
+    
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if VersionedSnapshot.etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
+    from app.schemas.response import create_success_response
+    return create_success_response(data=timeline, message=f"获取到 {len(timeline)} 个艺术运动的时间线")
 
 
 @router.get("/{movement_id}/statistics", response_model=APIResponse[ArtMovementStatistics])
@@ -190,7 +215,7 @@ async def get_movement_statistics(movement_id: str = Path(..., description="艺
         movement_id: 艺术运动ID
     """
     try:
-        stats = ArtMovementService.get_movement_statistics(movement_id)
+        stats = await AsyncArtMovementService.get_movement_statistics(movement_id)
         if not stats:
             raise HTTPException(status_code=404, detail="Art movement not found")
         
@@ -211,7 +236,7 @@ async def get_movements_by_artist(artist_id: str = Path(..., description="艺术
         artist_id: 艺术家ID
     """
     try:
-        movements = ArtMovementService.get_movements_by_artist(artist_id)
+        movements = await AsyncArtMovementService.get_movements_by_artist(artist_id)
         from app.schemas.response import create_success_response
         return create_success_response(data=movements, message=f"找到 {len(movements)} 个相关艺术运动")
     except Exception as e:
@@ -231,7 +256,7 @@ async def add_artist_to_movement(
         request: 包含艺术家ID的请求
     """
     try:
-        success = ArtMovementService.add_artist_to_movement(movement_id, request.artist_id)
+        success = await AsyncArtMovementService.add_artist_to_movement(movement_id, request.artist_id)
         if success:
             from app.schemas.response import create_success_response
             return create_success_response(message="艺术家添加成功")
@@ -256,7 +281,7 @@ async def remove_artist_from_movement(
         artist_id: 艺术家ID
     """
     try:
-        success = ArtMovementService.remove_artist_from_movement(movement_id, artist_id)
+        success = await AsyncArtMovementService.remove_artist_from_movement(movement_id, artist_id)
         if success:
             from app.schemas.response import create_success_response
             return create_success_response(message="艺术家移除成功")
@@ -281,7 +306,7 @@ async def add_artwork_to_movement(
         request: 包含作品ID的请求
     """
     try:
-        success = ArtMovementService.add_artwork_to_movement(movement_id, request.artwork_id)
+        success = await AsyncArtMovementService.add_artwork_to_movement(movement_id, request.artwork_id)
         if success:
             from app.schemas.response import create_success_response
             return create_success_response(message="代表作品添加成功")
@@ -306,7 +331,7 @@ async def remove_artwork_from_movement(
         artwork_id: 作品ID
     """
     try:
-        success = ArtMovementService.remove_artwork_from_movement(movement_id, artwork_id)
+        success = await AsyncArtMovementService.remove_artwork_from_movement(movement_id, artwork_id)
         if success:
             from app.schemas.response import create_success_response
             return create_success_response(message="代表作品移除成功")
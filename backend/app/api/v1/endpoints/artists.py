@@ -1,10 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from typing import List, Optional
 
-from app.schemas.artist import Artist, ArtistCreate, ArtistUpdate, ArtistResponse
+from app.schemas.artist import (
+    Artist, ArtistCreate, ArtistUpdate, ArtistResponse,
+    NetworkNode, NetworkNeighborhood, NetworkPath, NetworkStats, SocialNetworkArtist
+)
+from app.core.config import SOCIAL_NETWORK_MAX_DEPTH, SOCIAL_NETWORK_MAX_RESULTS
 from app.schemas.response import APIResponse, PaginatedResponse
-from app.services.artist_service import ArtistService
-from app.utils.query_params import QueryParams
+from app.services.artist_service import AsyncArtistService
+from app.utils.json_response import model_response
+from app.utils.query_params import QueryParams, QueryParamsParser
 
 router = APIRouter()
 
@@ -13,16 +18,21 @@ async def get_artists(params: QueryParams = Depends()):
     """
     获取所有艺术家
 
-    支持查询参数：project, fields, include, search, tags, yearFrom, yearTo, sortBy, order, page, pageSize, isFictional
+    支持查询参数：project, fields, include, search, tags, yearFrom, yearTo, sortBy, order, page, pageSize, isFictional, pagination, after
     """
     try:
-        response = ArtistService.get_all(params)
-        return response
+        response = await AsyncArtistService.get_all(params)
+        return model_response(response)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching artists: {str(e)}")
 
 @router.get("/{artist_id}", response_model=APIResponse[Artist])
-async def get_artist(artist_id: str = Path(..., description="艺术家ID")):
+async def get_artist(
+    artist_id: str = Path(..., description="艺术家ID"),
+    include: Optional[str] = Query(None, description="展开的关联，用逗号分隔，如 'notableWorks,associatedMovements'")
+):
     """
     获取特定艺术家
 
@@ -30,10 +40,13 @@ async def get_artist(artist_id: str = Path(..., description="艺术家ID")):
 
     Args:
         artist_id: 艺术家ID
+        include: 展开的关联
     """
     try:
-        response = ArtistService.get_by_id(artist_id)
+        response = await AsyncArtistService.get_by_id(artist_id, QueryParamsParser.parse_include(include))
         return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching artist: {str(e)}")
 
@@ -48,7 +61,7 @@ async def create_artist(artist: ArtistCreate):
         artist: 艺术家创建模式
     """
     try:
-        response = ArtistService.create(artist.dict())
+        response = await AsyncArtistService.create(artist.dict())
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating artist: {str(e)}")
@@ -71,7 +84,7 @@ async def update_artist(
         # 过滤掉 None 值，只更新提供的字段
         update_data = {k: v for k, v in artist_update.dict().items() if v is not None}
 
-        response = ArtistService.update(artist_id, update_data)
+        response = await AsyncArtistService.update(artist_id, update_data)
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating artist: {str(e)}")
@@ -87,7 +100,7 @@ async def delete_artist(artist_id: str = Path(..., description="艺术家ID")):
         artist_id: 艺术家ID
     """
     try:
-        response = ArtistService.delete(artist_id)
+        response = await AsyncArtistService.delete(artist_id)
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting artist: {str(e)}")
@@ -95,7 +108,8 @@ async def delete_artist(artist_id: str = Path(..., description="艺术家ID")):
 @router.get("/search/", response_model=APIResponse[List[Artist]])
 async def search_artists(
     query: str = Query(..., description="搜索关键词"),
-    limit: int = Query(10, description="结果数量限制")
+    limit: int = Query(10, description="结果数量限制"),
+    mode: Optional[str] = Query(None, description="搜索模式：text（全文索引 + 名称前缀）、prefix（名称前缀）、regex（子串匹配）")
 ):
     """
     搜索艺术家
@@ -105,11 +119,14 @@ async def search_artists(
     Args:
         query: 搜索关键词
         limit: 结果数量限制
+        mode: 搜索模式
     """
     try:
-        artists = ArtistService.search_artists(query, limit)
+        artists = await AsyncArtistService.search_artists(query, limit, mode)
         from app.schemas.response import create_success_response
         return create_success_response(data=artists, message=f"找到 {len(artists)} 个匹配的艺术家")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching artists: {str(e)}")
 
@@ -124,7 +141,7 @@ async def get_fictional_artists(
         project: 项目名称筛选（如 'zhuyizhuyi'）
     """
     try:
-        artists = ArtistService.get_fictional_artists(project)
+        artists = await AsyncArtistService.get_fictional_artists(project)
         from app.schemas.response import create_success_response
         return create_success_response(data=artists, message=f"找到 {len(artists)} 个虚构艺术家")
     except Exception as e:
@@ -136,23 +153,118 @@ async def get_real_artists():
     获取真实艺术家
     """
     try:
-        artists = ArtistService.get_real_artists()
+        artists = await AsyncArtistService.get_real_artists()
         from app.schemas.response import create_success_response
         return create_success_response(data=artists, message=f"找到 {len(artists)} 个真实艺术家")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching real artists: {str(e)}")
 
-@router.get("/{artist_id}/social-network/", response_model=APIResponse[List[Artist]])
-async def get_artist_social_network(artist_id: str = Path(..., description="艺术家ID")):
+@router.get("/{artist_id}/social-network/", response_model=APIResponse[List[SocialNetworkArtist]])
+async def get_artist_social_network(
+    artist_id: str = Path(..., description="艺术家ID"),
+    depth: int = Query(1, ge=1, le=SOCIAL_NETWORK_MAX_DEPTH, description="最大跳数，大于 1 时在数据库端遍历"),
+    fields: Optional[str] = Query(None, description="返回的字段，逗号分隔"),
+    limit: Optional[int] = Query(None, ge=1, le=SOCIAL_NETWORK_MAX_RESULTS, description="结果数量限制")
+):
     """
     获取艺术家的社交网络
 
     Args:
         artist_id: 艺术家ID
+        depth: 最大跳数
+        fields: 返回的字段
+        limit: 结果数量限制
     """
     try:
-        connected_artists = ArtistService.get_artist_social_network(artist_id)
+        connected_artists = await AsyncArtistService.get_artist_social_network(
+            artist_id, depth=depth, fields=QueryParamsParser.parse_fields(fields), limit=limit
+        )
         from app.schemas.response import create_success_response
         return create_success_response(data=connected_artists, message=f"找到 {len(connected_artists)} 个连接的艺术家")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching artist social network: {str(e)}")
+
+@router.get("/network/stats", response_model=APIResponse[NetworkStats])
+async def get_network_stats():
+    """
+    获取艺术家社交网络的整体统计（节点数、边数、度数）
+    """
+    try:
+        stats = await AsyncArtistService.get_network_stats()
+        from app.schemas.response import create_success_response
+        return create_success_response(data=stats, message="获取社交网络统计成功")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching network stats: {str(e)}")
+
+@router.get("/{artist_id}/network/", response_model=APIResponse[NetworkNeighborhood])
+async def get_network_neighborhood(
+    artist_id: str = Path(..., description="艺术家ID"),
+    depth: int = Query(2, ge=1, le=6, description="最大跳数"),
+    limit: int = Query(100, ge=1, le=1000, description="结果数量限制")
+):
+    """
+    获取艺术家 depth 跳以内的社交网络（内存图上的 BFS，按距离排序）
+
+    Args:
+        artist_id: 艺术家ID
+        depth: 最大跳数
+        limit: 结果数量限制
+    """
+    try:
+        neighborhood = await AsyncArtistService.get_network_neighborhood(artist_id, depth, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching network neighborhood: {str(e)}")
+    if neighborhood is None:
+        raise HTTPException(status_code=404, detail="Artist not found")
+    
+    from app.schemas.response import create_success_response
+    return create_success_response(data=neighborhood, message=f"找到 {len(neighborhood['nodes'])} 个可达的艺术家")
+
+@router.get("/{artist_id}/network/mutual/{other_id}", response_model=APIResponse[List[NetworkNode]])
+async def get_mutual_connections(
+    artist_id: str = Path(..., description="艺术家ID"),
+    other_id: str = Path(..., description="另一位艺术家ID")
+):
+    """
+    获取两位艺术家的共同连接
+
+    Args:
+        artist_id: 艺术家ID
+        other_id: 另一位艺术家ID
+    """
+    try:
+        mutual = await AsyncArtistService.get_mutual_connections(artist_id, other_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching mutual connections: {str(e)}")
+    if mutual is None:
+        raise HTTPException(status_code=404, detail="Artist not found")
+    
+    from app.schemas.response import create_success_response
+    return create_success_response(data=mutual, message=f"找到 {len(mutual)} 个共同连接")
+
+@router.get("/{artist_id}/network/path/{other_id}", response_model=APIResponse[NetworkPath])
+async def get_shortest_path(
+    artist_id: str = Path(..., description="起点艺术家ID"),
+    other_id: str = Path(..., description="终点艺术家ID"),
+    max_depth: Optional[int] = Query(None, ge=1, description="最大跳数，为空时不限")
+):
+    """
+    获取两位艺术家之间的最短连接路径（BFS）
+
+    Args:
+        artist_id: 起点艺术家ID
+        other_id: 终点艺术家ID
+        max_depth: 最大跳数
+    """
+    try:
+        path = await AsyncArtistService.get_shortest_path(artist_id, other_id, max_depth)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching artist social network: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error fetching shortest path: {str(e)}")
+    if path is None:
+        raise HTTPException(status_code=404, detail="Artist not found")
+    
+    from app.schemas.response import create_success_response
+    message = f"最短路径长度为 {path['length']}" if path["found"] else "两位艺术家之间没有连接路径"
+    return create_success_response(data=path, message=message)
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from typing import List, Optional
 
-from app.schemas.artwork import Artwork, ArtworkCreate, ArtworkUpdate, ArtworkResponse, SimilarArtworkRequest
+from app.schemas.artwork import (
+    Artwork, ArtworkCreate, ArtworkUpdate, ArtworkResponse, SimilarArtworkRequest,
+    BatchSimilarArtworkRequest, SimilarArtworkBatchResult
+)
 from app.schemas.response import APIResponse, PaginatedResponse
-from app.services.artwork_service import ArtworkService
-from app.services.artist_service import ArtistService
-from app.utils.query_params import QueryParams
+from app.services.artwork_service import AsyncArtworkService
+from app.services.artist_service import AsyncArtistService
+from app.utils.json_response import model_response
+from app.utils.query_params import QueryParams, QueryParamsParser
 
 router = APIRouter()
 
@@ -14,18 +18,51 @@ async def get_artworks(params: QueryParams = Depends()):
     """
     获取所有艺术品
 
-    支持查询参数：project, fields, include, search, tags, yearFrom, yearTo, sortBy, order, page, pageSize
+    支持查询参数：project, fields, include, search, tags, yearFrom, yearTo, sortBy, order, page, pageSize, pagination, after
     """
     try:
-        response = ArtworkService.get_all(params)
-        return response
+        response = await AsyncArtworkService.get_all(params)
+        return model_response(response)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching artworks: {str(e)}")
 
 # Removed import_test_data endpoint - will be handled by data generation utilities
 
+@router.post("/similar/batch", response_model=APIResponse[List[SimilarArtworkBatchResult]])
+async def get_similar_artworks_batch(request: BatchSimilarArtworkRequest):
+    """
+    批量获取相似艺术品
+
+    为多个作品ID或原始风格向量一次性返回近邻，所有查询共用一次索引扫描。
+
+    Args:
+        request: 批量查询请求（artwork_ids 和 vectors 至少提供一项）
+    """
+    if not request.artwork_ids and not request.vectors:
+        raise HTTPException(status_code=400, detail="Either artwork_ids or vectors must be provided")
+
+    try:
+        results = await AsyncArtworkService.get_similar_artworks_batch(
+            artwork_ids=request.artwork_ids,
+            vectors=request.vectors,
+            threshold=request.threshold,
+            limit=request.top_k
+        )
+        from app.schemas.response import create_success_response
+        return create_success_response(
+            data=results,
+            message=f"完成 {len(results)} 个相似作品查询"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching similar artworks: {str(e)}")
+
 @router.get("/{artwork_id}", response_model=APIResponse[Artwork])
-async def get_artwork(artwork_id: str = Path(..., description="艺术品ID")):
+async def get_artwork(
+    artwork_id: str = Path(..., description="艺术品ID"),
+    include: Optional[str] = Query(None, description="展开的关联，用逗号分隔，如 'artist,movements'")
+):
     """
     获取特定艺术品
 
@@ -33,10 +70,13 @@ async def get_artwork(artwork_id: str = Path(..., description="艺术品ID")):
 
     Args:
         artwork_id: 艺术品ID
+        include: 展开的关联
     """
     try:
-        response = ArtworkService.get_by_id(artwork_id)
+        response = await AsyncArtworkService.get_by_id(artwork_id, QueryParamsParser.parse_include(include))
         return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching artwork: {str(e)}")
 
@@ -51,7 +91,7 @@ async def create_artwork(artwork: ArtworkCreate):
         artwork: 艺术品数据
     """
     try:
-        response = ArtworkService.create(artwork.dict())
+        response = await AsyncArtworkService.create(artwork.dict())
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating artwork: {str(e)}")
@@ -70,7 +110,7 @@ async def update_artwork(artwork_data: ArtworkUpdate, artwork_id: str = Path(...
     try:
         # 过滤掉 None 值，只更新提供的字段
         update_data = {k: v for k, v in artwork_data.dict().items() if v is not None}
-        response = ArtworkService.update(artwork_id, update_data)
+        response = await AsyncArtworkService.update(artwork_id, update_data)
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating artwork: {str(e)}")
@@ -86,7 +126,7 @@ async def delete_artwork(artwork_id: str = Path(..., description="艺术品ID"))
         artwork_id: 艺术品ID
     """
     try:
-        response = ArtworkService.delete(artwork_id)
+        response = await AsyncArtworkService.delete(artwork_id)
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting artwork: {str(e)}")
@@ -102,7 +142,7 @@ async def get_artworks_by_artist(artist_id: str = Path(..., description="艺术
         artist_id: 艺术家ID
     """
     try:
-        artworks = ArtworkService.get_artworks_by_artist(artist_id)
+        artworks = await AsyncArtworkService.get_artworks_by_artist(artist_id)
         from app.schemas.response import create_success_response
         return create_success_response(data=artworks, message=f"找到 {len(artworks)} 件作品")
     except Exception as e:
@@ -125,7 +165,7 @@ async def get_similar_artworks(
         limit: 返回结果数量限制
     """
     try:
-        similar_artworks = ArtworkService.get_similar_artworks(artwork_id, threshold, limit)
+        similar_artworks = await AsyncArtworkService.get_similar_artworks(artwork_id, threshold, limit)
         from app.schemas.response import create_success_response
         return create_success_response(
             data=similar_artworks,
@@ -143,7 +183,7 @@ async def get_artworks_by_movement(movement_id: str = Path(..., description="艺
         movement_id: 艺术运动ID
     """
     try:
-        artworks = ArtworkService.get_artworks_by_movement(movement_id)
+        artworks = await AsyncArtworkService.get_artworks_by_movement(movement_id)
         from app.schemas.response import create_success_response
         return create_success_response(data=artworks, message=f"找到 {len(artworks)} 件代表作品")
     except Exception as e:
@@ -163,7 +203,7 @@ async def search_artworks_by_style(
     """
     try:
         style_tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
-        artworks = ArtworkService.search_artworks_by_style(style_tags, limit)
+        artworks = await AsyncArtworkService.search_artworks_by_style(style_tags, limit)
         from app.schemas.response import create_success_response
         return create_success_response(data=artworks, message=f"找到 {len(artworks)} 件匹配作品")
     except Exception as e:
@@ -182,7 +222,7 @@ async def get_artworks_by_year_range(
         end_year: 结束年份
     """
     try:
-        artworks = ArtworkService.get_artworks_by_year_range(start_year, end_year)
+        artworks = await AsyncArtworkService.get_artworks_by_year_range(start_year, end_year)
         from app.schemas.response import create_success_response
         return create_success_response(
             data=artworks,
@@ -1,47 +1,92 @@
-from fastapi import APIRouter, HTTPException, File, UploadFile, Depends
+from fastapi import APIRouter, HTTPException, File, UploadFile, Depends, BackgroundTasks, Query
 from fastapi.responses import JSONResponse
 from bson import json_util
 import json
 import os
 
+from app.core.config import DATA_DIR, ARTISTS_COLLECTION, ARTWORKS_COLLECTION, ART_MOVEMENTS_COLLECTION
 from app.schemas.artist import CSVUploadResponse
-from app.services.artist_service import ArtistService
+from app.schemas.response import APIResponse, create_success_response
+from app.services.artist_service import AsyncArtistService
+from app.services.artwork_service import AsyncArtworkService
+from app.services.art_movement_service import AsyncArtMovementService
 from app.utils.csv_handler import CSVHandler
+from app.utils.import_jobs import ImportJobManager
 
 router = APIRouter()
 
-@router.post("/upload-csv", response_model=CSVUploadResponse)
-async def upload_csv(file: UploadFile = File(...)):
+# 可导入的集合及其服务
+IMPORT_SERVICES = {
+    ARTISTS_COLLECTION: AsyncArtistService,
+    ARTWORKS_COLLECTION: AsyncArtworkService,
+    ART_MOVEMENTS_COLLECTION: AsyncArtMovementService,
+}
+
+@router.post("/upload-csv", response_model=CSVUploadResponse, status_code=202)
+async def upload_csv(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    collection: str = Query(ARTISTS_COLLECTION, description="目标集合：artists / artworks / art_movements"),
+    clear_existing: bool = Query(False, description="是否清除现有数据")
+):
     """
     上传 CSV 文件
     
-    上传 CSV 文件并处理其中的数据
+    上传的文件分块写入磁盘后，在后台分块导入到目标集合。
+    返回任务ID，通过 /data/import-jobs/{job_id} 查询进度。
     
     Args:
         file: 上传的 CSV 文件
+        collection: 目标集合
+        clear_existing: 是否清除现有数据
     """
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="Only CSV files are allowed")
     
+    service = IMPORT_SERVICES.get(collection)
+    if service is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported collection '{collection}', expected one of: {', '.join(IMPORT_SERVICES)}"
+        )
+    
     try:
-        # 保存文件
-        file_path = await CSVHandler.save_upload_file(file)
+        job = ImportJobManager.create_job(collection, file.filename)
         
-        # 读取 CSV 文件
-        df = CSVHandler.read_csv(file_path)
-        rows_count = len(df)
+        # 分块保存文件，以任务ID命名避免并发上传互相覆盖
+        file_path = await CSVHandler.save_upload_file(
+            file,
+            directory=os.path.join(DATA_DIR, "uploads"),
+            filename=f"{job['job_id']}.csv"
+        )
         
-        # 这里可以添加数据处理逻辑
-        # 例如，将数据导入到数据库
+        # 后台导入
+        background_tasks.add_task(ImportJobManager.run_import, job["job_id"], service, file_path, clear_existing)
         
         return {
             "filename": file.filename,
-            "rows_processed": rows_count,
-            "status": "success"
+            "rows_processed": 0,
+            "status": job["status"],
+            "job_id": job["job_id"],
+            "collection": collection
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing CSV: {str(e)}")
 
+@router.get("/import-jobs/{job_id}", response_model=APIResponse)
+async def get_import_job(job_id: str):
+    """
+    查询 CSV 导入任务状态和进度
+    
+    Args:
+        job_id: 任务ID
+    """
+    job = ImportJobManager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Import job {job_id} not found")
+    
+    return create_success_response(data=job, message="Import job retrieved successfully")
+
 @router.get("/import-test-data")
 async def import_test_data():
     """
@@ -57,18 +102,18 @@ async def import_test_data():
             raise HTTPException(status_code=404, detail="Test data file not found")
         
         # 导入数据
-        result = ArtistService.import_from_csv(test_data_path)
+        result = await AsyncArtistService.import_from_csv(test_data_path)
         
-        if result["status"] == "error":
-            raise HTTPException(status_code=400, detail={"message": "Error importing test data", "errors": result["errors"]})
+        if not result.success:
+            raise HTTPException(status_code=400, detail={"message": "Error importing test data", "errors": result.error_details})
         
         # 返回自定义响应
-        return JSONResponse(content={
+        return JSONResponse(content=json.loads(json_util.dumps({
             "message": "Test data import successful",
-            "records_count": result["rows_processed"],
-            "collection": ArtistService.COLLECTION_NAME,
-            "sample_records": result["sample_records"]
-        })
+            "records_count": result.data["inserted_count"],
+            "collection": AsyncArtistService.COLLECTION_NAME,
+            "sample_records": result.data["sample_records"]
+        })))
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -6,13 +6,37 @@ from app.schemas.response import APIResponse
 from app.utils.data_generator import (
     ArtistDataGenerator, ArtworkDataGenerator, ArtMovementDataGenerator, FullDatasetGenerator
 )
-from app.services.artist_service import ArtistService
-from app.services.artwork_service import ArtworkService
-from app.services.art_movement_service import ArtMovementService
+from app.services.artist_service import AsyncArtistService
+from app.services.artwork_service import AsyncArtworkService
+from app.services.art_movement_service import AsyncArtMovementService
 
 router = APIRouter()
 
 
+async def bulk_insert(service, records, label_field: str, kind: str):
+    """
+    通过 bulk_create 批量写入生成的数据
+    
+    Args:
+        service: 异步服务类
+        records: 生成的记录列表
+        label_field: 错误信息中用于标识记录的字段
+        kind: 记录类型名称（artist / artwork / movement）
+        
+    Returns:
+        Tuple[int, List[str]]: (成功创建数量, 错误信息列表)
+    """
+    response = await service.bulk_create(records)
+    if not response.success:
+        return 0, [f"Error creating {kind}s: {response.message}"]
+    
+    errors = [
+        f"Failed to create {kind} {records[error['index']].get(label_field)}: {error['message']}"
+        for error in response.data["errors"]
+    ]
+    return response.data["created_count"], errors
+
+
 class ArtistGenerationRequest(BaseModel):
     """艺术家生成请求"""
     count: int = Field(5, ge=1, le=50, description="生成数量")
@@ -58,18 +82,7 @@ async def generate_artists(request: ArtistGenerationRequest):
             artists_data = ArtistDataGenerator.generate_real_artists(count=request.count)
         
         # 批量插入数据库
-        created_count = 0
-        errors = []
-        
-        for artist_data in artists_data:
-            try:
-                response = ArtistService.create(artist_data)
-                if response.success:
-                    created_count += 1
-                else:
-                    errors.append(f"Failed to create artist {artist_data['name']}: {response.message}")
-            except Exception as e:
-                errors.append(f"Error creating artist {artist_data['name']}: {str(e)}")
+        created_count, errors = await bulk_insert(AsyncArtistService, artists_data, "name", "artist")
         
         from app.schemas.response import create_success_response
         return create_success_response(
@@ -96,7 +109,7 @@ async def generate_artworks(request: ArtworkGenerationRequest):
     """
     try:
         # 获取现有艺术家
-        artists_response = ArtistService.get_all()
+        artists_response = await AsyncArtistService.get_all()
         if not artists_response.success or not artists_response.data:
             raise HTTPException(status_code=400, detail="No artists found. Please create artists first.")
         
@@ -120,18 +133,7 @@ async def generate_artworks(request: ArtworkGenerationRequest):
         )
         
         # 批量插入数据库
-        created_count = 0
-        errors = []
-        
-        for artwork_data in artworks_data:
-            try:
-                response = ArtworkService.create(artwork_data)
-                if response.success:
-                    created_count += 1
-                else:
-                    errors.append(f"Failed to create artwork {artwork_data['title']}: {response.message}")
-            except Exception as e:
-                errors.append(f"Error creating artwork {artwork_data['title']}: {str(e)}")
+        created_count, errors = await bulk_insert(AsyncArtworkService, artworks_data, "title", "artwork")
         
         from app.schemas.response import create_success_response
         return create_success_response(
@@ -162,18 +164,7 @@ async def generate_art_movements(request: MovementGenerationRequest):
         movements_data = ArtMovementDataGenerator.generate_movements(fictional=request.fictional)
         
         # 批量插入数据库
-        created_count = 0
-        errors = []
-        
-        for movement_data in movements_data:
-            try:
-                response = ArtMovementService.create(movement_data)
-                if response.success:
-                    created_count += 1
-                else:
-                    errors.append(f"Failed to create movement {movement_data['name']}: {response.message}")
-            except Exception as e:
-                errors.append(f"Error creating movement {movement_data['name']}: {str(e)}")
+        created_count, errors = await bulk_insert(AsyncArtMovementService, movements_data, "name", "movement")
         
         from app.schemas.response import create_success_response
         return create_success_response(
@@ -219,42 +210,17 @@ async def generate_full_dataset(request: FullDatasetRequest):
             "movements": {"generated": 0, "created": 0, "errors": []}
         }
         
-        # 插入艺术家
-        for artist_data in dataset["artists"]:
-            stats["artists"]["generated"] += 1
-            try:
-                response = ArtistService.create(artist_data)
-                if response.success:
-                    stats["artists"]["created"] += 1
-                else:
-                    stats["artists"]["errors"].append(f"Failed to create artist {artist_data['name']}")
-            except Exception as e:
-                stats["artists"]["errors"].append(f"Error creating artist {artist_data['name']}: {str(e)}")
-        
-        # 插入艺术品
-        for artwork_data in dataset["artworks"]:
-            stats["artworks"]["generated"] += 1
-            try:
-                response = ArtworkService.create(artwork_data)
-                if response.success:
-                    stats["artworks"]["created"] += 1
-                else:
-                    stats["artworks"]["errors"].append(f"Failed to create artwork {artwork_data['title']}")
-            except Exception as e:
-                stats["artworks"]["errors"].append(f"Error creating artwork {artwork_data['title']}: {str(e)}")
-        
-        # 插入艺术运动
+        # 按依赖顺序批量插入：艺术家、艺术品、艺术运动
+        batches = [
+            ("artists", AsyncArtistService, dataset["artists"], "name", "artist"),
+            ("artworks", AsyncArtworkService, dataset["artworks"], "title", "artwork"),
+        ]
         if request.include_movements:
-            for movement_data in dataset["movements"]:
-                stats["movements"]["generated"] += 1
-                try:
-                    response = ArtMovementService.create(movement_data)
-                    if response.success:
-                        stats["movements"]["created"] += 1
-                    else:
-                        stats["movements"]["errors"].append(f"Failed to create movement {movement_data['name']}")
-                except Exception as e:
-                    stats["movements"]["errors"].append(f"Error creating movement {movement_data['name']}: {str(e)}")
+            batches.append(("movements", AsyncArtMovementService, dataset["movements"], "name", "movement"))
+        
+        for key, service, records, label_field, kind in batches:
+            stats[key]["generated"] = len(records)
+            stats[key]["created"], stats[key]["errors"] = await bulk_insert(service, records, label_field, kind)
         
         from app.schemas.response import create_success_response
         return create_success_response(
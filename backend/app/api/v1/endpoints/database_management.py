@@ -1,5 +1,5 @@
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from typing import Dict, Any, Optional
 
 from app.schemas.response import APIResponse
 from app.utils.database_setup import DatabaseSetup, DatabaseMigration
@@ -7,6 +7,19 @@ from app.utils.database_setup import DatabaseSetup, DatabaseMigration
 router = APIRouter()
 
 
+def _invalidate_services():
+    """
+    迁移或重置绕过了服务层：对每个服务调用批量写入钩子，递增集合版本号（其他进程的查询缓存
+    和时间线随之失效）并清空进程内的搜索、向量、区间树和社交网络索引
+    """
+    from app.services.artist_service import ArtistService
+    from app.services.artwork_service import ArtworkService
+    from app.services.art_movement_service import ArtMovementService
+    
+    for service in (ArtistService, ArtworkService, ArtMovementService):
+        service._after_bulk_write()
+
+
 @router.post("/setup", response_model=APIResponse)
 async def setup_database():
     """
@@ -116,6 +129,92 @@ async def get_database_stats():
         raise HTTPException(status_code=500, detail=f"Error getting database stats: {str(e)}")
 
 
+@router.get("/pool-stats", response_model=APIResponse)
+async def get_pool_stats():
+    """
+    获取连接池统计信息（按客户端和服务器地址分组的打开、借出和空闲连接数）
+    """
+    try:
+        from app.db.mongodb import get_pool_stats as collect_pool_stats
+        from app.core.config import (
+            MONGODB_MAX_POOL_SIZE, MONGODB_MIN_POOL_SIZE, MONGODB_MAX_IDLE_TIME_MS,
+            MONGODB_READ_PREFERENCE, MONGODB_READONLY_READ_PREFERENCE
+        )
+        
+        pool_info = {
+            "config": {
+                "max_pool_size": MONGODB_MAX_POOL_SIZE,
+                "min_pool_size": MONGODB_MIN_POOL_SIZE,
+                "max_idle_time_ms": MONGODB_MAX_IDLE_TIME_MS,
+                "read_preference": MONGODB_READ_PREFERENCE,
+                "readonly_read_preference": MONGODB_READONLY_READ_PREFERENCE
+            },
+            "clients": collect_pool_stats()
+        }
+        
+        from app.schemas.response import create_success_response
+        return create_success_response(
+            data=pool_info,
+            message="连接池统计信息获取成功"
+        )
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting pool stats: {str(e)}")
+
+
+@router.get("/cache-stats", response_model=APIResponse)
+async def get_cache_stats():
+    """
+    获取查询缓存统计信息（总体和按查询类型的命中、未命中次数，各级缓存状态）
+    """
+    try:
+        from app.utils.query_cache import QUERY_CACHE
+        
+        from app.schemas.response import create_success_response
+        return create_success_response(
+            data=QUERY_CACHE.stats(),
+            message="查询缓存统计信息获取成功"
+        )
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting cache stats: {str(e)}")
+
+
+@router.get("/explain-search", response_model=APIResponse)
+async def explain_search(
+    collection: str = Query(..., description="集合名称：artists / artworks / art_movements"),
+    q: str = Query(..., min_length=1, description="搜索关键词"),
+    mode: Optional[str] = Query(None, description="搜索模式：text / prefix / regex")
+):
+    """
+    查看搜索查询的执行计划（阶段、使用的索引和扫描的文档数）
+    """
+    from app.services.artist_service import ArtistService
+    from app.services.artwork_service import ArtworkService
+    from app.services.art_movement_service import ArtMovementService
+    
+    services = {
+        service.COLLECTION_NAME: service
+        for service in (ArtistService, ArtworkService, ArtMovementService)
+    }
+    service = services.get(collection)
+    if service is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported collection '{collection}'")
+    
+    try:
+        plan = service.explain_search(q, mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error explaining search: {str(e)}")
+    
+    from app.schemas.response import create_success_response
+    return create_success_response(
+        data=plan,
+        message="搜索执行计划获取成功"
+    )
+
+
 @router.post("/migrate", response_model=APIResponse)
 async def migrate_database():
     """
@@ -124,6 +223,9 @@ async def migrate_database():
     try:
         DatabaseMigration.migrate_to_new_schema()
         DatabaseMigration.add_timestamps()
+        DatabaseMigration.add_search_fields()
+        
+        _invalidate_services()
         
         from app.schemas.response import create_success_response
         return create_success_response(
@@ -158,6 +260,7 @@ async def reset_database():
     """
     try:
         DatabaseSetup.reset_database()
+        _invalidate_services()
         
         from app.schemas.response import create_success_response
         return create_success_response(
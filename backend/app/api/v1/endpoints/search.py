@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+
+from app.schemas.response import APIResponse
+from app.schemas.search import SearchResults
+from app.services.search_service import AsyncSearchService
+from app.utils.query_params import QueryParamsParser
+
+router = APIRouter()
+
+@router.get("/", response_model=APIResponse[SearchResults])
+async def search(
+    q: str = Query(..., min_length=1, description="搜索关键词（支持中文和英文）"),
+    types: Optional[str] = Query(None, description="实体类型筛选，用逗号分隔：artist, artwork, movement"),
+    limit: int = Query(20, ge=1, le=100, description="结果数量限制")
+):
+    """
+    跨实体搜索
+
+    在艺术家、作品和艺术运动的进程内倒排索引上按 BM25 相关度检索，返回混合排序的结果
+
+    Args:
+        q: 搜索关键词
+        types: 实体类型筛选
+        limit: 结果数量限制
+    """
+    try:
+        results = await AsyncSearchService.search(q, QueryParamsParser.parse_fields(types), limit)
+        from app.schemas.response import create_success_response
+        return create_success_response(data=results, message=f"找到 {len(results['hits'])} 个匹配结果")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching: {str(e)}")
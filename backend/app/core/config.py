@@ -37,6 +37,46 @@ BASE_URL = f"http://{'localhost' if HOST == '0.0.0.0' else HOST}:{PORT}"
 MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017/aida")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "aida")
 
+# 连接池配置
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+MONGODB_MAX_IDLE_TIME_MS = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "0")) or None  # 0 表示不限制
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "30000"))
+# 网络压缩算法，逗号分隔，如 "zstd,snappy"（需要安装 zstandard / python-snappy）
+MONGODB_COMPRESSORS = [c.strip() for c in os.getenv("MONGODB_COMPRESSORS", "").split(",") if c.strip()]
+MONGODB_READ_PREFERENCE = os.getenv("MONGODB_READ_PREFERENCE", "primary")
+
+# 只读客户端配置（列表与搜索流量，设置为 secondaryPreferred 等可路由到从节点）
+# 均未设置时与主客户端相同，复用主客户端的连接池
+MONGODB_READONLY_URI = os.getenv("MONGODB_READONLY_URI") or MONGODB_URI
+MONGODB_READONLY_READ_PREFERENCE = os.getenv("MONGODB_READONLY_READ_PREFERENCE") or MONGODB_READ_PREFERENCE
+
+# 分页配置
+# count=estimated 且带筛选条件时，count_documents 最多统计到该数量
+ESTIMATED_COUNT_LIMIT = int(os.getenv("ESTIMATED_COUNT_LIMIT", "1000"))
+
+# 搜索配置
+# 默认搜索模式：text（全文索引 + 名称前缀）、prefix（仅名称前缀）、regex（子串匹配，无法使用索引）
+SEARCH_MODE = os.getenv("SEARCH_MODE", "text")
+
+# 社交网络遍历配置（$graphLookup 服务端遍历）
+SOCIAL_NETWORK_MAX_DEPTH = int(os.getenv("SOCIAL_NETWORK_MAX_DEPTH", "4"))  # 最大跳数
+SOCIAL_NETWORK_MAX_RESULTS = int(os.getenv("SOCIAL_NETWORK_MAX_RESULTS", "500"))  # 单次遍历返回的艺术家上限
+
+# 查询缓存配置（进程内 LRU + 可选的 Redis 共享层）
+QUERY_CACHE_ENABLED = os.getenv("QUERY_CACHE_ENABLED", "true").lower() == "true"
+QUERY_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "2048"))  # 进程内缓存的条目上限
+QUERY_CACHE_TTL_SECONDS = float(os.getenv("QUERY_CACHE_TTL_SECONDS", "30"))  # 进程内缓存的过期时间，也是跨进程写入可见的最大延迟
+QUERY_CACHE_REDIS_URL = os.getenv("QUERY_CACHE_REDIS_URL", "")  # 为空时不启用共享层
+QUERY_CACHE_SHARED_TTL_SECONDS = int(os.getenv("QUERY_CACHE_SHARED_TTL_SECONDS", "300"))
+
+# CSV 导入配置
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "5000"))  # 每个分块的行数
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", "1000"))  # 导入结果中最多保留的错误条数
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))  # 上传文件落盘的分块字节数
+IMPORT_JOB_TTL_SECONDS = float(os.getenv("IMPORT_JOB_TTL_SECONDS", "3600"))  # 已结束的导入任务保留时长
+IMPORT_JOB_MAX_JOBS = int(os.getenv("IMPORT_JOB_MAX_JOBS", "1000"))  # 内存中保留的导入任务数上限
+
 # 集合名称常量
 ARTISTS_COLLECTION = "artists"
 ARTWORKS_COLLECTION = "artworks"
@@ -1,8 +1,63 @@
 import pymongo
-from app.core.config import MONGODB_URI, DATABASE_NAME
+from app.core.config import (
+    MONGODB_URI, DATABASE_NAME,
+    MONGODB_MAX_POOL_SIZE, MONGODB_MIN_POOL_SIZE, MONGODB_MAX_IDLE_TIME_MS,
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS, MONGODB_COMPRESSORS, MONGODB_READ_PREFERENCE,
+    MONGODB_READONLY_URI, MONGODB_READONLY_READ_PREFERENCE
+)
+from .pool_monitor import ConnectionPoolMonitor
 
 # MongoDB 客户端单例
 _client = None
+_read_client = None
+
+# 连接池监听器（按客户端名称）
+_pool_monitors = {}
+
+def get_pool_monitor(name):
+    """
+    获取指定客户端的连接池监听器
+    
+    Args:
+        name: 客户端名称，如 'primary'、'read'
+        
+    Returns:
+        ConnectionPoolMonitor: 连接池监听器
+    """
+    if name not in _pool_monitors:
+        _pool_monitors[name] = ConnectionPoolMonitor(name)
+    return _pool_monitors[name]
+
+def get_client_options(name, read_preference=MONGODB_READ_PREFERENCE):
+    """
+    构建 MongoDB 客户端参数（同步与异步客户端共用）
+    
+    Args:
+        name: 客户端名称，用于连接池统计
+        read_preference: 读偏好
+        
+    Returns:
+        dict: 客户端参数
+    """
+    options = {
+        "maxPoolSize": MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": MONGODB_MIN_POOL_SIZE,
+        "maxIdleTimeMS": MONGODB_MAX_IDLE_TIME_MS,
+        "serverSelectionTimeoutMS": MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "readPreference": read_preference,
+        "event_listeners": [get_pool_monitor(name)]
+    }
+    if MONGODB_COMPRESSORS:
+        options["compressors"] = MONGODB_COMPRESSORS
+    return options
+
+def use_separate_read_client():
+    """
+    是否需要单独的只读客户端
+    
+    只读配置与主客户端相同时复用主客户端，避免重复的连接池。
+    """
+    return MONGODB_READONLY_URI != MONGODB_URI or MONGODB_READONLY_READ_PREFERENCE != MONGODB_READ_PREFERENCE
 
 def get_client():
     """
@@ -10,15 +65,37 @@ def get_client():
     """
     global _client
     if _client is None:
-        _client = pymongo.MongoClient(MONGODB_URI)
+        _client = pymongo.MongoClient(MONGODB_URI, **get_client_options("primary"))
     return _client
 
+def get_read_client():
+    """
+    获取只读 MongoDB 客户端实例（单例模式）
+    
+    列表和搜索等可以容忍轻微复制延迟的读流量使用该客户端，默认路由到从节点。
+    """
+    global _read_client
+    if not use_separate_read_client():
+        return get_client()
+    if _read_client is None:
+        _read_client = pymongo.MongoClient(
+            MONGODB_READONLY_URI,
+            **get_client_options("read", MONGODB_READONLY_READ_PREFERENCE)
+        )
+    return _read_client
+
 def get_database():
     """
     获取数据库实例
     """
     return get_client().get_database(DATABASE_NAME)
 
+def get_read_database():
+    """
+    获取只读数据库实例
+    """
+    return get_read_client().get_database(DATABASE_NAME)
+
 def get_collection(collection_name):
     """
     获取集合实例
@@ -30,3 +107,30 @@ def get_collection(collection_name):
         pymongo.collection.Collection: 集合实例
     """
     return get_database()[collection_name]
+
+def get_read_collection(collection_name):
+    """
+    获取只读集合实例
+    
+    Args:
+        collection_name: 集合名称
+        
+    Returns:
+        pymongo.collection.Collection: 集合实例
+    """
+    return get_read_database()[collection_name]
+
+def get_pool_stats():
+    """
+    获取所有已创建客户端的连接池统计
+    
+    Returns:
+        dict: 按客户端名称分组的连接池统计
+    """
+    return {name: monitor.get_stats() for name, monitor in _pool_monitors.items()}
+
+
+from .async_client import (
+    get_async_client, get_async_read_client, get_async_database, get_async_read_database,
+    get_async_collection, get_async_read_collection, close_async_client
+)
@@ -0,0 +1,80 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import MONGODB_URI, DATABASE_NAME, MONGODB_READONLY_URI, MONGODB_READONLY_READ_PREFERENCE
+from app.db.mongodb import get_client_options, use_separate_read_client
+
+# Motor 异步客户端单例
+_async_client = None
+_async_read_client = None
+
+def get_async_client():
+    """
+    获取 Motor 异步客户端实例（单例模式）
+    
+    客户端在首次使用时绑定当前事件循环，请在应用的事件循环中调用。
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncIOMotorClient(MONGODB_URI, **get_client_options("async_primary"))
+    return _async_client
+
+def get_async_read_client():
+    """
+    获取只读 Motor 异步客户端实例（单例模式）
+    """
+    global _async_read_client
+    if not use_separate_read_client():
+        return get_async_client()
+    if _async_read_client is None:
+        _async_read_client = AsyncIOMotorClient(
+            MONGODB_READONLY_URI,
+            **get_client_options("async_read", MONGODB_READONLY_READ_PREFERENCE)
+        )
+    return _async_read_client
+
+def get_async_database():
+    """
+    获取异步数据库实例
+    """
+    return get_async_client().get_database(DATABASE_NAME)
+
+def get_async_read_database():
+    """
+    获取只读异步数据库实例
+    """
+    return get_async_read_client().get_database(DATABASE_NAME)
+
+def get_async_collection(collection_name):
+    """
+    获取异步集合实例
+    
+    Args:
+        collection_name: 集合名称
+        
+    Returns:
+        motor.motor_asyncio.AsyncIOMotorCollection: 异步集合实例
+    """
+    return get_async_database()[collection_name]
+
+def get_async_read_collection(collection_name):
+    """
+    获取只读异步集合实例
+    
+    Args:
+        collection_name: 集合名称
+        
+    Returns:
+        motor.motor_asyncio.AsyncIOMotorCollection: 异步集合实例
+    """
+    return get_async_read_database()[collection_name]
+
+def close_async_client():
+    """
+    关闭异步客户端（应用关闭时调用）
+    """
+    global _async_client, _async_read_client
+    if _async_read_client is not None:
+        _async_read_client.close()
+        _async_read_client = None
+    if _async_client is not None:
+        _async_client.close()
+        _async_client = None
@@ -0,0 +1,82 @@
+import threading
+from collections import defaultdict
+from typing import Dict, Any
+
+from pymongo import monitoring
+
+
+class ConnectionPoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    连接池监听器
+    
+    pymongo 没有公开连接池的实时状态，这里通过连接池事件统计每个服务器地址的
+    已打开、已借出和空闲连接数。
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {
+            "open": 0,
+            "checked_out": 0,
+            "created_total": 0,
+            "closed_total": 0,
+            "checkout_failed_total": 0,
+            "cleared_total": 0
+        })
+    
+    def _address_key(self, event) -> str:
+        host, port = event.address
+        return f"{host}:{port}"
+    
+    def _update(self, event, **changes):
+        with self._lock:
+            stats = self._stats[self._address_key(event)]
+            for key, delta in changes.items():
+                stats[key] += delta
+    
+    def pool_created(self, event):
+        self._update(event)
+    
+    def pool_ready(self, event):
+        pass
+    
+    def pool_cleared(self, event):
+        self._update(event, cleared_total=1)
+    
+    def pool_closed(self, event):
+        pass
+    
+    def connection_created(self, event):
+        self._update(event, open=1, created_total=1)
+    
+    def connection_ready(self, event):
+        pass
+    
+    def connection_closed(self, event):
+        self._update(event, open=-1, closed_total=1)
+    
+    def connection_check_out_started(self, event):
+        pass
+    
+    def connection_check_out_failed(self, event):
+        self._update(event, checkout_failed_total=1)
+    
+    def connection_checked_out(self, event):
+        self._update(event, checked_out=1)
+    
+    def connection_checked_in(self, event):
+        self._update(event, checked_out=-1)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取连接池统计
+        
+        Returns:
+            Dict[str, Any]: 按服务器地址分组的连接数统计，available 为空闲可用连接数
+        """
+        with self._lock:
+            return {
+                address: {**stats, "available": max(stats["open"] - stats["checked_out"], 0)}
+                for address, stats in self._stats.items()
+            }
@@ -1,6 +1,6 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Collection
 import pandas as pd
-from .base import BaseModel
+from .base import BaseModel, REQUIRED, OPTIONAL, NUMBER, LIST
 
 
 class ArtMovement(BaseModel):
@@ -10,59 +10,38 @@ class ArtMovement(BaseModel):
     用于表示艺术运动的基本信息和相关数据
     """
     
-    def __init__(
-        self,
-        name: str,
-        description: Optional[str] = None,
-        start_year: Optional[int] = None,
-        end_year: Optional[int] = None,
-        key_artists: Optional[List[str]] = None,
-        representative_works: Optional[List[str]] = None,
-        tags: Optional[List[str]] = None,
-        **kwargs
-    ):
-        super().__init__(**kwargs)
-        self.name = name
-        self.description = description
-        self.start_year = start_year
-        self.end_year = end_year
-        self.key_artists = key_artists or []
-        self.representative_works = representative_works or []
-        self.tags = tags or []
+    FIELDS = {
+        "name": REQUIRED,
+        "description": OPTIONAL,
+        "start_year": NUMBER,
+        "end_year": NUMBER,
+        "key_artists": LIST,
+        "representative_works": LIST,
+        "tags": LIST,
+    }
+    __slots__ = tuple(FIELDS)
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ArtMovement':
-        """
-        从字典创建艺术运动实例
-        
-        Args:
-            data: 包含艺术运动数据的字典
-            
-        Returns:
-            ArtMovement: 艺术运动实例
-        """
-        # 确保必填字段存在
-        if 'name' not in data:
-            raise ValueError("ArtMovement data must contain 'name' field")
-        
-        # 调用父类方法处理基础字段
-        return super().from_dict(data)
+    VALIDATION_GROUPS = (("start_year", "end_year"),)
     
-    def validate_data(self) -> List[str]:
+    def validate_data(self, fields: Optional[Collection[str]] = None) -> List[str]:
         """
         验证艺术运动数据
         
+        Args:
+            fields: 只运行涉及这些字段的校验（部分更新），None 表示完整校验
+        
         Returns:
             List[str]: 验证错误列表
         """
-        errors = super().validate_data()
+        errors = super().validate_data(fields)
         
         # 艺术运动特有验证
-        if not self.name or not self.name.strip():
+        if self._should_check(fields, "name") and (not self.name or not self.name.strip()):
             errors.append("ArtMovement name is required")
         
         # 验证年份逻辑
-        if (self.start_year is not None and self.end_year is not None and 
+        if (self._should_check(fields, "start_year", "end_year") and
+            self.start_year is not None and self.end_year is not None and 
             self.start_year > self.end_year):
             errors.append("Start year cannot be greater than end year")
         
@@ -1,6 +1,6 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Collection
 import pandas as pd
-from .base import BaseModel
+from .base import BaseModel, ModelField, REQUIRED, OPTIONAL, NUMBER, LIST
 
 class Artist(BaseModel):
     """
@@ -10,69 +10,43 @@ class Artist(BaseModel):
     支持AIDA（真实艺术家）和主义主义机（虚构艺术家）两个项目
     """
 
-    def __init__(
-        self,
-        name: str,
-        birth_year: Optional[int] = None,
-        death_year: Optional[int] = None,
-        nationality: Optional[str] = None,
-        bio: Optional[str] = None,
-        avatar_url: Optional[str] = None,
-        notable_works: Optional[List[str]] = None,
-        associated_movements: Optional[List[str]] = None,
-        tags: Optional[List[str]] = None,
-        is_fictional: bool = False,
-        fictional_meta: Optional[Dict[str, Any]] = None,
-        agent: Optional[Dict[str, Any]] = None,
-        **kwargs
-    ):
-        super().__init__(**kwargs)
-        self.name = name
-        self.birth_year = birth_year
-        self.death_year = death_year
-        self.nationality = nationality
-        self.bio = bio
-        self.avatar_url = avatar_url
-        self.notable_works = notable_works or []
-        self.associated_movements = associated_movements or []
-        self.tags = tags or []
-        self.is_fictional = is_fictional
-        self.fictional_meta = fictional_meta
-        self.agent = agent
+    FIELDS = {
+        "name": REQUIRED,
+        "birth_year": NUMBER,
+        "death_year": NUMBER,
+        "nationality": OPTIONAL,
+        "bio": OPTIONAL,
+        "avatar_url": OPTIONAL,
+        "notable_works": LIST,
+        "associated_movements": LIST,
+        "tags": LIST,
+        "is_fictional": ModelField(default=False),
+        "fictional_meta": OPTIONAL,
+        "agent": OPTIONAL,
+    }
+    __slots__ = tuple(FIELDS)
+
+    VALIDATION_GROUPS = (("is_fictional", "fictional_meta"),)
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Artist':
+    def validate_data(self, fields: Optional[Collection[str]] = None) -> List[str]:
         """
-        从字典创建艺术家实例
+        验证艺术家数据
 
         Args:
-            data: 包含艺术家数据的字典
-
-        Returns:
-            Artist: 艺术家实例
-        """
-        # 确保 name 字段存在
-        if 'name' not in data:
-            raise ValueError("Artist data must contain 'name' field")
-
-        # 调用父类方法处理基础字段
-        return super().from_dict(data)
-    
-    def validate_data(self) -> List[str]:
-        """
-        验证艺术家数据
+            fields: 只运行涉及这些字段的校验（部分更新），None 表示完整校验
 
         Returns:
             List[str]: 验证错误列表
         """
-        errors = super().validate_data()
+        errors = super().validate_data(fields)
 
         # 艺术家特有验证
-        if not self.name or not self.name.strip():
+        if self._should_check(fields, "name") and (not self.name or not self.name.strip()):
             errors.append("Artist name is required")
 
         # 虚构艺术家验证
-        if self.is_fictional and self.fictional_meta:
+        if (self._should_check(fields, "is_fictional", "fictional_meta") and
+                self.is_fictional and self.fictional_meta):
             if not self.fictional_meta.get('origin_project'):
                 errors.append("Fictional artist must have origin_project")
 
@@ -1,6 +1,7 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Collection
 import pandas as pd
-from .base import BaseModel
+from .base import BaseModel, REQUIRED, OPTIONAL, NUMBER, LIST
+from app.utils.similarity import cosine_similarity
 
 class Artwork(BaseModel):
     """
@@ -9,63 +10,35 @@ class Artwork(BaseModel):
     用于表示艺术品的基本信息和相关数据
     """
 
-    def __init__(
-        self,
-        title: str,
-        artist_id: str,
-        year: Optional[int] = None,
-        description: Optional[str] = None,
-        image_url: Optional[str] = None,
-        movement_ids: Optional[List[str]] = None,
-        tags: Optional[List[str]] = None,
-        style_vector: Optional[List[float]] = None,
-        **kwargs
-    ):
-        super().__init__(**kwargs)
-        self.title = title
-        self.artist_id = artist_id
-        self.year = year
-        self.description = description
-        self.image_url = image_url
-        self.movement_ids = movement_ids or []
-        self.tags = tags or []
-        self.style_vector = style_vector or []
+    FIELDS = {
+        "title": REQUIRED,
+        "artist_id": REQUIRED,
+        "year": NUMBER,
+        "description": OPTIONAL,
+        "image_url": OPTIONAL,
+        "movement_ids": LIST,
+        "tags": LIST,
+        "style_vector": LIST,
+    }
+    __slots__ = tuple(FIELDS)
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Artwork':
+    def validate_data(self, fields: Optional[Collection[str]] = None) -> List[str]:
         """
-        从字典创建艺术品实例
+        验证艺术品数据
 
         Args:
-            data: 包含艺术品数据的字典
-
-        Returns:
-            Artwork: 艺术品实例
-        """
-        # 确保必填字段存在
-        if 'title' not in data:
-            raise ValueError("Artwork data must contain 'title' field")
-
-        if 'artist_id' not in data:
-            raise ValueError("Artwork data must contain 'artist_id' field")
-
-        # 调用父类方法处理基础字段
-        return super().from_dict(data)
-    
-    def validate_data(self) -> List[str]:
-        """
-        验证艺术品数据
+            fields: 只运行涉及这些字段的校验（部分更新），None 表示完整校验
 
         Returns:
             List[str]: 验证错误列表
         """
-        errors = super().validate_data()
+        errors = super().validate_data(fields)
 
         # 艺术品特有验证
-        if not self.title or not self.title.strip():
+        if self._should_check(fields, "title") and (not self.title or not self.title.strip()):
             errors.append("Artwork title is required")
 
-        if not self.artist_id:
+        if self._should_check(fields, "artist_id") and not self.artist_id:
             errors.append("Artwork artist_id is required")
 
         return errors
@@ -109,17 +82,5 @@ class Artwork(BaseModel):
         Returns:
             float: 相似度分数 (0-1)
         """
-        if not vector1 or not vector2 or len(vector1) != len(vector2):
-            return 0.0
-
-        # 计算余弦相似度
-        import math
-
-        dot_product = sum(a * b for a, b in zip(vector1, vector2))
-        magnitude1 = math.sqrt(sum(a * a for a in vector1))
-        magnitude2 = math.sqrt(sum(b * b for b in vector2))
-
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-
-        return dot_product / (magnitude1 * magnitude2)
\ No newline at end of file
+        # 批量计算请使用 app.utils.similarity 中的一对多 / 多对多接口
+        return cosine_similarity(vector1, vector2)
\ No newline at end of file
@@ -1,89 +1,277 @@
-from typing import Optional, Dict, Any, List
+import keyword
+from typing import Optional, Dict, Any, List, Callable, Collection, NamedTuple, Tuple
 from datetime import datetime
 import pandas as pd
 from bson import ObjectId
 
+from app.utils.query_params import SEARCH_PREFIX_FIELD
+
+
+class ModelField(NamedTuple):
+    """
+    字段定义
+
+    缺省时使用 factory() 或 default；传入的值经 convert 转换；to_dict 时非空值经 serialize 输出。
+    internal 字段（数据库内部字段）保存在槽中，但不由 to_dict 输出。
+    """
+    default: Any = None
+    factory: Optional[Callable[[], Any]] = None
+    convert: Optional[Callable[[Any], Any]] = None
+    serialize: Optional[Callable[[Any], Any]] = None
+    required: bool = False
+    internal: bool = False
+
+
+_MISSING = object()
+
+
+def _parse_datetime(value: Any) -> datetime:
+    """ISO 8601 字符串转为 datetime，空值使用当前时间"""
+    if not value:
+        return datetime.utcnow()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+def _serialize_value(value: Any) -> Any:
+    """datetime 转为 ISO 8601 字符串，ObjectId 转为字符串"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    return value
+
+
+def _nan_to_none(value: Any) -> Any:
+    """NaN 转为 None（NaN 不等于自身）"""
+    return None if isinstance(value, float) and value != value else value
+
+
+def _list_or_empty(value: Any) -> Any:
+    """空值转为空列表"""
+    return value or []
+
+
+# 常用字段定义
+REQUIRED = ModelField(required=True)
+OPTIONAL = ModelField()
+NUMBER = ModelField(convert=_nan_to_none)
+LIST = ModelField(factory=list, convert=_list_or_empty)
+TIMESTAMP = ModelField(factory=datetime.utcnow, convert=_parse_datetime, serialize=_serialize_value)
+
+
+def _compile_init(fields: Dict[str, ModelField]) -> Callable:
+    """
+    生成 __init__：所有字段为仅限关键字参数，必填字段缺失时由 Python 抛出 TypeError，
+    其余关键字参数保存为扩展字段（没有时不分配字典，扩展字段中的 NaN 转为 None）
+    """
+    namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+    params, lines = [], []
+    for name, spec in fields.items():
+        if not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(f"Invalid model field name: '{name}'")
+        convert = factory = None
+        if spec.convert is not None:
+            convert = namespace[f"_convert_{name}"] = spec.convert
+        if spec.factory is not None:
+            factory = namespace[f"_factory_{name}"] = spec.factory
+        
+        if spec.required:
+            params.append(name)
+        elif factory is not None:
+            params.append(f"{name}=_MISSING")
+        else:
+            namespace[f"_default_{name}"] = spec.default
+            params.append(f"{name}=_default_{name}")
+        
+        value = f"_convert_{name}({name})" if convert is not None else name
+        if factory is not None:
+            value = f"_factory_{name}() if {name} is _MISSING else {value}"
+        elif convert is not None:
+            value = f"{name} if {name} is None else {value}"
+        lines.append(f"    self.{name} = {value}")
+    
+    source = (
+        "def __init__(self, *, {}, **extra):\n"
+        "{}\n"
+        "    if extra:\n"
+        "        for key, value in extra.items():\n"
+        "            if isinstance(value, float) and value != value:\n"
+        "                extra[key] = None\n"
+        "        self._extra = extra\n"
+        "    else:\n"
+        "        self._extra = None\n"
+    ).format(", ".join(params), "\n".join(lines))
+    exec(source, namespace)
+    return namespace["__init__"]
+
+
+def _compile_to_dict(fields: Dict[str, ModelField]) -> Callable:
+    """
+    生成 to_dict：声明字段按顺序输出（内部字段除外），只有声明了序列化函数的字段做转换
+    """
+    namespace: Dict[str, Any] = {"_serialize_value": _serialize_value}
+    items = []
+    for name, spec in fields.items():
+        if spec.internal:
+            continue
+        if spec.serialize is None:
+            items.append(f"'{name}': self.{name}")
+        else:
+            namespace[f"_serialize_{name}"] = spec.serialize
+            items.append(f"'{name}': None if self.{name} is None else _serialize_{name}(self.{name})")
+    
+    source = (
+        "def to_dict(self):\n"
+        "    result = {{{}}}\n"
+        "    if self._extra:\n"
+        "        for key, value in self._extra.items():\n"
+        "            if not key.startswith('_'):  # 排除私有属性\n"
+        "                result[key] = _serialize_value(value)\n"
+        "    return result\n"
+    ).format(", ".join(items))
+    exec(source, namespace)
+    return namespace["to_dict"]
+
 
 class BaseModel:
     """
     基础数据模型类
     
-    提供所有数据模型的通用字段和方法
+    提供所有数据模型的通用字段和方法。字段在 FIELDS 中声明（子类的 FIELDS 追加在父类之后），
+    实例用 __slots__ 保存字段值，未声明的扩展字段保存在 extra 字典中，读取时可以像普通属性一样访问。
+    定义子类时按字段定义生成 __init__ 和 to_dict（与 dataclasses 相同的做法），
+    构造和序列化时不再逐个字段判断类型。
     """
     
-    def __init__(
-        self,
-        id: Optional[str] = None,
-        created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None,
-        **kwargs
-    ):
-        self.id = id
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
-        
-        # 存储其他可能的字段
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    FIELDS: Dict[str, ModelField] = {
+        "id": ModelField(serialize=_serialize_value),
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+        # 服务层写入的名称前缀搜索字段，声明为字段以免每个实例都分配扩展字段字典
+        SEARCH_PREFIX_FIELD: ModelField(internal=True),
+    }
+    __slots__ = tuple(FIELDS) + ("_extra",)
+    
+    _REQUIRED_FIELDS: Tuple[str, ...] = ()
+    
+    # 组合校验的字段组：部分更新修改了组内任一字段时，需要其余字段的当前值一起校验
+    VALIDATION_GROUPS: Tuple[Tuple[str, ...], ...] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compile_fields()
+    
+    @classmethod
+    def _compile_fields(cls):
+        fields: Dict[str, ModelField] = {}
+        for klass in reversed(cls.__mro__):
+            fields.update(klass.__dict__.get("FIELDS", {}))
+        cls._REQUIRED_FIELDS = tuple(name for name, spec in fields.items() if spec.required)
+        cls.__init__ = _compile_init(fields)
+        cls.to_dict = _compile_to_dict(fields)
+    
+    @property
+    def extra(self) -> Dict[str, Any]:
+        """扩展字段（首次访问时才分配字典）"""
+        if self._extra is None:
+            self._extra = {}
+        return self._extra
+    
+    def __getattr__(self, name: str) -> Any:
+        # 只有常规属性查找失败时才会调用：从扩展字段中读取
+        if name == "_extra" or name.startswith("__"):
+            raise AttributeError(name)
+        extra = self._extra
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BaseModel':
         """
-        从字典创建模型实例
+        从字典创建模型实例（不修改传入的字典）
         
         Args:
             data: 包含模型数据的字典
             
         Returns:
             BaseModel: 模型实例
+            
+        Raises:
+            ValueError: 缺少必填字段
         """
+        for name in cls._REQUIRED_FIELDS:
+            if name not in data:
+                raise ValueError(f"{cls.__name__} data must contain '{name}' field")
+        
         # 处理 MongoDB ObjectId
         if "_id" in data:
-            data["id"] = str(data["_id"])
-            del data["_id"]
-        
-        # 处理 NaN 值
-        for key, value in data.items():
-            if isinstance(value, float) and pd.isna(value):
-                data[key] = None
+            data = dict(data)
+            data["id"] = str(data.pop("_id"))
         
-        # 处理日期字段
-        if "created_at" in data and isinstance(data["created_at"], str):
-            data["created_at"] = datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
-        if "updated_at" in data and isinstance(data["updated_at"], str):
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
-                
         return cls(**data)
     
+    @classmethod
+    def from_patch(cls, data: Dict[str, Any]) -> 'BaseModel':
+        """
+        从部分更新数据创建用于校验的实例，未提供的必填字段为 None
+        
+        Args:
+            data: 部分更新数据（可合并了现有记录中的相关字段）
+            
+        Returns:
+            BaseModel: 模型实例
+        """
+        missing = {name: None for name in cls._REQUIRED_FIELDS if name not in data}
+        return cls(**missing, **data)
+    
+    @classmethod
+    def patch_context_fields(cls, fields: Collection[str]) -> List[str]:
+        """
+        校验部分更新时还需要读取的现有字段（与被修改字段同组、但本次未修改的字段）
+        
+        Args:
+            fields: 本次修改的字段
+            
+        Returns:
+            List[str]: 需要从现有记录读取的字段，不需要时为空列表
+        """
+        context = []
+        for group in cls.VALIDATION_GROUPS:
+            if not set(group).isdisjoint(fields):
+                context.extend(name for name in group if name not in fields and name not in context)
+        return context
+    
+    @staticmethod
+    def _should_check(fields: Optional[Collection[str]], *names: str) -> bool:
+        """fields 为 None（完整校验）或包含任一字段时运行该项校验"""
+        return fields is None or any(name in fields for name in names)
+    
     def to_dict(self) -> Dict[str, Any]:
         """
-        将模型实例转换为字典
+        将模型实例转换为字典（定义子类时按字段定义重新生成）
         
         Returns:
             Dict[str, Any]: 包含模型数据的字典
         """
-        result = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_'):  # 排除私有属性
-                if isinstance(value, datetime):
-                    result[key] = value.isoformat()
-                elif isinstance(value, ObjectId):
-                    result[key] = str(value)
-                else:
-                    result[key] = value
-        return result
+        raise NotImplementedError
     
-    def validate_data(self) -> List[str]:
+    def validate_data(self, fields: Optional[Collection[str]] = None) -> List[str]:
         """
         验证数据是否符合模型要求
         
+        Args:
+            fields: 只运行涉及这些字段的校验（部分更新），None 表示完整校验
+        
         Returns:
             List[str]: 验证错误列表，如果没有错误则为空列表
         """
         errors = []
         
         # 基础验证 - 子类可以重写此方法添加更多验证
-        if not hasattr(self, 'id') or self.id is None:
+        if self._should_check(fields, "id") and self.id is None:
             errors.append("Missing required field: 'id'")
             
         return errors
@@ -132,3 +320,6 @@ class BaseModel:
             errors.append("DataFrame is empty")
             
         return errors
+
+
+BaseModel._compile_fields()
@@ -35,6 +35,7 @@ class ArtMovement(ArtMovementBase):
     id: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    included: Optional[Dict[str, List[Dict[str, Any]]]] = None  # include 参数展开的关联记录
     
     class Config:
         from_attributes = True
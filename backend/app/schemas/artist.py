@@ -50,6 +50,7 @@ class Artist(ArtistBase):
     id: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    included: Optional[Dict[str, List[Dict[str, Any]]]] = None  # include 参数展开的关联记录
 
     class Config:
         from_attributes = True
@@ -59,6 +60,8 @@ class CSVUploadResponse(BaseModel):
     filename: str
     rows_processed: int
     status: str
+    job_id: Optional[str] = None
+    collection: Optional[str] = None
 
 class QueryParams(BaseModel):
     """查询参数模式"""
@@ -81,10 +84,42 @@ class ArtistDetail(Artist):
     exhibitions: Optional[List[Dict[str, Any]]] = None
     related_artists: Optional[List[Dict[str, Any]]] = None
 
+class SocialNetworkArtist(Artist):
+    """社交网络中的艺术家（带跳数）"""
+    network_distance: Optional[int] = None
+
+class NetworkNode(BaseModel):
+    """社交网络节点"""
+    id: str
+    name: str = ""
+    distance: Optional[int] = None
+    degree: Optional[int] = None
+
+class NetworkNeighborhood(BaseModel):
+    """艺术家的多跳社交网络"""
+    artist_id: str
+    depth: int
+    degree: int
+    nodes: List[NetworkNode] = []
+
+class NetworkPath(BaseModel):
+    """两位艺术家之间的最短连接路径"""
+    found: bool
+    length: Optional[int] = None
+    path: List[NetworkNode] = []
+
+class NetworkStats(BaseModel):
+    """社交网络整体统计"""
+    nodes: int
+    edges: int
+    average_degree: float
+    max_degree: int
+    isolated: int
+
 class AIInteractionRequest(BaseModel):
     """AI交互请求模式"""
     message: str = Field(..., description="用户发送给AI艺术家的消息")
-    artist_id: Optional[int] = Field(None, description="特定艺术家ID，如果为空则使用默认AI艺术家")
+    artist_id: Optional[str] = Field(None, description="特定艺术家ID，如果为空则使用默认AI艺术家")
     
 class AIInteractionResponse(BaseModel):
     """AI交互响应模式"""
@@ -33,6 +33,7 @@ class Artwork(ArtworkBase):
     id: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    included: Optional[Dict[str, List[Dict[str, Any]]]] = None  # include 参数展开的关联记录
 
     class Config:
         from_attributes = True
@@ -53,4 +54,19 @@ class ArtworkDetail(Artwork):
 class SimilarArtworkRequest(BaseModel):
     """相似作品查询请求"""
     threshold: float = Field(0.8, ge=0.0, le=1.0, description="相似度阈值")
-    limit: int = Field(10, ge=1, le=50, description="返回结果数量限制")
\ No newline at end of file
+    limit: int = Field(10, ge=1, le=50, description="返回结果数量限制")
+
+class BatchSimilarArtworkRequest(BaseModel):
+    """批量相似作品查询请求"""
+    artwork_ids: List[str] = Field([], max_length=500, description="作品ID列表")
+    vectors: List[List[float]] = Field([], max_length=500, description="原始风格向量列表")
+    threshold: float = Field(0.8, ge=0.0, le=1.0, description="相似度阈值")
+    top_k: int = Field(10, ge=1, le=50, description="每个查询返回的结果数量")
+
+class SimilarArtworkBatchResult(BaseModel):
+    """单个查询的相似作品结果"""
+    query_id: Optional[str] = None
+    vector_index: Optional[int] = None
+    found: bool
+    error: Optional[str] = None
+    neighbors: List[Dict[str, Any]] = []
@@ -32,13 +32,19 @@ class PaginatedResponse(BaseModel, Generic[T]):
     timestamp: datetime = datetime.utcnow()
     
     # 分页信息
-    total: int = 0
+    total: Optional[int] = 0
     page: int = 1
     page_size: int = 10
     total_pages: int = 0
     has_next: bool = False
     has_prev: bool = False
     
+    # 游标分页
+    next_cursor: Optional[str] = None
+    
+    # 总数统计模式：exact（精确）、estimated（估算/封顶，total 可能为下限）、none（不统计，total 为 null）
+    count_mode: str = "exact"
+    
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
@@ -46,10 +52,12 @@ class PaginatedResponse(BaseModel, Generic[T]):
     
     def __init__(self, **data):
         super().__init__(**data)
-        # 计算分页信息
-        if self.total > 0 and self.page_size > 0:
+        # 计算分页信息（显式传入的 has_next/has_prev 优先，例如游标分页）
+        if self.total and self.page_size > 0:
             self.total_pages = (self.total + self.page_size - 1) // self.page_size
-            self.has_next = self.page < self.total_pages
+            if "has_next" not in data:
+                self.has_next = self.page < self.total_pages
+        if "has_prev" not in data:
             self.has_prev = self.page > 1
 
 
@@ -114,26 +122,40 @@ def create_error_response(message: str, code: int = 400, error_details: dict = N
 
 def create_paginated_response(
     data: List[Any],
-    total: int,
+    total: Optional[int],
     page: int = 1,
     page_size: int = 10,
     message: str = "操作成功",
-    code: int = 200
+    code: int = 200,
+    next_cursor: Optional[str] = None,
+    has_next: Optional[bool] = None,
+    has_prev: Optional[bool] = None,
+    count_mode: str = "exact"
 ) -> PaginatedResponse:
     """
     创建分页响应
     
     Args:
         data: 响应数据列表
-        total: 总记录数
+        total: 总记录数，count_mode 为 none 时为 None
         page: 当前页码
         page_size: 每页大小
         message: 响应消息
         code: 状态码
+        next_cursor: 下一页游标令牌（游标分页）
+        has_next: 是否有下一页，为 None 时根据总数计算
+        has_prev: 是否有上一页，为 None 时根据页码计算
+        count_mode: 总数统计模式
         
     Returns:
         PaginatedResponse: 分页响应
     """
+    extra = {}
+    if has_next is not None:
+        extra["has_next"] = has_next
+    if has_prev is not None:
+        extra["has_prev"] = has_prev
+    
     return PaginatedResponse(
         success=True,
         data=data,
@@ -142,5 +164,8 @@ def create_paginated_response(
         page_size=page_size,
         message=message,
         code=code,
-        timestamp=datetime.utcnow()
+        timestamp=datetime.utcnow(),
+        next_cursor=next_cursor,
+        count_mode=count_mode,
+        **extra
     )
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+class SearchHit(BaseModel):
+    """跨实体搜索命中"""
+    type: str = Field(..., description="实体类型：artist / artwork / movement")
+    id: str
+    title: str = ""
+    score: float = Field(..., description="BM25 得分")
+
+class SearchResults(BaseModel):
+    """跨实体搜索结果"""
+    query: str
+    hits: List[SearchHit] = []
+    took_ms: float = Field(..., description="索引检索耗时（毫秒）")
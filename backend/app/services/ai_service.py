@@ -1,6 +1,6 @@
 from typing import Dict, Any, Optional
 from app.core.config import OPENAI_API_KEY
-from app.services.artist_service import ArtistService
+from app.services.artist_service import AsyncArtistService
 
 class AIService:
     """
@@ -10,7 +10,7 @@ class AIService:
     """
     
     @classmethod
-    def interact(cls, message: str, artist_id: Optional[int] = None) -> Dict[str, Any]:
+    async def interact(cls, message: str, artist_id: Optional[str] = None) -> Dict[str, Any]:
         """
         与 AI 艺术家交互
         
@@ -26,10 +26,10 @@ class AIService:
         artist_name = "AI Leonardo da Vinci"  # 默认 AI 艺术家名称
         
         if artist_id is not None:
-            artist = ArtistService.get_artist_by_id(artist_id)
-            if artist:
-                artist_info = artist
-                artist_name = f"AI {artist['name']}"
+            artist_response = await AsyncArtistService.get_by_id(str(artist_id))
+            if artist_response.success and artist_response.data:
+                artist_info = artist_response.data
+                artist_name = f"AI {artist_info['name']}"
         
         # TODO: 在生产环境中，这里应该集成 OpenAI API 或其他 LLM
         # 目前返回模拟响应
@@ -1,12 +1,13 @@
-from typing import List, Dict, Any, Optional
-import pandas as pd
+from typing import List, Dict, Any, Optional, Tuple
 from bson import json_util
 import json
 
-from app.db.mongodb import get_collection
+from app.db.mongodb import get_collection, get_read_collection, get_async_collection
 from app.models.art_movement import ArtMovement
-from app.core.config import ART_MOVEMENTS_COLLECTION
-from .base_service import BaseService
+from app.core.config import ART_MOVEMENTS_COLLECTION, ARTISTS_COLLECTION, ARTWORKS_COLLECTION
+from app.utils.collection_versions import VersionedSnapshot
+from app.utils.interval_tree import IntervalIndex, IntervalTree
+from .base_service import BaseService, AsyncBaseService
 
 
 class ArtMovementService(BaseService):
@@ -18,53 +19,56 @@ class ArtMovementService(BaseService):
     
     COLLECTION_NAME = ART_MOVEMENTS_COLLECTION
     MODEL_CLASS = ArtMovement
+    SEARCH_FIELDS = ["name", "description", "tags"]
+    SEARCH_ENTITY = "movement"
+    YEAR_FIELD = "start_year"
+    RELATIONS = {
+        "keyArtists": ("key_artists", ARTISTS_COLLECTION),
+        "representativeWorks": ("representative_works", ARTWORKS_COLLECTION)
+    }
+    
+    # 列表视图：艺术运动记录没有大字段，卡片即完整记录
+    LIST_VIEWS = {
+        "summary": {"id": 1, "name": 1, "start_year": 1, "end_year": 1},
+        "card": None,
+        "detail": None
+    }
+    
+    # 时期区间树（进程内，同步与异步服务共用），保存处理后的完整记录，写入后失效、下次查询时重建
+    PERIOD_INDEX = IntervalIndex(ART_MOVEMENTS_COLLECTION)
+    
+    # 物化的时间线（按集合版本号失效）
+    TIMELINE = VersionedSnapshot(ART_MOVEMENTS_COLLECTION)
+    
+    # 时间线条目的投影：只保留时间线需要的字段，成员列表在数据库端折算为数量
+    TIMELINE_PROJECTION = {
+        "_id": 0,
+        "movement_id": "$id",
+        "name": 1,
+        "start_year": 1,
+        "end_year": 1,
+        "key_artists_count": {"$size": {"$ifNull": ["$key_artists", []]}},
+        "representative_works_count": {"$size": {"$ifNull": ["$representative_works", []]}}
+    }
+    TIMELINE_PIPELINE = [
+        {"$sort": {"start_year": 1, "id": 1}},
+        {"$project": TIMELINE_PROJECTION}
+    ]
     
     @classmethod
     def get_movements_by_period(cls, start_year: int, end_year: int) -> List[Dict[str, Any]]:
         """
-        根据时期获取艺术运动
+        根据时期获取艺术运动（与指定时期有重叠，缺失的起止年份视为无界）
         
         Args:
             start_year: 起始年份
             end_year: 结束年份
             
         Returns:
-            List[Dict[str, Any]]: 艺术运动列表
+            List[Dict[str, Any]]: 按开始年份排序的艺术运动列表
         """
-        collection = get_collection(cls.COLLECTION_NAME)
-        
-        # 构建查询条件：运动时期与指定时期有重叠
-        filter_dict = {
-            "$or": [
-                # 运动开始时间在指定时期内
-                {
-                    "start_year": {"$gte": start_year, "$lte": end_year}
-                },
-                # 运动结束时间在指定时期内
-                {
-                    "end_year": {"$gte": start_year, "$lte": end_year}
-                },
-                # 运动跨越整个指定时期
-                {
-                    "start_year": {"$lte": start_year},
-                    "end_year": {"$gte": end_year}
-                },
-                # 没有结束时间的运动（仍在进行）
-                {
-                    "start_year": {"$lte": end_year},
-                    "end_year": None
-                }
-            ]
-        }
-        
-        movements = list(collection.find(filter_dict))
-        
-        processed_movements = []
-        for movement in movements:
-            processed_movement = cls._process_record(movement)
-            processed_movements.append(processed_movement)
-        
-        return processed_movements
+        index = cls.PERIOD_INDEX if cls.PERIOD_INDEX.built else cls._period_tree()
+        return cls._sort_by_period(index.overlap(start_year, end_year))
     
     @classmethod
     def get_active_movements(cls, year: int) -> List[Dict[str, Any]]:
@@ -75,58 +79,127 @@ class ArtMovementService(BaseService):
             year: 指定年份
             
         Returns:
-            List[Dict[str, Any]]: 活跃的艺术运动列表
+            List[Dict[str, Any]]: 按开始年份排序的活跃艺术运动列表
         """
-        collection = get_collection(cls.COLLECTION_NAME)
+        index = cls.PERIOD_INDEX if cls.PERIOD_INDEX.built else cls._period_tree()
+        return cls._sort_by_period(index.stab(year))
+    
+    @classmethod
+    def build_period_index(cls) -> int:
+        """
+        从数据库加载所有艺术运动并重建时期区间树
         
-        filter_dict = {
-            "$and": [
-                {"$or": [{"start_year": None}, {"start_year": {"$lte": year}}]},
-                {"$or": [{"end_year": None}, {"end_year": {"$gte": year}}]}
-            ]
-        }
+        Returns:
+            int: 区间树中的艺术运动数量
+        """
+        return len(cls._period_tree())
+    
+    @classmethod
+    def _period_tree(cls) -> IntervalTree:
+        """
+        从数据库加载所有艺术运动并重建时期区间树，加载期间没有写入时保存到 PERIOD_INDEX
         
-        movements = list(collection.find(filter_dict))
+        Returns:
+            IntervalTree: 重建的区间树
+        """
+        # 区间树按集合版本号保存，从主节点读取，避免以新版本号保存落后从节点上的旧数据
+        version = cls.PERIOD_INDEX.current_version()
+        collection = get_collection(cls.COLLECTION_NAME)
+        return cls._load_period_index(collection.find({}, cls.RECORD_PROJECTION), version)
+    
+    @classmethod
+    def _load_period_index(cls, movements: List[Dict[str, Any]], version: Optional[int]) -> IntervalTree:
+        """
+        用按 RECORD_PROJECTION 查询的记录重建时期区间树（同步与异步实现共用）
+        
+        区间端点取自处理后的记录（NaN 年份已转为 None，视为无界）。
         
-        processed_movements = []
-        for movement in movements:
-            processed_movement = cls._process_record(movement)
-            processed_movements.append(processed_movement)
+        Args:
+            movements: 艺术运动记录
+            version: 加载前读取的集合版本号
+            
+        Returns:
+            IntervalTree: 重建的区间树
+        """
+        movements = cls._process_records(movements, cls.RECORD_PROJECTION)
+        return cls.PERIOD_INDEX.build(
+            ((movement.get("start_year"), movement.get("end_year"), movement) for movement in movements),
+            version
+        )
+    
+    @staticmethod
+    def _sort_by_period(movements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        按开始年份（缺失的排在最前）和ID排序，并复制记录，避免调用方修改缓存
         
-        return processed_movements
+        Args:
+            movements: 区间树返回的记录
+            
+        Returns:
+            List[Dict[str, Any]]: 排序后的记录副本
+        """
+        ordered = sorted(
+            movements,
+            key=lambda movement: (movement.get("start_year") is not None, movement.get("start_year") or 0, movement["id"])
+        )
+        return [dict(movement) for movement in ordered]
+    
+    @classmethod
+    def _after_create(cls, record: Dict[str, Any]):
+        """新建艺术运动后让区间树失效"""
+        super()._after_create(record)
+        cls.PERIOD_INDEX.clear()
+    
+    @classmethod
+    def _after_bulk_create(cls, records: List[Dict[str, Any]]):
+        """批量创建艺术运动后让区间树失效（整批一次）"""
+        super()._after_bulk_create(records)
+        cls.PERIOD_INDEX.clear()
     
     @classmethod
-    def search_movements(cls, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def _after_update(cls, record: Dict[str, Any]):
+        """更新艺术运动后让区间树失效"""
+        super()._after_update(record)
+        cls.PERIOD_INDEX.clear()
+    
+    @classmethod
+    def _after_delete(cls, record_id: str):
+        """删除艺术运动后让区间树失效"""
+        super()._after_delete(record_id)
+        cls.PERIOD_INDEX.clear()
+    
+    @classmethod
+    def _after_bulk_write(cls):
+        """批量导入后让区间树失效"""
+        super()._after_bulk_write()
+        cls.PERIOD_INDEX.clear()
+    
+    @classmethod
+    def _after_partial_update(cls, record_id: str):
+        """成员列表（key_artists、representative_works）变化后让区间树和时间线失效"""
+        super()._after_partial_update(record_id)
+        cls.PERIOD_INDEX.clear()
+    
+    @classmethod
+    def search_movements(cls, query: str, limit: int = 10, mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         搜索艺术运动
         
         Args:
             query: 搜索关键词
             limit: 结果限制数量
+            mode: 搜索模式（text / prefix / regex），为空时使用配置的默认模式
             
         Returns:
-            List[Dict[str, Any]]: 搜索结果
+            List[Dict[str, Any]]: 搜索结果，text 模式下按相关度排序
         """
-        collection = get_collection(cls.COLLECTION_NAME)
+        collection = get_read_collection(cls.COLLECTION_NAME)
+        search = cls._build_search_query(query, mode)
         
-        # 构建搜索条件
-        search_regex = {"$regex": query, "$options": "i"}
-        filter_dict = {
-            "$or": [
-                {"name": search_regex},
-                {"description": search_regex},
-                {"tags": search_regex}
-            ]
-        }
-        
-        movements = list(collection.find(filter_dict).limit(limit))
-        
-        processed_movements = []
-        for movement in movements:
-            processed_movement = cls._process_record(movement)
-            processed_movements.append(processed_movement)
-        
-        return processed_movements
+        cursor = collection.find(search["filter"], search["projection"])
+        if search["sort"]:
+            cursor = cursor.sort(search["sort"])
+        return cls._process_records(cursor.limit(limit), search["projection"])
     
     @classmethod
     def get_movements_by_artist(cls, artist_id: str) -> List[Dict[str, Any]]:
@@ -139,15 +212,7 @@ class ArtMovementService(BaseService):
         Returns:
             List[Dict[str, Any]]: 艺术运动列表
         """
-        collection = get_collection(cls.COLLECTION_NAME)
-        movements = list(collection.find({"key_artists": artist_id}))
-        
-        processed_movements = []
-        for movement in movements:
-            processed_movement = cls._process_record(movement)
-            processed_movements.append(processed_movement)
-        
-        return processed_movements
+        return cls._cached_find("get_movements_by_artist", {"key_artists": artist_id})
     
     @classmethod
     def add_artist_to_movement(cls, movement_id: str, artist_id: str) -> bool:
@@ -168,6 +233,9 @@ class ArtMovementService(BaseService):
             {"$addToSet": {"key_artists": artist_id}}
         )
         
+        if result.modified_count > 0:
+            cls._after_partial_update(movement_id)
+        
         return result.modified_count > 0
     
     @classmethod
@@ -189,6 +257,9 @@ class ArtMovementService(BaseService):
             {"$pull": {"key_artists": artist_id}}
         )
         
+        if result.modified_count > 0:
+            cls._after_partial_update(movement_id)
+        
         return result.modified_count > 0
     
     @classmethod
@@ -210,6 +281,9 @@ class ArtMovementService(BaseService):
             {"$addToSet": {"representative_works": artwork_id}}
         )
         
+        if result.modified_count > 0:
+            cls._after_partial_update(movement_id)
+        
         return result.modified_count > 0
     
     @classmethod
@@ -231,6 +305,9 @@ class ArtMovementService(BaseService):
             {"$pull": {"representative_works": artwork_id}}
         )
         
+        if result.modified_count > 0:
+            cls._after_partial_update(movement_id)
+        
         return result.modified_count > 0
     
     @classmethod
@@ -250,6 +327,21 @@ class ArtMovementService(BaseService):
         if not movement:
             return {}
         
+        return cls._build_statistics(movement)
+    
+    @staticmethod
+    def _build_statistics(movement: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        根据艺术运动记录计算统计信息
+        
+        Args:
+            movement: 艺术运动记录
+            
+        Returns:
+            Dict[str, Any]: 统计信息
+        """
+        movement_id = movement.get("id")
+        
         # 计算统计信息
         stats = {
             "movement_id": movement_id,
@@ -272,16 +364,260 @@ class ArtMovementService(BaseService):
         获取艺术运动时间线
         
         Returns:
-            List[Dict[str, Any]]: 按时间排序的艺术运动列表
+            List[Dict[str, Any]]: 按开始年份排序的时间线条目
+        """
+        timeline, _ = cls.get_timeline_snapshot()
+        return [dict(entry) for entry in timeline]
+    
+    @classmethod
+    def get_timeline_snapshot(cls) -> Tuple[List[Dict[str, Any]], str]:
         """
+        获取物化的时间线及其 ETag，集合版本变化后重新生成
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], str]: (时间线条目, ETag)，条目为共享缓存，调用方不应修改
+        """
+        snapshot = cls.TIMELINE.get()
+        if snapshot is not None:
+            return snapshot
+        
+        # 按集合版本号物化，从主节点读取，避免以新版本号保存落后从节点上的旧数据
+        version = cls.TIMELINE.current_version()
         collection = get_collection(cls.COLLECTION_NAME)
+        timeline = cls._process_records(collection.aggregate(cls.TIMELINE_PIPELINE), cls.TIMELINE_PROJECTION)
+        return cls.TIMELINE.set(version, timeline)
+
+
+class AsyncArtMovementService(AsyncBaseService, ArtMovementService):
+    """
+    异步艺术运动服务类
+    
+    ArtMovementService 的 Motor 异步实现，供 API 路由使用
+    """
+    
+    @classmethod
+    async def get_movements_by_period(cls, start_year: int, end_year: int) -> List[Dict[str, Any]]:
+        """
+        根据时期获取艺术运动
+        
+        Args:
+            start_year: 起始年份
+            end_year: 结束年份
+            
+        Returns:
+            List[Dict[str, Any]]: 艺术运动列表
+        """
+        index = cls.PERIOD_INDEX if cls.PERIOD_INDEX.built else await cls._period_tree_async()
+        return cls._sort_by_period(index.overlap(start_year, end_year))
+    
+    @classmethod
+    async def get_active_movements(cls, year: int) -> List[Dict[str, Any]]:
+        """
+        获取指定年份活跃的艺术运动
+        
+        Args:
+            year: 指定年份
+            
+        Returns:
+            List[Dict[str, Any]]: 活跃的艺术运动列表
+        """
+        index = cls.PERIOD_INDEX if cls.PERIOD_INDEX.built else await cls._period_tree_async()
+        return cls._sort_by_period(index.stab(year))
+    
+    @classmethod
+    async def _build_period_index_async(cls) -> int:
+        """
+        从数据库加载所有艺术运动并重建时期区间树
+        
+        Returns:
+            int: 区间树中的艺术运动数量
+        """
+        return len(await cls._period_tree_async())
+    
+    @classmethod
+    async def _period_tree_async(cls) -> IntervalTree:
+        """
+        从数据库加载所有艺术运动并重建时期区间树，加载期间没有写入时保存到 PERIOD_INDEX
+        
+        Returns:
+            IntervalTree: 重建的区间树
+        """
+        # 区间树按集合版本号保存，从主节点读取，避免以新版本号保存落后从节点上的旧数据
+        version = cls.PERIOD_INDEX.current_version()
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        movements = await collection.find({}, cls.RECORD_PROJECTION).to_list(length=None)
+        return cls._load_period_index(movements, version)
+    
+    @classmethod
+    async def search_movements(cls, query: str, limit: int = 10, mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        搜索艺术运动
+        
+        Args:
+            query: 搜索关键词
+            limit: 结果限制数量
+            mode: 搜索模式（text / prefix / regex），为空时使用配置的默认模式
+            
+        Returns:
+            List[Dict[str, Any]]: 搜索结果，text 模式下按相关度排序
+        """
+        search = cls._build_search_query(query, mode)
+        return await cls._find_records(
+            search["filter"], sort=search["sort"], limit=limit, projection=search["projection"]
+        )
+    
+    @classmethod
+    async def get_movements_by_artist(cls, artist_id: str) -> List[Dict[str, Any]]:
+        """
+        根据艺术家获取相关艺术运动
+        
+        Args:
+            artist_id: 艺术家ID
+            
+        Returns:
+            List[Dict[str, Any]]: 艺术运动列表
+        """
+        return await cls._cached_find_async("get_movements_by_artist", {"key_artists": artist_id})
+    
+    @classmethod
+    async def add_artist_to_movement(cls, movement_id: str, artist_id: str) -> bool:
+        """
+        将艺术家添加到艺术运动
+        
+        Args:
+            movement_id: 艺术运动ID
+            artist_id: 艺术家ID
+            
+        Returns:
+            bool: 是否成功添加
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        
+        result = await collection.update_one(
+            {"id": movement_id},
+            {"$addToSet": {"key_artists": artist_id}}
+        )
+        
+        if result.modified_count > 0:
+            cls._after_partial_update(movement_id)
         
-        # 按开始年份排序
-        movements = list(collection.find().sort("start_year", 1))
+        return result.modified_count > 0
+    
+    @classmethod
+    async def remove_artist_from_movement(cls, movement_id: str, artist_id: str) -> bool:
+        """
+        从艺术运动中移除艺术家
         
-        processed_movements = []
-        for movement in movements:
-            processed_movement = cls._process_record(movement)
-            processed_movements.append(processed_movement)
+        Args:
+            movement_id: 艺术运动ID
+            artist_id: 艺术家ID
+            
+        Returns:
+            bool: 是否成功移除
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        
+        result = await collection.update_one(
+            {"id": movement_id},
+            {"$pull": {"key_artists": artist_id}}
+        )
+        
+        if result.modified_count > 0:
+            cls._after_partial_update(movement_id)
+        
+        return result.modified_count > 0
+    
+    @classmethod
+    async def add_artwork_to_movement(cls, movement_id: str, artwork_id: str) -> bool:
+        """
+        将作品添加到艺术运动的代表作品
         
-        return processed_movements
+        Args:
+            movement_id: 艺术运动ID
+            artwork_id: 作品ID
+            
+        Returns:
+            bool: 是否成功添加
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        
+        result = await collection.update_one(
+            {"id": movement_id},
+            {"$addToSet": {"representative_works": artwork_id}}
+        )
+        
+        if result.modified_count > 0:
+            cls._after_partial_update(movement_id)
+        
+        return result.modified_count > 0
+    
+    @classmethod
+    async def remove_artwork_from_movement(cls, movement_id: str, artwork_id: str) -> bool:
+        """
+        从艺术运动的代表作品中移除作品
+        
+        Args:
+            movement_id: 艺术运动ID
+            artwork_id: 作品ID
+            
+        Returns:
+            bool: 是否成功移除
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        
+        result = await collection.update_one(
+            {"id": movement_id},
+            {"$pull": {"representative_works": artwork_id}}
+        )
+        
+        if result.modified_count > 0:
+            cls._after_partial_update(movement_id)
+        
+        return result.modified_count > 0
+    
+    @classmethod
+    async def get_movement_statistics(cls, movement_id: str) -> Dict[str, Any]:
+        """
+        获取艺术运动统计信息
+        
+        Args:
+            movement_id: 艺术运动ID
+            
+        Returns:
+            Dict[str, Any]: 统计信息
+        """
+        movement = await cls._load_by_id(movement_id)
+        
+        if not movement:
+            return {}
+        
+        return cls._build_statistics(movement)
+    
+    @classmethod
+    async def get_movements_timeline(cls) -> List[Dict[str, Any]]:
+        """
+        获取艺术运动时间线
+        
+        Returns:
+            List[Dict[str, Any]]: 按开始年份排序的时间线条目
+        """
+        timeline, _ = await cls.get_timeline_snapshot()
+        return [dict(entry) for entry in timeline]
+    
+    @classmethod
+    async def get_timeline_snapshot(cls) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        获取物化的时间线及其 ETag，集合版本变化后重新生成
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], str]: (时间线条目, ETag)，条目为共享缓存，调用方不应修改
+        """
+        snapshot = cls.TIMELINE.get()
+        if snapshot is not None:
+            return snapshot
+        
+        # 按集合版本号物化，从主节点读取，避免以新版本号保存落后从节点上的旧数据
+        version = cls.TIMELINE.current_version()
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        timeline = await collection.aggregate(cls.TIMELINE_PIPELINE).to_list(length=None)
+        return cls.TIMELINE.set(version, cls._process_records(timeline, cls.TIMELINE_PROJECTION))
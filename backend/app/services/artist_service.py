@@ -1,12 +1,15 @@
 from typing import List, Dict, Any, Optional
-import pandas as pd
 from bson import json_util
 import json
 
-from app.db.mongodb import get_collection
+from app.db.mongodb import get_collection, get_read_collection, get_async_collection, get_async_read_collection
 from app.models.artist import Artist
-from app.core.config import ARTISTS_COLLECTION
-from .base_service import BaseService
+from app.core.config import (
+    ARTISTS_COLLECTION, ARTWORKS_COLLECTION, ART_MOVEMENTS_COLLECTION,
+    SOCIAL_NETWORK_MAX_DEPTH, SOCIAL_NETWORK_MAX_RESULTS
+)
+from app.utils.artist_graph import ArtistGraph
+from .base_service import BaseService, AsyncBaseService
 
 class ArtistService(BaseService):
     """
@@ -17,6 +20,32 @@ class ArtistService(BaseService):
 
     COLLECTION_NAME = ARTISTS_COLLECTION
     MODEL_CLASS = Artist
+    SEARCH_FIELDS = ["name", "bio", "nationality", "tags"]
+    SEARCH_ENTITY = "artist"
+    YEAR_FIELD = "birth_year"
+    RELATIONS = {
+        "notableWorks": ("notable_works", ARTWORKS_COLLECTION),
+        "associatedMovements": ("associated_movements", ART_MOVEMENTS_COLLECTION)
+    }
+    
+    # 列表视图：卡片省略虚构设定的长文本和 AI 代理的提示词
+    LIST_VIEWS = {
+        "summary": {
+            "id": 1, "name": 1, "birth_year": 1, "death_year": 1,
+            "nationality": 1, "avatar_url": 1, "is_fictional": 1
+        },
+        "card": {
+            "fictional_meta.origin_story": 0,
+            "fictional_meta.model_prompt_seed": 0,
+            "agent.personality_profile": 0,
+            "agent.prompt_seed": 0
+        },
+        "detail": None
+    }
+    
+    # 社交网络图（进程内，同步与异步服务共用）
+    SOCIAL_GRAPH = ArtistGraph(ARTISTS_COLLECTION)
+    SOCIAL_GRAPH_PROJECTION = {"id": 1, "name": 1, "agent.connected_network_ids": 1, "_id": 0}
     
     @classmethod
     def get_artists_by_movement(cls, movement_id: str) -> List[Dict[str, Any]]:
@@ -29,15 +58,7 @@ class ArtistService(BaseService):
         Returns:
             List[Dict[str, Any]]: 艺术家列表
         """
-        collection = get_collection(cls.COLLECTION_NAME)
-        artists = list(collection.find({"associated_movements": movement_id}))
-
-        processed_artists = []
-        for artist in artists:
-            processed_artist = cls._process_record(artist)
-            processed_artists.append(processed_artist)
-
-        return processed_artists
+        return cls._cached_find("get_artists_by_movement", {"associated_movements": movement_id})
     
     @classmethod
     def get_fictional_artists(cls, project: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -50,20 +71,7 @@ class ArtistService(BaseService):
         Returns:
             List[Dict[str, Any]]: 虚构艺术家列表
         """
-        collection = get_collection(cls.COLLECTION_NAME)
-
-        filter_dict = {"is_fictional": True}
-        if project:
-            filter_dict["fictional_meta.origin_project"] = project
-
-        artists = list(collection.find(filter_dict))
-
-        processed_artists = []
-        for artist in artists:
-            processed_artist = cls._process_record(artist)
-            processed_artists.append(processed_artist)
-
-        return processed_artists
+        return cls._cached_find("get_fictional_artists", cls._build_fictional_filter(project))
     
     @classmethod
     def get_real_artists(cls) -> List[Dict[str, Any]]:
@@ -73,61 +81,78 @@ class ArtistService(BaseService):
         Returns:
             List[Dict[str, Any]]: 真实艺术家列表
         """
-        collection = get_collection(cls.COLLECTION_NAME)
-        artists = list(collection.find({"is_fictional": {"$ne": True}}))
-
-        processed_artists = []
-        for artist in artists:
-            processed_artist = cls._process_record(artist)
-            processed_artists.append(processed_artist)
-
-        return processed_artists
+        return cls._cached_find("get_real_artists", {"is_fictional": {"$ne": True}})
     
     @classmethod
-    def search_artists(cls, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def search_artists(cls, query: str, limit: int = 10, mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         搜索艺术家
 
         Args:
             query: 搜索关键词
             limit: 结果限制数量
+            mode: 搜索模式（text / prefix / regex），为空时使用配置的默认模式
 
         Returns:
-            List[Dict[str, Any]]: 搜索结果
+            List[Dict[str, Any]]: 搜索结果，text 模式下按相关度排序
         """
-        collection = get_collection(cls.COLLECTION_NAME)
+        collection = get_read_collection(cls.COLLECTION_NAME)
+        search = cls._build_search_query(query, mode)
 
-        # 构建搜索条件
-        search_regex = {"$regex": query, "$options": "i"}
-        filter_dict = {
-            "$or": [
-                {"name": search_regex},
-                {"bio": search_regex},
-                {"nationality": search_regex},
-                {"tags": search_regex}
-            ]
-        }
+        cursor = collection.find(search["filter"], search["projection"])
+        if search["sort"]:
+            cursor = cursor.sort(search["sort"])
+        return cls._process_records(cursor.limit(limit), search["projection"])
+    
+    @staticmethod
+    def _build_fictional_filter(project: Optional[str] = None) -> Dict[str, Any]:
+        """
+        构建虚构艺术家查询条件
 
-        artists = list(collection.find(filter_dict).limit(limit))
+        Args:
+            project: 项目名称筛选
 
-        processed_artists = []
-        for artist in artists:
-            processed_artist = cls._process_record(artist)
-            processed_artists.append(processed_artist)
+        Returns:
+            Dict[str, Any]: MongoDB查询过滤器
+        """
+        filter_dict = {"is_fictional": True}
+        if project:
+            filter_dict["fictional_meta.origin_project"] = project
+        return filter_dict
 
-        return processed_artists
-    
     @classmethod
-    def get_artist_social_network(cls, artist_id: str) -> List[Dict[str, Any]]:
+    def get_artist_social_network(
+        cls,
+        artist_id: str,
+        depth: int = 1,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         获取艺术家的社交网络
 
+        depth 为 1 时只查询直接连接；大于 1 时在数据库端用 $graphLookup 沿
+        agent.connected_network_ids 遍历，无需把整张网络加载到 API 进程。
+        结果带 network_distance（跳数），按距离、ID排序。
+
         Args:
             artist_id: 艺术家ID
+            depth: 最大跳数
+            fields: 返回的字段（id、name 总会返回），为空时返回完整记录
+            limit: 结果数量限制，多跳遍历时不超过 SOCIAL_NETWORK_MAX_RESULTS
 
         Returns:
             List[Dict[str, Any]]: 连接的艺术家列表
+
+        Raises:
+            ValueError: 跳数超出范围
         """
+        limit = cls._social_network_limit(depth, limit)
+        if depth > 1:
+            collection = get_read_collection(cls.COLLECTION_NAME)
+            pipeline = cls._build_social_network_pipeline(artist_id, depth, fields, limit)
+            return [cls._process_record(artist) for artist in collection.aggregate(pipeline)]
+
         collection = get_collection(cls.COLLECTION_NAME)
 
         # 获取艺术家信息
@@ -137,15 +162,278 @@ class ArtistService(BaseService):
 
         # 获取连接的艺术家
         connected_ids = artist["agent"]["connected_network_ids"]
-        connected_artists = list(collection.find({"id": {"$in": connected_ids}}))
+        cursor = collection.find({"id": {"$in": connected_ids}}, cls._social_network_projection(fields))
+        if limit:
+            cursor = cursor.sort("id", 1).limit(limit)
+        connected_artists = list(cursor)
 
         processed_artists = []
         for connected_artist in connected_artists:
             processed_artist = cls._process_record(connected_artist)
+            processed_artist["network_distance"] = 1
             processed_artists.append(processed_artist)
 
         return processed_artists
-    
+
+    @staticmethod
+    def _social_network_limit(depth: int, limit: Optional[int]) -> Optional[int]:
+        """
+        校验跳数并确定结果数量限制
+
+        Args:
+            depth: 最大跳数
+            limit: 请求的结果数量限制
+
+        Returns:
+            Optional[int]: 实际使用的限制，直接连接且未指定时为 None（不限制）
+
+        Raises:
+            ValueError: 跳数超出范围
+        """
+        if depth < 1 or depth > SOCIAL_NETWORK_MAX_DEPTH:
+            raise ValueError(f"depth must be between 1 and {SOCIAL_NETWORK_MAX_DEPTH}")
+        if depth == 1:
+            return limit
+        return min(limit or SOCIAL_NETWORK_MAX_RESULTS, SOCIAL_NETWORK_MAX_RESULTS)
+
+    @staticmethod
+    def _social_network_projection(fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+        """
+        构建社交网络结果的字段投影
+
+        Args:
+            fields: 返回的字段
+
+        Returns:
+            Optional[Dict[str, int]]: 字段投影，未指定字段时为 None
+        """
+        if not fields:
+            return None
+        projection = {"_id": 0, "id": 1, "name": 1, "network_distance": 1}
+        for field in fields:
+            projection[field] = 1
+        return projection
+
+    @classmethod
+    def _build_social_network_pipeline(
+        cls,
+        artist_id: str,
+        depth: int,
+        fields: Optional[List[str]],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        构建 $graphLookup 多跳遍历的聚合管道
+
+        连接按文档声明的方向（agent.connected_network_ids）遍历。$unwind 紧跟 $graphLookup，
+        MongoDB 会把两者合并执行，遍历结果不受单个文档 16MB 的限制；遍历本身仍受
+        $graphLookup 100MB 内存限制，因此跳数和结果数量都有上限。
+
+        Args:
+            artist_id: 起点艺术家ID
+            depth: 最大跳数（大于 1）
+            fields: 返回的字段
+            limit: 结果数量限制
+
+        Returns:
+            List[Dict[str, Any]]: 聚合管道
+        """
+        return [
+            {"$match": {"id": artist_id}},
+            {"$project": {"_id": 0, "agent.connected_network_ids": 1}},
+            {"$graphLookup": {
+                "from": cls.COLLECTION_NAME,
+                "startWith": "$agent.connected_network_ids",
+                "connectFromField": "agent.connected_network_ids",
+                "connectToField": "id",
+                "as": "network",
+                "maxDepth": depth - 1,
+                "depthField": "network_depth"
+            }},
+            {"$unwind": "$network"},
+            {"$replaceRoot": {"newRoot": "$network"}},
+            # 环路可能回到起点
+            {"$match": {"id": {"$ne": artist_id}}},
+            {"$addFields": {"network_distance": {"$add": ["$network_depth", 1]}}},
+            {"$sort": {"network_distance": 1, "id": 1}},
+            {"$limit": limit},
+            {"$project": cls._social_network_projection(fields) or {"_id": 0, "network_depth": 0}}
+        ]
+
+    @classmethod
+    def build_social_graph(cls) -> int:
+        """
+        从数据库加载所有艺术家的连接并重建社交网络图（应用启动时调用）
+
+        图随写入增量更新，从主节点读取；加载期间发生写入时不标记为已构建（见 ArtistGraph.build）。
+
+        Returns:
+            int: 图中的艺术家数量
+        """
+        version = cls.SOCIAL_GRAPH.current_version()
+        collection = get_collection(cls.COLLECTION_NAME)
+        cls.SOCIAL_GRAPH.build(
+            (cls._graph_entry(artist) for artist in collection.find({}, cls.SOCIAL_GRAPH_PROJECTION)),
+            version
+        )
+        return len(cls.SOCIAL_GRAPH)
+
+    @staticmethod
+    def _graph_entry(artist: Dict[str, Any]) -> tuple:
+        """
+        将艺术家记录转换为图节点
+
+        Args:
+            artist: 艺术家记录
+
+        Returns:
+            tuple: (艺术家ID, 名称, 连接ID列表)
+        """
+        connected_ids = (artist.get("agent") or {}).get("connected_network_ids") or []
+        return artist["id"], artist.get("name", ""), connected_ids
+
+    @classmethod
+    def get_network_neighborhood(cls, artist_id: str, depth: int = 2, limit: int = 100) -> Optional[Dict[str, Any]]:
+        """
+        获取艺术家 depth 跳以内的社交网络
+
+        Args:
+            artist_id: 艺术家ID
+            depth: 最大跳数
+            limit: 返回数量上限
+
+        Returns:
+            Optional[Dict[str, Any]]: 邻域节点（按距离排序），艺术家不存在时返回 None
+        """
+        if not cls.SOCIAL_GRAPH.built:
+            cls.build_social_graph()
+        return cls._network_neighborhood(artist_id, depth, limit)
+
+    @classmethod
+    def get_mutual_connections(cls, artist_id: str, other_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        获取两位艺术家的共同连接
+
+        Args:
+            artist_id: 艺术家ID
+            other_id: 另一位艺术家ID
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: 共同连接，任一艺术家不存在时返回 None
+        """
+        if not cls.SOCIAL_GRAPH.built:
+            cls.build_social_graph()
+        return cls._mutual_connections(artist_id, other_id)
+
+    @classmethod
+    def get_shortest_path(cls, artist_id: str, other_id: str, max_depth: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        获取两位艺术家之间的最短连接路径
+
+        Args:
+            artist_id: 起点艺术家ID
+            other_id: 终点艺术家ID
+            max_depth: 最大跳数
+
+        Returns:
+            Optional[Dict[str, Any]]: 路径信息，任一艺术家不存在时返回 None
+        """
+        if not cls.SOCIAL_GRAPH.built:
+            cls.build_social_graph()
+        return cls._shortest_path(artist_id, other_id, max_depth)
+
+    @classmethod
+    def get_network_stats(cls) -> Dict[str, Any]:
+        """
+        获取社交网络的整体统计
+
+        Returns:
+            Dict[str, Any]: 节点数、边数、度数统计
+        """
+        if not cls.SOCIAL_GRAPH.built:
+            cls.build_social_graph()
+        return cls.SOCIAL_GRAPH.stats()
+
+    @classmethod
+    def _network_node(cls, artist_id: str, **extra) -> Dict[str, Any]:
+        """
+        构建图节点的响应数据（同步与异步实现共用）
+
+        Args:
+            artist_id: 艺术家ID
+            **extra: 附加字段
+
+        Returns:
+            Dict[str, Any]: 节点数据
+        """
+        return {"id": artist_id, "name": cls.SOCIAL_GRAPH.name(artist_id), **extra}
+
+    @classmethod
+    def _network_neighborhood(cls, artist_id: str, depth: int, limit: int) -> Optional[Dict[str, Any]]:
+        """在已构建的图上查询邻域（同步与异步实现共用）"""
+        if artist_id not in cls.SOCIAL_GRAPH:
+            return None
+        reached = cls.SOCIAL_GRAPH.k_hop(artist_id, depth, limit)
+        return {
+            "artist_id": artist_id,
+            "depth": depth,
+            "degree": cls.SOCIAL_GRAPH.degree(artist_id),
+            "nodes": [
+                cls._network_node(node_id, distance=distance, degree=cls.SOCIAL_GRAPH.degree(node_id))
+                for node_id, distance in reached
+            ]
+        }
+
+    @classmethod
+    def _mutual_connections(cls, artist_id: str, other_id: str) -> Optional[List[Dict[str, Any]]]:
+        """在已构建的图上查询共同连接（同步与异步实现共用）"""
+        if artist_id not in cls.SOCIAL_GRAPH or other_id not in cls.SOCIAL_GRAPH:
+            return None
+        return [cls._network_node(node_id) for node_id in cls.SOCIAL_GRAPH.mutual(artist_id, other_id)]
+
+    @classmethod
+    def _shortest_path(cls, artist_id: str, other_id: str, max_depth: Optional[int]) -> Optional[Dict[str, Any]]:
+        """在已构建的图上查询最短路径（同步与异步实现共用）"""
+        if artist_id not in cls.SOCIAL_GRAPH or other_id not in cls.SOCIAL_GRAPH:
+            return None
+        path = cls.SOCIAL_GRAPH.shortest_path(artist_id, other_id, max_depth)
+        return {
+            "found": path is not None,
+            "length": len(path) - 1 if path else None,
+            "path": [cls._network_node(node_id) for node_id in path or []]
+        }
+
+    @classmethod
+    def _after_create(cls, record: Dict[str, Any]):
+        """新艺术家写入社交网络图"""
+        super()._after_create(record)
+        cls.SOCIAL_GRAPH.upsert(*cls._graph_entry(record), if_built=True)
+
+    @classmethod
+    def _after_bulk_create(cls, records: List[Dict[str, Any]]):
+        """批量创建的艺术家写入社交网络图"""
+        super()._after_bulk_create(records)
+        for record in records:
+            cls.SOCIAL_GRAPH.upsert(*cls._graph_entry(record), if_built=True)
+
+    @classmethod
+    def _after_update(cls, record: Dict[str, Any]):
+        """同步更新后的名称和连接"""
+        super()._after_update(record)
+        cls.SOCIAL_GRAPH.upsert(*cls._graph_entry(record), if_built=True)
+
+    @classmethod
+    def _after_delete(cls, record_id: str):
+        """从社交网络图中移除已删除的艺术家"""
+        super()._after_delete(record_id)
+        cls.SOCIAL_GRAPH.remove(record_id)
+
+    @classmethod
+    def _after_bulk_write(cls):
+        """批量导入后让社交网络图失效，下一次查询时重新加载"""
+        super()._after_bulk_write()
+        cls.SOCIAL_GRAPH.clear()
+
     @classmethod
     def add_artist_to_movement(cls, artist_id: str, movement_id: str) -> bool:
         """
@@ -165,6 +453,9 @@ class ArtistService(BaseService):
             {"$addToSet": {"associated_movements": movement_id}}
         )
 
+        if result.modified_count > 0:
+            cls._after_partial_update(artist_id)
+
         return result.modified_count > 0
 
     @classmethod
@@ -186,4 +477,238 @@ class ArtistService(BaseService):
             {"$pull": {"associated_movements": movement_id}}
         )
 
-        return result.modified_count > 0
\ No newline at end of file
+        if result.modified_count > 0:
+            cls._after_partial_update(artist_id)
+
+        return result.modified_count > 0
+
+
+class AsyncArtistService(AsyncBaseService, ArtistService):
+    """
+    异步艺术家服务类
+
+    ArtistService 的 Motor 异步实现，供 API 路由使用
+    """
+
+    @classmethod
+    async def get_artists_by_movement(cls, movement_id: str) -> List[Dict[str, Any]]:
+        """
+        根据艺术运动获取艺术家
+
+        Args:
+            movement_id: 艺术运动ID
+
+        Returns:
+            List[Dict[str, Any]]: 艺术家列表
+        """
+        return await cls._cached_find_async("get_artists_by_movement", {"associated_movements": movement_id})
+
+    @classmethod
+    async def get_fictional_artists(cls, project: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        获取虚构艺术家
+
+        Args:
+            project: 项目名称筛选
+
+        Returns:
+            List[Dict[str, Any]]: 虚构艺术家列表
+        """
+        return await cls._cached_find_async("get_fictional_artists", cls._build_fictional_filter(project))
+
+    @classmethod
+    async def get_real_artists(cls) -> List[Dict[str, Any]]:
+        """
+        获取真实艺术家
+
+        Returns:
+            List[Dict[str, Any]]: 真实艺术家列表
+        """
+        return await cls._cached_find_async("get_real_artists", {"is_fictional": {"$ne": True}})
+
+    @classmethod
+    async def search_artists(cls, query: str, limit: int = 10, mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        搜索艺术家
+
+        Args:
+            query: 搜索关键词
+            limit: 结果限制数量
+            mode: 搜索模式（text / prefix / regex），为空时使用配置的默认模式
+
+        Returns:
+            List[Dict[str, Any]]: 搜索结果，text 模式下按相关度排序
+        """
+        search = cls._build_search_query(query, mode)
+        return await cls._find_records(
+            search["filter"], sort=search["sort"], limit=limit, projection=search["projection"]
+        )
+
+    @classmethod
+    async def get_artist_social_network(
+        cls,
+        artist_id: str,
+        depth: int = 1,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        获取艺术家的社交网络
+
+        Args:
+            artist_id: 艺术家ID
+            depth: 最大跳数，大于 1 时使用 $graphLookup 在数据库端遍历
+            fields: 返回的字段（id、name 总会返回），为空时返回完整记录
+            limit: 结果数量限制
+
+        Returns:
+            List[Dict[str, Any]]: 连接的艺术家列表（带 network_distance）
+
+        Raises:
+            ValueError: 跳数超出范围
+        """
+        limit = cls._social_network_limit(depth, limit)
+        if depth > 1:
+            collection = get_async_read_collection(cls.COLLECTION_NAME)
+            pipeline = cls._build_social_network_pipeline(artist_id, depth, fields, limit)
+            artists = await collection.aggregate(pipeline).to_list(length=None)
+            return [cls._process_record(artist) for artist in artists]
+
+        artist = await cls._load_by_id(artist_id)
+        if not artist or not (artist.get("agent") or {}).get("connected_network_ids"):
+            return []
+
+        connected_ids = artist["agent"]["connected_network_ids"]
+        artists = await cls._find_records(
+            {"id": {"$in": connected_ids}},
+            sort=[("id", 1)] if limit else None,
+            limit=limit or 0,
+            projection=cls._social_network_projection(fields)
+        )
+        for connected_artist in artists:
+            connected_artist["network_distance"] = 1
+        return artists
+
+    @classmethod
+    async def _build_social_graph_async(cls) -> int:
+        """
+        从数据库加载所有艺术家的连接并重建社交网络图（从主节点读取，并做版本检查，同 build_social_graph）
+
+        Returns:
+            int: 图中的艺术家数量
+        """
+        version = cls.SOCIAL_GRAPH.current_version()
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        artists = await collection.find({}, cls.SOCIAL_GRAPH_PROJECTION).to_list(length=None)
+        cls.SOCIAL_GRAPH.build((cls._graph_entry(artist) for artist in artists), version)
+        return len(cls.SOCIAL_GRAPH)
+
+    @classmethod
+    async def get_network_neighborhood(cls, artist_id: str, depth: int = 2, limit: int = 100) -> Optional[Dict[str, Any]]:
+        """
+        获取艺术家 depth 跳以内的社交网络
+
+        Args:
+            artist_id: 艺术家ID
+            depth: 最大跳数
+            limit: 返回数量上限
+
+        Returns:
+            Optional[Dict[str, Any]]: 邻域节点（按距离排序），艺术家不存在时返回 None
+        """
+        if not cls.SOCIAL_GRAPH.built:
+            await cls._build_social_graph_async()
+        return cls._network_neighborhood(artist_id, depth, limit)
+
+    @classmethod
+    async def get_mutual_connections(cls, artist_id: str, other_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        获取两位艺术家的共同连接
+
+        Args:
+            artist_id: 艺术家ID
+            other_id: 另一位艺术家ID
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: 共同连接，任一艺术家不存在时返回 None
+        """
+        if not cls.SOCIAL_GRAPH.built:
+            await cls._build_social_graph_async()
+        return cls._mutual_connections(artist_id, other_id)
+
+    @classmethod
+    async def get_shortest_path(cls, artist_id: str, other_id: str, max_depth: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        获取两位艺术家之间的最短连接路径
+
+        Args:
+            artist_id: 起点艺术家ID
+            other_id: 终点艺术家ID
+            max_depth: 最大跳数
+
+        Returns:
+            Optional[Dict[str, Any]]: 路径信息，任一艺术家不存在时返回 None
+        """
+        if not cls.SOCIAL_GRAPH.built:
+            await cls._build_social_graph_async()
+        return cls._shortest_path(artist_id, other_id, max_depth)
+
+    @classmethod
+    async def get_network_stats(cls) -> Dict[str, Any]:
+        """
+        获取社交网络的整体统计
+
+        Returns:
+            Dict[str, Any]: 节点数、边数、度数统计
+        """
+        if not cls.SOCIAL_GRAPH.built:
+            await cls._build_social_graph_async()
+        return cls.SOCIAL_GRAPH.stats()
+
+    @classmethod
+    async def add_artist_to_movement(cls, artist_id: str, movement_id: str) -> bool:
+        """
+        将艺术家添加到艺术运动
+
+        Args:
+            artist_id: 艺术家ID
+            movement_id: 艺术运动ID
+
+        Returns:
+            bool: 是否成功添加
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+
+        result = await collection.update_one(
+            {"id": artist_id},
+            {"$addToSet": {"associated_movements": movement_id}}
+        )
+
+        if result.modified_count > 0:
+            cls._after_partial_update(artist_id)
+
+        return result.modified_count > 0
+
+    @classmethod
+    async def remove_artist_from_movement(cls, artist_id: str, movement_id: str) -> bool:
+        """
+        从艺术运动中移除艺术家
+
+        Args:
+            artist_id: 艺术家ID
+            movement_id: 艺术运动ID
+
+        Returns:
+            bool: 是否成功移除
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+
+        result = await collection.update_one(
+            {"id": artist_id},
+            {"$pull": {"associated_movements": movement_id}}
+        )
+
+        if result.modified_count > 0:
+            cls._after_partial_update(artist_id)
+
+        return result.modified_count > 0
@@ -1,14 +1,14 @@
-from typing import List, Dict, Any, Optional
-import pandas as pd
+from typing import List, Dict, Any, Optional, Tuple
 from bson import json_util
 import json
 import os
 from pymongo.collection import Collection
 
-from app.db.mongodb import get_collection
+from app.db.mongodb import get_collection, get_read_collection, get_async_collection, get_async_read_collection
 from app.models.artwork import Artwork
-from app.core.config import ARTWORKS_COLLECTION
-from .base_service import BaseService
+from app.core.config import ARTWORKS_COLLECTION, ARTISTS_COLLECTION, ART_MOVEMENTS_COLLECTION
+from app.utils.vector_index import StyleVectorIndex
+from .base_service import BaseService, AsyncBaseService
 
 class ArtworkService(BaseService):
     """
@@ -19,6 +19,24 @@ class ArtworkService(BaseService):
 
     COLLECTION_NAME = ARTWORKS_COLLECTION
     MODEL_CLASS = Artwork
+    SEARCH_FIELDS = ["title", "description", "tags"]
+    PREFIX_SOURCE_FIELD = "title"
+    SEARCH_ENTITY = "artwork"
+    YEAR_FIELD = "year"
+    RELATIONS = {
+        "artist": ("artist_id", ARTISTS_COLLECTION),
+        "movements": ("movement_ids", ART_MOVEMENTS_COLLECTION)
+    }
+    
+    # 列表视图：风格向量只在 detail 视图或 fields 中显式指定时返回
+    LIST_VIEWS = {
+        "summary": {"id": 1, "title": 1, "artist_id": 1, "year": 1, "image_url": 1},
+        "card": {"style_vector": 0},
+        "detail": None
+    }
+
+    # 风格向量索引（进程内，同步与异步服务共用）
+    STYLE_INDEX = StyleVectorIndex(ARTWORKS_COLLECTION)
     
     @classmethod
     def get_artworks_by_artist(cls, artist_id: str) -> List[Dict[str, Any]]:
@@ -31,15 +49,7 @@ class ArtworkService(BaseService):
         Returns:
             List[Dict[str, Any]]: 作品列表
         """
-        collection = get_collection(cls.COLLECTION_NAME)
-        artworks = list(collection.find({"artist_id": artist_id}))
-
-        processed_artworks = []
-        for artwork in artworks:
-            processed_artwork = cls._process_record(artwork)
-            processed_artworks.append(processed_artwork)
-
-        return processed_artworks
+        return cls._cached_find("get_artworks_by_artist", {"artist_id": artist_id})
     
     @classmethod
     def get_artworks_by_movement(cls, movement_id: str) -> List[Dict[str, Any]]:
@@ -52,21 +62,15 @@ class ArtworkService(BaseService):
         Returns:
             List[Dict[str, Any]]: 作品列表
         """
-        collection = get_collection(cls.COLLECTION_NAME)
-        artworks = list(collection.find({"movement_ids": movement_id}))
-
-        processed_artworks = []
-        for artwork in artworks:
-            processed_artwork = cls._process_record(artwork)
-            processed_artworks.append(processed_artwork)
-
-        return processed_artworks
+        return cls._cached_find("get_artworks_by_movement", {"movement_ids": movement_id})
     
     @classmethod
     def get_similar_artworks(cls, artwork_id: str, threshold: float = 0.8, limit: int = 10) -> List[Dict[str, Any]]:
         """
         根据风格向量获取相似作品
 
+        通过内存向量索引检索，索引未构建时先从数据库加载。
+
         Args:
             artwork_id: 作品ID
             threshold: 相似度阈值
@@ -75,41 +79,247 @@ class ArtworkService(BaseService):
         Returns:
             List[Dict[str, Any]]: 相似作品列表
         """
+        if not cls.STYLE_INDEX.built:
+            cls.build_style_index()
+
+        neighbors = cls._search_style_index(artwork_id, threshold, limit)
+        if not neighbors:
+            return []
+
+        collection = get_read_collection(cls.COLLECTION_NAME)
+        artworks = list(collection.find({"id": {"$in": [record_id for record_id, _ in neighbors]}}))
+
+        return cls._attach_similarity(neighbors, artworks)
+
+    @classmethod
+    def get_similar_artworks_batch(
+        cls,
+        artwork_ids: Optional[List[str]] = None,
+        vectors: Optional[List[List[float]]] = None,
+        threshold: float = 0.8,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        批量获取相似作品
+
+        所有查询在向量索引上分块做矩阵乘法，近邻作品用一次 $in 查询取回。
+
+        Args:
+            artwork_ids: 作品ID列表（结果中排除作品自身）
+            vectors: 原始风格向量列表
+            threshold: 相似度阈值
+            limit: 每个查询的结果数量
+
+        Returns:
+            List[Dict[str, Any]]: 与查询一一对应的结果，先作品ID后原始向量
+        """
+        if not cls.STYLE_INDEX.built:
+            cls.build_style_index()
+
+        queries = cls._batch_similarity_queries(artwork_ids, vectors)
+        neighbor_lists = cls.STYLE_INDEX.search_many(
+            [query["vector"] for query in queries],
+            top_k=limit,
+            threshold=threshold,
+            exclude_ids=[query["query_id"] for query in queries]
+        )
+
+        neighbor_ids = list({record_id for neighbors in neighbor_lists for record_id, _ in neighbors})
+        artworks = []
+        if neighbor_ids:
+            collection = get_read_collection(cls.COLLECTION_NAME)
+            artworks = list(collection.find({"id": {"$in": neighbor_ids}}))
+
+        return cls._build_batch_similarity_results(queries, neighbor_lists, artworks)
+
+    @classmethod
+    def _batch_similarity_queries(
+        cls,
+        artwork_ids: Optional[List[str]],
+        vectors: Optional[List[List[float]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        将作品ID和原始向量整理为批量查询列表（作品ID从向量索引中取向量）
+
+        Args:
+            artwork_ids: 作品ID列表
+            vectors: 原始风格向量列表
+
+        Returns:
+            List[Dict[str, Any]]: 查询列表，包含 query_id、vector_index 和 vector
+        """
+        queries = [
+            {"query_id": artwork_id, "vector_index": None, "vector": cls.STYLE_INDEX.get_vector(artwork_id)}
+            for artwork_id in (artwork_ids or [])
+        ]
+        queries.extend(
+            {"query_id": None, "vector_index": index, "vector": vector}
+            for index, vector in enumerate(vectors or [])
+        )
+        return queries
+
+    @classmethod
+    def _build_batch_similarity_results(
+        cls,
+        queries: List[Dict[str, Any]],
+        neighbor_lists: List[List[Tuple[str, float]]],
+        artworks: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        组装批量相似作品结果
+
+        没有可用向量的查询（作品不在索引中、空向量、维度与索引不一致）返回 found=False 和 error，
+        与确实没有近邻的查询区分开。
+
+        Args:
+            queries: 查询列表
+            neighbor_lists: 与查询一一对应的 (作品ID, 相似度) 列表
+            artworks: 所有近邻作品记录
+
+        Returns:
+            List[Dict[str, Any]]: 批量查询结果
+        """
+        artworks_by_id = {artwork["id"]: cls._process_record(artwork) for artwork in artworks}
+
+        results = []
+        for query, neighbors in zip(queries, neighbor_lists):
+            error = cls._batch_query_error(query)
+            results.append({
+                "query_id": query["query_id"],
+                "vector_index": query["vector_index"],
+                "found": error is None,
+                "error": error,
+                "neighbors": [
+                    {**artworks_by_id[record_id], "similarity_score": score}
+                    for record_id, score in neighbors
+                    if record_id in artworks_by_id
+                ]
+            })
+        return results
+
+    @classmethod
+    def _batch_query_error(cls, query: Dict[str, Any]) -> Optional[str]:
+        """
+        检查批量查询是否有可用的查询向量
+
+        Args:
+            query: 查询（见 _batch_similarity_queries）
+
+        Returns:
+            Optional[str]: 错误信息，向量可用时为 None
+        """
+        vector = query["vector"]
+        if query["query_id"] is not None and vector is None:
+            return f"Artwork {query['query_id']} has no style vector in the index"
+        if vector is None or len(vector) == 0:
+            return "Empty style vector"
+        dimension = cls.STYLE_INDEX.dimension
+        if dimension is not None and len(vector) != dimension:
+            return f"Vector dimension {len(vector)} does not match style index dimension {dimension}"
+        return None
+
+    @classmethod
+    def build_style_index(cls) -> int:
+        """
+        从数据库加载所有风格向量并重建索引（应用启动时调用）
+
+        索引随写入增量更新，从主节点读取；加载期间发生写入时不标记为已构建（见 StyleVectorIndex.build）。
+
+        Returns:
+            int: 索引中的向量数量
+        """
+        version = cls.STYLE_INDEX.current_version()
         collection = get_collection(cls.COLLECTION_NAME)
+        cursor = collection.find(
+            {"style_vector": {"$exists": True, "$ne": []}},
+            {"id": 1, "style_vector": 1, "_id": 0}
+        )
+        cls.STYLE_INDEX.build(((doc["id"], doc.get("style_vector")) for doc in cursor), version)
+        return len(cls.STYLE_INDEX)
+
+    @classmethod
+    def _search_style_index(cls, artwork_id: str, threshold: float, limit: int) -> List[Tuple[str, float]]:
+        """
+        在向量索引中检索目标作品的近邻
+
+        Args:
+            artwork_id: 作品ID
+            threshold: 相似度阈值
+            limit: 结果限制数量
 
-        # 获取目标作品
-        target_artwork = collection.find_one({"id": artwork_id})
-        if not target_artwork or not target_artwork.get("style_vector"):
+        Returns:
+            List[Tuple[str, float]]: (作品ID, 相似度) 列表，目标作品没有风格向量时为空
+        """
+        target_vector = cls.STYLE_INDEX.get_vector(artwork_id)
+        if target_vector is None:
             return []
 
-        target_vector = target_artwork["style_vector"]
+        return cls.STYLE_INDEX.search(target_vector, top_k=limit, threshold=threshold, exclude_ids={artwork_id})
 
-        # 获取所有有风格向量的作品
-        artworks_with_vectors = list(collection.find({
-            "style_vector": {"$exists": True, "$ne": []},
-            "id": {"$ne": artwork_id}
-        }))
+    @classmethod
+    def _attach_similarity(
+        cls,
+        neighbors: List[Tuple[str, float]],
+        artworks: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        按近邻顺序排列作品并附加相似度分数
 
-        # 计算相似度并筛选
-        similar_artworks = []
-        for artwork in artworks_with_vectors:
-            if artwork.get("style_vector"):
-                similarity = Artwork.calculate_style_similarity(target_vector, artwork["style_vector"])
-                if similarity >= threshold:
-                    artwork["similarity_score"] = similarity
-                    similar_artworks.append(artwork)
+        Args:
+            neighbors: 按相似度降序排列的 (作品ID, 相似度) 列表
+            artworks: 近邻对应的作品记录
 
-        # 按相似度排序
-        similar_artworks.sort(key=lambda x: x["similarity_score"], reverse=True)
+        Returns:
+            List[Dict[str, Any]]: 按相似度降序排列的作品列表
+        """
+        artworks_by_id = {artwork["id"]: artwork for artwork in artworks}
 
-        # 处理结果
         processed_artworks = []
-        for artwork in similar_artworks[:limit]:
-            processed_artwork = cls._process_record(artwork)
-            processed_artworks.append(processed_artwork)
+        for record_id, similarity in neighbors:
+            artwork = artworks_by_id.get(record_id)
+            if artwork is None:
+                continue
+            artwork["similarity_score"] = similarity
+            processed_artworks.append(cls._process_record(artwork))
 
         return processed_artworks
-    
+
+    @classmethod
+    def _upsert_style_vector(cls, artwork_id: str, style_vector: Optional[List[float]]):
+        """索引已构建时写入作品的风格向量"""
+        cls.STYLE_INDEX.upsert(artwork_id, style_vector, if_built=True)
+
+    @classmethod
+    def _after_create(cls, record: Dict[str, Any]):
+        """新作品写入向量索引"""
+        super()._after_create(record)
+        cls._upsert_style_vector(record["id"], record.get("style_vector"))
+
+    @classmethod
+    def _after_bulk_create(cls, records: List[Dict[str, Any]]):
+        """批量创建的作品写入向量索引"""
+        super()._after_bulk_create(records)
+        for record in records:
+            cls._upsert_style_vector(record["id"], record.get("style_vector"))
+
+    @classmethod
+    def _after_update(cls, record: Dict[str, Any]):
+        """同步更新后的风格向量"""
+        super()._after_update(record)
+        cls._upsert_style_vector(record["id"], record.get("style_vector"))
+
+    @classmethod
+    def _after_delete(cls, record_id: str):
+        """从向量索引中移除已删除的作品"""
+        super()._after_delete(record_id)
+        cls.STYLE_INDEX.remove(record_id)
+
+    @classmethod
+    def _after_bulk_write(cls):
+        """批量导入后让向量索引失效，下一次检索时重新加载"""
+        super()._after_bulk_write()
+        cls.STYLE_INDEX.clear()
+
     @classmethod
     def search_artworks_by_style(cls, style_tags: List[str], limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -122,7 +332,7 @@ class ArtworkService(BaseService):
         Returns:
             List[Dict[str, Any]]: 搜索结果
         """
-        collection = get_collection(cls.COLLECTION_NAME)
+        collection = get_read_collection(cls.COLLECTION_NAME)
 
         # 构建查询条件
         filter_dict = {"tags": {"$in": style_tags}}
@@ -148,7 +358,7 @@ class ArtworkService(BaseService):
         Returns:
             List[Dict[str, Any]]: 作品列表
         """
-        collection = get_collection(cls.COLLECTION_NAME)
+        collection = get_read_collection(cls.COLLECTION_NAME)
 
         filter_dict = {
             "year": {
@@ -185,6 +395,9 @@ class ArtworkService(BaseService):
             {"$addToSet": {"movement_ids": movement_id}}
         )
 
+        if result.modified_count > 0:
+            cls._after_partial_update(artwork_id)
+
         return result.modified_count > 0
     
     @classmethod
@@ -206,6 +419,9 @@ class ArtworkService(BaseService):
             {"$pull": {"movement_ids": movement_id}}
         )
 
+        if result.modified_count > 0:
+            cls._after_partial_update(artwork_id)
+
         return result.modified_count > 0
 
     @classmethod
@@ -227,4 +443,226 @@ class ArtworkService(BaseService):
             {"$set": {"style_vector": style_vector}}
         )
 
-        return result.modified_count > 0
\ No newline at end of file
+        if result.matched_count > 0:
+            cls._after_partial_update(artwork_id)
+            cls._upsert_style_vector(artwork_id, style_vector)
+
+        return result.modified_count > 0
+
+
+class AsyncArtworkService(AsyncBaseService, ArtworkService):
+    """
+    异步艺术品服务
+
+    ArtworkService 的 Motor 异步实现，供 API 路由使用
+    """
+
+    @classmethod
+    async def get_artworks_by_artist(cls, artist_id: str) -> List[Dict[str, Any]]:
+        """
+        根据艺术家ID获取作品
+
+        Args:
+            artist_id: 艺术家ID
+
+        Returns:
+            List[Dict[str, Any]]: 作品列表
+        """
+        return await cls._cached_find_async("get_artworks_by_artist", {"artist_id": artist_id})
+
+    @classmethod
+    async def get_artworks_by_movement(cls, movement_id: str) -> List[Dict[str, Any]]:
+        """
+        根据艺术运动ID获取作品
+
+        Args:
+            movement_id: 艺术运动ID
+
+        Returns:
+            List[Dict[str, Any]]: 作品列表
+        """
+        return await cls._cached_find_async("get_artworks_by_movement", {"movement_ids": movement_id})
+
+    @classmethod
+    async def get_similar_artworks(cls, artwork_id: str, threshold: float = 0.8, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        根据风格向量获取相似作品
+
+        Args:
+            artwork_id: 作品ID
+            threshold: 相似度阈值
+            limit: 结果限制数量
+
+        Returns:
+            List[Dict[str, Any]]: 相似作品列表
+        """
+        if not cls.STYLE_INDEX.built:
+            await cls._build_style_index_async()
+
+        neighbors = cls._search_style_index(artwork_id, threshold, limit)
+        if not neighbors:
+            return []
+
+        collection = get_async_read_collection(cls.COLLECTION_NAME)
+        artworks = await collection.find(
+            {"id": {"$in": [record_id for record_id, _ in neighbors]}}
+        ).to_list(length=None)
+
+        return cls._attach_similarity(neighbors, artworks)
+
+    @classmethod
+    async def get_similar_artworks_batch(
+        cls,
+        artwork_ids: Optional[List[str]] = None,
+        vectors: Optional[List[List[float]]] = None,
+        threshold: float = 0.8,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        批量获取相似作品
+
+        Args:
+            artwork_ids: 作品ID列表（结果中排除作品自身）
+            vectors: 原始风格向量列表
+            threshold: 相似度阈值
+            limit: 每个查询的结果数量
+
+        Returns:
+            List[Dict[str, Any]]: 与查询一一对应的结果，先作品ID后原始向量
+        """
+        if not cls.STYLE_INDEX.built:
+            await cls._build_style_index_async()
+
+        queries = cls._batch_similarity_queries(artwork_ids, vectors)
+        neighbor_lists = cls.STYLE_INDEX.search_many(
+            [query["vector"] for query in queries],
+            top_k=limit,
+            threshold=threshold,
+            exclude_ids=[query["query_id"] for query in queries]
+        )
+
+        neighbor_ids = list({record_id for neighbors in neighbor_lists for record_id, _ in neighbors})
+        artworks = []
+        if neighbor_ids:
+            collection = get_async_read_collection(cls.COLLECTION_NAME)
+            artworks = await collection.find({"id": {"$in": neighbor_ids}}).to_list(length=None)
+
+        return cls._build_batch_similarity_results(queries, neighbor_lists, artworks)
+
+    @classmethod
+    async def _build_style_index_async(cls) -> int:
+        """
+        从数据库加载所有风格向量并重建索引（从主节点读取，并做版本检查，同 build_style_index）
+
+        Returns:
+            int: 索引中的向量数量
+        """
+        version = cls.STYLE_INDEX.current_version()
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        docs = await collection.find(
+            {"style_vector": {"$exists": True, "$ne": []}},
+            {"id": 1, "style_vector": 1, "_id": 0}
+        ).to_list(length=None)
+        cls.STYLE_INDEX.build(((doc["id"], doc.get("style_vector")) for doc in docs), version)
+        return len(cls.STYLE_INDEX)
+
+    @classmethod
+    async def search_artworks_by_style(cls, style_tags: List[str], limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        根据风格标签搜索作品
+
+        Args:
+            style_tags: 风格标签列表
+            limit: 结果限制数量
+
+        Returns:
+            List[Dict[str, Any]]: 搜索结果
+        """
+        return await cls._find_records({"tags": {"$in": style_tags}}, limit=limit)
+
+    @classmethod
+    async def get_artworks_by_year_range(cls, start_year: int, end_year: int) -> List[Dict[str, Any]]:
+        """
+        根据年份范围获取作品
+
+        Args:
+            start_year: 起始年份
+            end_year: 结束年份
+
+        Returns:
+            List[Dict[str, Any]]: 作品列表
+        """
+        return await cls._find_records({"year": {"$gte": start_year, "$lte": end_year}})
+
+    @classmethod
+    async def add_artwork_to_movement(cls, artwork_id: str, movement_id: str) -> bool:
+        """
+        将作品添加到艺术运动
+
+        Args:
+            artwork_id: 作品ID
+            movement_id: 艺术运动ID
+
+        Returns:
+            bool: 是否成功添加
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+
+        result = await collection.update_one(
+            {"id": artwork_id},
+            {"$addToSet": {"movement_ids": movement_id}}
+        )
+
+        if result.modified_count > 0:
+            cls._after_partial_update(artwork_id)
+
+        return result.modified_count > 0
+
+    @classmethod
+    async def remove_artwork_from_movement(cls, artwork_id: str, movement_id: str) -> bool:
+        """
+        从艺术运动中移除作品
+
+        Args:
+            artwork_id: 作品ID
+            movement_id: 艺术运动ID
+
+        Returns:
+            bool: 是否成功移除
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+
+        result = await collection.update_one(
+            {"id": artwork_id},
+            {"$pull": {"movement_ids": movement_id}}
+        )
+
+        if result.modified_count > 0:
+            cls._after_partial_update(artwork_id)
+
+        return result.modified_count > 0
+
+    @classmethod
+    async def update_style_vector(cls, artwork_id: str, style_vector: List[float]) -> bool:
+        """
+        更新作品的风格向量
+
+        Args:
+            artwork_id: 作品ID
+            style_vector: 新的风格向量
+
+        Returns:
+            bool: 是否成功更新
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+
+        result = await collection.update_one(
+            {"id": artwork_id},
+            {"$set": {"style_vector": style_vector}}
+        )
+
+        if result.matched_count > 0:
+            cls._after_partial_update(artwork_id)
+            cls._upsert_style_vector(artwork_id, style_vector)
+
+        return result.modified_count > 0
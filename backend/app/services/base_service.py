@@ -1,13 +1,29 @@
-from typing import List, Dict, Any, Optional, Type, Union
+from typing import List, Dict, Any, Optional, Type, Union, Tuple, Callable
+import asyncio
 import pandas as pd
 from bson import json_util
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
 import json
 from datetime import datetime
 
-from app.db.mongodb import get_collection
+from app.db.mongodb import get_collection, get_read_collection, get_async_collection, get_async_read_collection
+from app.core.config import ESTIMATED_COUNT_LIMIT, IMPORT_CHUNK_SIZE, IMPORT_MAX_ERRORS
 from app.models.base import BaseModel
-from app.utils.query_params import QueryParams, QueryParamsParser
-from app.schemas.response import APIResponse, PaginatedResponse, create_success_response, create_error_response, create_paginated_response
+from app.utils.query_params import (
+    QueryParams, QueryParamsParser, DEFAULT_SEARCH_FIELDS, SEARCH_PREFIX_FIELD
+)
+from app.utils.collection_versions import COLLECTION_VERSIONS
+from app.utils.csv_handler import CSVHandler
+from app.utils.query_cache import QUERY_CACHE
+from app.utils.record_loader import RecordLoader, request_loader, prime_record, forget_records
+from app.utils.record_processor import exclude_internal_fields, record_processor
+from app.utils.database_setup import TEXT_SEARCH_FIELDS
+from app.utils.search_index import InvertedIndex, document_terms
+from app.schemas.response import (
+    APIResponse, PaginatedResponse, ErrorResponse,
+    create_success_response, create_error_response, create_paginated_response
+)
 
 
 class BaseService:
@@ -20,8 +36,1336 @@ class BaseService:
     COLLECTION_NAME: str = None  # 子类必须定义
     MODEL_CLASS: Type[BaseModel] = None  # 子类必须定义
     
+    # 搜索配置：regex 模式匹配的字段，以及生成名称前缀字段的源字段
+    SEARCH_FIELDS: List[str] = DEFAULT_SEARCH_FIELDS
+    PREFIX_SOURCE_FIELD: str = "name"
+    
+    # 时间区间筛选（yearFrom / yearTo）使用的年份字段
+    YEAR_FIELD: Optional[str] = None
+    
+    # 跨实体搜索：倒排索引（进程内，所有服务共用一个实例）和本服务记录的实体类型，
+    # 字段权重与 MongoDB 全文索引一致（TEXT_SEARCH_FIELDS）
+    SEARCH_INDEX = InvertedIndex()
+    SEARCH_ENTITY: Optional[str] = None
+    
+    # 关联展开（include 参数）：参数值 -> (保存关联ID的字段, 关联集合)
+    RELATIONS: Dict[str, Tuple[str, str]] = {}
+    
+    # 列表视图：视图名称 -> 默认字段投影（None 表示完整记录），未指定 fields 时使用；
+    # 列表默认使用 card 视图，省略卡片上用不到的长文本和向量等大字段
+    LIST_VIEWS: Dict[str, Optional[Dict[str, int]]] = {
+        "summary": {"id": 1, "name": 1},
+        "card": None,
+        "detail": None
+    }
+    DEFAULT_LIST_VIEW = "card"
+    
+    # 读取记录时默认的字段投影：由数据库排除 _id 和内部搜索字段
+    RECORD_PROJECTION = exclude_internal_fields()
+    
+    # 查询缓存：按集合版本失效（进程内，所有服务共用一个实例）
+    QUERY_CACHE = QUERY_CACHE
+    
+    @classmethod
+    def get_all(cls, params: Optional[QueryParams] = None) -> PaginatedResponse:
+        """
+        获取所有记录
+        
+        Args:
+            params: 查询参数
+            
+        Returns:
+            PaginatedResponse: 分页响应
+            
+        Raises:
+            ValueError: 游标令牌或总数统计模式无效
+        """
+        if not cls.COLLECTION_NAME:
+            raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
+        
+        query = cls._build_list_query(params)
+        
+        hit, cached, cache_key = cls._cache_lookup("get_all", query, query["include"])
+        if hit:
+            return PaginatedResponse(**cached)
+        
+        collection = cls._cache_fill_collection(cls.COLLECTION_NAME)
+        
+        # 计算总数
+        total = cls._count_records(collection, query["count_filter"], query["count_mode"])
+        
+        # 查询数据
+        cursor = collection.find(query["filter"], query["projection"])
+        
+        if query["sort"]:
+            cursor = cursor.sort(query["sort"])
+        
+        records = list(cursor.skip(query["skip"]).limit(query["limit"]))
+        cls._expand_relations(records[:query["page_size"]], query["include"])
+        
+        response = cls._build_page_response(query, records, total)
+        cls.QUERY_CACHE.store(cache_key, response.model_dump(exclude={"timestamp"}))
+        return response
+    
+    @classmethod
+    def _build_list_query(cls, params: Optional[QueryParams] = None) -> Dict[str, Any]:
+        """
+        构建列表查询计划（同步与异步实现共用）
+        
+        游标分页按 (sortBy, id) 排序，并以上一页最后一条记录的排序键作为过滤条件，
+        避免 skip 带来的深分页开销；游标分页和非精确统计模式下多取一条用于判断是否还有下一页。
+        
+        Args:
+            params: 查询参数
+            
+        Returns:
+            Dict[str, Any]: 查询计划
+            
+        Raises:
+            ValueError: 游标令牌、总数统计模式、视图或关联字段无效
+        """
+        filter_dict = {}
+        sort_params = None
+        projection = QueryParamsParser.build_mongo_projection(params) if params else None
+        relations = []
+        
+        # 未指定 fields 时使用视图的默认投影
+        if projection is None:
+            projection = cls._view_projection(QueryParamsParser.parse_view(params))
+        
+        if params:
+            filter_dict = QueryParamsParser.build_mongo_filter(params, cls.SEARCH_FIELDS, cls.YEAR_FIELD)
+            sort_params = QueryParamsParser.build_mongo_sort(params)
+            relations = cls._parse_relations(QueryParamsParser.parse_include(params.include))
+            
+            # 展开关联需要保存关联ID的字段，字段投影中缺失时补上
+            QueryParamsParser.require_fields(projection, [cls.RELATIONS[relation][0] for relation in relations])
+            
+            # 全文搜索且未指定排序时按相关度排序（游标分页仍按 id 排序）
+            if (params.search and not sort_params and not QueryParamsParser.is_cursor_mode(params)
+                    and QueryParamsParser.parse_search_mode(params.search_mode) == "text"):
+                score_projection, sort_params = QueryParamsParser.build_relevance_sort()
+                projection = {**(projection or {}), **score_projection}
+        
+        count_mode = QueryParamsParser.parse_count_mode(params)
+        
+        # 分页参数
+        page = params.page if params else 1
+        page_size = params.page_size if params else 10
+        
+        query = {
+            "filter": filter_dict,
+            "count_filter": filter_dict,
+            "projection": projection,
+            "sort": sort_params,
+            "skip": QueryParamsParser.calculate_skip(page, page_size),
+            "limit": page_size if count_mode == "exact" else page_size + 1,
+            "page": page,
+            "page_size": page_size,
+            "count_mode": count_mode,
+            "cursor_sort": None,
+            "after": None,
+            "include": relations
+        }
+        
+        if params and QueryParamsParser.is_cursor_mode(params):
+            cursor_sort = QueryParamsParser.build_cursor_sort(params)
+            
+            if params.after:
+                last_value, last_id = QueryParamsParser.decode_cursor(params.after, cursor_sort)
+                cursor_filter = QueryParamsParser.build_cursor_filter(cursor_sort, last_value, last_id)
+                query["filter"] = {"$and": [filter_dict, cursor_filter]} if filter_dict else cursor_filter
+            
+            # 游标需要排序字段和 id，字段投影中缺失时补上
+            QueryParamsParser.require_fields(projection, [field for field, _ in cursor_sort])
+            
+            query.update({
+                "sort": cursor_sort,
+                "skip": 0,
+                "limit": page_size + 1,
+                "cursor_sort": cursor_sort,
+                "after": params.after
+            })
+        
+        query["projection"] = exclude_internal_fields(query["projection"])
+        return query
+    
+    @classmethod
+    def _view_projection(cls, view: Optional[str] = None) -> Optional[Dict[str, int]]:
+        """
+        获取列表视图的默认字段投影
+        
+        Args:
+            view: 视图名称，为空时使用 DEFAULT_LIST_VIEW
+            
+        Returns:
+            Optional[Dict[str, int]]: 字段投影副本，None 表示完整记录
+        """
+        projection = cls.LIST_VIEWS[view or cls.DEFAULT_LIST_VIEW]
+        return dict(projection) if projection is not None else None
+    
+    @classmethod
+    def _build_page_response(
+        cls,
+        query: Dict[str, Any],
+        records: List[Dict[str, Any]],
+        total: Optional[int]
+    ) -> PaginatedResponse:
+        """
+        根据查询计划和查询结果构建分页响应（同步与异步实现共用）
+        
+        Args:
+            query: 查询计划
+            records: 查询到的原始记录
+            total: 总记录数
+            
+        Returns:
+            PaginatedResponse: 分页响应
+        """
+        page_size = query["page_size"]
+        cursor_sort = query["cursor_sort"]
+        
+        has_next = None
+        if query["limit"] > page_size:
+            has_next = len(records) > page_size
+            records = records[:page_size]
+        
+        next_cursor = None
+        if cursor_sort and has_next and records:
+            next_cursor = QueryParamsParser.encode_cursor(records[-1], cursor_sort)
+        
+        processed_records = cls._process_records(records, query["projection"])
+        
+        return create_paginated_response(
+            data=processed_records,
+            total=total,
+            page=query["page"],
+            page_size=page_size,
+            next_cursor=next_cursor,
+            has_next=has_next,
+            has_prev=bool(query["after"]) if cursor_sort else None,
+            count_mode=query["count_mode"]
+        )
+    
+    @classmethod
+    def _count_records(cls, collection, filter_dict: Dict[str, Any], count_mode: str) -> Optional[int]:
+        """
+        按统计模式计算总数
+        
+        Args:
+            collection: 集合实例
+            filter_dict: 查询过滤器
+            count_mode: 'exact'、'estimated' 或 'none'
+            
+        Returns:
+            Optional[int]: 总数，'none' 模式下为 None
+        """
+        if count_mode == "none":
+            return None
+        
+        if count_mode == "estimated":
+            # 无筛选条件时直接读取集合元数据，否则只统计到上限
+            if not filter_dict:
+                return collection.estimated_document_count()
+            return collection.count_documents(filter_dict, limit=ESTIMATED_COUNT_LIMIT)
+        
+        return collection.count_documents(filter_dict)
+    
+    @classmethod
+    def _parse_relations(cls, include: Optional[List[str]]) -> List[str]:
+        """
+        校验需要展开的关联
+        
+        Args:
+            include: 关联名称列表
+            
+        Returns:
+            List[str]: 去重后的关联名称
+            
+        Raises:
+            ValueError: 不支持的关联
+        """
+        if not include:
+            return []
+        
+        unknown = [relation for relation in include if relation not in cls.RELATIONS]
+        if unknown:
+            expected = ", ".join(cls.RELATIONS) or "none"
+            raise ValueError(f"Unsupported include value(s) {', '.join(unknown)}, expected: {expected}")
+        return list(dict.fromkeys(include))
+    
+    @classmethod
+    def _relation_ids(cls, records: List[Dict[str, Any]], relation: str) -> List[str]:
+        """
+        收集一组记录在某个关联上引用的全部ID
+        
+        Args:
+            records: 原始记录
+            relation: 关联名称
+            
+        Returns:
+            List[str]: 去重后的ID列表
+        """
+        field = cls.RELATIONS[relation][0]
+        ids = {}
+        for record in records:
+            value = record.get(field)
+            for related_id in (value if isinstance(value, list) else [value]):
+                if related_id:
+                    ids[related_id] = None
+        return list(ids)
+    
+    @classmethod
+    def _stitch_relations(
+        cls,
+        records: List[Dict[str, Any]],
+        relations: List[str],
+        related: Dict[str, Dict[str, Dict[str, Any]]]
+    ):
+        """
+        把批量查询到的关联记录按引用顺序写入各记录的 included 字段（同步与异步实现共用）
+        
+        Args:
+            records: 原始记录
+            relations: 关联名称
+            related: 关联名称 -> (ID -> 关联记录)
+        """
+        for record in records:
+            included = {}
+            for relation in relations:
+                value = record.get(cls.RELATIONS[relation][0])
+                by_id = related[relation]
+                included[relation] = [
+                    by_id[related_id] for related_id in (value if isinstance(value, list) else [value])
+                    if related_id in by_id
+                ]
+            record["included"] = included
+    
+    @classmethod
+    def _expand_relations(cls, records: List[Dict[str, Any]], relations: List[str]):
+        """
+        展开关联：每个关联只执行一次 $in 查询，避免逐条 get_by_id 的 N+1 查询
+        
+        Args:
+            records: 原始记录（原地写入 included）
+            relations: 关联名称
+        """
+        if not records or not relations:
+            return
+        
+        related = {}
+        for relation in relations:
+            ids = cls._relation_ids(records, relation)
+            collection_name = cls.RELATIONS[relation][1]
+            collection = cls._cache_fill_collection(collection_name)
+            docs = collection.find({"id": {"$in": ids}}, cls.RECORD_PROJECTION) if ids else []
+            processor = record_processor(collection_name, cls.RECORD_PROJECTION)
+            related[relation] = {doc["id"]: doc for doc in processor.process_many(docs)}
+        
+        cls._stitch_relations(records, relations, related)
+    
+    @classmethod
+    def _cache_lookup(
+        cls,
+        kind: str,
+        payload: Any,
+        relations: Optional[List[str]] = None
+    ) -> Tuple[bool, Any, Any]:
+        """
+        查找查询缓存（结果依赖本集合和所展开关联的集合）
+        
+        Args:
+            kind: 查询类型
+            payload: 决定查询结果的参数
+            relations: 展开的关联
+            
+        Returns:
+            Tuple[bool, Any, Any]: (是否命中, 缓存值, 写回时使用的缓存键)
+        """
+        return cls.QUERY_CACHE.lookup(
+            cls._cache_collections(relations), f"{cls.COLLECTION_NAME}.{kind}", payload
+        )
+    
+    @classmethod
+    def _cache_fill_collection(cls, collection_name: str):
+        """
+        获取查询结果会写入查询缓存时使用的集合
+        
+        从节点可能落后于刚完成的写入：写入递增版本号后从从节点读到旧数据，会以新版本号缓存，
+        直到下次写入或过期都不会失效。因此启用查询缓存时从主节点读取，未启用时使用只读客户端。
+        
+        Args:
+            collection_name: 集合名称
+            
+        Returns:
+            Collection: MongoDB 集合
+        """
+        if cls.QUERY_CACHE.enabled:
+            return get_collection(collection_name)
+        return get_read_collection(collection_name)
+    
+    @classmethod
+    def _cache_collections(cls, relations: Optional[List[str]] = None) -> List[str]:
+        """
+        查询结果依赖的集合
+        
+        Args:
+            relations: 展开的关联
+            
+        Returns:
+            List[str]: 集合名称列表
+        """
+        return [cls.COLLECTION_NAME] + [cls.RELATIONS[relation][1] for relation in relations or []]
+    
+    @classmethod
+    def _cached_find(cls, kind: str, filter_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        经过查询缓存的列表查询（结果只依赖本集合）
+        
+        Args:
+            kind: 查询类型
+            filter_dict: 查询过滤器
+            
+        Returns:
+            List[Dict[str, Any]]: 处理后的记录列表
+        """
+        payload = {"filter": filter_dict, "sort": None, "limit": 0, "projection": None}
+        hit, cached, cache_key = cls._cache_lookup(kind, payload)
+        if hit:
+            return cached
+        
+        collection = cls._cache_fill_collection(cls.COLLECTION_NAME)
+        records = cls._process_records(collection.find(filter_dict, cls.RECORD_PROJECTION), cls.RECORD_PROJECTION)
+        cls.QUERY_CACHE.store(cache_key, records)
+        return records
+    
+    @classmethod
+    def get_by_id(cls, record_id: str, include: Optional[List[str]] = None) -> APIResponse:
+        """
+        根据 ID 获取记录
+        
+        Args:
+            record_id: 记录 ID
+            include: 需要展开的关联
+            
+        Returns:
+            APIResponse: API响应
+            
+        Raises:
+            ValueError: 关联字段无效
+        """
+        if not cls.COLLECTION_NAME:
+            raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
+        
+        relations = cls._parse_relations(include)
+        hit, cached, cache_key = cls._cache_lookup("get_by_id", {"id": record_id, "include": relations}, relations)
+        if hit:
+            return create_success_response(data=cached)
+        
+        collection = get_collection(cls.COLLECTION_NAME)
+        record = collection.find_one({"id": record_id})
+        
+        if not record:
+            return create_error_response(
+                message=f"Record with ID {record_id} not found",
+                code=404
+            )
+        
+        cls._expand_relations([record], relations)
+        processed_record = cls._process_record(record)
+        cls.QUERY_CACHE.store(cache_key, processed_record)
+        return create_success_response(data=processed_record)
+    
+    @classmethod
+    def create(cls, record_data: Dict[str, Any]) -> APIResponse:
+        """
+        创建记录
+        
+        Args:
+            record_data: 记录数据
+            
+        Returns:
+            APIResponse: API响应
+        """
+        if not cls.COLLECTION_NAME:
+            raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
+        
+        try:
+            collection = get_collection(cls.COLLECTION_NAME)
+            
+            # 生成ID、添加时间戳并验证数据
+            error_response = cls._prepare_new_record(record_data)
+            if error_response:
+                return error_response
+            
+            # 检查ID唯一性
+            existing = collection.find_one({"id": record_data["id"]})
+            if existing:
+                return create_error_response(
+                    message=f"Record with ID {record_data['id']} already exists",
+                    code=409
+                )
+            
+            # 插入数据
+            collection.insert_one(record_data)
+            
+            # 返回创建的记录
+            created_record = cls._process_record(record_data)
+            cls._after_create(created_record)
+            return create_success_response(
+                data=created_record,
+                message="Record created successfully",
+                code=201
+            )
+            
+        except Exception as e:
+            return create_error_response(
+                message=f"Failed to create record: {str(e)}",
+                code=500
+            )
+    
+    @classmethod
+    def _prepare_new_record(cls, record_data: Dict[str, Any]) -> Optional[ErrorResponse]:
+        """
+        为新记录生成ID、添加时间戳并验证数据（同步与异步实现共用）
+        
+        Args:
+            record_data: 记录数据，会被原地补全
+            
+        Returns:
+            Optional[ErrorResponse]: 验证失败时的错误响应，成功时为 None
+        """
+        # 生成ID（如果没有提供）
+        if "id" not in record_data or not record_data["id"]:
+            record_data["id"] = cls._generate_id()
+        
+        # 添加时间戳
+        now = datetime.utcnow()
+        record_data["created_at"] = now
+        record_data["updated_at"] = now
+        
+        cls._set_search_fields(record_data)
+        
+        # 验证数据
+        if cls.MODEL_CLASS:
+            model_instance = cls.MODEL_CLASS.from_dict(record_data)
+            validation_errors = model_instance.validate_data()
+            if validation_errors:
+                return create_error_response(
+                    message="Validation failed",
+                    code=400,
+                    error_details={"validation_errors": validation_errors}
+                )
+        
+        return None
+    
+    @classmethod
+    def bulk_create(cls, records: List[Dict[str, Any]]) -> APIResponse:
+        """
+        批量创建记录
+        
+        逐条验证后，用一次 $in 查询检查ID唯一性，再以 insert_many(ordered=False) 写入，
+        单条记录失败不会影响其他记录。
+        
+        Args:
+            records: 记录数据列表
+            
+        Returns:
+            APIResponse: API响应，data 包含 created_count、created_ids 和按记录下标给出的 errors
+        """
+        if not cls.COLLECTION_NAME:
+            raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
+        
+        try:
+            collection = get_collection(cls.COLLECTION_NAME)
+            
+            # 验证数据并去除批次内重复ID
+            candidates, errors = cls._prepare_bulk_records(records)
+            
+            # 检查数据库中已存在的ID
+            existing_ids = cls._find_existing_ids(collection, [record["id"] for _, record in candidates])
+            candidates, existing_errors = cls._exclude_existing(candidates, existing_ids)
+            errors.extend(existing_errors)
+            
+            # 批量插入
+            write_errors = cls._insert_batch(collection, [record for _, record in candidates])
+            
+            return cls._build_bulk_response(len(records), candidates, errors, write_errors)
+            
+        except Exception as e:
+            return create_error_response(
+                message=f"Failed to bulk create records: {str(e)}",
+                code=500
+            )
+    
+    @classmethod
+    def _prepare_bulk_records(
+        cls, records: List[Dict[str, Any]]
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        逐条准备待批量插入的记录（同步与异步实现共用）
+        
+        Args:
+            records: 记录数据列表，会被原地补全
+            
+        Returns:
+            Tuple: (通过验证的 (原始下标, 记录) 列表, 错误列表)
+        """
+        candidates = []
+        errors = []
+        seen_ids = set()
+        
+        for index, record_data in enumerate(records):
+            try:
+                error_response = cls._prepare_new_record(record_data)
+            except (ValueError, TypeError) as e:
+                # from_dict 对缺失必填字段抛出 ValueError
+                errors.append(cls._bulk_error(index, record_data, f"Validation failed: {str(e)}", 400))
+                continue
+            if error_response:
+                errors.append(cls._bulk_error(index, record_data, error_response.message,
+                                              error_response.code, error_response.error_details))
+                continue
+            
+            if record_data["id"] in seen_ids:
+                errors.append(cls._bulk_error(
+                    index, record_data, f"Duplicate ID {record_data['id']} in batch", 409
+                ))
+                continue
+            
+            seen_ids.add(record_data["id"])
+            candidates.append((index, record_data))
+        
+        return candidates, errors
+    
+    @classmethod
+    def _exclude_existing(
+        cls, candidates: List[Tuple[int, Dict[str, Any]]], existing_ids: set
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        排除数据库中已存在ID的记录
+        
+        Args:
+            candidates: (原始下标, 记录) 列表
+            existing_ids: 已存在的ID集合
+            
+        Returns:
+            Tuple: (剩余的待插入记录, 错误列表)
+        """
+        remaining = []
+        errors = []
+        for index, record_data in candidates:
+            if record_data["id"] in existing_ids:
+                errors.append(cls._bulk_error(
+                    index, record_data, f"Record with ID {record_data['id']} already exists", 409
+                ))
+            else:
+                remaining.append((index, record_data))
+        return remaining, errors
+    
+    @classmethod
+    def _find_existing_ids(cls, collection, ids: List[str]) -> set:
+        """
+        查询已存在的ID
+        
+        Args:
+            collection: 集合实例
+            ids: 待检查的ID列表
+            
+        Returns:
+            set: 已存在的ID集合
+        """
+        if not ids:
+            return set()
+        return {doc["id"] for doc in collection.find({"id": {"$in": ids}}, {"id": 1, "_id": 0})}
+    
+    @classmethod
+    def _insert_batch(cls, collection, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        无序批量插入
+        
+        Args:
+            collection: 集合实例
+            docs: 待插入文档
+            
+        Returns:
+            List[Dict[str, Any]]: BulkWriteError 中的 writeErrors，全部成功时为空列表
+        """
+        if not docs:
+            return []
+        try:
+            collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            return e.details.get("writeErrors", [])
+        return []
+    
+    @classmethod
+    def _build_bulk_response(
+        cls,
+        requested: int,
+        candidates: List[Tuple[int, Dict[str, Any]]],
+        errors: List[Dict[str, Any]],
+        write_errors: List[Dict[str, Any]]
+    ) -> APIResponse:
+        """
+        构建批量创建响应，将 writeErrors 映射回原始记录下标，并对写入成功的记录调用一次 _after_bulk_create
+        
+        Args:
+            requested: 请求的记录总数
+            candidates: 提交给 insert_many 的 (原始下标, 记录) 列表
+            errors: 写入前产生的错误
+            write_errors: insert_many 返回的 writeErrors
+            
+        Returns:
+            APIResponse: API响应
+        """
+        failed_positions = set()
+        for write_error in write_errors:
+            position = write_error["index"]
+            failed_positions.add(position)
+            index, record_data = candidates[position]
+            # 11000 为重复键错误（并发写入时可能绕过前置检查）
+            if write_error.get("code") == 11000:
+                message, code = f"Record with ID {record_data['id']} already exists", 409
+            else:
+                message, code = write_error.get("errmsg", "Write failed"), 500
+            errors.append(cls._bulk_error(index, record_data, message, code))
+        
+        created = [
+            record_data for position, (_, record_data) in enumerate(candidates)
+            if position not in failed_positions
+        ]
+        created_ids = [record_data["id"] for record_data in created]
+        if created:
+            cls._after_bulk_create(created)
+        errors.sort(key=lambda error: error["index"])
+        
+        return create_success_response(
+            data={
+                "requested": requested,
+                "created_count": len(created_ids),
+                "created_ids": created_ids,
+                "errors": errors
+            },
+            message=f"Created {len(created_ids)} of {requested} records",
+            code=201 if created_ids else 200
+        )
+    
+    @staticmethod
+    def _bulk_error(
+        index: int,
+        record_data: Dict[str, Any],
+        message: str,
+        code: int,
+        details: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        构建单条记录的批量写入错误
+        """
+        error = {"index": index, "id": record_data.get("id"), "message": message, "code": code}
+        if details:
+            error["details"] = details
+        return error
+    
+    @classmethod
+    def update(cls, record_id: str, record_data: Dict[str, Any]) -> APIResponse:
+        """
+        更新记录
+        
+        Args:
+            record_id: 记录 ID
+            record_data: 要更新的记录数据
+            
+        Returns:
+            APIResponse: API响应
+        """
+        if not cls.COLLECTION_NAME:
+            raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
+        
+        try:
+            collection = get_collection(cls.COLLECTION_NAME)
+            
+            # 只有修改了组合校验字段中的一部分时，才读取其余字段的现有值
+            pre_image = None
+            context_projection = cls._update_context_projection(record_data)
+            if context_projection:
+                pre_image = collection.find_one({"id": record_id}, context_projection)
+                if not pre_image:
+                    return create_error_response(
+                        message=f"Record with ID {record_id} not found",
+                        code=404
+                    )
+            
+            # 更新时间戳并验证数据；校验失败时先确认记录存在，不存在的记录返回 404 而不是 400
+            error_response = cls._prepare_update(record_data, pre_image)
+            if error_response:
+                if pre_image is None and not collection.find_one({"id": record_id}, {"_id": 1}):
+                    return create_error_response(
+                        message=f"Record with ID {record_id} not found",
+                        code=404
+                    )
+                return error_response
+            
+            # 更新并返回更新后的记录（一次往返）
+            updated_record = collection.find_one_and_update(
+                {"id": record_id},
+                {"$set": record_data},
+                projection=cls.RECORD_PROJECTION,
+                return_document=ReturnDocument.AFTER
+            )
+            if not updated_record:
+                return create_error_response(
+                    message=f"Record with ID {record_id} not found",
+                    code=404
+                )
+            
+            processed_record = record_processor(cls.COLLECTION_NAME, cls.RECORD_PROJECTION)(updated_record)
+            cls._after_update(processed_record)
+            return create_success_response(
+                data=processed_record,
+                message="Record updated successfully"
+            )
+            
+        except Exception as e:
+            return create_error_response(
+                message=f"Failed to update record: {str(e)}",
+                code=500
+            )
+    
+    @classmethod
+    def _update_context_projection(cls, record_data: Dict[str, Any]) -> Optional[Dict[str, int]]:
+        """
+        校验更新数据时需要读取的现有字段投影（同步与异步实现共用）
+        
+        Args:
+            record_data: 要更新的记录数据
+            
+        Returns:
+            Optional[Dict[str, int]]: 字段投影，不需要读取现有记录时为 None
+        """
+        if not cls.MODEL_CLASS:
+            return None
+        fields = cls.MODEL_CLASS.patch_context_fields(record_data)
+        return exclude_internal_fields(dict.fromkeys(fields, 1)) if fields else None
+    
+    @classmethod
+    def _prepare_update(
+        cls,
+        record_data: Dict[str, Any],
+        pre_image: Optional[Dict[str, Any]] = None
+    ) -> Optional[ErrorResponse]:
+        """
+        为更新数据添加时间戳并验证（同步与异步实现共用）
+        
+        只运行涉及被修改字段的校验；组合校验需要的其余字段取自 pre_image。
+        
+        Args:
+            record_data: 要更新的记录数据，会被原地补全
+            pre_image: 现有记录中组合校验需要的字段（见 _update_context_projection）
+            
+        Returns:
+            Optional[ErrorResponse]: 验证失败时的错误响应，成功时为 None
+        """
+        # 只校验调用方提交的字段，不含下面补全的时间戳和搜索字段
+        fields = list(record_data)
+        
+        # 更新时间戳
+        record_data["updated_at"] = datetime.utcnow()
+        
+        cls._set_search_fields(record_data)
+        
+        # 验证数据
+        if cls.MODEL_CLASS:
+            # 合并组合校验需要的现有字段和更新数据进行验证
+            merged_data = {**(pre_image or {}), **record_data}
+            merged_data.pop("_id", None)
+            model_instance = cls.MODEL_CLASS.from_patch(merged_data)
+            validation_errors = model_instance.validate_data(fields)
+            if validation_errors:
+                return create_error_response(
+                    message="Validation failed",
+                    code=400,
+                    error_details={"validation_errors": validation_errors}
+                )
+        
+        return None
+    
+    @classmethod
+    def delete(cls, record_id: str) -> APIResponse:
+        """
+        删除记录
+        
+        Args:
+            record_id: 记录 ID
+            
+        Returns:
+            APIResponse: API响应
+        """
+        if not cls.COLLECTION_NAME:
+            raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
+        
+        try:
+            collection = get_collection(cls.COLLECTION_NAME)
+            
+            # 删除记录，未删除任何记录说明记录不存在
+            result = collection.delete_one({"id": record_id})
+            if not result.deleted_count:
+                return create_error_response(
+                    message=f"Record with ID {record_id} not found",
+                    code=404
+                )
+            
+            cls._after_delete(record_id)
+            return create_success_response(
+                message="Record deleted successfully"
+            )
+                
+        except Exception as e:
+            return create_error_response(
+                message=f"Failed to delete record: {str(e)}",
+                code=500
+            )
+    
+    @classmethod
+    def import_from_csv(
+        cls,
+        csv_path: str,
+        clear_existing: bool = False,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> APIResponse:
+        """
+        从 CSV 文件流式导入数据
+        
+        按 chunk_size 分块读取、向量化清理并以无序批量插入写入，内存占用与文件大小无关。
+        验证失败的行和写入失败的记录会被跳过并记录到 errors，不影响其他行。
+        
+        Args:
+            csv_path: CSV 文件路径
+            clear_existing: 是否清除现有数据
+            chunk_size: 每个分块的行数
+            progress_callback: 每个分块处理完成后调用，参数为当前进度字典
+            
+        Returns:
+            APIResponse: 导入结果
+        """
+        try:
+            collection = get_collection(cls.COLLECTION_NAME)
+            
+            progress = {
+                "rows_processed": 0,
+                "inserted_count": 0,
+                "failed_count": 0,
+                "chunks_processed": 0
+            }
+            errors = []
+            sample_records = []
+            
+            for chunk_index, chunk in enumerate(CSVHandler.iter_chunks(csv_path, chunk_size)):
+                # CSV 第 1 行为表头，数据行号从 2 开始
+                first_line = progress["rows_processed"] + 2
+                
+                # 验证数据，失败时逐行定位错误行
+                valid_chunk, row_errors = cls._validate_chunk(chunk, first_line)
+                if chunk_index == 0 and row_errors and valid_chunk.empty:
+                    # 首个分块全部无效，通常是缺少必需列
+                    return create_error_response(
+                        message="CSV validation failed",
+                        code=400,
+                        error_details={"validation_errors": row_errors[0]["errors"]}
+                    )
+                
+                # 清除现有数据（在确认文件有效后执行）
+                if chunk_index == 0 and clear_existing:
+                    collection.delete_many({})
+                
+                lines = [first_line + position for position in valid_chunk.index]
+                records = cls._prepare_chunk_records(valid_chunk)
+                
+                # 插入记录，writeErrors 按下标映射回行号
+                write_errors = cls._insert_batch(collection, records)
+                for write_error in write_errors:
+                    row_errors.append({
+                        "line": lines[write_error["index"]],
+                        "errors": [write_error.get("errmsg", "Write failed")]
+                    })
+                
+                if len(sample_records) < 3:
+                    failed_positions = {write_error["index"] for write_error in write_errors}
+                    sample_records.extend(
+                        record for position, record in enumerate(records[:3]) if position not in failed_positions
+                    )
+                    sample_records = sample_records[:3]
+                
+                progress["rows_processed"] += len(chunk)
+                progress["inserted_count"] += len(records) - len(write_errors)
+                progress["failed_count"] += len(row_errors)
+                progress["chunks_processed"] += 1
+                errors.extend(row_errors[:max(IMPORT_MAX_ERRORS - len(errors), 0)])
+                
+                if progress_callback:
+                    progress_callback({**progress, "chunk": chunk_index, "chunk_errors": len(row_errors)})
+            
+            if progress["rows_processed"] == 0:
+                return create_error_response(
+                    message="CSV validation failed",
+                    code=400,
+                    error_details={"validation_errors": ["DataFrame is empty"]}
+                )
+            
+            return create_success_response(
+                data={
+                    **progress,
+                    "errors": errors,
+                    "errors_truncated": progress["failed_count"] > len(errors),
+                    "sample_records": sample_records
+                },
+                message=f"Successfully imported {progress['inserted_count']} of {progress['rows_processed']} records"
+            )
+            
+        except pd.errors.EmptyDataError:
+            return create_error_response(
+                message="CSV validation failed",
+                code=400,
+                error_details={"validation_errors": ["DataFrame is empty"]}
+            )
+        except Exception as e:
+            return create_error_response(
+                message=f"Failed to import CSV: {str(e)}",
+                code=500
+            )
+        finally:
+            cls._after_bulk_write()
+    
+    @classmethod
+    def _validate_chunk(cls, chunk: pd.DataFrame, first_line: int) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+        """
+        验证数据分块
+        
+        整块验证通过时直接返回；否则逐行验证，剔除无效行。
+        
+        Args:
+            chunk: 数据分块（索引为块内位置）
+            first_line: 分块首行在 CSV 文件中的行号
+            
+        Returns:
+            Tuple: (有效行组成的 DataFrame, 行错误列表)
+        """
+        chunk = chunk.reset_index(drop=True)
+        if not cls.MODEL_CLASS or not cls.MODEL_CLASS.validate_csv_data(chunk):
+            return chunk, []
+        
+        row_errors = []
+        valid_positions = []
+        for position in range(len(chunk)):
+            errors = cls.MODEL_CLASS.validate_csv_data(chunk.iloc[[position]])
+            if errors:
+                row_errors.append({"line": first_line + position, "errors": errors})
+            else:
+                valid_positions.append(position)
+        
+        return chunk.iloc[valid_positions], row_errors
+    
+    @classmethod
+    def _prepare_chunk_records(cls, chunk: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        清理分块并补全ID和时间戳
+        
+        Args:
+            chunk: 已验证的数据分块
+            
+        Returns:
+            List[Dict[str, Any]]: 待插入的记录列表
+        """
+        records = CSVHandler.to_records(CSVHandler.clean_chunk(chunk))
+        
+        now = datetime.utcnow()
+        for record in records:
+            if not record.get("id"):
+                record["id"] = cls._generate_id()
+            record["created_at"] = now
+            record["updated_at"] = now
+            cls._set_search_fields(record)
+        
+        return records
+    
+    @classmethod
+    def _after_create(cls, record: Dict[str, Any]):
+        """
+        记录创建后的钩子（同步与异步实现共用），子类重写时需调用 super() 以维护搜索索引
+        
+        Args:
+            record: 已写入的记录
+        """
+        COLLECTION_VERSIONS.bump(cls.COLLECTION_NAME)
+        cls._index_search_document(record)
+        prime_record(cls.COLLECTION_NAME, record["id"], record)
+    
+    @classmethod
+    def _after_bulk_create(cls, records: List[Dict[str, Any]]):
+        """
+        批量创建后的钩子：整批只递增一次集合版本号，再逐条维护索引，子类重写时需调用 super()
+        
+        Args:
+            records: 已写入的记录
+        """
+        COLLECTION_VERSIONS.bump(cls.COLLECTION_NAME)
+        for record in records:
+            cls._index_search_document(record)
+            prime_record(cls.COLLECTION_NAME, record["id"], record)
+    
+    @classmethod
+    def _after_update(cls, record: Dict[str, Any]):
+        """
+        记录更新后的钩子
+        
+        Args:
+            record: 更新后的完整记录
+        """
+        COLLECTION_VERSIONS.bump(cls.COLLECTION_NAME)
+        cls._index_search_document(record)
+        prime_record(cls.COLLECTION_NAME, record["id"], record)
+    
+    @classmethod
+    def _after_delete(cls, record_id: str):
+        """
+        记录删除后的钩子
+        
+        Args:
+            record_id: 已删除的记录ID
+        """
+        COLLECTION_VERSIONS.bump(cls.COLLECTION_NAME)
+        prime_record(cls.COLLECTION_NAME, record_id, None)
+        if cls.SEARCH_ENTITY:
+            cls.SEARCH_INDEX.remove(cls.SEARCH_ENTITY, record_id)
+    
+    @classmethod
+    def _after_bulk_write(cls):
+        """
+        批量导入或清空集合后的钩子，子类可据此让内存索引失效
+        """
+        COLLECTION_VERSIONS.bump(cls.COLLECTION_NAME)
+        forget_records(cls.COLLECTION_NAME)
+        if cls.SEARCH_ENTITY:
+            cls.SEARCH_INDEX.clear(cls.SEARCH_ENTITY)
+    
+    @classmethod
+    def _after_partial_update(cls, record_id: str):
+        """
+        直接用 update_one 修改部分字段（不经过 update()）后的钩子
+        
+        Args:
+            record_id: 被修改的记录ID
+        """
+        COLLECTION_VERSIONS.bump(cls.COLLECTION_NAME)
+        forget_records(cls.COLLECTION_NAME, record_id)
+    
+    @classmethod
+    def build_search_index(cls) -> int:
+        """
+        从数据库加载本服务的全部记录并重建其搜索索引（应用启动时或首次检索时调用）
+        
+        索引随写入增量更新，从主节点读取，避免落后的从节点漏掉刚完成的写入；
+        加载期间发生写入时不标记为已构建（见 InvertedIndex.build）。
+        
+        Returns:
+            int: 索引的记录数量
+        """
+        version = COLLECTION_VERSIONS.get(cls.COLLECTION_NAME)
+        collection = get_collection(cls.COLLECTION_NAME)
+        documents = [cls._search_document(doc) for doc in collection.find({}, cls._search_projection())]
+        cls.SEARCH_INDEX.build(cls.SEARCH_ENTITY, documents, cls.COLLECTION_NAME, version)
+        return len(documents)
+    
+    @classmethod
+    def _search_projection(cls) -> Dict[str, int]:
+        """
+        构建搜索索引时需要读取的字段
+        
+        Returns:
+            Dict[str, int]: MongoDB 投影
+        """
+        fields = dict.fromkeys(TEXT_SEARCH_FIELDS[cls.COLLECTION_NAME], 1)
+        return {**fields, "id": 1, cls.PREFIX_SOURCE_FIELD: 1, "_id": 0}
+    
+    @classmethod
+    def _search_document(cls, record: Dict[str, Any]) -> Tuple[str, Dict[str, float], str]:
+        """
+        将记录转换为搜索索引文档
+        
+        Args:
+            record: 记录
+            
+        Returns:
+            Tuple: (记录ID, 加权词频, 显示名称)
+        """
+        terms = document_terms(record, TEXT_SEARCH_FIELDS[cls.COLLECTION_NAME])
+        return record["id"], terms, record.get(cls.PREFIX_SOURCE_FIELD) or ""
+    
+    @classmethod
+    def _index_search_document(cls, record: Dict[str, Any]):
+        """
+        本服务的搜索索引已构建时写入记录（未构建时在首次检索时整体加载）
+        
+        Args:
+            record: 完整记录
+        """
+        if cls.SEARCH_ENTITY:
+            cls.SEARCH_INDEX.upsert(cls.SEARCH_ENTITY, *cls._search_document(record), if_built=True)
+    
+    @classmethod
+    def _set_search_fields(cls, record_data: Dict[str, Any]):
+        """
+        根据名称字段生成规范化的前缀搜索字段（同步与异步实现共用）
+        
+        Args:
+            record_data: 新建或更新的记录数据，会被原地补全；不包含名称字段时不做处理
+        """
+        value = record_data.get(cls.PREFIX_SOURCE_FIELD)
+        if isinstance(value, str):
+            record_data[SEARCH_PREFIX_FIELD] = QueryParamsParser.normalize_prefix(value)
+    
+    @classmethod
+    def _build_search_query(cls, query: str, mode: Optional[str] = None) -> Dict[str, Any]:
+        """
+        构建搜索查询（同步与异步实现共用）
+        
+        Args:
+            query: 搜索关键词
+            mode: 搜索模式，为空时使用配置的默认模式
+            
+        Returns:
+            Dict[str, Any]: 包含 filter、projection 和 sort 的查询
+            
+        Raises:
+            ValueError: 不支持的搜索模式
+        """
+        search_mode = QueryParamsParser.parse_search_mode(mode)
+        search = {
+            "filter": QueryParamsParser.build_search_filter(query, search_mode, cls.SEARCH_FIELDS),
+            "projection": None,
+            "sort": None
+        }
+        if search_mode == "text":
+            search["projection"], search["sort"] = QueryParamsParser.build_relevance_sort()
+        search["projection"] = exclude_internal_fields(search["projection"])
+        return search
+    
+    @classmethod
+    def explain_search(cls, query: str, mode: Optional[str] = None, limit: int = 10) -> Dict[str, Any]:
+        """
+        获取搜索查询的执行计划摘要，用于确认搜索走索引扫描
+        
+        Args:
+            query: 搜索关键词
+            mode: 搜索模式
+            limit: 结果限制数量
+            
+        Returns:
+            Dict[str, Any]: 查询条件、执行阶段、使用的索引和扫描统计
+        """
+        collection = get_read_collection(cls.COLLECTION_NAME)
+        search = cls._build_search_query(query, mode)
+        
+        cursor = collection.find(search["filter"], search["projection"])
+        if search["sort"]:
+            cursor = cursor.sort(search["sort"])
+        explain = cursor.limit(limit).explain()
+        
+        stages, indexes = [], []
+        cls._collect_plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {}), stages, indexes)
+        execution_stats = explain.get("executionStats", {})
+        
+        return {
+            "collection": cls.COLLECTION_NAME,
+            "filter": json.loads(json_util.dumps(search["filter"])),
+            "stages": stages,
+            "indexes": indexes,
+            "uses_index": bool(indexes) and "COLLSCAN" not in stages,
+            "docs_examined": execution_stats.get("totalDocsExamined"),
+            "keys_examined": execution_stats.get("totalKeysExamined"),
+            "n_returned": execution_stats.get("nReturned")
+        }
+    
     @classmethod
-    def get_all(cls, params: Optional[QueryParams] = None) -> PaginatedResponse:
+    def _collect_plan_stages(cls, plan: Dict[str, Any], stages: List[str], indexes: List[str]):
+        """
+        递归收集执行计划中的阶段名和索引名
+        
+        Args:
+            plan: 执行计划节点
+            stages: 阶段名列表（原地追加）
+            indexes: 索引名列表（原地追加）
+        """
+        if not isinstance(plan, dict):
+            return
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        if plan.get("indexName") and plan["indexName"] not in indexes:
+            indexes.append(plan["indexName"])
+        # 新版查询引擎的执行计划嵌套在 queryPlan 中
+        for key in ("queryPlan", "inputStage"):
+            cls._collect_plan_stages(plan.get(key), stages, indexes)
+        for child in plan.get("inputStages", []):
+            cls._collect_plan_stages(child, stages, indexes)
+    
+    @classmethod
+    def _process_record(cls, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        处理记录，移除MongoDB特有字段并把浮点字段的 NaN 转换为 None
+        
+        Args:
+            record: 原始记录
+            
+        Returns:
+            Dict[str, Any]: 处理后的记录
+        """
+        return record_processor(cls.COLLECTION_NAME)(record)
+    
+    @classmethod
+    def _process_records(
+        cls,
+        records,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        批量处理按某个字段投影查询到的记录
+        
+        后处理流程按集合和投影编译一次后复用：投影已排除的内部字段不再逐条删除，
+        只检查投影中可能出现的浮点字段。
+        
+        Args:
+            records: 原始记录列表或游标
+            projection: 查询使用的字段投影
+            
+        Returns:
+            List[Dict[str, Any]]: 处理后的记录列表
+        """
+        return record_processor(cls.COLLECTION_NAME, projection).process_many(records)
+    
+    @classmethod
+    def _generate_id(cls) -> str:
+        """
+        生成唯一ID
+        
+        Returns:
+            str: 唯一ID
+        """
+        import uuid
+        return str(uuid.uuid4())
+
+
+class AsyncBaseService(BaseService):
+    """
+    异步基础服务类
+    
+    基于 Motor 的异步数据访问层，与 BaseService 提供同名的异步方法，
+    查询构建、数据验证和记录处理逻辑与同步实现共用。
+    具体服务通过 class AsyncXxxService(AsyncBaseService, XxxService) 继承集合配置。
+    """
+    
+    @classmethod
+    async def get_all(cls, params: Optional[QueryParams] = None) -> PaginatedResponse:
         """
         获取所有记录
         
@@ -30,67 +1374,283 @@ class BaseService:
             
         Returns:
             PaginatedResponse: 分页响应
+            
+        Raises:
+            ValueError: 游标令牌或总数统计模式无效
         """
         if not cls.COLLECTION_NAME:
             raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
         
-        collection = get_collection(cls.COLLECTION_NAME)
+        query = cls._build_list_query(params)
         
-        # 构建查询条件
-        filter_dict = {}
-        sort_params = None
-        projection = None
+        hit, cached, cache_key = await cls._cache_lookup_async("get_all", query, query["include"])
+        if hit:
+            return PaginatedResponse(**cached)
         
-        if params:
-            filter_dict = QueryParamsParser.build_mongo_filter(params)
-            sort_params = QueryParamsParser.build_mongo_sort(params)
-            projection = QueryParamsParser.build_mongo_projection(params)
+        collection = cls._cache_fill_collection_async(cls.COLLECTION_NAME)
         
-        # 计算总数
-        total = collection.count_documents(filter_dict)
+        # 查询数据
+        cursor = collection.find(query["filter"], query["projection"])
         
-        # 分页参数
-        page = params.page if params else 1
-        page_size = params.page_size if params else 10
-        skip = QueryParamsParser.calculate_skip(page, page_size)
+        if query["sort"]:
+            cursor = cursor.sort(query["sort"])
+        
+        cursor = cursor.skip(query["skip"]).limit(query["limit"])
+        
+        # 总数统计与分页查询并发执行
+        total, records = await asyncio.gather(
+            cls._count_records_async(collection, query["count_filter"], query["count_mode"]),
+            cursor.to_list(length=None)
+        )
+        await cls._expand_relations_async(records[:query["page_size"]], query["include"])
+        
+        response = cls._build_page_response(query, records, total)
+        await cls.QUERY_CACHE.store_async(cache_key, response.model_dump(exclude={"timestamp"}))
+        return response
+    
+    @classmethod
+    async def _count_records_async(cls, collection, filter_dict: Dict[str, Any], count_mode: str) -> Optional[int]:
+        """
+        按统计模式计算总数
+        
+        Args:
+            collection: 异步集合实例
+            filter_dict: 查询过滤器
+            count_mode: 'exact'、'estimated' 或 'none'
+            
+        Returns:
+            Optional[int]: 总数，'none' 模式下为 None
+        """
+        if count_mode == "none":
+            return None
+        
+        if count_mode == "estimated":
+            if not filter_dict:
+                return await collection.estimated_document_count()
+            return await collection.count_documents(filter_dict, limit=ESTIMATED_COUNT_LIMIT)
+        
+        return await collection.count_documents(filter_dict)
+    
+    @classmethod
+    async def _expand_relations_async(cls, records: List[Dict[str, Any]], relations: List[str]):
+        """
+        展开关联：每个关联一次 $in 查询，多个关联并发执行
+        
+        Args:
+            records: 原始记录（原地写入 included）
+            relations: 关联名称
+        """
+        if not records or not relations:
+            return
+        
+        async def fetch(relation: str) -> Dict[str, Dict[str, Any]]:
+            ids = cls._relation_ids(records, relation)
+            if not ids:
+                return {}
+            collection_name = cls.RELATIONS[relation][1]
+            collection = cls._cache_fill_collection_async(collection_name)
+            docs = await collection.find({"id": {"$in": ids}}, cls.RECORD_PROJECTION).to_list(length=None)
+            processor = record_processor(collection_name, cls.RECORD_PROJECTION)
+            return {doc["id"]: doc for doc in processor.process_many(docs)}
+        
+        results = await asyncio.gather(*(fetch(relation) for relation in relations))
+        cls._stitch_relations(records, relations, dict(zip(relations, results)))
+    
+    @classmethod
+    async def _find_records(
+        cls,
+        filter_dict: Dict[str, Any],
+        sort: Optional[List[tuple]] = None,
+        limit: int = 0,
+        projection: Optional[Dict[str, Any]] = None,
+        cached: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        查询并处理记录列表（异步服务方法的公共实现）
+        
+        Args:
+            filter_dict: 查询过滤器
+            sort: 排序参数
+            limit: 结果限制数量，0 表示不限制
+            projection: 字段投影，_id 和内部字段总是由数据库排除
+            cached: 结果是否会写入查询缓存（见 _cache_fill_collection）
+            
+        Returns:
+            List[Dict[str, Any]]: 处理后的记录列表
+        """
+        if cached:
+            collection = cls._cache_fill_collection_async(cls.COLLECTION_NAME)
+        else:
+            collection = get_async_read_collection(cls.COLLECTION_NAME)
+        projection = exclude_internal_fields(projection)
         
-        # 查询数据
         cursor = collection.find(filter_dict, projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
         
-        if sort_params:
-            cursor = cursor.sort(sort_params)
+        records = await cursor.to_list(length=None)
+        return cls._process_records(records, projection)
+    
+    @classmethod
+    async def _load_by_id(cls, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        按ID读取单条原始记录
         
-        records = list(cursor.skip(skip).limit(page_size))
+        在请求范围内经由请求级加载器：同一轮次的并发读取合并为一次 $in 查询，
+        已读过的记录直接复用；请求之外退化为 find_one。
         
-        # 处理数据
-        processed_records = []
-        for record in records:
-            processed_record = cls._process_record(record)
-            processed_records.append(processed_record)
+        Args:
+            record_id: 记录 ID
+            
+        Returns:
+            Optional[Dict[str, Any]]: 原始记录，不存在时返回 None
+        """
+        loader = cls._record_loader()
+        if loader is None:
+            collection = get_async_collection(cls.COLLECTION_NAME)
+            return await collection.find_one({"id": record_id})
+        return await loader.load(record_id)
+    
+    @classmethod
+    async def _load_update_context(cls, record_id: str, projection: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """
+        读取校验更新数据需要的现有字段
         
-        return create_paginated_response(
-            data=processed_records,
-            total=total,
-            page=page,
-            page_size=page_size
+        在请求范围内经由请求级加载器（已读过的记录直接复用），请求之外只按投影读取需要的字段。
+        
+        Args:
+            record_id: 记录 ID
+            projection: 需要的字段投影
+            
+        Returns:
+            Optional[Dict[str, Any]]: 现有记录（可能只含投影字段），不存在时返回 None
+        """
+        loader = cls._record_loader()
+        if loader is not None:
+            return await loader.load(record_id)
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        return await collection.find_one({"id": record_id}, projection)
+    
+    @classmethod
+    def _record_loader(cls) -> Optional[RecordLoader]:
+        """
+        获取当前请求中本集合的加载器
+        
+        Returns:
+            Optional[RecordLoader]: 加载器，不在请求范围内时返回 None
+        """
+        return request_loader(cls.COLLECTION_NAME, cls._fetch_by_ids)
+    
+    @classmethod
+    async def _fetch_by_ids(cls, record_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        加载器使用的批量查询
+        
+        Args:
+            record_ids: 记录 ID 列表
+            
+        Returns:
+            List[Dict[str, Any]]: 原始记录
+        """
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        return await collection.find({"id": {"$in": record_ids}}).to_list(length=None)
+    
+    @classmethod
+    def _cache_fill_collection_async(cls, collection_name: str):
+        """
+        获取查询结果会写入查询缓存时使用的异步集合（同 _cache_fill_collection）
+        
+        Args:
+            collection_name: 集合名称
+            
+        Returns:
+            AsyncIOMotorCollection: Motor 集合
+        """
+        if cls.QUERY_CACHE.enabled:
+            return get_async_collection(collection_name)
+        return get_async_read_collection(collection_name)
+    
+    @classmethod
+    async def _cache_lookup_async(
+        cls,
+        kind: str,
+        payload: Any,
+        relations: Optional[List[str]] = None
+    ) -> Tuple[bool, Any, Any]:
+        """
+        查找查询缓存
+        
+        Args:
+            kind: 查询类型
+            payload: 决定查询结果的参数
+            relations: 展开的关联
+            
+        Returns:
+            Tuple[bool, Any, Any]: (是否命中, 缓存值, 写回时使用的缓存键)
+        """
+        return await cls.QUERY_CACHE.lookup_async(
+            cls._cache_collections(relations), f"{cls.COLLECTION_NAME}.{kind}", payload
         )
     
     @classmethod
-    def get_by_id(cls, record_id: str) -> APIResponse:
+    async def _cached_find_async(
+        cls,
+        kind: str,
+        filter_dict: Dict[str, Any],
+        sort: Optional[List[tuple]] = None,
+        limit: int = 0,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        经过查询缓存的 _find_records（结果只依赖本集合）
+        
+        Args:
+            kind: 查询类型
+            filter_dict: 查询过滤器
+            sort: 排序参数
+            limit: 结果限制数量，0 表示不限制
+            projection: 字段投影
+            
+        Returns:
+            List[Dict[str, Any]]: 处理后的记录列表
+        """
+        payload = {"filter": filter_dict, "sort": sort, "limit": limit, "projection": projection}
+        hit, cached, cache_key = await cls._cache_lookup_async(kind, payload)
+        if hit:
+            return cached
+        
+        records = await cls._find_records(filter_dict, sort=sort, limit=limit, projection=projection, cached=True)
+        await cls.QUERY_CACHE.store_async(cache_key, records)
+        return records
+    
+    @classmethod
+    async def get_by_id(cls, record_id: str, include: Optional[List[str]] = None) -> APIResponse:
         """
         根据 ID 获取记录
         
         Args:
             record_id: 记录 ID
+            include: 需要展开的关联
             
         Returns:
             APIResponse: API响应
+            
+        Raises:
+            ValueError: 关联字段无效
         """
         if not cls.COLLECTION_NAME:
             raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
         
-        collection = get_collection(cls.COLLECTION_NAME)
-        record = collection.find_one({"id": record_id})
+        relations = cls._parse_relations(include)
+        hit, cached, cache_key = await cls._cache_lookup_async(
+            "get_by_id", {"id": record_id, "include": relations}, relations
+        )
+        if hit:
+            return create_success_response(data=cached)
+        
+        record = await cls._load_by_id(record_id)
         
         if not record:
             return create_error_response(
@@ -98,11 +1658,13 @@ class BaseService:
                 code=404
             )
         
+        await cls._expand_relations_async([record], relations)
         processed_record = cls._process_record(record)
+        await cls.QUERY_CACHE.store_async(cache_key, processed_record)
         return create_success_response(data=processed_record)
     
     @classmethod
-    def create(cls, record_data: Dict[str, Any]) -> APIResponse:
+    async def create(cls, record_data: Dict[str, Any]) -> APIResponse:
         """
         创建记录
         
@@ -116,41 +1678,27 @@ class BaseService:
             raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
         
         try:
-            collection = get_collection(cls.COLLECTION_NAME)
+            collection = get_async_collection(cls.COLLECTION_NAME)
             
-            # 生成ID（如果没有提供）
-            if "id" not in record_data or not record_data["id"]:
-                record_data["id"] = cls._generate_id()
+            # 生成ID、添加时间戳并验证数据
+            error_response = cls._prepare_new_record(record_data)
+            if error_response:
+                return error_response
             
             # 检查ID唯一性
-            existing = collection.find_one({"id": record_data["id"]})
+            existing = await cls._load_by_id(record_data["id"])
             if existing:
                 return create_error_response(
                     message=f"Record with ID {record_data['id']} already exists",
                     code=409
                 )
             
-            # 添加时间戳
-            now = datetime.utcnow()
-            record_data["created_at"] = now
-            record_data["updated_at"] = now
-            
-            # 验证数据
-            if cls.MODEL_CLASS:
-                model_instance = cls.MODEL_CLASS.from_dict(record_data)
-                validation_errors = model_instance.validate_data()
-                if validation_errors:
-                    return create_error_response(
-                        message="Validation failed",
-                        code=400,
-                        error_details={"validation_errors": validation_errors}
-                    )
-            
             # 插入数据
-            collection.insert_one(record_data)
+            await collection.insert_one(record_data)
             
             # 返回创建的记录
             created_record = cls._process_record(record_data)
+            cls._after_create(created_record)
             return create_success_response(
                 data=created_record,
                 message="Record created successfully",
@@ -164,71 +1712,59 @@ class BaseService:
             )
     
     @classmethod
-    def update(cls, record_id: str, record_data: Dict[str, Any]) -> APIResponse:
+    async def bulk_create(cls, records: List[Dict[str, Any]]) -> APIResponse:
         """
-        更新记录
+        批量创建记录（异步）
         
         Args:
-            record_id: 记录 ID
-            record_data: 要更新的记录数据
+            records: 记录数据列表
             
         Returns:
-            APIResponse: API响应
+            APIResponse: API响应，data 包含 created_count、created_ids 和按记录下标给出的 errors
         """
         if not cls.COLLECTION_NAME:
             raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
         
         try:
-            collection = get_collection(cls.COLLECTION_NAME)
-            
-            # 检查记录是否存在
-            existing = collection.find_one({"id": record_id})
-            if not existing:
-                return create_error_response(
-                    message=f"Record with ID {record_id} not found",
-                    code=404
-                )
+            collection = get_async_collection(cls.COLLECTION_NAME)
             
-            # 更新时间戳
-            record_data["updated_at"] = datetime.utcnow()
+            # 验证数据并去除批次内重复ID
+            candidates, errors = cls._prepare_bulk_records(records)
             
-            # 验证数据
-            if cls.MODEL_CLASS:
-                # 合并现有数据和更新数据进行验证
-                merged_data = {**existing, **record_data}
-                model_instance = cls.MODEL_CLASS.from_dict(merged_data)
-                validation_errors = model_instance.validate_data()
-                if validation_errors:
-                    return create_error_response(
-                        message="Validation failed",
-                        code=400,
-                        error_details={"validation_errors": validation_errors}
-                    )
+            # 检查数据库中已存在的ID
+            ids = [record["id"] for _, record in candidates]
+            existing_ids = set()
+            if ids:
+                existing_ids = {
+                    doc["id"] async for doc in collection.find({"id": {"$in": ids}}, {"id": 1, "_id": 0})
+                }
+            candidates, existing_errors = cls._exclude_existing(candidates, existing_ids)
+            errors.extend(existing_errors)
             
-            # 更新数据
-            collection.update_one({"id": record_id}, {"$set": record_data})
+            # 批量插入
+            write_errors = []
+            if candidates:
+                try:
+                    await collection.insert_many([record for _, record in candidates], ordered=False)
+                except BulkWriteError as e:
+                    write_errors = e.details.get("writeErrors", [])
             
-            # 返回更新后的记录
-            updated_record = collection.find_one({"id": record_id})
-            processed_record = cls._process_record(updated_record)
-            return create_success_response(
-                data=processed_record,
-                message="Record updated successfully"
-            )
+            return cls._build_bulk_response(len(records), candidates, errors, write_errors)
             
         except Exception as e:
             return create_error_response(
-                message=f"Failed to update record: {str(e)}",
+                message=f"Failed to bulk create records: {str(e)}",
                 code=500
             )
     
     @classmethod
-    def delete(cls, record_id: str) -> APIResponse:
+    async def update(cls, record_id: str, record_data: Dict[str, Any]) -> APIResponse:
         """
-        删除记录
+        更新记录
         
         Args:
             record_id: 记录 ID
+            record_data: 要更新的记录数据
             
         Returns:
             APIResponse: API响应
@@ -237,134 +1773,129 @@ class BaseService:
             raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
         
         try:
-            collection = get_collection(cls.COLLECTION_NAME)
+            collection = get_async_collection(cls.COLLECTION_NAME)
+            
+            # 只有修改了组合校验字段中的一部分时，才读取其余字段的现有值
+            pre_image = None
+            context_projection = cls._update_context_projection(record_data)
+            if context_projection:
+                pre_image = await cls._load_update_context(record_id, context_projection)
+                if not pre_image:
+                    return create_error_response(
+                        message=f"Record with ID {record_id} not found",
+                        code=404
+                    )
+            
+            # 更新时间戳并验证数据；校验失败时先确认记录存在，不存在的记录返回 404 而不是 400
+            error_response = cls._prepare_update(record_data, pre_image)
+            if error_response:
+                if pre_image is None and not await collection.find_one({"id": record_id}, {"_id": 1}):
+                    return create_error_response(
+                        message=f"Record with ID {record_id} not found",
+                        code=404
+                    )
+                return error_response
             
-            # 检查记录是否存在
-            existing = collection.find_one({"id": record_id})
-            if not existing:
+            # 更新并返回更新后的记录（一次往返）
+            updated_record = await collection.find_one_and_update(
+                {"id": record_id},
+                {"$set": record_data},
+                projection=cls.RECORD_PROJECTION,
+                return_document=ReturnDocument.AFTER
+            )
+            if not updated_record:
                 return create_error_response(
                     message=f"Record with ID {record_id} not found",
                     code=404
                 )
             
-            # 删除记录
-            result = collection.delete_one({"id": record_id})
+            processed_record = record_processor(cls.COLLECTION_NAME, cls.RECORD_PROJECTION)(updated_record)
+            cls._after_update(processed_record)
+            return create_success_response(
+                data=processed_record,
+                message="Record updated successfully"
+            )
             
-            if result.deleted_count > 0:
-                return create_success_response(
-                    message="Record deleted successfully"
-                )
-            else:
-                return create_error_response(
-                    message="Failed to delete record",
-                    code=500
-                )
-                
         except Exception as e:
             return create_error_response(
-                message=f"Failed to delete record: {str(e)}",
+                message=f"Failed to update record: {str(e)}",
                 code=500
             )
     
     @classmethod
-    def import_from_csv(cls, csv_path: str, clear_existing: bool = False) -> APIResponse:
+    async def delete(cls, record_id: str) -> APIResponse:
         """
-        从 CSV 文件导入数据
+        删除记录
         
         Args:
-            csv_path: CSV 文件路径
-            clear_existing: 是否清除现有数据
+            record_id: 记录 ID
             
         Returns:
-            APIResponse: 导入结果
+            APIResponse: API响应
         """
+        if not cls.COLLECTION_NAME:
+            raise NotImplementedError("COLLECTION_NAME must be defined in subclass")
+        
         try:
-            # 读取 CSV 文件
-            df = pd.read_csv(csv_path)
-            
-            # 验证数据
-            if cls.MODEL_CLASS:
-                errors = cls.MODEL_CLASS.validate_csv_data(df)
-                if errors:
-                    return create_error_response(
-                        message="CSV validation failed",
-                        code=400,
-                        error_details={"validation_errors": errors}
-                    )
-            
-            # 转换为记录列表
-            records = df.to_dict('records')
+            collection = get_async_collection(cls.COLLECTION_NAME)
             
-            # 获取集合
-            collection = get_collection(cls.COLLECTION_NAME)
-            
-            # 清除现有数据（如果需要）
-            if clear_existing:
-                collection.delete_many({})
-            
-            # 处理记录
-            processed_records = []
-            for record in records:
-                # 清理数据
-                cleaned_record = BaseModel.clean_data(record)
-                
-                # 生成ID（如果没有）
-                if "id" not in cleaned_record or not cleaned_record["id"]:
-                    cleaned_record["id"] = cls._generate_id()
-                
-                # 添加时间戳
-                now = datetime.utcnow()
-                cleaned_record["created_at"] = now
-                cleaned_record["updated_at"] = now
-                
-                processed_records.append(cleaned_record)
-            
-            # 插入记录
-            if processed_records:
-                collection.insert_many(processed_records)
+            # 删除记录，未删除任何记录说明记录不存在
+            result = await collection.delete_one({"id": record_id})
+            if not result.deleted_count:
+                return create_error_response(
+                    message=f"Record with ID {record_id} not found",
+                    code=404
+                )
             
+            cls._after_delete(record_id)
             return create_success_response(
-                data={
-                    "rows_processed": len(processed_records),
-                    "sample_records": processed_records[:3] if len(processed_records) > 3 else processed_records
-                },
-                message=f"Successfully imported {len(processed_records)} records"
+                message="Record deleted successfully"
             )
-            
+                
         except Exception as e:
             return create_error_response(
-                message=f"Failed to import CSV: {str(e)}",
+                message=f"Failed to delete record: {str(e)}",
                 code=500
             )
     
     @classmethod
-    def _process_record(cls, record: Dict[str, Any]) -> Dict[str, Any]:
+    async def import_from_csv(
+        cls,
+        csv_path: str,
+        clear_existing: bool = False,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> APIResponse:
         """
-        处理记录，移除MongoDB特有字段并转换数据类型
+        从 CSV 文件流式导入数据
+        
+        CSV 解析是 CPU 密集型操作，在线程池中执行同步实现，避免阻塞事件循环。
+        progress_callback 在工作线程中调用。
         
         Args:
-            record: 原始记录
+            csv_path: CSV 文件路径
+            clear_existing: 是否清除现有数据
+            chunk_size: 每个分块的行数
+            progress_callback: 每个分块处理完成后调用，参数为当前进度字典
             
         Returns:
-            Dict[str, Any]: 处理后的记录
+            APIResponse: 导入结果
         """
-        if "_id" in record:
-            del record["_id"]
-        
-        # 转换 NaN 值为 None
-        for key, value in record.items():
-            if isinstance(value, float) and pd.isna(value):
-                record[key] = None
-        
-        return record
+        return await asyncio.to_thread(
+            super().import_from_csv, csv_path, clear_existing, chunk_size, progress_callback
+        )
     
     @classmethod
-    def _generate_id(cls) -> str:
+    async def _build_search_index_async(cls) -> int:
         """
-        生成唯一ID
+        从数据库加载本服务的全部记录并重建其搜索索引（从主节点读取，并做版本检查，同 build_search_index）
         
         Returns:
-            str: 唯一ID
+            int: 索引的记录数量
         """
-        import uuid
-        return str(uuid.uuid4())
+        version = COLLECTION_VERSIONS.get(cls.COLLECTION_NAME)
+        collection = get_async_collection(cls.COLLECTION_NAME)
+        docs = await collection.find({}, cls._search_projection()).to_list(length=None)
+        documents = [cls._search_document(doc) for doc in docs]
+        cls.SEARCH_INDEX.build(cls.SEARCH_ENTITY, documents, cls.COLLECTION_NAME, version)
+        return len(documents)
@@ -0,0 +1,142 @@
+from typing import List, Dict, Any, Optional
+import time
+
+from .base_service import BaseService
+from .artist_service import ArtistService, AsyncArtistService
+from .artwork_service import ArtworkService, AsyncArtworkService
+from .art_movement_service import ArtMovementService, AsyncArtMovementService
+
+
+class SearchService:
+    """
+    跨实体搜索服务
+
+    在进程内倒排索引（BaseService.SEARCH_INDEX）上按 BM25 检索艺术家、作品和艺术运动。
+    各实体的索引在首次检索时从数据库加载，之后由服务的写入钩子增量维护。
+    """
+
+    SERVICES = (ArtistService, ArtworkService, ArtMovementService)
+
+    @classmethod
+    def entity_types(cls) -> List[str]:
+        """
+        支持的实体类型
+
+        Returns:
+            List[str]: 实体类型列表
+        """
+        return [service.SEARCH_ENTITY for service in cls.SERVICES]
+
+    @classmethod
+    def build_indexes(cls) -> Dict[str, int]:
+        """
+        重建所有实体的搜索索引（应用启动时调用）
+
+        Returns:
+            Dict[str, int]: 实体类型到索引记录数量的映射
+        """
+        return {service.SEARCH_ENTITY: service.build_search_index() for service in cls.SERVICES}
+
+    @classmethod
+    def search(cls, query: str, types: Optional[List[str]] = None, limit: int = 20) -> Dict[str, Any]:
+        """
+        跨实体搜索
+
+        Args:
+            query: 搜索关键词
+            types: 限定的实体类型，为空时搜索全部
+            limit: 结果限制数量
+
+        Returns:
+            Dict[str, Any]: 搜索结果
+
+        Raises:
+            ValueError: 不支持的实体类型
+        """
+        services = cls._resolve_services(types)
+        for service in services:
+            if not BaseService.SEARCH_INDEX.is_built(service.SEARCH_ENTITY):
+                service.build_search_index()
+
+        return cls._run_search(query, services, limit)
+
+    @classmethod
+    def _resolve_services(cls, types: Optional[List[str]]) -> List[type]:
+        """
+        根据实体类型选出需要检索的服务
+
+        Args:
+            types: 实体类型列表
+
+        Returns:
+            List[type]: 服务类列表
+
+        Raises:
+            ValueError: 不支持的实体类型
+        """
+        if not types:
+            return list(cls.SERVICES)
+
+        services_by_type = {service.SEARCH_ENTITY: service for service in cls.SERVICES}
+        unknown = [entity for entity in types if entity not in services_by_type]
+        if unknown:
+            raise ValueError(
+                f"Unsupported search type(s) {', '.join(unknown)}, expected: {', '.join(services_by_type)}"
+            )
+        return [services_by_type[entity] for entity in dict.fromkeys(types)]
+
+    @classmethod
+    def _run_search(cls, query: str, services: List[type], limit: int) -> Dict[str, Any]:
+        """
+        在已构建的索引上执行检索（同步与异步实现共用）
+
+        Args:
+            query: 搜索关键词
+            services: 需要检索的服务
+            limit: 结果限制数量
+
+        Returns:
+            Dict[str, Any]: 包含 query、hits、took_ms 的搜索结果
+        """
+        start = time.perf_counter()
+        hits = BaseService.SEARCH_INDEX.search(
+            query, limit=limit, entities=[service.SEARCH_ENTITY for service in services]
+        )
+        return {
+            "query": query,
+            "hits": hits,
+            "took_ms": round((time.perf_counter() - start) * 1000, 3)
+        }
+
+
+class AsyncSearchService(SearchService):
+    """
+    异步跨实体搜索服务
+
+    检索本身在内存中完成，只有首次加载索引时需要异步访问数据库。
+    """
+
+    SERVICES = (AsyncArtistService, AsyncArtworkService, AsyncArtMovementService)
+
+    @classmethod
+    async def search(cls, query: str, types: Optional[List[str]] = None, limit: int = 20) -> Dict[str, Any]:
+        """
+        跨实体搜索
+
+        Args:
+            query: 搜索关键词
+            types: 限定的实体类型，为空时搜索全部
+            limit: 结果限制数量
+
+        Returns:
+            Dict[str, Any]: 搜索结果
+
+        Raises:
+            ValueError: 不支持的实体类型
+        """
+        services = cls._resolve_services(types)
+        for service in services:
+            if not BaseService.SEARCH_INDEX.is_built(service.SEARCH_ENTITY):
+                await service._build_search_index_async()
+
+        return cls._run_search(query, services, limit)
@@ -0,0 +1,330 @@
+import threading
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+import numpy as np
+
+from app.utils.collection_versions import COLLECTION_VERSIONS
+
+
+class ArtistGraph:
+    """
+    艺术家社交网络图
+
+    以 agent.connected_network_ids 为边，按无向图处理（任一方声明连接即视为相连）。
+    艺术家ID映射为连续的整数下标，邻接关系保存为 CSR 数组：indices[indptr[i]:indptr[i + 1]]
+    是下标 i 的邻居（升序）。写入只更新各节点声明的连接，CSR 数组在下一次查询时整体重建。
+    指向不存在的艺术家的连接会被保留，但在该艺术家出现之前不产生边。
+    """
+
+    def __init__(self, collection_name: Optional[str] = None):
+        self.collection_name = collection_name
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        """
+        清空图并标记为未构建
+        """
+        with self._lock:
+            self._connections: Dict[str, Tuple[str, ...]] = {}
+            self._names: Dict[str, str] = {}
+            self._ids: List[str] = []
+            self._index: Dict[str, int] = {}
+            self._indptr = np.zeros(1, dtype=np.int64)
+            self._indices = np.zeros(0, dtype=np.int32)
+            self._dirty = False
+            self.built = False
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def __contains__(self, artist_id: str) -> bool:
+        return artist_id in self._connections
+
+    def current_version(self) -> Optional[int]:
+        """
+        获取集合的当前版本号（加载数据前读取，传给 build()）
+
+        Returns:
+            Optional[int]: 版本号，未指定集合时为 None
+        """
+        if self.collection_name is None:
+            return None
+        return COLLECTION_VERSIONS.get(self.collection_name)
+
+    def build(self, artists: Iterable[Tuple[str, str, Optional[List[str]]]], version: Optional[int] = None):
+        """
+        用 (艺术家ID, 名称, 连接ID列表) 序列重建图
+
+        加载期间发生写入（版本号已变化）时仍写入图，但不标记为已构建，下一次查询时重新加载。
+
+        Args:
+            artists: 艺术家序列
+            version: 加载数据前读取的集合版本号
+        """
+        with self._lock:
+            self.clear()
+            for artist_id, name, connected_ids in artists:
+                self._set(artist_id, name, connected_ids)
+            self._rebuild()
+            self.built = version is None or version == self.current_version()
+
+    def upsert(
+        self,
+        artist_id: str,
+        name: str,
+        connected_ids: Optional[List[str]],
+        if_built: bool = False
+    ):
+        """
+        插入或更新艺术家及其声明的连接
+
+        Args:
+            artist_id: 艺术家ID
+            name: 名称
+            connected_ids: 连接的艺术家ID
+            if_built: 只在图已构建时写入（与 build() 的版本检查在同一把锁内判断）
+        """
+        with self._lock:
+            if if_built and not self.built:
+                return
+            self._set(artist_id, name, connected_ids)
+            self._dirty = True
+
+    def remove(self, artist_id: str):
+        """
+        移除艺术家（及与其相连的边）
+
+        Args:
+            artist_id: 艺术家ID
+        """
+        with self._lock:
+            if self._connections.pop(artist_id, None) is not None:
+                self._names.pop(artist_id, None)
+                self._dirty = True
+
+    def name(self, artist_id: str) -> str:
+        """
+        获取艺术家名称
+
+        Args:
+            artist_id: 艺术家ID
+
+        Returns:
+            str: 名称
+        """
+        return self._names.get(artist_id, "")
+
+    def neighbors(self, artist_id: str) -> List[str]:
+        """
+        获取直接相连的艺术家
+
+        Args:
+            artist_id: 艺术家ID
+
+        Returns:
+            List[str]: 邻居ID，艺术家不存在时为空
+        """
+        with self._lock:
+            self._ensure_fresh()
+            node = self._index.get(artist_id)
+            if node is None:
+                return []
+            return [self._ids[neighbor] for neighbor in self._neighbor_slice(node)]
+
+    def k_hop(self, artist_id: str, depth: int, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        按层 BFS 获取 depth 跳以内可达的艺术家
+
+        Args:
+            artist_id: 起点艺术家ID
+            depth: 最大跳数
+            limit: 返回数量上限（按距离从近到远截断）
+
+        Returns:
+            List[Tuple[str, int]]: (艺术家ID, 距离) 列表，按距离、ID排序，不含起点
+        """
+        with self._lock:
+            self._ensure_fresh()
+            source = self._index.get(artist_id)
+            if source is None or depth <= 0:
+                return []
+
+            distances = self._bfs(source, depth)
+            reached = np.flatnonzero(distances > 0)
+            order = np.lexsort((reached, distances[reached]))
+            if limit is not None:
+                order = order[:limit]
+            return [(self._ids[reached[i]], int(distances[reached[i]])) for i in order]
+
+    def mutual(self, artist_id: str, other_id: str) -> List[str]:
+        """
+        获取两位艺术家的共同连接
+
+        Args:
+            artist_id: 艺术家ID
+            other_id: 另一位艺术家ID
+
+        Returns:
+            List[str]: 共同邻居ID
+        """
+        with self._lock:
+            self._ensure_fresh()
+            first = self._index.get(artist_id)
+            second = self._index.get(other_id)
+            if first is None or second is None:
+                return []
+            common = np.intersect1d(
+                self._neighbor_slice(first), self._neighbor_slice(second), assume_unique=True
+            )
+            return [self._ids[node] for node in common]
+
+    def shortest_path(self, artist_id: str, other_id: str, max_depth: Optional[int] = None) -> Optional[List[str]]:
+        """
+        BFS 求最短路径
+
+        Args:
+            artist_id: 起点艺术家ID
+            other_id: 终点艺术家ID
+            max_depth: 最大跳数，为空时不限
+
+        Returns:
+            Optional[List[str]]: 包含起点和终点的路径，不可达时返回 None
+        """
+        with self._lock:
+            self._ensure_fresh()
+            source = self._index.get(artist_id)
+            target = self._index.get(other_id)
+            if source is None or target is None:
+                return None
+            if source == target:
+                return [artist_id]
+
+            parents = np.full(len(self._ids), -1, dtype=np.int64)
+            parents[source] = source
+            frontier = np.array([source], dtype=np.int64)
+            hops = 0
+            while frontier.size and (max_depth is None or hops < max_depth):
+                hops += 1
+                sources, neighbors = self._expand(frontier)
+                fresh = parents[neighbors] < 0
+                sources, neighbors = sources[fresh], neighbors[fresh]
+                # 同一节点可能被多个前驱发现，保留第一个
+                neighbors, first = np.unique(neighbors, return_index=True)
+                parents[neighbors] = sources[first]
+                if parents[target] >= 0:
+                    path = [target]
+                    while path[-1] != source:
+                        path.append(int(parents[path[-1]]))
+                    return [self._ids[node] for node in reversed(path)]
+                frontier = neighbors
+            return None
+
+    def degree(self, artist_id: str) -> Optional[int]:
+        """
+        获取艺术家的度数
+
+        Args:
+            artist_id: 艺术家ID
+
+        Returns:
+            Optional[int]: 度数，艺术家不存在时返回 None
+        """
+        with self._lock:
+            self._ensure_fresh()
+            node = self._index.get(artist_id)
+            if node is None:
+                return None
+            return int(self._indptr[node + 1] - self._indptr[node])
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        图的整体统计
+
+        Returns:
+            Dict[str, Any]: 节点数、边数、平均/最大度数、孤立节点数
+        """
+        with self._lock:
+            self._ensure_fresh()
+            degrees = np.diff(self._indptr)
+            node_count = len(self._ids)
+            return {
+                "nodes": node_count,
+                "edges": int(self._indices.size // 2),
+                "average_degree": round(float(degrees.mean()), 4) if node_count else 0.0,
+                "max_degree": int(degrees.max()) if node_count else 0,
+                "isolated": int(np.count_nonzero(degrees == 0))
+            }
+
+    def _set(self, artist_id: str, name: str, connected_ids: Optional[List[str]]):
+        self._connections[artist_id] = tuple(
+            connected_id for connected_id in (connected_ids or ()) if connected_id != artist_id
+        )
+        self._names[artist_id] = name or ""
+
+    def _ensure_fresh(self):
+        if self._dirty:
+            self._rebuild()
+
+    def _rebuild(self):
+        ids = list(self._connections)
+        index = {artist_id: node for node, artist_id in enumerate(ids)}
+
+        sources, targets = [], []
+        for artist_id, connected_ids in self._connections.items():
+            node = index[artist_id]
+            for connected_id in connected_ids:
+                neighbor = index.get(connected_id)
+                if neighbor is not None:
+                    sources.append(node)
+                    targets.append(neighbor)
+
+        node_count = len(ids)
+        src = np.array(sources + targets, dtype=np.int64)
+        dst = np.array(targets + sources, dtype=np.int64)
+        # 按 (源, 目标) 排序去重，得到每个节点升序排列的邻居
+        keys = np.unique(src * node_count + dst)
+        src, dst = keys // max(node_count, 1), keys % max(node_count, 1)
+
+        self._ids = ids
+        self._index = index
+        self._indptr = np.concatenate(([0], np.cumsum(np.bincount(src, minlength=node_count)))).astype(np.int64)
+        self._indices = dst.astype(np.int32)
+        self._dirty = False
+
+    def _neighbor_slice(self, node: int) -> np.ndarray:
+        return self._indices[self._indptr[node]:self._indptr[node + 1]]
+
+    def _expand(self, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        一次性展开一层节点的所有邻居
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (前驱下标, 邻居下标)
+        """
+        starts = self._indptr[frontier]
+        counts = self._indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        # 每条边在 indices 中的位置：各段起点 + 段内偏移
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(starts, counts) + offsets
+        return np.repeat(frontier, counts), self._indices[positions].astype(np.int64)
+
+    def _bfs(self, source: int, depth: int) -> np.ndarray:
+        """
+        返回各节点到起点的距离（不可达为 -1）
+        """
+        distances = np.full(len(self._ids), -1, dtype=np.int64)
+        distances[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        for hop in range(1, depth + 1):
+            _, neighbors = self._expand(frontier)
+            neighbors = np.unique(neighbors[distances[neighbors] < 0])
+            if neighbors.size == 0:
+                break
+            distances[neighbors] = hop
+            frontier = neighbors
+        return distances
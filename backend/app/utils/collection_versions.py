@@ -0,0 +1,152 @@
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class CollectionVersions:
+    """
+    集合版本号
+
+    每次通过服务层写入集合时版本号加一，基于集合内容的缓存记录生成时的版本号，
+    版本号变化即视为失效。版本号只在当前进程内有效，跨进程的缓存可通过 subscribe()
+    在版本变化时同步失效。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        self._listeners: List[Callable[[str], None]] = []
+
+    def get(self, collection_name: str) -> int:
+        """
+        获取集合的当前版本号
+
+        Args:
+            collection_name: 集合名称
+
+        Returns:
+            int: 版本号
+        """
+        return self._versions.get(collection_name, 0)
+
+    def bump(self, collection_name: str) -> int:
+        """
+        集合写入后递增版本号
+
+        Args:
+            collection_name: 集合名称
+
+        Returns:
+            int: 新的版本号
+        """
+        with self._lock:
+            version = self._versions.get(collection_name, 0) + 1
+            self._versions[collection_name] = version
+        for listener in self._listeners:
+            listener(collection_name)
+        return version
+
+    def subscribe(self, listener: Callable[[str], None]):
+        """
+        注册版本变化回调
+
+        Args:
+            listener: 以集合名称为参数的回调
+        """
+        self._listeners.append(listener)
+
+
+COLLECTION_VERSIONS = CollectionVersions()
+
+
+class VersionedSnapshot:
+    """
+    按集合版本失效的物化数据
+
+    保存数据、生成时的集合版本号和基于内容的 ETag。ETag 由数据内容计算，
+    因此不同进程对相同数据给出相同的 ETag，可安全用于 If-None-Match 校验。
+    """
+
+    def __init__(self, collection_name: str):
+        self.collection_name = collection_name
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """
+        丢弃已物化的数据
+        """
+        with self._lock:
+            self._snapshot: Optional[Tuple[int, Any, str]] = None
+
+    def current_version(self) -> int:
+        """
+        获取集合的当前版本号（加载数据前读取，加载期间发生的写入会使结果在下次读取时失效）
+
+        Returns:
+            int: 版本号
+        """
+        return COLLECTION_VERSIONS.get(self.collection_name)
+
+    def get(self) -> Optional[Tuple[Any, str]]:
+        """
+        获取仍然有效的数据
+
+        Returns:
+            Optional[Tuple[Any, str]]: (数据, ETag)，未物化或已失效时返回 None
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] != self.current_version():
+            return None
+        return snapshot[1], snapshot[2]
+
+    def set(self, version: int, data: Any) -> Tuple[Any, str]:
+        """
+        保存物化数据
+
+        Args:
+            version: 加载数据前读取的集合版本号
+            data: 可 JSON 序列化的数据
+
+        Returns:
+            Tuple[Any, str]: (数据, ETag)
+        """
+        etag = self.compute_etag(data)
+        with self._lock:
+            self._snapshot = (version, data, etag)
+        return data, etag
+
+    @staticmethod
+    def compute_etag(data: Any) -> str:
+        """
+        根据数据内容计算强 ETag
+
+        Args:
+            data: 可 JSON 序列化的数据
+
+        Returns:
+            str: 带引号的 ETag
+        """
+        payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+        return '"' + hashlib.sha1(payload.encode("utf-8")).hexdigest() + '"'
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """
+        判断 If-None-Match 请求头是否与 ETag 匹配（弱比较）
+
+        Args:
+            if_none_match: If-None-Match 请求头
+            etag: 当前 ETag
+
+        Returns:
+            bool: 匹配时可返回 304
+        """
+        if not if_none_match:
+            return False
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or any(
+            (candidate[2:] if candidate.startswith("W/") else candidate) == etag
+            for candidate in candidates
+        )
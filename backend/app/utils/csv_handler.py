@@ -1,8 +1,8 @@
 import os
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
 from fastapi import UploadFile
-from app.core.config import DATA_DIR
+from app.core.config import DATA_DIR, IMPORT_CHUNK_SIZE, UPLOAD_CHUNK_SIZE
 
 class CSVHandler:
     """
@@ -12,25 +12,37 @@ class CSVHandler:
     """
     
     @staticmethod
-    async def save_upload_file(file: UploadFile) -> str:
+    async def save_upload_file(
+        file: UploadFile,
+        directory: Optional[str] = None,
+        filename: Optional[str] = None
+    ) -> str:
         """
         保存上传的 CSV 文件
         
+        按 UPLOAD_CHUNK_SIZE 分块复制到磁盘，不会把整个文件读入内存。
+        
         Args:
             file: 上传的文件
+            directory: 保存目录，默认为 DATA_DIR
+            filename: 保存的文件名，默认使用上传的文件名
             
         Returns:
             str: 保存的文件路径
         """
         # 确保数据目录存在
-        os.makedirs(DATA_DIR, exist_ok=True)
+        directory = directory or DATA_DIR
+        os.makedirs(directory, exist_ok=True)
         
-        # 保存文件
-        file_path = os.path.join(DATA_DIR, file.filename)
-        content = await file.read()
+        # 保存文件（去除客户端提供的路径部分）
+        file_path = os.path.join(directory, filename or os.path.basename(file.filename))
         
         with open(file_path, "wb") as f:
-            f.write(content)
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
         
         return file_path
     
@@ -95,6 +107,63 @@ class CSVHandler:
         
         return cleaned_df
     
+    @staticmethod
+    def iter_chunks(file_path: str, chunk_size: int = IMPORT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """
+        分块读取 CSV 文件，内存占用与分块大小相关而与文件大小无关
+        
+        Args:
+            file_path: CSV 文件路径
+            chunk_size: 每个分块的行数
+            
+        Returns:
+            Iterator[pd.DataFrame]: DataFrame 分块迭代器
+        """
+        return pd.read_csv(file_path, chunksize=chunk_size)
+    
+    @staticmethod
+    def clean_chunk(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        向量化清理数据分块：去除字符串首尾空白，空字符串和缺失值统一为 None
+        
+        与 BaseModel.clean_data 的逐行清理规则一致。
+        
+        Args:
+            df: 数据分块
+            
+        Returns:
+            pd.DataFrame: 清理后的 object 类型 DataFrame
+        """
+        cleaned_df = df.copy()
+        
+        for column in cleaned_df.columns:
+            series = cleaned_df[column]
+            if pd.api.types.is_object_dtype(series):
+                # 非字符串值经 .str.strip() 后为 NaN，保留原值
+                stripped = series.str.strip()
+                series = stripped.where(stripped.notna(), series)
+                cleaned_df[column] = series.mask(series == "")
+        
+        cleaned_df = cleaned_df.astype(object)
+        return cleaned_df.where(cleaned_df.notna(), None)
+    
+    @staticmethod
+    def to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        将清理后的分块转换为记录列表，省略值为 None 的字段
+        
+        Args:
+            df: clean_chunk 返回的 DataFrame
+            
+        Returns:
+            List[Dict[str, Any]]: 记录列表
+        """
+        columns = list(df.columns)
+        return [
+            {key: value for key, value in zip(columns, row) if value is not None}
+            for row in df.itertuples(index=False, name=None)
+        ]
+    
     @staticmethod
     def get_test_data_path(filename: str = "test_table.csv") -> Optional[str]:
         """
@@ -4,6 +4,31 @@ from pymongo import IndexModel, ASCENDING, DESCENDING, TEXT
 
 from app.db.mongodb import get_database
 from app.core.config import ARTISTS_COLLECTION, ARTWORKS_COLLECTION, ART_MOVEMENTS_COLLECTION
+from app.utils.query_params import SEARCH_PREFIX_FIELD
+
+# 每个集合只能有一个文本索引，统一命名以便替换旧的单字段文本索引
+SEARCH_TEXT_INDEX = "search_text"
+
+# 全文搜索字段及权重（名称权重最高）
+TEXT_SEARCH_FIELDS = {
+    ARTISTS_COLLECTION: {"name": 10, "nationality": 3, "tags": 3, "bio": 1},
+    ARTWORKS_COLLECTION: {"title": 10, "tags": 3, "description": 1},
+    ART_MOVEMENTS_COLLECTION: {"name": 10, "tags": 3, "description": 1},
+}
+
+# 名称前缀字段的源字段
+PREFIX_SOURCE_FIELDS = {
+    ARTISTS_COLLECTION: "name",
+    ARTWORKS_COLLECTION: "title",
+    ART_MOVEMENTS_COLLECTION: "name",
+}
+
+# 时间区间筛选的年份字段（与各服务的 YEAR_FIELD 一致）
+YEAR_FIELDS = {
+    ARTISTS_COLLECTION: "birth_year",
+    ARTWORKS_COLLECTION: "year",
+    ART_MOVEMENTS_COLLECTION: "start_year",
+}
 
 
 class DatabaseSetup:
@@ -11,6 +36,72 @@ class DatabaseSetup:
     数据库设置和索引管理
     """
     
+    @staticmethod
+    def search_indexes(collection_name: str) -> List[IndexModel]:
+        """
+        构建集合的搜索索引：多字段加权文本索引和名称前缀索引
+        
+        文本索引使用 default_language="none"，不做词干提取和停用词过滤，中英文字段按相同规则分词。
+        
+        Args:
+            collection_name: 集合名称
+            
+        Returns:
+            List[IndexModel]: 索引列表
+        """
+        weights = TEXT_SEARCH_FIELDS[collection_name]
+        return [
+            IndexModel(
+                [(field, TEXT) for field in weights],
+                name=SEARCH_TEXT_INDEX,
+                weights=weights,
+                default_language="none"
+            ),
+            IndexModel([(SEARCH_PREFIX_FIELD, ASCENDING)])
+        ]
+    
+    @staticmethod
+    def list_filter_indexes(collection_name: str, with_fictional: bool = False) -> List[IndexModel]:
+        """
+        构建列表筛选的复合索引
+        
+        按"等值 - 排序 - 范围"原则排列：等值条件（is_fictional、tags）在前，年份字段兼作
+        排序和范围条件，id 为游标分页的次级排序键。按年份排序或按年份筛选、按 id 翻页的
+        列表查询都能走索引扫描，不需要内存排序。
+        
+        Args:
+            collection_name: 集合名称
+            with_fictional: 集合是否有 is_fictional 字段
+            
+        Returns:
+            List[IndexModel]: 索引列表
+        """
+        year_field = YEAR_FIELDS[collection_name]
+        prefixes = [[], ["tags"]]
+        if with_fictional:
+            prefixes += [["is_fictional"], ["is_fictional", "tags"]]
+        
+        indexes = [
+            IndexModel([(field, ASCENDING) for field in prefix] + [(year_field, ASCENDING), ("id", ASCENDING)])
+            for prefix in prefixes
+        ]
+        if with_fictional:
+            indexes.append(IndexModel([("is_fictional", ASCENDING), ("id", ASCENDING)]))
+        return indexes
+    
+    @staticmethod
+    def drop_legacy_text_indexes(collection):
+        """
+        删除旧的文本索引（集合只能有一个文本索引）
+        
+        Args:
+            collection: 集合实例
+        """
+        for index in collection.list_indexes():
+            if "_fts" in index.get("key", {}) and index["name"] != SEARCH_TEXT_INDEX:
+                collection.drop_index(index["name"])
+                print(f"Dropped legacy text index {index['name']} on {collection.name}")
+    
     @staticmethod
     def create_indexes():
         """
@@ -22,12 +113,10 @@ class DatabaseSetup:
         artists_collection = db[ARTISTS_COLLECTION]
         artist_indexes = [
             IndexModel([("id", ASCENDING)], unique=True),
-            IndexModel([("name", TEXT)]),
+            *DatabaseSetup.search_indexes(ARTISTS_COLLECTION),
+            *DatabaseSetup.list_filter_indexes(ARTISTS_COLLECTION, with_fictional=True),
             IndexModel([("nationality", ASCENDING)]),
-            IndexModel([("birth_year", ASCENDING)]),
             IndexModel([("death_year", ASCENDING)]),
-            IndexModel([("is_fictional", ASCENDING)]),
-            IndexModel([("tags", ASCENDING)]),
             IndexModel([("associated_movements", ASCENDING)]),
             IndexModel([("fictional_meta.origin_project", ASCENDING)]),
             IndexModel([("created_at", DESCENDING)]),
@@ -35,6 +124,7 @@ class DatabaseSetup:
         ]
         
         try:
+            DatabaseSetup.drop_legacy_text_indexes(artists_collection)
             artists_collection.create_indexes(artist_indexes)
             print(f"Created {len(artist_indexes)} indexes for {ARTISTS_COLLECTION}")
         except Exception as e:
@@ -44,19 +134,18 @@ class DatabaseSetup:
         artworks_collection = db[ARTWORKS_COLLECTION]
         artwork_indexes = [
             IndexModel([("id", ASCENDING)], unique=True),
-            IndexModel([("title", TEXT)]),
+            *DatabaseSetup.search_indexes(ARTWORKS_COLLECTION),
+            *DatabaseSetup.list_filter_indexes(ARTWORKS_COLLECTION),
             IndexModel([("artist_id", ASCENDING)]),
-            IndexModel([("year", ASCENDING)]),
-            IndexModel([("tags", ASCENDING)]),
             IndexModel([("movement_ids", ASCENDING)]),
             IndexModel([("created_at", DESCENDING)]),
             IndexModel([("updated_at", DESCENDING)]),
             # 复合索引
-            IndexModel([("artist_id", ASCENDING), ("year", ASCENDING)]),
-            IndexModel([("year", ASCENDING), ("tags", ASCENDING)])
+            IndexModel([("artist_id", ASCENDING), ("year", ASCENDING)])
         ]
         
         try:
+            DatabaseSetup.drop_legacy_text_indexes(artworks_collection)
             artworks_collection.create_indexes(artwork_indexes)
             print(f"Created {len(artwork_indexes)} indexes for {ARTWORKS_COLLECTION}")
         except Exception as e:
@@ -66,12 +155,11 @@ class DatabaseSetup:
         movements_collection = db[ART_MOVEMENTS_COLLECTION]
         movement_indexes = [
             IndexModel([("id", ASCENDING)], unique=True),
-            IndexModel([("name", TEXT)]),
-            IndexModel([("start_year", ASCENDING)]),
+            *DatabaseSetup.search_indexes(ART_MOVEMENTS_COLLECTION),
+            *DatabaseSetup.list_filter_indexes(ART_MOVEMENTS_COLLECTION),
             IndexModel([("end_year", ASCENDING)]),
             IndexModel([("key_artists", ASCENDING)]),
             IndexModel([("representative_works", ASCENDING)]),
-            IndexModel([("tags", ASCENDING)]),
             IndexModel([("created_at", DESCENDING)]),
             IndexModel([("updated_at", DESCENDING)]),
             # 复合索引
@@ -79,6 +167,7 @@ class DatabaseSetup:
         ]
         
         try:
+            DatabaseSetup.drop_legacy_text_indexes(movements_collection)
             movements_collection.create_indexes(movement_indexes)
             print(f"Created {len(movement_indexes)} indexes for {ART_MOVEMENTS_COLLECTION}")
         except Exception as e:
@@ -297,6 +386,43 @@ class DatabaseMigration:
             )
             
             print(f"Added timestamps to {collection_name}")
+    
+    @staticmethod
+    def add_search_fields(batch_size: int = 1000):
+        """
+        为现有记录补充名称前缀搜索字段
+        
+        规范化在应用端完成（与写入路径一致），按批次批量更新。
+        
+        Args:
+            batch_size: 每批更新的记录数
+        """
+        from pymongo import UpdateOne
+        from app.utils.query_params import QueryParamsParser
+        
+        db = get_database()
+        
+        for collection_name, source_field in PREFIX_SOURCE_FIELDS.items():
+            collection = db[collection_name]
+            cursor = collection.find(
+                {SEARCH_PREFIX_FIELD: {"$exists": False}, source_field: {"$type": "string"}},
+                {"_id": 1, source_field: 1}
+            )
+            
+            updated = 0
+            operations = []
+            for doc in cursor:
+                operations.append(UpdateOne(
+                    {"_id": doc["_id"]},
+                    {"$set": {SEARCH_PREFIX_FIELD: QueryParamsParser.normalize_prefix(doc[source_field])}}
+                ))
+                if len(operations) >= batch_size:
+                    updated += collection.bulk_write(operations, ordered=False).modified_count
+                    operations = []
+            if operations:
+                updated += collection.bulk_write(operations, ordered=False).modified_count
+            
+            print(f"Added search fields to {updated} records in {collection_name}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,161 @@
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from app.core.config import IMPORT_JOB_TTL_SECONDS, IMPORT_JOB_MAX_JOBS
+
+
+class ImportJobManager:
+    """
+    CSV 导入任务管理器
+    
+    在内存中记录后台导入任务的状态和进度。进度回调在导入线程中调用，读写均加锁。
+    任务状态仅在当前进程内可见，多进程部署时请将上传请求和查询请求路由到同一进程。
+    
+    已结束（completed / failed）的任务在最后一次更新 TTL_SECONDS 秒后清除；任务数超过 MAX_JOBS 时
+    按最后更新时间从早到晚清除已结束的任务。未结束的任务不会被清除。清理在创建和查询任务时进行。
+    """
+    
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    
+    TTL_SECONDS = IMPORT_JOB_TTL_SECONDS
+    MAX_JOBS = IMPORT_JOB_MAX_JOBS
+    
+    _jobs: Dict[str, Dict[str, Any]] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def _prune(cls, now: datetime):
+        """
+        清除过期的已结束任务，并将任务数控制在 MAX_JOBS 以内（调用方需持有锁）
+        
+        Args:
+            now: 当前时间
+        """
+        finished = sorted(
+            (job for job in cls._jobs.values() if job["status"] in (cls.COMPLETED, cls.FAILED)),
+            key=lambda job: job["updated_at"]
+        )
+        expires_before = now - timedelta(seconds=cls.TTL_SECONDS)
+        excess = len(cls._jobs) - cls.MAX_JOBS
+        for job in finished:
+            if job["updated_at"] >= expires_before and excess <= 0:
+                break
+            del cls._jobs[job["job_id"]]
+            excess -= 1
+    
+    @classmethod
+    def create_job(cls, collection: str, filename: str) -> Dict[str, Any]:
+        """
+        创建导入任务
+        
+        Args:
+            collection: 目标集合名称
+            filename: 上传的文件名
+            
+        Returns:
+            Dict[str, Any]: 任务信息
+        """
+        now = datetime.utcnow()
+        job = {
+            "job_id": str(uuid.uuid4()),
+            "status": cls.PENDING,
+            "collection": collection,
+            "filename": filename,
+            "progress": {
+                "rows_processed": 0,
+                "inserted_count": 0,
+                "failed_count": 0,
+                "chunks_processed": 0
+            },
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+        with cls._lock:
+            cls._jobs[job["job_id"]] = job
+            cls._prune(now)
+        return dict(job)
+    
+    @classmethod
+    def get_job(cls, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        获取任务信息快照
+        
+        Args:
+            job_id: 任务ID
+            
+        Returns:
+            Optional[Dict[str, Any]]: 任务信息，不存在时返回 None
+        """
+        with cls._lock:
+            cls._prune(datetime.utcnow())
+            job = cls._jobs.get(job_id)
+            if job is None:
+                return None
+            return {**job, "progress": dict(job["progress"])}
+    
+    @classmethod
+    def _update(cls, job_id: str, **fields):
+        with cls._lock:
+            job = cls._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+                job["updated_at"] = datetime.utcnow()
+    
+    @classmethod
+    def update_progress(cls, job_id: str, progress: Dict[str, Any]):
+        """
+        更新任务进度（作为 import_from_csv 的 progress_callback）
+        
+        Args:
+            job_id: 任务ID
+            progress: 导入进度
+        """
+        cls._update(job_id, progress={
+            key: progress[key]
+            for key in ("rows_processed", "inserted_count", "failed_count", "chunks_processed")
+        })
+    
+    @classmethod
+    async def run_import(cls, job_id: str, service, file_path: str, clear_existing: bool = False):
+        """
+        执行导入任务（由 BackgroundTasks 调度）
+        
+        导入完成后删除上传的临时文件。
+        
+        Args:
+            job_id: 任务ID
+            service: 目标集合对应的异步服务类
+            file_path: 已保存的 CSV 文件路径
+            clear_existing: 是否清除现有数据
+        """
+        cls._update(job_id, status=cls.RUNNING)
+        try:
+            result = await service.import_from_csv(
+                file_path,
+                clear_existing=clear_existing,
+                progress_callback=lambda progress: cls.update_progress(job_id, progress)
+            )
+            if result.success:
+                cls.update_progress(job_id, result.data)
+                cls._update(job_id, status=cls.COMPLETED, result={
+                    "errors": result.data["errors"],
+                    "errors_truncated": result.data["errors_truncated"]
+                })
+            else:
+                cls._update(job_id, status=cls.FAILED, error={
+                    "message": result.message,
+                    "details": result.error_details
+                })
+        except Exception as e:
+            cls._update(job_id, status=cls.FAILED, error={"message": str(e), "details": None})
+        finally:
+            if os.path.exists(file_path):
+                os.remove(file_path)
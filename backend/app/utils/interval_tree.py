@@ -0,0 +1,212 @@
+import math
+import threading
+from typing import List, Any, Optional, Iterable, Tuple
+
+from app.utils.collection_versions import COLLECTION_VERSIONS
+
+# 缺失的起止年份视为无界
+_NEG_INF = -math.inf
+_POS_INF = math.inf
+
+
+def _bounds(start: Optional[float], end: Optional[float]) -> Tuple[float, float]:
+    # NaN（早期导入数据中缺失的年份）与 None 相同
+    return (
+        _NEG_INF if start is None or start != start else start,
+        _POS_INF if end is None or end != end else end
+    )
+
+
+class _Node:
+    """区间树节点：保存包含中心点的区间，分别按起点升序和终点降序排列"""
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, center: float, intervals: List[Tuple[float, float, Any]]):
+        self.center = center
+        self.by_start = sorted(intervals, key=lambda interval: interval[0])
+        self.by_end = sorted(intervals, key=lambda interval: interval[1], reverse=True)
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+
+
+class IntervalTree:
+    """
+    中心区间树（静态）
+
+    每个节点以区间端点的中位数为中心，保存包含中心点的区间，其余区间分到左右子树。
+    树高 O(log n)，重叠查询和点查询为 O(log n + k)。区间为闭区间，起止为 None 时视为无界。
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[Optional[float], Optional[float], Any]]):
+        """
+        Args:
+            intervals: (起点, 终点, 数据) 可迭代对象，起点大于终点的区间被忽略
+        """
+        items = []
+        for start, end, value in intervals:
+            low, high = _bounds(start, end)
+            if low <= high:
+                items.append((low, high, value))
+        self._size = len(items)
+        self._root = self._build(items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def overlap(self, start: Optional[float], end: Optional[float]) -> List[Any]:
+        """
+        查询与 [start, end] 有重叠的区间
+
+        Args:
+            start: 查询起点，None 表示无界
+            end: 查询终点，None 表示无界
+
+        Returns:
+            List[Any]: 重叠区间的数据（无序）
+        """
+        low, high = _bounds(start, end)
+        result: List[Any] = []
+        if low > high:
+            return result
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if high < node.center:
+                # 节点区间都包含中心点，终点必然不小于 low，只需比较起点
+                for interval in node.by_start:
+                    if interval[0] > high:
+                        break
+                    result.append(interval[2])
+                stack.append(node.left)
+            elif low > node.center:
+                for interval in node.by_end:
+                    if interval[1] < low:
+                        break
+                    result.append(interval[2])
+                stack.append(node.right)
+            else:
+                result.extend(interval[2] for interval in node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+        return result
+
+    def stab(self, point: float) -> List[Any]:
+        """
+        查询包含某一点的区间
+
+        Args:
+            point: 查询点
+
+        Returns:
+            List[Any]: 包含该点的区间数据（无序）
+        """
+        return self.overlap(point, point)
+
+    @classmethod
+    def _build(cls, items: List[Tuple[float, float, Any]]) -> Optional[_Node]:
+        if not items:
+            return None
+
+        endpoints = sorted(endpoint for interval in items for endpoint in interval[:2])
+        center = endpoints[len(endpoints) // 2]
+
+        left, middle, right = [], [], []
+        for interval in items:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                middle.append(interval)
+
+        node = _Node(center, middle)
+        node.left = cls._build(left)
+        node.right = cls._build(right)
+        return node
+
+
+class IntervalIndex:
+    """
+    可失效的区间树缓存
+
+    写入后调用 clear() 标记为未构建，下一次查询前由调用方整体重建。指定集合时按集合版本号防止
+    过期的重建覆盖失效：加载数据期间发生写入，重建的区间树只返回给调用方，不保存。
+    """
+
+    def __init__(self, collection_name: Optional[str] = None):
+        self.collection_name = collection_name
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        """
+        清空缓存并标记为未构建
+        """
+        with self._lock:
+            self._tree = IntervalTree([])
+            self.built = False
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+    def current_version(self) -> Optional[int]:
+        """
+        获取集合的当前版本号（加载数据前读取，传给 build()）
+
+        Returns:
+            Optional[int]: 版本号，未指定集合时为 None
+        """
+        if self.collection_name is None:
+            return None
+        return COLLECTION_VERSIONS.get(self.collection_name)
+
+    def build(
+        self,
+        intervals: Iterable[Tuple[Optional[float], Optional[float], Any]],
+        version: Optional[int] = None
+    ) -> IntervalTree:
+        """
+        用区间序列重建缓存
+
+        Args:
+            intervals: (起点, 终点, 数据) 可迭代对象
+            version: 加载数据前读取的集合版本号，与当前版本不一致时不保存
+
+        Returns:
+            IntervalTree: 重建的区间树
+        """
+        tree = IntervalTree(intervals)
+        with self._lock:
+            if version is None or version == self.current_version():
+                self._tree = tree
+                self.built = True
+        return tree
+
+    def overlap(self, start: Optional[float], end: Optional[float]) -> List[Any]:
+        """
+        查询与 [start, end] 有重叠的区间
+
+        Args:
+            start: 查询起点
+            end: 查询终点
+
+        Returns:
+            List[Any]: 重叠区间的数据（无序）
+        """
+        return self._tree.overlap(start, end)
+
+    def stab(self, point: float) -> List[Any]:
+        """
+        查询包含某一点的区间
+
+        Args:
+            point: 查询点
+
+        Returns:
+            List[Any]: 包含该点的区间数据（无序）
+        """
+        return self._tree.stab(point)
@@ -0,0 +1,55 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    """orjson 不支持的类型：ObjectId、Decimal、集合和嵌套的 Pydantic 模型"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal128):
+        return float(value.to_decimal())
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    使用 orjson 编码的 JSON 响应
+
+    datetime 按 ISO 8601 输出，ObjectId 转为字符串，NaN 输出为 null。
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> FastJSONResponse:
+    """
+    把响应模型直接编码为 JSON 响应
+
+    路由直接返回 Response 时 FastAPI 不再按 response_model 校验和序列化（response_model
+    仍用于 OpenAPI 文档），记录只在这里编码一次。模型字段按原样输出，不做深拷贝，
+    因此记录应当已经过服务层的 _process_record 处理。
+
+    Args:
+        model: 响应模型，如 PaginatedResponse
+        status_code: HTTP 状态码
+
+    Returns:
+        FastJSONResponse: JSON 响应
+    """
+    content = {name: getattr(model, name) for name in model.model_fields}
+    return FastJSONResponse(content, status_code=status_code)
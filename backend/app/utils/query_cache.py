@@ -0,0 +1,392 @@
+import asyncio
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from bson import json_util
+
+from app.core.config import (
+    QUERY_CACHE_ENABLED, QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_TTL_SECONDS,
+    QUERY_CACHE_REDIS_URL, QUERY_CACHE_SHARED_TTL_SECONDS
+)
+from app.utils.collection_versions import COLLECTION_VERSIONS
+
+
+class LRUCache:
+    """
+    进程内 LRU 缓存
+
+    超过 max_entries 时淘汰最久未使用的条目，条目写入 ttl 秒后过期。
+    保存和返回的都是副本，调用方可以自由修改。
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        读取条目
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Tuple[bool, Any]: (是否命中, 值的副本)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return False, None
+            self._entries.move_to_end(key)
+            value = entry[1]
+        return True, copy.deepcopy(value)
+
+    def set(self, key: str, value: Any):
+        """
+        写入条目
+
+        Args:
+            key: 缓存键
+            value: 值
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        清空缓存
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        缓存统计
+
+        Returns:
+            Dict[str, Any]: 条目数、上限、过期时间、淘汰和过期次数
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
+class RedisCache:
+    """
+    Redis 兼容的共享缓存层
+
+    只使用 get、set(ex=)、mget、incr、scan_iter、delete 命令，任何实现了这些方法的
+    客户端均可使用。值用 bson.json_util 序列化以保留日期等类型。各集合的版本号也保存在
+    Redis 中，任一进程写入集合后递增，所有进程的共享层缓存随之失效。
+    """
+
+    def __init__(self, client, ttl: int, prefix: str = "aida:cache:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def versions(self, collection_names: List[str]) -> List[int]:
+        """
+        读取集合的共享版本号
+
+        Args:
+            collection_names: 集合名称列表
+
+        Returns:
+            List[int]: 版本号
+        """
+        values = self.client.mget([f"{self.prefix}version:{name}" for name in collection_names])
+        return [int(value or 0) for value in values]
+
+    def bump(self, collection_name: str):
+        """
+        递增集合的共享版本号
+
+        Args:
+            collection_name: 集合名称
+        """
+        self.client.incr(f"{self.prefix}version:{collection_name}")
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        读取条目
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Tuple[bool, Any]: (是否命中, 值)
+        """
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return False, None
+        return True, json_util.loads(raw)
+
+    def set(self, key: str, value: Any):
+        """
+        写入条目
+
+        Args:
+            key: 缓存键
+            value: 可用 json_util 序列化的值
+        """
+        self.client.set(self.prefix + key, json_util.dumps(value), ex=self.ttl)
+
+    def clear(self):
+        """
+        删除本缓存的全部条目
+        """
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+class CacheKey(NamedTuple):
+    """一次查找得到的缓存键（写回时使用查找时的版本号）"""
+    kind: str
+    local: str
+    shared: Optional[str]
+
+
+class QueryCache:
+    """
+    按集合版本失效的两级查询缓存
+
+    缓存键由查询类型、查询参数摘要和所涉及集合的版本号组成：服务层写入集合后版本号
+    递增，旧条目不再被命中并随 LRU / TTL 淘汰。进程内一级缓存使用本进程的版本号，
+    其他进程的写入最多在 TTL 后可见；共享层使用 Redis 中的版本号，写入立即对所有进程生效。
+    """
+
+    def __init__(self, local: LRUCache, shared: Optional[RedisCache] = None, enabled: bool = True):
+        self.local = local
+        self.shared = shared
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        重置命中统计
+        """
+        with self._lock:
+            self._kinds: Dict[str, Dict[str, int]] = {}
+            self.shared_errors = 0
+
+    def make_key(self, collection_names: List[str], kind: str, payload: Any) -> CacheKey:
+        """
+        生成缓存键
+
+        Args:
+            collection_names: 结果依赖的集合
+            kind: 查询类型，如 "artists.get_all"
+            payload: 查询参数（可 JSON 序列化，字典键顺序无关）
+
+        Returns:
+            CacheKey: 缓存键
+        """
+        digest = hashlib.sha1(
+            json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        ).hexdigest()
+        names = sorted(set(collection_names))
+        local_versions = ",".join(f"{name}@{COLLECTION_VERSIONS.get(name)}" for name in names)
+        shared = None
+        if self.shared is not None:
+            try:
+                shared_versions = ",".join(
+                    f"{name}@{version}" for name, version in zip(names, self.shared.versions(names))
+                )
+                shared = f"{kind}:{shared_versions}:{digest}"
+            except Exception:
+                self._count_shared_error()
+        return CacheKey(kind, f"{kind}:{local_versions}:{digest}", shared)
+
+    def lookup(self, collection_names: List[str], kind: str, payload: Any) -> Tuple[bool, Any, CacheKey]:
+        """
+        查找缓存（先进程内，再共享层；共享层命中时回填进程内缓存）
+
+        Args:
+            collection_names: 结果依赖的集合
+            kind: 查询类型
+            payload: 查询参数
+
+        Returns:
+            Tuple[bool, Any, CacheKey]: (是否命中, 值, 写回时使用的缓存键)
+        """
+        if not self.enabled:
+            return False, None, CacheKey(kind, "", None)
+
+        key = self.make_key(collection_names, kind, payload)
+        hit, value = self.local.get(key.local)
+        if hit:
+            self._count(kind, "local_hits")
+            return True, value, key
+
+        if key.shared is not None:
+            try:
+                hit, value = self.shared.get(key.shared)
+            except Exception:
+                self._count_shared_error()
+                hit = False
+            if hit:
+                self.local.set(key.local, value)
+                self._count(kind, "shared_hits")
+                return True, value, key
+
+        self._count(kind, "misses")
+        return False, None, key
+
+    def store(self, key: CacheKey, value: Any):
+        """
+        写回查询结果
+
+        Args:
+            key: lookup() 返回的缓存键
+            value: 查询结果
+        """
+        if not self.enabled:
+            return
+        self.local.set(key.local, value)
+        if key.shared is not None:
+            try:
+                self.shared.set(key.shared, value)
+            except Exception:
+                self._count_shared_error()
+
+    async def lookup_async(self, collection_names: List[str], kind: str, payload: Any) -> Tuple[bool, Any, CacheKey]:
+        """
+        查找缓存（共享层的网络请求在线程池中执行，不阻塞事件循环）
+
+        Args:
+            collection_names: 结果依赖的集合
+            kind: 查询类型
+            payload: 查询参数
+
+        Returns:
+            Tuple[bool, Any, CacheKey]: (是否命中, 值, 写回时使用的缓存键)
+        """
+        if self.shared is None:
+            return self.lookup(collection_names, kind, payload)
+        return await asyncio.to_thread(self.lookup, collection_names, kind, payload)
+
+    async def store_async(self, key: CacheKey, value: Any):
+        """
+        写回查询结果
+
+        Args:
+            key: lookup_async() 返回的缓存键
+            value: 查询结果
+        """
+        if key.shared is None:
+            self.store(key, value)
+        else:
+            await asyncio.to_thread(self.store, key, value)
+
+    def on_collection_changed(self, collection_name: str):
+        """
+        集合版本变化回调：递增共享层版本号
+
+        Args:
+            collection_name: 集合名称
+        """
+        if self.shared is None:
+            return
+        try:
+            self.shared.bump(collection_name)
+        except Exception:
+            self._count_shared_error()
+
+    def clear(self):
+        """
+        清空两级缓存（绕过服务层直接修改数据库后调用）
+        """
+        self.local.clear()
+        if self.shared is not None:
+            try:
+                self.shared.clear()
+            except Exception:
+                self._count_shared_error()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        命中统计
+
+        Returns:
+            Dict[str, Any]: 总体和按查询类型的命中、未命中次数，以及各级缓存状态
+        """
+        with self._lock:
+            kinds = {kind: dict(counts) for kind, counts in self._kinds.items()}
+            shared_errors = self.shared_errors
+
+        totals = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+        for counts in kinds.values():
+            for name in totals:
+                totals[name] += counts.get(name, 0)
+        hits = totals["local_hits"] + totals["shared_hits"]
+        lookups = hits + totals["misses"]
+
+        return {
+            "enabled": self.enabled,
+            "hits": hits,
+            **totals,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "local": self.local.stats(),
+            "shared": {"enabled": self.shared is not None, "ttl_seconds": self.shared.ttl if self.shared else None,
+                       "errors": shared_errors},
+            "by_kind": kinds
+        }
+
+    def _count(self, kind: str, name: str):
+        with self._lock:
+            counts = self._kinds.setdefault(kind, {"local_hits": 0, "shared_hits": 0, "misses": 0})
+            counts[name] += 1
+
+    def _count_shared_error(self):
+        with self._lock:
+            self.shared_errors += 1
+
+
+def create_query_cache() -> QueryCache:
+    """
+    根据配置创建查询缓存，配置了 QUERY_CACHE_REDIS_URL 时启用共享层（需要安装 redis）
+
+    Returns:
+        QueryCache: 查询缓存
+    """
+    shared = None
+    if QUERY_CACHE_REDIS_URL:
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("QUERY_CACHE_REDIS_URL is set but the 'redis' package is not installed") from e
+        shared = RedisCache(redis.Redis.from_url(QUERY_CACHE_REDIS_URL), QUERY_CACHE_SHARED_TTL_SECONDS)
+
+    cache = QueryCache(LRUCache(QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_TTL_SECONDS), shared, QUERY_CACHE_ENABLED)
+    COLLECTION_VERSIONS.subscribe(cache.on_collection_changed)
+    return cache
+
+
+QUERY_CACHE = create_query_cache()
@@ -1,7 +1,13 @@
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Tuple
 from pydantic import BaseModel, Field
 from fastapi import Query
+from bson import json_util
+import base64
+import binascii
 import re
+import unicodedata
+
+from app.core.config import SEARCH_MODE
 
 
 class QueryParams(BaseModel):
@@ -13,10 +19,12 @@ class QueryParams(BaseModel):
     
     # 字段控制
     fields: Optional[str] = Field(None, description="限定返回字段，用逗号分隔，如 'name,avatarUrl'")
+    view: Optional[str] = Field(None, description="列表视图，'summary'、'card' 或 'detail'，指定 fields 时忽略")
     include: Optional[str] = Field(None, description="填充关联字段，用逗号分隔，如 'notableWorks,associatedMovements'")
     
     # 搜索和筛选
     search: Optional[str] = Field(None, description="模糊搜索关键词")
+    search_mode: Optional[str] = Field(None, alias="searchMode", description="搜索模式，'text'、'prefix' 或 'regex'")
     tags: Optional[str] = Field(None, description="标签筛选，用逗号分隔")
     
     # 时间区间筛选
@@ -31,15 +39,164 @@ class QueryParams(BaseModel):
     page: int = Field(1, ge=1, description="页码")
     page_size: int = Field(10, ge=1, le=100, alias="pageSize", description="每页大小")
     
+    # 游标分页
+    pagination: Optional[str] = Field("offset", description="分页模式，'offset' 或 'cursor'")
+    after: Optional[str] = Field(None, description="游标分页令牌，取自上一页响应的 next_cursor")
+    
+    # 总数统计
+    count: Optional[str] = Field("exact", description="总数统计模式，'exact'、'estimated' 或 'none'")
+    
     # 特殊筛选
     is_fictional: Optional[bool] = Field(None, alias="isFictional", description="真实/虚构筛选")
 
 
+COUNT_MODES = ("exact", "estimated", "none")
+PAGINATION_MODES = ("offset", "cursor")
+LIST_VIEWS = ("summary", "card", "detail")
+SEARCH_MODES = ("text", "prefix", "regex")
+
+# 名称的规范化小写副本，用于前缀（自动补全）搜索
+SEARCH_PREFIX_FIELD = "name_lower"
+
+# 全文搜索相关度得分的输出字段
+SEARCH_SCORE_FIELD = "search_score"
+
+# regex 模式下默认匹配的字段
+DEFAULT_SEARCH_FIELDS = ["name", "description", "bio"]
+
+# 未指定年份字段时，时间区间筛选匹配的字段
+DEFAULT_YEAR_FIELDS = ["year", "birth_year", "start_year"]
+
+
 class QueryParamsParser:
     """
     查询参数解析器
     """
     
+    @staticmethod
+    def parse_count_mode(params: Optional[QueryParams]) -> str:
+        """
+        解析总数统计模式
+        
+        Args:
+            params: 查询参数
+            
+        Returns:
+            str: 'exact'、'estimated' 或 'none'
+            
+        Raises:
+            ValueError: 不支持的统计模式
+        """
+        if not params or not params.count:
+            return "exact"
+        
+        count_mode = params.count.lower()
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Unsupported count mode '{params.count}', expected one of: {', '.join(COUNT_MODES)}")
+        return count_mode
+    
+    @staticmethod
+    def parse_view(params: Optional[QueryParams]) -> Optional[str]:
+        """
+        解析列表视图
+        
+        Args:
+            params: 查询参数
+            
+        Returns:
+            Optional[str]: 'summary'、'card'、'detail'，未指定时为 None
+            
+        Raises:
+            ValueError: 不支持的视图
+        """
+        if not params or not params.view:
+            return None
+        
+        view = params.view.lower()
+        if view not in LIST_VIEWS:
+            raise ValueError(f"Unsupported view '{params.view}', expected one of: {', '.join(LIST_VIEWS)}")
+        return view
+    
+    @staticmethod
+    def parse_search_mode(mode: Optional[str]) -> str:
+        """
+        解析搜索模式
+        
+        Args:
+            mode: 搜索模式，为空时使用配置的默认模式
+            
+        Returns:
+            str: 'text'、'prefix' 或 'regex'
+            
+        Raises:
+            ValueError: 不支持的搜索模式
+        """
+        search_mode = (mode or SEARCH_MODE).lower()
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unsupported search mode '{mode}', expected one of: {', '.join(SEARCH_MODES)}")
+        return search_mode
+    
+    @staticmethod
+    def normalize_prefix(value: str) -> str:
+        """
+        规范化名称用于前缀搜索（NFKC 归一化、去除首尾空白、转小写）
+        
+        Args:
+            value: 原始名称
+            
+        Returns:
+            str: 规范化后的名称
+        """
+        return unicodedata.normalize("NFKC", value).strip().lower()
+    
+    @staticmethod
+    def build_search_filter(
+        search: str,
+        mode: Optional[str] = None,
+        regex_fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        构建搜索条件
+        
+        text 模式组合全文索引和名称前缀索引（$or 的每个分支都有索引，可走索引扫描）；
+        prefix 模式只做锚定的名称前缀匹配；regex 模式为原有的多字段子串匹配。
+        
+        Args:
+            search: 搜索关键词
+            mode: 搜索模式
+            regex_fields: regex 模式下匹配的字段
+            
+        Returns:
+            Dict[str, Any]: MongoDB查询过滤器
+            
+        Raises:
+            ValueError: 不支持的搜索模式
+        """
+        search_mode = QueryParamsParser.parse_search_mode(mode)
+        
+        if search_mode == "regex":
+            search_regex = {"$regex": search, "$options": "i"}
+            return {"$or": [{field: search_regex} for field in (regex_fields or DEFAULT_SEARCH_FIELDS)]}
+        
+        prefix_clause = {
+            SEARCH_PREFIX_FIELD: {"$regex": "^" + re.escape(QueryParamsParser.normalize_prefix(search))}
+        }
+        if search_mode == "prefix":
+            return prefix_clause
+        
+        return {"$or": [{"$text": {"$search": search}}, prefix_clause]}
+    
+    @staticmethod
+    def build_relevance_sort() -> Tuple[Dict[str, Any], List[tuple]]:
+        """
+        构建按全文搜索相关度排序的投影和排序参数
+        
+        Returns:
+            Tuple: (投影中的得分字段, 排序参数)
+        """
+        score = {"$meta": "textScore"}
+        return {SEARCH_SCORE_FIELD: score}, [(SEARCH_SCORE_FIELD, score)]
+    
     @staticmethod
     def parse_fields(fields_str: Optional[str]) -> Optional[List[str]]:
         """
@@ -86,17 +243,25 @@ class QueryParamsParser:
         return [tag.strip() for tag in tags_str.split(",") if tag.strip()]
     
     @staticmethod
-    def build_mongo_filter(params: QueryParams) -> Dict[str, Any]:
+    def build_mongo_filter(
+        params: QueryParams,
+        search_fields: Optional[List[str]] = None,
+        year_field: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         构建MongoDB查询过滤器
         
+        各筛选条件分别构建后用 $and 组合，搜索条件中的 $or 不会被其他条件覆盖。
+        
         Args:
             params: 查询参数
+            search_fields: regex 搜索模式下匹配的字段
+            year_field: 时间区间筛选使用的年份字段，为空时在所有年份字段上匹配
             
         Returns:
             Dict[str, Any]: MongoDB查询过滤器
         """
-        filter_dict = {}
+        clauses = []
         
         # 项目筛选
         if params.project:
@@ -105,19 +270,15 @@ class QueryParamsParser:
         
         # 搜索
         if params.search:
-            # 在多个字段中进行模糊搜索
-            search_regex = {"$regex": params.search, "$options": "i"}
-            filter_dict["$or"] = [
-                {"name": search_regex},
-                {"description": search_regex},
-                {"bio": search_regex}
-            ]
+            clauses.append(
+                QueryParamsParser.build_search_filter(params.search, params.search_mode, search_fields)
+            )
         
         # 标签筛选
         if params.tags:
             tags_list = QueryParamsParser.parse_tags(params.tags)
             if tags_list:
-                filter_dict["tags"] = {"$in": tags_list}
+                clauses.append({"tags": {"$in": tags_list}})
         
         # 时间区间筛选
         year_filter = {}
@@ -127,18 +288,20 @@ class QueryParamsParser:
             year_filter["$lte"] = params.year_to
         
         if year_filter:
-            # 根据模型类型选择年份字段
-            filter_dict["$or"] = [
-                {"year": year_filter},
-                {"birth_year": year_filter},
-                {"start_year": year_filter}
-            ]
+            if year_field:
+                clauses.append({year_field: year_filter})
+            else:
+                clauses.append({"$or": [{field: year_filter} for field in DEFAULT_YEAR_FIELDS]})
         
         # 虚构/真实筛选
         if params.is_fictional is not None:
-            filter_dict["is_fictional"] = params.is_fictional
+            clauses.append({"is_fictional": params.is_fictional})
         
-        return filter_dict
+        if not clauses:
+            return {}
+        if len(clauses) == 1:
+            return clauses[0]
+        return {"$and": clauses}
     
     @staticmethod
     def build_mongo_sort(params: QueryParams) -> Optional[List[tuple]]:
@@ -178,6 +341,44 @@ class QueryParamsParser:
         
         return projection
     
+    @staticmethod
+    def is_inclusion_projection(projection: Optional[Dict[str, Any]]) -> bool:
+        """
+        判断字段投影是否为包含式（列出要返回的字段）
+        
+        Args:
+            projection: MongoDB字段投影
+            
+        Returns:
+            bool: 包含式投影返回 True，排除式投影或 None 返回 False
+        """
+        return any(
+            value is True or (isinstance(value, int) and not isinstance(value, bool) and value == 1)
+            for value in (projection or {}).values()
+        )
+    
+    @staticmethod
+    def require_fields(projection: Optional[Dict[str, Any]], fields: List[str]):
+        """
+        确保字段投影返回指定字段（包含式投影补上字段，排除式投影取消对它们的排除）
+        
+        Args:
+            projection: MongoDB字段投影，原地修改
+            fields: 必须返回的字段
+        """
+        if not projection:
+            return
+        
+        if QueryParamsParser.is_inclusion_projection(projection):
+            for field in fields:
+                projection[field] = 1
+            return
+        
+        for field in fields:
+            for key in [key for key in projection if key == field or key.startswith(field + ".")]:
+                if projection[key] in (0, False):
+                    del projection[key]
+    
     @staticmethod
     def calculate_skip(page: int, page_size: int) -> int:
         """
@@ -192,6 +393,152 @@ class QueryParamsParser:
         """
         return (page - 1) * page_size
     
+    @staticmethod
+    def is_cursor_mode(params: QueryParams) -> bool:
+        """
+        判断是否使用游标分页
+        
+        Args:
+            params: 查询参数
+            
+        Returns:
+            bool: 是否为游标分页模式
+            
+        Raises:
+            ValueError: 不支持的分页模式
+        """
+        pagination = (params.pagination or "offset").lower()
+        if pagination not in PAGINATION_MODES:
+            raise ValueError(
+                f"Unsupported pagination mode '{params.pagination}', expected one of: {', '.join(PAGINATION_MODES)}"
+            )
+        return bool(params.after) or pagination == "cursor"
+    
+    @staticmethod
+    def build_cursor_sort(params: QueryParams) -> List[tuple]:
+        """
+        构建游标分页的排序参数（始终以 id 作为次级排序键，保证顺序稳定）
+        
+        Args:
+            params: 查询参数
+            
+        Returns:
+            List[tuple]: MongoDB排序参数
+        """
+        sort_field = params.sort_by or "id"
+        direction = 1 if (params.order or "asc").lower() == "asc" else -1
+        
+        sort_params = [(sort_field, direction)]
+        if sort_field != "id":
+            sort_params.append(("id", direction))
+        return sort_params
+    
+    @staticmethod
+    def encode_cursor(record: Dict[str, Any], sort_params: List[tuple]) -> str:
+        """
+        根据一页中的最后一条记录生成游标令牌
+        
+        Args:
+            record: 最后一条记录
+            sort_params: 游标分页的排序参数
+            
+        Returns:
+            str: 不透明的游标令牌
+        """
+        sort_field, direction = sort_params[0]
+        payload = {
+            "s": sort_field,
+            "d": direction,
+            "v": QueryParamsParser._get_field_value(record, sort_field),
+            "id": record.get("id")
+        }
+        raw = json_util.dumps(payload).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+    
+    @staticmethod
+    def decode_cursor(token: str, sort_params: List[tuple]) -> Tuple[Any, str]:
+        """
+        解析游标令牌
+        
+        Args:
+            token: 游标令牌
+            sort_params: 当前请求的排序参数
+            
+        Returns:
+            Tuple[Any, str]: (排序字段值, 记录ID)
+            
+        Raises:
+            ValueError: 令牌无效或与当前排序参数不匹配
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json_util.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        except (ValueError, binascii.Error, UnicodeError):
+            raise ValueError("Invalid cursor token")
+        
+        if not isinstance(payload, dict) or "id" not in payload or "v" not in payload:
+            raise ValueError("Invalid cursor token")
+        
+        sort_field, direction = sort_params[0]
+        if payload.get("s") != sort_field or payload.get("d") != direction:
+            raise ValueError("Cursor token does not match the requested sortBy/order")
+        
+        return payload["v"], payload["id"]
+    
+    @staticmethod
+    def build_cursor_filter(sort_params: List[tuple], last_value: Any, last_id: str) -> Dict[str, Any]:
+        """
+        构建游标分页的键集过滤条件（取排在上一页最后一条记录之后的记录）
+        
+        MongoDB 排序时 null/缺失值最小：升序排在最前，降序排在最后。
+        
+        Args:
+            sort_params: 游标分页的排序参数
+            last_value: 上一页最后一条记录的排序字段值
+            last_id: 上一页最后一条记录的ID
+            
+        Returns:
+            Dict[str, Any]: MongoDB查询过滤器
+        """
+        sort_field, direction = sort_params[0]
+        op = "$gt" if direction == 1 else "$lt"
+        
+        if sort_field == "id":
+            return {"id": {op: last_id}}
+        
+        if last_value is None:
+            branches = [{sort_field: None, "id": {op: last_id}}]
+            if direction == 1:
+                branches.append({sort_field: {"$ne": None}})
+        else:
+            branches = [
+                {sort_field: {op: last_value}},
+                {sort_field: last_value, "id": {op: last_id}}
+            ]
+            if direction == -1:
+                branches.append({sort_field: None})
+        
+        return {"$or": branches}
+    
+    @staticmethod
+    def _get_field_value(record: Dict[str, Any], field: str) -> Any:
+        """
+        获取记录中（可能嵌套的）字段值
+        
+        Args:
+            record: 记录
+            field: 字段名，支持 'a.b' 形式
+            
+        Returns:
+            Any: 字段值，不存在时为 None
+        """
+        value = record
+        for part in field.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+    
     @staticmethod
     def validate_sort_field(sort_by: str, allowed_fields: List[str]) -> bool:
         """
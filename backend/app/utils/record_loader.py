@@ -0,0 +1,198 @@
+import asyncio
+import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# 当前请求的加载器（集合名称 -> RecordLoader），请求之外为 None
+_REQUEST_LOADERS: ContextVar[Optional[Dict[str, "RecordLoader"]]] = ContextVar("request_loaders", default=None)
+
+
+class RecordLoader:
+    """
+    请求级的按ID批量加载器
+
+    同一事件循环轮次内的 load() 调用合并为一次 $in 查询，结果（包括不存在的ID）在请求
+    剩余时间内缓存。调用方拿到的是记录副本，可以自由修改。写入后由服务层调用 prime()
+    或 forget() 保持缓存与数据库一致。
+    """
+
+    def __init__(self, fetch: Callable[[List[str]], Awaitable[List[Dict[str, Any]]]]):
+        """
+        Args:
+            fetch: 按ID列表批量查询记录的协程函数
+        """
+        self._fetch = fetch
+        self._cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._queue: Dict[str, asyncio.Future] = {}
+        self._tasks = set()
+        self.batches = 0
+
+    async def load(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        按ID加载记录
+
+        Args:
+            record_id: 记录ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 记录副本，不存在时返回 None
+        """
+        if record_id in self._cache:
+            return copy.deepcopy(self._cache[record_id])
+
+        future = self._pending.get(record_id) or self._queue.get(record_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            if not self._queue:
+                # 等当前轮次中已就绪的协程都登记完ID后再发出查询
+                loop.call_soon(self._schedule_dispatch)
+            self._queue[record_id] = future
+        self._pending[record_id] = future
+
+        return copy.deepcopy(await asyncio.shield(future))
+
+    async def load_many(self, record_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        批量加载记录
+
+        Args:
+            record_ids: 记录ID列表
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: 与 record_ids 一一对应的记录副本
+        """
+        return list(await asyncio.gather(*(self.load(record_id) for record_id in record_ids)))
+
+    def prime(self, record_id: str, record: Optional[Dict[str, Any]]):
+        """
+        写入后直接更新缓存（None 表示记录已删除）
+
+        Args:
+            record_id: 记录ID
+            record: 最新记录
+        """
+        self._pending.pop(record_id, None)
+        self._cache[record_id] = copy.deepcopy(record)
+
+    def forget(self, record_id: Optional[str] = None):
+        """
+        丢弃缓存，下一次 load() 重新查询
+
+        Args:
+            record_id: 记录ID，为空时丢弃全部
+        """
+        if record_id is None:
+            self._cache.clear()
+            self._pending.clear()
+        else:
+            self._cache.pop(record_id, None)
+            self._pending.pop(record_id, None)
+
+    def _schedule_dispatch(self):
+        task = asyncio.ensure_future(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self):
+        batch, self._queue = self._queue, {}
+        self.batches += 1
+        try:
+            records = await self._fetch(list(batch))
+        except Exception as e:
+            for record_id, future in batch.items():
+                if self._pending.get(record_id) is future:
+                    del self._pending[record_id]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        found = {record["id"]: record for record in records}
+        for record_id, future in batch.items():
+            record = found.get(record_id)
+            # 查询期间被 prime() / forget() 处理过的ID不写回缓存
+            if self._pending.get(record_id) is future:
+                del self._pending[record_id]
+                self._cache[record_id] = record
+            if not future.done():
+                future.set_result(record)
+
+
+def request_loader(
+    collection_name: str,
+    fetch: Callable[[List[str]], Awaitable[List[Dict[str, Any]]]]
+) -> Optional[RecordLoader]:
+    """
+    获取当前请求中某个集合的加载器
+
+    Args:
+        collection_name: 集合名称
+        fetch: 首次创建加载器时使用的批量查询函数
+
+    Returns:
+        Optional[RecordLoader]: 加载器，不在请求范围内时返回 None
+    """
+    loaders = _REQUEST_LOADERS.get()
+    if loaders is None:
+        return None
+    loader = loaders.get(collection_name)
+    if loader is None:
+        loader = loaders[collection_name] = RecordLoader(fetch)
+    return loader
+
+
+def prime_record(collection_name: str, record_id: str, record: Optional[Dict[str, Any]]):
+    """
+    写入后更新当前请求中已加载的记录（请求之外不做任何事）
+
+    Args:
+        collection_name: 集合名称
+        record_id: 记录ID
+        record: 最新记录，None 表示已删除
+    """
+    loaders = _REQUEST_LOADERS.get()
+    if loaders and collection_name in loaders:
+        loaders[collection_name].prime(record_id, record)
+
+
+def forget_records(collection_name: str, record_id: Optional[str] = None):
+    """
+    让当前请求中已加载的记录失效（请求之外不做任何事）
+
+    Args:
+        collection_name: 集合名称
+        record_id: 记录ID，为空时让整个集合失效
+    """
+    loaders = _REQUEST_LOADERS.get()
+    if loaders and collection_name in loaders:
+        loaders[collection_name].forget(record_id)
+
+
+@contextmanager
+def request_scope():
+    """
+    请求范围：进入时创建空的加载器表，退出时丢弃
+    """
+    token = _REQUEST_LOADERS.set({})
+    try:
+        yield
+    finally:
+        _REQUEST_LOADERS.reset(token)
+
+
+class RecordLoaderMiddleware:
+    """
+    为每个 HTTP 请求建立加载器范围的 ASGI 中间件
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_scope():
+            await self.app(scope, receive, send)
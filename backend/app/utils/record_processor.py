@@ -0,0 +1,137 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import ARTISTS_COLLECTION, ARTWORKS_COLLECTION, ART_MOVEMENTS_COLLECTION
+from app.utils.query_params import QueryParamsParser, SEARCH_PREFIX_FIELD
+
+# 数据库内部字段：_id 和搜索前缀字段，不出现在响应中
+INTERNAL_FIELDS: Tuple[str, ...] = ("_id", SEARCH_PREFIX_FIELD)
+
+# 各集合可能为 NaN 的顶层浮点字段（早期用 pandas 导入的数据中缺失的年份）
+FLOAT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    ARTISTS_COLLECTION: ("birth_year", "death_year"),
+    ARTWORKS_COLLECTION: ("year",),
+    ART_MOVEMENTS_COLLECTION: ("start_year", "end_year"),
+}
+
+
+class RecordProcessor:
+    """
+    编译后的记录后处理流程
+
+    只删除查询投影没有排除的内部字段，只检查投影中可能出现的浮点字段（NaN 用 x != x 判断，
+    转换为 None），不再逐个字段调用 pd.isna。由 record_processor() 按集合和查询形状构建并缓存，
+    同一查询形状复用同一个实例。
+    """
+
+    __slots__ = ("strip_fields", "float_fields")
+
+    def __init__(self, strip_fields: Tuple[str, ...], float_fields: Tuple[str, ...]):
+        self.strip_fields = strip_fields
+        self.float_fields = float_fields
+
+    def __call__(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        原地处理单条记录
+
+        Args:
+            record: 原始记录
+
+        Returns:
+            Dict[str, Any]: 处理后的记录
+        """
+        for field in self.strip_fields:
+            record.pop(field, None)
+        for field in self.float_fields:
+            value = record.get(field)
+            if value is not None and value != value:
+                record[field] = None
+        return record
+
+    def process_many(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        原地处理一批记录
+
+        Args:
+            records: 原始记录（可以是游标）
+
+        Returns:
+            List[Dict[str, Any]]: 处理后的记录列表
+        """
+        records = records if isinstance(records, list) else list(records)
+        strip_fields, float_fields = self.strip_fields, self.float_fields
+        if not strip_fields and not float_fields:
+            return records
+
+        for record in records:
+            for field in strip_fields:
+                record.pop(field, None)
+            for field in float_fields:
+                value = record.get(field)
+                if value is not None and value != value:
+                    record[field] = None
+        return records
+
+
+def exclude_internal_fields(projection: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    在字段投影中排除内部字段，由数据库而不是后处理去掉它们
+
+    包含式投影只需排除 _id（MongoDB 不允许混用包含和排除），其余情况排除全部内部字段。
+
+    Args:
+        projection: 字段投影，None 表示返回全部字段
+
+    Returns:
+        Dict[str, Any]: 新的字段投影
+    """
+    projection = dict(projection or {})
+    if QueryParamsParser.is_inclusion_projection(projection):
+        projection["_id"] = 0
+    else:
+        projection.update({field: 0 for field in INTERNAL_FIELDS})
+    return projection
+
+
+def record_processor(collection_name: str, projection: Optional[Dict[str, Any]] = None) -> RecordProcessor:
+    """
+    获取某个集合在给定字段投影下的记录后处理流程
+
+    Args:
+        collection_name: 集合名称
+        projection: 查询使用的字段投影，None 表示返回全部字段
+
+    Returns:
+        RecordProcessor: 后处理流程
+    """
+    return _compile(collection_name, _projection_shape(projection))
+
+
+def _projection_shape(projection: Optional[Dict[str, Any]]) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """把字段投影转换为可哈希的查询形状（$meta 等表达式只保留类型）"""
+    if projection is None:
+        return None
+    return tuple(sorted(
+        (field, int(value) if isinstance(value, (bool, int)) else "expression")
+        for field, value in projection.items()
+    ))
+
+
+@lru_cache(maxsize=512)
+def _compile(collection_name: str, shape: Optional[Tuple[Tuple[str, Any], ...]]) -> RecordProcessor:
+    """包含式投影只返回列出的字段（_id 除非显式排除），排除式投影返回未排除的全部字段"""
+    projection = dict(shape or ())
+    included = {field for field, value in projection.items() if value == 1}
+    excluded = {field for field, value in projection.items() if value == 0}
+    float_fields = FLOAT_FIELDS.get(collection_name, ())
+
+    if included:
+        strip_fields = tuple(field for field in INTERNAL_FIELDS if field in included or (
+            field == "_id" and "_id" not in excluded
+        ))
+        float_fields = tuple(field for field in float_fields if field in included)
+    else:
+        strip_fields = tuple(field for field in INTERNAL_FIELDS if field not in excluded)
+        float_fields = tuple(field for field in float_fields if field not in excluded)
+
+    return RecordProcessor(strip_fields, float_fields)
@@ -0,0 +1,273 @@
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Iterable, Tuple, Set
+
+from app.utils.collection_versions import COLLECTION_VERSIONS
+
+# 中日韩文字（汉字、假名、谚文）按字切分，其余文字按单词切分
+_CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_PATTERN = re.compile(f"[{_CJK_CHARS}]+|[^\\W_{_CJK_CHARS}]+")
+_CJK_PATTERN = re.compile(f"[{_CJK_CHARS}]")
+
+
+def normalize_text(text: str) -> str:
+    """
+    规范化文本：NFKC 兼容字符归一（全角转半角）、去除变音符号、大小写折叠
+
+    Args:
+        text: 原始文本
+
+    Returns:
+        str: 规范化后的文本
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return unicodedata.normalize("NFKC", stripped).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    分词：拉丁等文字按单词切分；中日韩文字输出单字和相邻二字组合，
+    不依赖词典即可匹配任意长度的中文查询
+
+    Args:
+        text: 原始文本
+
+    Returns:
+        List[str]: 词项列表
+    """
+    tokens = []
+    for run in _TOKEN_PATTERN.findall(normalize_text(text)):
+        if not _CJK_PATTERN.match(run):
+            tokens.append(run)
+            continue
+        tokens.extend(run)
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def tokenize_query(text: str) -> List[str]:
+    """
+    查询分词：与 tokenize 相同，但两个字以上的中日韩文字片段只保留二字组合，
+    避免高频单字的长倒排表拖慢检索；单字查询仍按单字匹配
+
+    Args:
+        text: 查询文本
+
+    Returns:
+        List[str]: 词项列表
+    """
+    tokens = []
+    for run in _TOKEN_PATTERN.findall(normalize_text(text)):
+        if len(run) > 1 and _CJK_PATTERN.match(run):
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def document_terms(record: Dict[str, Any], field_weights: Dict[str, float]) -> Dict[str, float]:
+    """
+    按字段权重统计记录的词频（字段权重累加到词频上）
+
+    Args:
+        record: 记录
+        field_weights: 字段名到权重的映射，列表字段（如 tags）逐项分词
+
+    Returns:
+        Dict[str, float]: 词项到加权词频的映射
+    """
+    terms: Dict[str, float] = defaultdict(float)
+    for field, weight in field_weights.items():
+        value = record.get(field)
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if not isinstance(item, str):
+                continue
+            for token in tokenize(item):
+                terms[token] += weight
+    return dict(terms)
+
+
+class InvertedIndex:
+    """
+    多实体倒排索引
+
+    所有实体共用一份语料统计（文档数、平均长度），因此不同实体的 BM25 得分可以直接比较。
+    文档以 (实体类型, 记录ID) 为键；每种实体单独标记是否已构建，便于按实体懒加载和失效。
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self, entity: Optional[str] = None):
+        """
+        清空索引
+
+        Args:
+            entity: 只清空该实体的文档并标记为未构建；为空时清空全部
+        """
+        with self._lock:
+            if entity is None:
+                self._postings: Dict[str, Dict[Tuple[str, str], float]] = {}
+                self._documents: Dict[Tuple[str, str], Tuple[float, Tuple[str, ...], str]] = {}
+                self._total_length = 0.0
+                self._built: Set[str] = set()
+                return
+
+            for key in [key for key in self._documents if key[0] == entity]:
+                self._remove(key)
+            self._built.discard(entity)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def is_built(self, entity: str) -> bool:
+        """
+        实体的文档是否已加载
+
+        Args:
+            entity: 实体类型
+
+        Returns:
+            bool: 是否已构建
+        """
+        return entity in self._built
+
+    def build(
+        self,
+        entity: str,
+        documents: Iterable[Tuple[str, Dict[str, float], str]],
+        collection_name: Optional[str] = None,
+        version: Optional[int] = None
+    ):
+        """
+        重建某一实体的文档
+
+        加载期间发生的写入在实体未构建时被跳过：指定集合和加载前读取的版本号时，版本号已变化则
+        仍写入文档，但不标记为已构建，下一次检索时重新加载。
+
+        Args:
+            entity: 实体类型
+            documents: (记录ID, 加权词频, 显示名称) 可迭代对象
+            collection_name: 实体所在集合
+            version: 加载数据前读取的集合版本号
+        """
+        with self._lock:
+            self.clear(entity)
+            for record_id, terms, label in documents:
+                self._upsert((entity, record_id), terms, label)
+            if version is None or version == COLLECTION_VERSIONS.get(collection_name):
+                self._built.add(entity)
+
+    def upsert(
+        self,
+        entity: str,
+        record_id: str,
+        terms: Dict[str, float],
+        label: str = "",
+        if_built: bool = False
+    ):
+        """
+        插入或替换文档
+
+        Args:
+            entity: 实体类型
+            record_id: 记录ID
+            terms: 加权词频
+            label: 显示名称
+            if_built: 只在实体已构建时写入（与 build() 的版本检查在同一把锁内判断）
+        """
+        with self._lock:
+            if if_built and entity not in self._built:
+                return
+            self._upsert((entity, record_id), terms, label)
+
+    def remove(self, entity: str, record_id: str):
+        """
+        移除文档
+
+        Args:
+            entity: 实体类型
+            record_id: 记录ID
+        """
+        with self._lock:
+            self._remove((entity, record_id))
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        entities: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        按 BM25 得分检索
+
+        Args:
+            query: 查询文本
+            limit: 返回数量
+            entities: 限定的实体类型，为空时检索全部
+
+        Returns:
+            List[Dict[str, Any]]: 按得分降序排列的命中（type、id、title、score）
+        """
+        terms = set(tokenize_query(query))
+        if not terms or limit <= 0:
+            return []
+        allowed = set(entities) if entities else None
+
+        with self._lock:
+            document_count = len(self._documents)
+            if document_count == 0:
+                return []
+            average_length = self._total_length / document_count or 1.0
+            documents = self._documents
+
+            scores: Dict[Tuple[str, str], float] = defaultdict(float)
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                frequency = len(postings)
+                idf = math.log(1 + (document_count - frequency + 0.5) / (frequency + 0.5))
+                for key, tf in postings.items():
+                    if allowed is not None and key[0] not in allowed:
+                        continue
+                    length_norm = self.K1 * (1 - self.B + self.B * documents[key][0] / average_length)
+                    scores[key] += idf * tf * (self.K1 + 1) / (tf + length_norm)
+
+            top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            return [
+                {"type": key[0], "id": key[1], "title": documents[key][2], "score": round(score, 6)}
+                for key, score in top
+            ]
+
+    def _upsert(self, key: Tuple[str, str], terms: Dict[str, float], label: str):
+        self._remove(key)
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[key] = tf
+        length = sum(terms.values())
+        self._documents[key] = (length, tuple(terms), label)
+        self._total_length += length
+
+    def _remove(self, key: Tuple[str, str]):
+        document = self._documents.pop(key, None)
+        if document is None:
+            return
+        length, terms, _ = document
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(key, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= length
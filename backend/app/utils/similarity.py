@@ -0,0 +1,251 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+VectorLike = Union[Sequence[float], np.ndarray]
+
+
+def to_matrix(vectors: Union[Sequence[VectorLike], np.ndarray], dtype=np.float32) -> np.ndarray:
+    """
+    将向量列表转换为二维矩阵
+
+    Args:
+        vectors: 等长向量列表或二维数组
+        dtype: 元素类型
+
+    Returns:
+        np.ndarray: 形状为 (n, d) 的矩阵
+
+    Raises:
+        ValueError: 向量长度不一致时
+    """
+    matrix = np.asarray(vectors, dtype=dtype)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1) if matrix.size else matrix.reshape(0, 0)
+    if matrix.ndim != 2:
+        raise ValueError("Vectors must all have the same length")
+    return matrix
+
+
+def row_norms(matrix: np.ndarray) -> np.ndarray:
+    """
+    计算每一行的 L2 范数
+
+    Args:
+        matrix: 形状为 (n, d) 的矩阵
+
+    Returns:
+        np.ndarray: 形状为 (n,) 的范数
+    """
+    return np.linalg.norm(matrix, axis=1)
+
+
+def normalize_rows(matrix: np.ndarray, norms: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    按行归一化，零向量保持为零（与任何向量的相似度为 0）
+
+    Args:
+        matrix: 形状为 (n, d) 的矩阵
+        norms: 预先计算的行范数
+
+    Returns:
+        np.ndarray: 归一化后的矩阵
+    """
+    if norms is None:
+        norms = row_norms(matrix)
+    safe_norms = np.where(norms > 0, norms, 1).astype(matrix.dtype, copy=False)
+    return matrix / safe_norms[:, None]
+
+
+def cosine_one_to_many(
+    query: VectorLike,
+    matrix: np.ndarray,
+    matrix_norms: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    计算一个向量与矩阵每一行的余弦相似度
+
+    Args:
+        query: 查询向量
+        matrix: 形状为 (n, d) 的候选矩阵
+        matrix_norms: 候选矩阵的行范数（可复用缓存）
+
+    Returns:
+        np.ndarray: 形状为 (n,) 的相似度；维度不一致或查询为零向量时全为 0
+    """
+    return cosine_many_to_many(to_matrix([query], matrix.dtype), matrix, matrix_norms=matrix_norms)[0]
+
+
+def cosine_many_to_many(
+    queries: np.ndarray,
+    matrix: np.ndarray,
+    query_norms: Optional[np.ndarray] = None,
+    matrix_norms: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    计算两组向量两两之间的余弦相似度
+
+    Args:
+        queries: 形状为 (m, d) 的查询矩阵
+        matrix: 形状为 (n, d) 的候选矩阵
+        query_norms: 查询矩阵的行范数
+        matrix_norms: 候选矩阵的行范数
+
+    Returns:
+        np.ndarray: 形状为 (m, n) 的相似度矩阵；维度不一致时全为 0
+    """
+    if queries.shape[1] != matrix.shape[1]:
+        return np.zeros((queries.shape[0], matrix.shape[0]), dtype=matrix.dtype)
+    return normalize_rows(queries, query_norms) @ normalize_rows(matrix, matrix_norms).T
+
+
+def top_k(
+    scores: np.ndarray,
+    k: int,
+    threshold: float = 0.0,
+    exclude: Optional[Sequence[int]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    选出相似度不低于阈值的前 k 个下标
+
+    与 get_similar_artworks 的语义一致：先按阈值过滤（包含阈值），再按相似度降序取前 k 个。
+
+    Args:
+        scores: 形状为 (n,) 的相似度
+        k: 返回数量
+        threshold: 相似度阈值
+        exclude: 需要排除的下标
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (下标, 相似度)，按相似度降序排列
+    """
+    if k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=scores.dtype)
+
+    if exclude is not None and len(exclude):
+        scores = scores.copy()
+        scores[list(exclude)] = -np.inf
+
+    candidates = np.flatnonzero(scores >= threshold)
+    if candidates.size > k:
+        candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    order = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return order, scores[order]
+
+
+def top_k_rows(
+    scores: np.ndarray,
+    k: int,
+    threshold: float = 0.0
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    对相似度矩阵的每一行分别取前 k 个
+
+    Args:
+        scores: 形状为 (m, n) 的相似度矩阵
+        k: 每行返回数量
+        threshold: 相似度阈值
+
+    Returns:
+        List[Tuple[np.ndarray, np.ndarray]]: 每一行的 (下标, 相似度)
+    """
+    return [top_k(row, k, threshold) for row in scores]
+
+
+def cosine_similarity(vector1: VectorLike, vector2: VectorLike) -> float:
+    """
+    计算两个向量的余弦相似度
+
+    Args:
+        vector1: 第一个向量
+        vector2: 第二个向量
+
+    Returns:
+        float: 相似度；任一向量为空、长度不一致或为零向量时返回 0.0
+    """
+    if vector1 is None or vector2 is None or len(vector1) == 0 or len(vector1) != len(vector2):
+        return 0.0
+    a = np.asarray(vector1, dtype=np.float64)
+    b = np.asarray(vector2, dtype=np.float64)
+    magnitude = np.linalg.norm(a) * np.linalg.norm(b)
+    if magnitude == 0:
+        return 0.0
+    return float(a @ b / magnitude)
+
+
+class VectorMatrix:
+    """
+    向量矩阵
+
+    保存一组向量并缓存其范数和归一化结果，便于反复进行一对多、多对多检索。
+    """
+
+    def __init__(self, vectors: Union[Sequence[VectorLike], np.ndarray], dtype=np.float32):
+        self.matrix = to_matrix(vectors, dtype)
+        self._norms: Optional[np.ndarray] = None
+        self._normalized: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    @property
+    def dimension(self) -> int:
+        return self.matrix.shape[1]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """缓存的行范数"""
+        if self._norms is None:
+            self._norms = row_norms(self.matrix)
+        return self._norms
+
+    @property
+    def normalized(self) -> np.ndarray:
+        """缓存的归一化矩阵"""
+        if self._normalized is None:
+            self._normalized = normalize_rows(self.matrix, self.norms)
+        return self._normalized
+
+    def similarity_to(self, query: VectorLike) -> np.ndarray:
+        """
+        计算查询向量与所有向量的相似度
+
+        Args:
+            query: 查询向量
+
+        Returns:
+            np.ndarray: 形状为 (n,) 的相似度
+        """
+        return self.similarity_matrix(to_matrix([query], self.matrix.dtype))[0]
+
+    def similarity_matrix(self, queries: Union["VectorMatrix", np.ndarray]) -> np.ndarray:
+        """
+        计算一组查询向量与所有向量的相似度
+
+        Args:
+            queries: VectorMatrix 或形状为 (m, d) 的矩阵
+
+        Returns:
+            np.ndarray: 形状为 (m, n) 的相似度矩阵
+        """
+        if isinstance(queries, VectorMatrix):
+            normalized_queries = queries.normalized
+        else:
+            normalized_queries = normalize_rows(queries.astype(self.matrix.dtype, copy=False))
+        if normalized_queries.shape[1] != self.dimension:
+            return np.zeros((normalized_queries.shape[0], len(self)), dtype=self.matrix.dtype)
+        return normalized_queries @ self.normalized.T
+
+    def top_k(self, query: VectorLike, k: int = 10, threshold: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        检索与查询向量最相似的前 k 个向量
+
+        Args:
+            query: 查询向量
+            k: 返回数量
+            threshold: 相似度阈值
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (下标, 相似度)
+        """
+        return top_k(self.similarity_to(query), k, threshold)
@@ -25,6 +25,7 @@ async def initialize_database():
         try:
             DatabaseMigration.add_timestamps()
             DatabaseMigration.migrate_to_new_schema()
+            DatabaseMigration.add_search_fields()
         except Exception as e:
             print(f"Migration warning (this is normal for new databases): {e}")
         
@@ -45,6 +46,34 @@ async def initialize_database():
         return False
 
 
+def build_memory_indexes():
+    """
+    构建进程内索引（风格向量索引、跨实体搜索索引、艺术运动时期区间树、艺术家社交网络图）
+    """
+    try:
+        from app.services.artist_service import ArtistService
+        from app.services.artwork_service import ArtworkService
+        from app.services.art_movement_service import ArtMovementService
+        from app.services.search_service import SearchService
+        
+        count = ArtworkService.build_style_index()
+        print(f"Style vector index built: {count} vectors")
+        
+        count = ArtMovementService.build_period_index()
+        print(f"Movement period index built: {count} movements")
+        
+        count = ArtistService.build_social_graph()
+        print(f"Artist social graph built: {count} artists")
+        
+        counts = SearchService.build_indexes()
+        print(f"Search index built: {counts}")
+        return True
+        
+    except Exception as e:
+        print(f"Memory index build failed (will be built on first use): {e}")
+        return False
+
+
 async def startup_sequence():
     """
     完整的启动序列
@@ -59,6 +88,10 @@ async def startup_sequence():
     else:
         print("❌ Database initialization failed")
     
+    # 构建内存索引
+    if db_success:
+        build_memory_indexes()
+    
     print("AIDA backend initialization completed!")
     return db_success
 
@@ -0,0 +1,250 @@
+import threading
+from typing import List, Dict, Optional, Iterable, Tuple, Set
+
+import numpy as np
+
+from app.utils import similarity
+from app.utils.collection_versions import COLLECTION_VERSIONS
+
+
+class StyleVectorIndex:
+    """
+    风格向量内存索引
+
+    以 float32 矩阵保存归一化后的向量，查询时一次矩阵乘法得到余弦相似度，
+    再用 argpartition 取 top-k，避免逐条计算和全量排序。
+
+    索引只收录与首个向量维度相同的向量；其他维度的向量与之相似度恒为 0
+    （与 Artwork.calculate_style_similarity 的约定一致），不参与检索。
+    """
+
+    # 批量检索时每次矩阵乘法的查询行数
+    QUERY_BLOCK_SIZE = 256
+
+    def __init__(self, collection_name: Optional[str] = None):
+        self.collection_name = collection_name
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        """
+        清空索引并标记为未构建
+        """
+        with self._lock:
+            self._ids: List[str] = []
+            self._positions: Dict[str, int] = {}
+            self._matrix = np.zeros((0, 0), dtype=np.float32)
+            self._size = 0
+            self.dimension: Optional[int] = None
+            self.built = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    def current_version(self) -> Optional[int]:
+        """
+        获取集合的当前版本号（加载数据前读取，传给 build()）
+
+        Returns:
+            Optional[int]: 版本号，未指定集合时为 None
+        """
+        if self.collection_name is None:
+            return None
+        return COLLECTION_VERSIONS.get(self.collection_name)
+
+    def build(self, items: Iterable[Tuple[str, List[float]]], version: Optional[int] = None):
+        """
+        用 (id, 向量) 序列重建索引
+
+        加载期间发生写入（版本号已变化）时仍写入向量，但不标记为已构建，下一次检索时重新加载。
+
+        Args:
+            items: (记录ID, 风格向量) 可迭代对象
+            version: 加载数据前读取的集合版本号
+        """
+        with self._lock:
+            self.clear()
+            for record_id, vector in items:
+                self._upsert(record_id, vector)
+            self.built = version is None or version == self.current_version()
+
+    def upsert(self, record_id: str, vector: Optional[List[float]], if_built: bool = False):
+        """
+        插入或更新向量，向量为空时从索引中移除
+
+        Args:
+            record_id: 记录ID
+            vector: 风格向量
+            if_built: 只在索引已构建时写入（与 build() 的版本检查在同一把锁内判断）
+        """
+        with self._lock:
+            if if_built and not self.built:
+                return
+            self._upsert(record_id, vector)
+
+    def remove(self, record_id: str):
+        """
+        从索引中移除向量
+
+        Args:
+            record_id: 记录ID
+        """
+        with self._lock:
+            self._remove(record_id)
+
+    def get_vector(self, record_id: str) -> Optional[np.ndarray]:
+        """
+        获取已归一化的向量
+
+        Args:
+            record_id: 记录ID
+
+        Returns:
+            Optional[np.ndarray]: 归一化向量，不在索引中时返回 None
+        """
+        with self._lock:
+            position = self._positions.get(record_id)
+            if position is None:
+                return None
+            return self._matrix[position].copy()
+
+    def search(
+        self,
+        vector: List[float],
+        top_k: int = 10,
+        threshold: float = 0.0,
+        exclude_ids: Optional[Set[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        检索最相似的向量
+
+        Args:
+            vector: 查询向量
+            top_k: 返回数量
+            threshold: 相似度阈值（包含）
+            exclude_ids: 需要排除的记录ID
+
+        Returns:
+            List[Tuple[str, float]]: 按相似度降序排列的 (记录ID, 相似度) 列表
+        """
+        query = self.normalize(vector)
+        if query is None or top_k <= 0:
+            return []
+
+        with self._lock:
+            if self._size == 0 or query.shape[0] != self.dimension:
+                return []
+            scores = self._matrix[:self._size] @ query
+            ids = self._ids
+
+            excluded = [self._positions[record_id] for record_id in (exclude_ids or ()) if record_id in self._positions]
+            positions, top_scores = similarity.top_k(scores, top_k, threshold, exclude=excluded)
+
+            return [(ids[position], float(score)) for position, score in zip(positions, top_scores)]
+
+    def search_many(
+        self,
+        vectors: List[Optional[List[float]]],
+        top_k: int = 10,
+        threshold: float = 0.0,
+        exclude_ids: Optional[List[Optional[str]]] = None
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        批量检索，按 QUERY_BLOCK_SIZE 分块做矩阵乘法，控制相似度矩阵的内存占用
+
+        Args:
+            vectors: 查询向量列表，空向量或维度不一致的查询结果为空
+            top_k: 每个查询的返回数量
+            threshold: 相似度阈值（包含）
+            exclude_ids: 与查询一一对应、需要从其结果中排除的记录ID（通常是查询作品自身）
+
+        Returns:
+            List[List[Tuple[str, float]]]: 与查询一一对应的 (记录ID, 相似度) 列表
+        """
+        results: List[List[Tuple[str, float]]] = [[] for _ in vectors]
+        if top_k <= 0:
+            return results
+
+        with self._lock:
+            if self._size == 0:
+                return results
+
+            valid_positions = []
+            valid_vectors = []
+            for position, vector in enumerate(vectors):
+                if vector is not None and len(vector) == self.dimension:
+                    valid_positions.append(position)
+                    valid_vectors.append(vector)
+            if not valid_vectors:
+                return results
+
+            queries = similarity.normalize_rows(similarity.to_matrix(valid_vectors))
+            matrix = self._matrix[:self._size]
+
+            for start in range(0, len(valid_positions), self.QUERY_BLOCK_SIZE):
+                block_scores = queries[start:start + self.QUERY_BLOCK_SIZE] @ matrix.T
+                for offset, scores in enumerate(block_scores):
+                    position = valid_positions[start + offset]
+                    exclude_id = exclude_ids[position] if exclude_ids else None
+                    excluded = [self._positions[exclude_id]] if exclude_id in self._positions else None
+                    indices, top_scores = similarity.top_k(scores, top_k, threshold, exclude=excluded)
+                    results[position] = [
+                        (self._ids[index], float(score)) for index, score in zip(indices, top_scores)
+                    ]
+
+        return results
+
+    @staticmethod
+    def normalize(vector: Optional[List[float]]) -> Optional[np.ndarray]:
+        """
+        转换为归一化的 float32 向量
+
+        Args:
+            vector: 原始向量
+
+        Returns:
+            Optional[np.ndarray]: 归一化向量；空向量返回 None，零向量原样返回（相似度为 0）
+        """
+        if vector is None or len(vector) == 0:
+            return None
+        return similarity.normalize_rows(similarity.to_matrix([vector]))[0]
+
+    def _upsert(self, record_id: str, vector: Optional[List[float]]):
+        normalized = self.normalize(vector)
+        if normalized is None:
+            self._remove(record_id)
+            return
+
+        if self.dimension is None:
+            self.dimension = normalized.shape[0]
+            self._matrix = np.zeros((16, self.dimension), dtype=np.float32)
+        if normalized.shape[0] != self.dimension:
+            self._remove(record_id)
+            return
+
+        position = self._positions.get(record_id)
+        if position is None:
+            if self._size == self._matrix.shape[0]:
+                grown = np.zeros((self._matrix.shape[0] * 2, self.dimension), dtype=np.float32)
+                grown[:self._size] = self._matrix[:self._size]
+                self._matrix = grown
+            position = self._size
+            self._ids.append(record_id)
+            self._positions[record_id] = position
+            self._size += 1
+        self._matrix[position] = normalized
+
+    def _remove(self, record_id: str):
+        position = self._positions.pop(record_id, None)
+        if position is None:
+            return
+
+        # 与最后一行交换后删除，保持矩阵紧凑
+        last = self._size - 1
+        if position != last:
+            last_id = self._ids[last]
+            self._matrix[position] = self._matrix[last]
+            self._ids[position] = last_id
+            self._positions[last_id] = position
+        self._ids.pop()
+        self._size -= 1
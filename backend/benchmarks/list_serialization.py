@@ -0,0 +1,126 @@
+"""
+列表响应序列化基准测试
+
+比较同一页数据的两种返回方式（response_model 相同，OpenAPI 文档一致）：
+- pydantic：返回 PaginatedResponse 模型，FastAPI 按 response_model 再校验、序列化一次
+- orjson：通过 model_response() 直接编码已处理的记录，跳过第二次校验
+
+两个路由返回预先构造好的同一页记录，测得的差异只来自响应序列化，
+不含数据库查询。通过 TestClient 发送真实的 HTTP 请求测量端到端延迟。
+
+用法（在 backend 目录下）：
+    python -m benchmarks.list_serialization --page-size 100 --requests 500
+"""
+
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.schemas.artist import Artist
+from app.schemas.response import PaginatedResponse, create_paginated_response
+from app.utils.json_response import model_response
+
+
+def build_page(page_size: int) -> List[Dict[str, Any]]:
+    """
+    构造一页与 _process_record 输出形状相同的艺术家记录
+
+    Args:
+        page_size: 记录数
+
+    Returns:
+        List[Dict[str, Any]]: 记录列表
+    """
+    created = datetime(2024, 1, 1, 12, 0, 0)
+    # 通过服务层写入的记录已按模型补全默认字段
+    return [
+        Artist(**{
+            "id": f"artist_{index:05d}",
+            "name": f"Artist {index}",
+            "birth_year": 1850 + index % 100,
+            "death_year": 1920 + index % 80,
+            "nationality": "French",
+            "bio": "x" * 400,
+            "avatar_url": f"https://example.com/avatars/{index}.jpg",
+            "notable_works": [f"artwork_{index}_{work}" for work in range(5)],
+            "associated_movements": ["impressionism", "post_impressionism"],
+            "tags": ["painting", "landscape", "portrait"],
+            "is_fictional": index % 2 == 0,
+            "fictional_meta": {"origin_project": "AIDA", "fictional_style": ["oil", "ink"]} if index % 2 == 0 else None,
+            "agent": {"enabled": True, "connected_network_ids": [f"artist_{(index + step) % page_size:05d}" for step in range(1, 6)]},
+            "created_at": created + timedelta(minutes=index),
+            "updated_at": created + timedelta(minutes=index, seconds=30)
+        }).model_dump()
+        for index in range(page_size)
+    ]
+
+
+def build_app(records: List[Dict[str, Any]]) -> FastAPI:
+    """
+    构造只包含两个列表路由的应用
+
+    Args:
+        records: 每次请求返回的记录
+
+    Returns:
+        FastAPI: 应用
+    """
+    app = FastAPI()
+    page_size = len(records)
+
+    @app.get("/pydantic", response_model=PaginatedResponse[Artist])
+    async def pydantic_page():
+        return create_paginated_response(records, total=page_size * 10, page=1, page_size=page_size)
+
+    @app.get("/orjson", response_model=PaginatedResponse[Artist])
+    async def orjson_page():
+        return model_response(create_paginated_response(records, total=page_size * 10, page=1, page_size=page_size))
+
+    return app
+
+
+def measure(client: TestClient, path: str, requests: int, warmup: int = 20) -> Dict[str, float]:
+    """多次请求同一路由，统计延迟"""
+    for _ in range(warmup):
+        client.get(path)
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+    timings.sort()
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95) - 1] if len(timings) >= 20 else timings[-1],
+        "bytes": len(response.content)
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    app = build_app(build_page(args.page_size))
+    with TestClient(app) as client:
+        # 两种方式的输出必须一致
+        assert client.get("/pydantic").json()["data"] == client.get("/orjson").json()["data"]
+
+        print(f"page_size={args.page_size} requests={args.requests}")
+        for name in ("pydantic", "orjson"):
+            result = measure(client, f"/{name}", args.requests)
+            print(
+                f"{name:<9} median {result['median_ms']:7.2f} ms  "
+                f"p95 {result['p95_ms']:7.2f} ms  body {result['bytes']} bytes"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+领域模型构造基准测试
+
+比较构造大量 Artist 实例的耗时和内存：
+- legacy：原实现，字段保存在实例 __dict__ 中，from_dict 原地修改输入并对每个浮点值调用 pd.isna，
+  to_dict 遍历 __dict__ 并逐个判断类型
+- slotted：app.models.Artist，字段保存在 __slots__ 中，转换函数在定义类时编译
+
+每种实现分别测量 from_dict、to_dict 的耗时，以及保留全部实例时 tracemalloc 统计的内存增量
+（不含输入字典本身）。记录带有服务层写入的 name_lower（新实现中为内部字段，不由 to_dict 输出）；
+--extension-fields 让每条记录再带一个未声明字段，此时新实现要为每个实例分配扩展字段字典。
+
+用法（在 backend 目录下）：
+    python -m benchmarks.model_construction --instances 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+from bson import ObjectId
+
+from app.models.artist import Artist
+from app.utils.query_params import SEARCH_PREFIX_FIELD
+
+
+class LegacyArtist:
+    """原 BaseModel + Artist 实现（保留用于对比）"""
+
+    def __init__(self, name, birth_year=None, death_year=None, nationality=None, bio=None, avatar_url=None,
+                 notable_works=None, associated_movements=None, tags=None, is_fictional=False,
+                 fictional_meta=None, agent=None, id=None, created_at=None, updated_at=None, **kwargs):
+        self.id = id
+        self.created_at = created_at or datetime.utcnow()
+        self.updated_at = updated_at or datetime.utcnow()
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self.name = name
+        self.birth_year = birth_year
+        self.death_year = death_year
+        self.nationality = nationality
+        self.bio = bio
+        self.avatar_url = avatar_url
+        self.notable_works = notable_works or []
+        self.associated_movements = associated_movements or []
+        self.tags = tags or []
+        self.is_fictional = is_fictional
+        self.fictional_meta = fictional_meta
+        self.agent = agent
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LegacyArtist":
+        if "name" not in data:
+            raise ValueError("Artist data must contain 'name' field")
+        if "_id" in data:
+            data["id"] = str(data["_id"])
+            del data["_id"]
+        for key, value in data.items():
+            if isinstance(value, float) and pd.isna(value):
+                data[key] = None
+        if "created_at" in data and isinstance(data["created_at"], str):
+            data["created_at"] = datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
+        if "updated_at" in data and isinstance(data["updated_at"], str):
+            data["updated_at"] = datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {}
+        for key, value in self.__dict__.items():
+            if not key.startswith("_"):
+                if isinstance(value, datetime):
+                    result[key] = value.isoformat()
+                elif isinstance(value, ObjectId):
+                    result[key] = str(value)
+                else:
+                    result[key] = value
+        return result
+
+
+def build_records(count: int, extension_fields: bool = False) -> List[Dict[str, Any]]:
+    """
+    生成艺术家字典（与服务层创建记录时传入 from_dict 的形状相同）
+
+    Args:
+        count: 记录数
+        extension_fields: 是否包含未声明的扩展字段
+
+    Returns:
+        List[Dict[str, Any]]: 记录列表
+    """
+    now = datetime(2024, 1, 1)
+    return [
+        {
+            "id": f"artist_{index:06d}",
+            "name": f"Artist {index}",
+            "birth_year": 1800 + index % 200,
+            "death_year": float("nan") if index % 10 == 0 else 1850 + index % 200,
+            "nationality": "French",
+            "bio": "A painter.",
+            "notable_works": [f"artwork_{index}"],
+            "associated_movements": ["impressionism"],
+            "tags": ["painting"],
+            "is_fictional": False,
+            "created_at": now,
+            "updated_at": now,
+            SEARCH_PREFIX_FIELD: f"artist {index}",
+            **({"source": "wikidata"} if extension_fields else {})
+        }
+        for index in range(count)
+    ]
+
+
+def measure(model: Callable[[Dict[str, Any]], Any], records: List[Dict[str, Any]], rounds: int = 3) -> Dict[str, float]:
+    """构造全部实例并转换回字典，耗时取多轮最小值；内存在单独一轮中用 tracemalloc 统计"""
+    construct, to_dict = [], []
+    for _ in range(rounds):
+        # 原实现会修改输入，每轮使用浅拷贝
+        inputs = [dict(record) for record in records]
+        gc.collect()
+        start = time.perf_counter()
+        instances = [model(record) for record in inputs]
+        construct.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        for instance in instances:
+            instance.to_dict()
+        to_dict.append((time.perf_counter() - start) * 1000)
+        del instances
+
+    inputs = [dict(record) for record in records]
+    gc.collect()
+    tracemalloc.start()
+    instances = [model(record) for record in inputs]
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+
+    return {"construct_ms": min(construct), "to_dict_ms": min(to_dict), "memory_mb": memory_mb}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances", type=int, default=100000)
+    parser.add_argument("--extension-fields", action="store_true",
+                        help="记录再带一个未声明的扩展字段")
+    args = parser.parse_args(argv)
+
+    records = build_records(args.instances, args.extension_fields)
+
+    # 两种实现的输出必须一致（新实现不输出内部搜索字段）
+    for record in records[:100]:
+        legacy = LegacyArtist.from_dict(dict(record)).to_dict()
+        legacy.pop(SEARCH_PREFIX_FIELD)
+        assert Artist.from_dict(record).to_dict() == legacy
+
+    print(f"instances={args.instances} extension_fields={args.extension_fields}")
+    for name, model in (("legacy", LegacyArtist.from_dict), ("slotted", Artist.from_dict)):
+        result = measure(model, records)
+        print(
+            f"{name:<8} from_dict {result['construct_ms']:8.1f} ms  "
+            f"to_dict {result['to_dict_ms']:8.1f} ms  memory {result['memory_mb']:7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+记录后处理微基准测试
+
+在 10k 条记录的页面上比较三种处理方式：
+- legacy：原 _process_record，逐条删除 _id 和搜索字段，对每个字段调用 pd.isna
+- compiled：同样取回全部字段，使用按集合编译的处理流程（只检查已知浮点字段）
+- projected：_id 和搜索字段由数据库投影排除，处理流程只剩浮点字段检查
+
+记录在内存中生成，不含数据库和网络耗时；每轮处理前复制一份原始记录，复制耗时不计入。
+
+用法（在 backend 目录下）：
+    python -m benchmarks.record_processing --records 10000 --rounds 20
+"""
+
+import argparse
+import copy
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+from bson import ObjectId
+
+from app.core.config import ARTISTS_COLLECTION
+from app.utils.query_params import SEARCH_PREFIX_FIELD
+from app.utils.record_processor import INTERNAL_FIELDS, exclude_internal_fields, record_processor
+
+
+def build_records(count: int, internal_fields: bool) -> List[Dict[str, Any]]:
+    """
+    生成艺术家记录，约十分之一缺失卒年（NaN）
+
+    Args:
+        count: 记录数
+        internal_fields: 是否包含 _id 和搜索字段（未使用投影时数据库返回的形状）
+
+    Returns:
+        List[Dict[str, Any]]: 记录列表
+    """
+    now = datetime(2024, 1, 1)
+    records = []
+    for index in range(count):
+        record = {
+            "id": f"artist_{index:06d}",
+            "name": f"Artist {index}",
+            "birth_year": 1800 + index % 200,
+            "death_year": float("nan") if index % 10 == 0 else 1850 + index % 200,
+            "nationality": "French",
+            "bio": "x" * 200,
+            "notable_works": [f"artwork_{index}_{work}" for work in range(3)],
+            "associated_movements": ["impressionism"],
+            "tags": ["painting", "portrait"],
+            "is_fictional": False,
+            "agent": {"enabled": False, "connected_network_ids": []},
+            "created_at": now,
+            "updated_at": now
+        }
+        if internal_fields:
+            record["_id"] = ObjectId()
+            record[SEARCH_PREFIX_FIELD] = record["name"].lower()
+        records.append(record)
+    return records
+
+
+def legacy_process(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """原实现：逐条处理"""
+    processed = []
+    for record in records:
+        if "_id" in record:
+            del record["_id"]
+        record.pop(SEARCH_PREFIX_FIELD, None)
+        for key, value in record.items():
+            if isinstance(value, float) and pd.isna(value):
+                record[key] = None
+        processed.append(record)
+    return processed
+
+
+def measure(process: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+            source: List[Dict[str, Any]], rounds: int) -> Dict[str, float]:
+    """多轮处理同一页记录，统计耗时"""
+    timings = []
+    for _ in range(rounds):
+        records = copy.deepcopy(source)
+        start = time.perf_counter()
+        process(records)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": statistics.median(timings), "min_ms": min(timings)}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    full = build_records(args.records, internal_fields=True)
+    projected = build_records(args.records, internal_fields=False)
+    compiled = record_processor(ARTISTS_COLLECTION)
+    compiled_projected = record_processor(ARTISTS_COLLECTION, exclude_internal_fields())
+
+    # 三种方式的结果必须一致
+    expected = legacy_process(copy.deepcopy(full))
+    assert compiled.process_many(copy.deepcopy(full)) == expected
+    assert compiled_projected.process_many(copy.deepcopy(projected)) == expected
+    assert all(field not in record for record in expected for field in INTERNAL_FIELDS)
+
+    print(f"records={args.records} rounds={args.rounds}")
+    for name, process, source in (
+        ("legacy", legacy_process, full),
+        ("compiled", compiled.process_many, full),
+        ("projected", compiled_projected.process_many, projected)
+    ):
+        result = measure(process, source, args.rounds)
+        print(f"{name:<10} median {result['median_ms']:8.2f} ms  min {result['min_ms']:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
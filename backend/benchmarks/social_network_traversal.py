@@ -0,0 +1,152 @@
+"""
+社交网络多跳遍历基准测试
+
+比较两种 depth 跳以内的遍历方式：
+- graphlookup：ArtistService 使用的 $graphLookup 聚合，在数据库端一次完成遍历
+- per-hop：在 Python 中逐跳执行 $in 查询展开前沿，最后按ID批量取回字段
+
+默认在 MONGODB_URI 指向的实例上创建临时数据库（运行结束后删除），
+--mongomock 可在没有 MongoDB 的环境中验证脚本本身（耗时不具参考意义）。
+
+用法（在 backend 目录下）：
+    python -m benchmarks.social_network_traversal --artists 50000 --degree 8 --depth 3
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo import MongoClient
+
+from app.core.config import MONGODB_URI, ARTISTS_COLLECTION
+from app.services.artist_service import ArtistService
+
+BENCHMARK_DATABASE = "aida_benchmark_social_network"
+FIELDS = ["name", "nationality"]
+
+
+def seed(collection, artists: int, degree: int, rng: random.Random):
+    """
+    写入随机连接的艺术家
+
+    Args:
+        collection: 目标集合
+        artists: 艺术家数量
+        degree: 每位艺术家声明的连接数
+        rng: 随机数生成器
+    """
+    collection.drop()
+    ids = [f"artist_{index:07d}" for index in range(artists)]
+    batch = []
+    for artist_id in ids:
+        batch.append({
+            "id": artist_id,
+            "name": artist_id.replace("_", " ").title(),
+            "nationality": rng.choice(["French", "Dutch", "Spanish", "Japanese", "Chinese"]),
+            "bio": "x" * 200,
+            "agent": {"connected_network_ids": rng.sample(ids, degree)}
+        })
+        if len(batch) == 5000:
+            collection.insert_many(batch)
+            batch = []
+    if batch:
+        collection.insert_many(batch)
+    collection.create_index("id", unique=True)
+
+
+def traverse_graphlookup(collection, artist_id: str, depth: int, limit: int) -> List[Dict[str, Any]]:
+    """服务端遍历：与 ArtistService 相同的 $graphLookup 管道"""
+    pipeline = ArtistService._build_social_network_pipeline(artist_id, depth, FIELDS, limit)
+    return list(collection.aggregate(pipeline))
+
+
+def traverse_per_hop(collection, artist_id: str, depth: int, limit: int) -> List[Dict[str, Any]]:
+    """逐跳遍历：每跳一次 $in 查询，最后批量取回字段"""
+    distances = {artist_id: 0}
+    frontier = [artist_id]
+    for hop in range(1, depth + 1):
+        next_frontier = set()
+        cursor = collection.find({"id": {"$in": frontier}}, {"_id": 0, "agent.connected_network_ids": 1})
+        for artist in cursor:
+            for connected_id in (artist.get("agent") or {}).get("connected_network_ids") or []:
+                if connected_id not in distances:
+                    distances[connected_id] = hop
+                    next_frontier.add(connected_id)
+        if not next_frontier:
+            break
+        frontier = list(next_frontier)
+
+    reached = sorted(
+        (distance, connected_id) for connected_id, distance in distances.items() if distance > 0
+    )[:limit]
+    projection = {"_id": 0, "id": 1, **{field: 1 for field in FIELDS}}
+    artists = {
+        artist["id"]: artist
+        for artist in collection.find({"id": {"$in": [connected_id for _, connected_id in reached]}}, projection)
+    }
+    return [
+        {**artists[connected_id], "network_distance": distance}
+        for distance, connected_id in reached if connected_id in artists
+    ]
+
+
+def measure(run: Callable[[str], List[Dict[str, Any]]], sources: List[str]) -> Dict[str, float]:
+    """对每个起点执行一次遍历，统计耗时和结果数量"""
+    timings = []
+    sizes = []
+    for source in sources:
+        start = time.perf_counter()
+        sizes.append(len(run(source)))
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95) - 1] if len(timings) >= 20 else timings[-1],
+        "avg_results": statistics.mean(sizes)
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--artists", type=int, default=20000)
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--mongomock", action="store_true", help="使用 mongomock 代替真实 MongoDB")
+    args = parser.parse_args(argv)
+
+    if args.mongomock:
+        import mongomock
+        client = mongomock.MongoClient()
+    else:
+        client = MongoClient(MONGODB_URI)
+
+    rng = random.Random(args.seed)
+    database = client[BENCHMARK_DATABASE]
+    collection = database[ARTISTS_COLLECTION]
+    try:
+        seed(collection, args.artists, args.degree, rng)
+        sources = [f"artist_{rng.randrange(args.artists):07d}" for _ in range(args.samples)]
+
+        # 两种方式的结果必须一致（同距离内按ID排序截断）
+        for source in sources[:5]:
+            expected = traverse_per_hop(collection, source, args.depth, args.limit)
+            assert traverse_graphlookup(collection, source, args.depth, args.limit) == expected
+
+        print(f"artists={args.artists} degree={args.degree} depth={args.depth} limit={args.limit}")
+        for name, traverse in (("graphlookup", traverse_graphlookup), ("per-hop", traverse_per_hop)):
+            result = measure(lambda source: traverse(collection, source, args.depth, args.limit), sources)
+            print(
+                f"{name:<12} median {result['median_ms']:8.2f} ms  "
+                f"p95 {result['p95_ms']:8.2f} ms  results {result['avg_results']:.0f}"
+            )
+    finally:
+        client.drop_database(BENCHMARK_DATABASE)
+
+
+if __name__ == "__main__":
+    main()
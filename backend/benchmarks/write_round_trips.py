@@ -0,0 +1,154 @@
+"""
+更新和删除的数据库往返基准测试
+
+比较两种写入方式：
+- legacy：原 update/delete，先 find_one 检查记录是否存在，更新后再 find_one 取回记录
+  （更新三次往返，删除两次往返）
+- single：BaseService 当前的实现，更新用一次 find_one_and_update（return_document=AFTER，
+  按 RECORD_PROJECTION 取回），删除只用一次 delete_one，按 deleted_count 判断记录是否存在
+
+只测量数据库调用本身（不含校验和钩子）。默认在 MONGODB_URI 指向的实例上创建临时数据库
+（运行结束后删除），--latency-ms 在每次往返前加入固定延迟以模拟应用与数据库之间的网络距离；
+--mongomock 可在没有 MongoDB 的环境中验证脚本本身（耗时不具参考意义）。
+
+用法（在 backend 目录下）：
+    python -m benchmarks.write_round_trips --records 5000 --operations 2000 --latency-ms 0.5
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo import MongoClient, ReturnDocument
+
+from app.core.config import MONGODB_URI, ARTISTS_COLLECTION
+from app.services.base_service import BaseService
+
+BENCHMARK_DATABASE = "aida_benchmark_write_round_trips"
+
+
+class DelayedCollection:
+    """在每次数据库调用前等待固定时间的集合包装"""
+
+    def __init__(self, collection, latency_ms: float):
+        self._collection = collection
+        self._latency = latency_ms / 1000
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._collection, name)
+
+        def call(*args, **kwargs):
+            if self._latency:
+                time.sleep(self._latency)
+            return method(*args, **kwargs)
+
+        return call
+
+
+def seed(collection, records: int):
+    """
+    写入艺术家记录
+
+    Args:
+        collection: 目标集合
+        records: 记录数
+    """
+    collection.drop()
+    collection.insert_many([
+        {"id": f"artist_{index:06d}", "name": f"Artist {index}", "nationality": "French", "bio": "x" * 200}
+        for index in range(records)
+    ])
+    collection.create_index("id", unique=True)
+
+
+def update_legacy(collection, record_id: str, patch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """原实现：检查存在、更新、再取回"""
+    if not collection.find_one({"id": record_id}):
+        return None
+    collection.update_one({"id": record_id}, {"$set": patch})
+    return collection.find_one({"id": record_id}, BaseService.RECORD_PROJECTION)
+
+
+def update_single(collection, record_id: str, patch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """当前实现：一次 find_one_and_update"""
+    return collection.find_one_and_update(
+        {"id": record_id},
+        {"$set": patch},
+        projection=BaseService.RECORD_PROJECTION,
+        return_document=ReturnDocument.AFTER
+    )
+
+
+def delete_legacy(collection, record_id: str) -> bool:
+    """原实现：检查存在后删除"""
+    if not collection.find_one({"id": record_id}):
+        return False
+    return collection.delete_one({"id": record_id}).deleted_count > 0
+
+
+def delete_single(collection, record_id: str) -> bool:
+    """当前实现：一次 delete_one"""
+    return collection.delete_one({"id": record_id}).deleted_count > 0
+
+
+def measure(run: Callable[[str], Any], record_ids: List[str]) -> Dict[str, float]:
+    """对每个记录执行一次操作，统计耗时分布"""
+    timings = []
+    for record_id in record_ids:
+        start = time.perf_counter()
+        run(record_id)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "median_ms": statistics.median(timings),
+        "p99_ms": timings[max(int(len(timings) * 0.99) - 1, 0)]
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="每次数据库往返前加入的延迟")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--mongomock", action="store_true", help="使用 mongomock 代替真实 MongoDB")
+    args = parser.parse_args(argv)
+
+    if args.mongomock:
+        import mongomock
+        client = mongomock.MongoClient()
+    else:
+        client = MongoClient(MONGODB_URI)
+
+    rng = random.Random(args.seed)
+    raw_collection = client[BENCHMARK_DATABASE][ARTISTS_COLLECTION]
+    collection = DelayedCollection(raw_collection, args.latency_ms)
+    try:
+        seed(raw_collection, args.records)
+        record_ids = [f"artist_{rng.randrange(args.records):06d}" for _ in range(args.operations)]
+
+        # 两种更新方式返回的记录必须一致
+        for record_id in record_ids[:5]:
+            expected = update_legacy(raw_collection, record_id, {"nationality": "Dutch"})
+            assert update_single(raw_collection, record_id, {"nationality": "Dutch"}) == expected
+
+        print(f"records={args.records} operations={args.operations} latency_ms={args.latency_ms}")
+        for name, update in (("legacy", update_legacy), ("single", update_single)):
+            result = measure(lambda record_id: update(collection, record_id, {"nationality": name}), record_ids)
+            print(f"update {name:<7} median {result['median_ms']:8.3f} ms  p99 {result['p99_ms']:8.3f} ms")
+
+        # 每种删除方式删除各自的一半记录
+        deletions = rng.sample(range(args.records), min(args.operations, args.records))
+        halves = (deletions[::2], deletions[1::2])
+        for (name, delete), indexes in zip((("legacy", delete_legacy), ("single", delete_single)), halves):
+            result = measure(lambda record_id: delete(collection, record_id),
+                             [f"artist_{index:06d}" for index in indexes])
+            print(f"delete {name:<7} median {result['median_ms']:8.3f} ms  p99 {result['p99_ms']:8.3f} ms")
+    finally:
+        client.drop_database(BENCHMARK_DATABASE)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,20 @@
 
 import pytest
 import asyncio
+import importlib
+from contextlib import ExitStack
 from typing import Generator, Dict, Any
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 import mongomock
+from mongomock_motor import AsyncMongoMockClient
 
 from app import create_app
+from app.services.art_movement_service import ArtMovementService
+from app.services.artist_service import ArtistService
+from app.services.artwork_service import ArtworkService
+from app.services.base_service import BaseService
 from app.utils.data_generator import ArtistDataGenerator, ArtworkDataGenerator, ArtMovementDataGenerator
 
 
@@ -51,6 +58,48 @@ def mock_db(mock_mongo_client):
             }
 
 
+# 服务模块中直接导入了 get_collection，需要逐个替换
+SERVICE_MODULES = [
+    "app.services.base_service",
+    "app.services.artist_service",
+    "app.services.artwork_service",
+    "app.services.art_movement_service",
+]
+
+
+@pytest.fixture(scope="function")
+def mongomock_db():
+    """基于mongomock的数据库 - 服务层的同步和异步查询真实执行在同一组内存集合上"""
+    client = mongomock.MongoClient()
+    db = client["aida_test"]
+    async_db = AsyncMongoMockClient(mock_mongo_client=client)["aida_test"]
+
+    # 只读客户端与主客户端指向同一组集合
+    getters = {
+        "get_collection": lambda name: db[name],
+        "get_read_collection": lambda name: db[name],
+        "get_async_collection": lambda name: async_db[name],
+        "get_async_read_collection": lambda name: async_db[name],
+    }
+
+    # 进程内索引随数据库一起重置
+    ArtworkService.STYLE_INDEX.clear()
+    BaseService.SEARCH_INDEX.clear()
+    ArtMovementService.PERIOD_INDEX.clear()
+    ArtMovementService.TIMELINE.clear()
+    ArtistService.SOCIAL_GRAPH.clear()
+    BaseService.QUERY_CACHE.clear()
+    BaseService.QUERY_CACHE.reset_stats()
+
+    with ExitStack() as stack:
+        for module_name in SERVICE_MODULES:
+            module = importlib.import_module(module_name)
+            for getter_name, getter in getters.items():
+                if hasattr(module, getter_name):
+                    stack.enter_context(patch(f"{module_name}.{getter_name}", side_effect=getter))
+        yield db
+
+
 @pytest.fixture(scope="session")
 def app():
     """创建测试应用"""
@@ -0,0 +1,175 @@
+"""
+艺术家社交网络图测试
+"""
+
+import random
+from collections import deque
+from unittest.mock import patch
+
+import pytest
+
+from app.services.artist_service import ArtistService
+from app.utils.artist_graph import ArtistGraph
+
+
+def _bfs_distances(adjacency, source):
+    distances = {source: 0}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for neighbor in adjacency[node]:
+            if neighbor not in distances:
+                distances[neighbor] = distances[node] + 1
+                queue.append(neighbor)
+    return distances
+
+
+@pytest.mark.unit
+class TestArtistGraph:
+    """ArtistGraph 测试"""
+
+    def test_matches_reference_bfs(self):
+        rng = random.Random(5)
+        ids = [f"a{i}" for i in range(60)]
+        connections = {artist_id: rng.sample(ids, rng.randint(0, 3)) for artist_id in ids}
+        graph = ArtistGraph()
+        graph.build((artist_id, artist_id.upper(), connected) for artist_id, connected in connections.items())
+
+        adjacency = {artist_id: set() for artist_id in ids}
+        for artist_id, connected in connections.items():
+            for other in connected:
+                if other != artist_id:
+                    adjacency[artist_id].add(other)
+                    adjacency[other].add(artist_id)
+
+        for source in ids[:10]:
+            distances = _bfs_distances(adjacency, source)
+            expected = sorted(((node, hops) for node, hops in distances.items() if 0 < hops <= 3),
+                              key=lambda item: (item[1], ids.index(item[0])))
+            assert graph.k_hop(source, 3) == expected
+
+            target = ids[-1]
+            path = graph.shortest_path(source, target)
+            if target in distances:
+                assert len(path) - 1 == distances[target]
+                assert all(b in adjacency[a] for a, b in zip(path, path[1:]))
+            else:
+                assert path is None
+
+        assert graph.mutual("a0", "a1") == sorted(adjacency["a0"] & adjacency["a1"], key=ids.index)
+        assert graph.stats()["edges"] == sum(len(neighbors) for neighbors in adjacency.values()) // 2
+
+    def test_updates(self):
+        graph = ArtistGraph()
+        graph.build([("a", "A", ["b"]), ("b", "B", []), ("c", "C", ["x"])])
+
+        graph.upsert("x", "X", ["b"])
+        assert graph.shortest_path("a", "c") == ["a", "b", "x", "c"]
+        assert graph.shortest_path("a", "c", max_depth=2) is None
+
+        graph.remove("b")
+        assert graph.neighbors("a") == []
+        assert graph.degree("x") == 1
+
+
+@pytest.mark.unit
+class TestSocialNetworkService:
+    """社交网络查询随艺术家写入更新"""
+
+    def _artist(self, artist_id, connected):
+        return {"id": artist_id, "name": artist_id.title(), "agent": {"connected_network_ids": connected}}
+
+    def test_graph_follows_writes(self, mongomock_db):
+        ArtistService.create(self._artist("a", ["b"]))
+        ArtistService.create(self._artist("b", ["c"]))
+        ArtistService.create(self._artist("c", []))
+
+        neighborhood = ArtistService.get_network_neighborhood("a", depth=2)
+        assert [(node["id"], node["distance"]) for node in neighborhood["nodes"]] == [("b", 1), ("c", 2)]
+        assert neighborhood["nodes"][0]["name"] == "B"
+
+        ArtistService.create(self._artist("d", ["a", "c"]))
+        assert [node["id"] for node in ArtistService.get_mutual_connections("a", "c")] == ["b", "d"]
+
+        ArtistService.delete("b")
+        path = ArtistService.get_shortest_path("a", "c")
+        assert [node["id"] for node in path["path"]] == ["a", "d", "c"]
+
+        ArtistService.update("d", {"agent": {"connected_network_ids": []}})
+        assert ArtistService.get_shortest_path("a", "c") == {"found": False, "length": None, "path": []}
+        assert ArtistService.get_network_neighborhood("missing") is None
+
+    def test_write_during_rebuild_is_not_lost(self, mongomock_db):
+        ArtistService.create(self._artist("a", ["b"]))
+        graph = ArtistService.SOCIAL_GRAPH
+        original = graph._set
+        writes = []
+
+        def set_artist(artist_id, name, connected_ids):
+            # 重建加载期间落地的写入
+            if not writes:
+                writes.append(ArtistService.create(self._artist("b", [])))
+            return original(artist_id, name, connected_ids)
+
+        with patch.object(graph, "_set", side_effect=set_artist):
+            ArtistService.build_social_graph()
+
+        assert not graph.built
+        neighborhood = ArtistService.get_network_neighborhood("a")
+        assert [node["id"] for node in neighborhood["nodes"]] == ["b"]
+        assert graph.built
+
+    def test_graph_lookup_traversal(self, mongomock_db):
+        ArtistService.create(self._artist("a", ["b", "c"]))
+        ArtistService.create(self._artist("b", ["d", "a"]))
+        ArtistService.create(self._artist("c", ["d"]))
+        ArtistService.create(self._artist("d", ["e"]))
+        ArtistService.create(self._artist("e", []))
+
+        network = ArtistService.get_artist_social_network("a", depth=2)
+        assert [(artist["id"], artist["network_distance"]) for artist in network] == [("b", 1), ("c", 1), ("d", 2)]
+        assert "network_depth" not in network[0]
+
+        network = ArtistService.get_artist_social_network("a", depth=3, fields=["birth_year"], limit=3)
+        assert network[-1] == {"id": "d", "name": "D", "network_distance": 2}
+
+        direct = ArtistService.get_artist_social_network("a")
+        assert {artist["id"] for artist in direct} == {"b", "c"}
+
+        with pytest.raises(ValueError):
+            ArtistService.get_artist_social_network("a", depth=0)
+
+
+@pytest.mark.api
+class TestSocialNetworkRoutes:
+    """社交网络接口"""
+
+    def test_routes(self, app, mongomock_db):
+        from fastapi.testclient import TestClient
+
+        mongomock_db["artists"].insert_many([
+            {"id": "a", "name": "A", "agent": {"connected_network_ids": ["b"]}},
+            {"id": "b", "name": "B", "agent": {"connected_network_ids": ["c"]}},
+            {"id": "c", "name": "C"},
+        ])
+
+        with TestClient(app) as client:
+            response = client.get("/api/v1/artists/a/network/", params={"depth": 1})
+            assert [node["id"] for node in response.json()["data"]["nodes"]] == ["b"]
+
+            response = client.get("/api/v1/artists/a/network/path/c")
+            assert response.json()["data"]["length"] == 2
+
+            response = client.get("/api/v1/artists/a/network/mutual/c")
+            assert [node["id"] for node in response.json()["data"]] == ["b"]
+
+            response = client.get("/api/v1/artists/network/stats")
+            assert response.json()["data"]["edges"] == 2
+
+            assert client.get("/api/v1/artists/missing/network/").status_code == 404
+
+            response = client.get("/api/v1/artists/a/social-network/", params={"depth": 2, "fields": "name"})
+            assert [(artist["id"], artist["network_distance"]) for artist in response.json()["data"]] == [
+                ("b", 1), ("c", 2)
+            ]
+            assert client.get("/api/v1/artists/a/social-network/", params={"depth": 99}).status_code == 422
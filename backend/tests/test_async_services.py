@@ -0,0 +1,208 @@
+"""
+异步数据访问层测试 - Motor 服务与路由
+"""
+
+import asyncio
+
+import pytest
+
+
+def run(coro):
+    """在独立事件循环中执行协程"""
+    return asyncio.run(coro)
+
+
+@pytest.mark.unit
+class TestAsyncServices:
+    """异步服务测试"""
+
+    def test_async_crud_roundtrip(self, mongomock_db, sample_artist_data):
+        """异步创建、查询、更新、删除"""
+        from app.services.artist_service import AsyncArtistService
+
+        created = run(AsyncArtistService.create(dict(sample_artist_data)))
+        assert created.success and created.code == 201
+
+        duplicate = run(AsyncArtistService.create(dict(sample_artist_data)))
+        assert duplicate.code == 409
+
+        fetched = run(AsyncArtistService.get_by_id("test-artist-1"))
+        assert fetched.data["name"] == "Test Artist"
+        assert "_id" not in fetched.data
+
+        updated = run(AsyncArtistService.update("test-artist-1", {"nationality": "Updated"}))
+        assert updated.data["nationality"] == "Updated"
+        assert run(AsyncArtistService.update("test-artist-1", {"name": ""})).code == 400
+        assert run(AsyncArtistService.update("missing", {"name": ""})).code == 404
+
+        deleted = run(AsyncArtistService.delete("test-artist-1"))
+        assert deleted.success
+        assert run(AsyncArtistService.get_by_id("test-artist-1")).code == 404
+
+    def test_writes_use_one_round_trip(self, mongomock_db, sample_movement_data, monkeypatch):
+        """更新用一次 find_one_and_update，只在组合校验需要时按投影读取现有字段；删除只用 delete_one"""
+        from app.services import base_service
+        from app.services.art_movement_service import ArtMovementService
+
+        calls = []
+
+        class RecordingCollection:
+            def __init__(self, collection):
+                self._collection = collection
+
+            def __getattr__(self, name):
+                calls.append(name)
+                return getattr(self._collection, name)
+
+        get_collection = base_service.get_collection
+        monkeypatch.setattr(base_service, "get_collection", lambda name: RecordingCollection(get_collection(name)))
+        mongomock_db["art_movements"].insert_one(dict(sample_movement_data))
+        movement_id = sample_movement_data["id"]
+
+        updated = ArtMovementService.update(movement_id, {"description": "Updated"})
+        assert updated.data["description"] == "Updated" and "_id" not in updated.data
+        assert calls == ["find_one_and_update"]
+
+        calls.clear()
+        rejected = ArtMovementService.update(movement_id, {"end_year": sample_movement_data["start_year"] - 1})
+        assert rejected.code == 400
+        assert calls == ["find_one"]
+
+        assert ArtMovementService.update("missing", {"description": "x"}).code == 404
+
+        # 校验失败时先确认记录存在：不存在的记录返回 404
+        calls.clear()
+        assert ArtMovementService.update(movement_id, {"name": ""}).code == 400
+        assert ArtMovementService.update("missing", {"name": ""}).code == 404
+        assert calls == ["find_one", "find_one"]
+
+        calls.clear()
+        assert ArtMovementService.delete(movement_id).success
+        assert ArtMovementService.delete(movement_id).code == 404
+        assert calls == ["delete_one", "delete_one"]
+
+    def test_async_get_all_matches_sync(self, mongomock_db):
+        """异步分页结果与同步实现一致"""
+        from app.services.artist_service import ArtistService, AsyncArtistService
+        from app.utils.query_params import QueryParams
+
+        mongomock_db["artists"].insert_many([
+            {"id": f"artist-{i:02d}", "name": f"Artist {i}", "birth_year": 1900 + i} for i in range(12)
+        ])
+        params = QueryParams(sortBy="birth_year", order="desc", pageSize=5, page=2)
+
+        sync_response = ArtistService.get_all(params)
+        async_response = run(AsyncArtistService.get_all(params))
+
+        assert async_response.data == sync_response.data
+        assert async_response.total == 12
+        assert async_response.has_next is True
+
+    def test_async_movement_queries(self, mongomock_db, sample_movement_data):
+        """异步艺术运动查询"""
+        from app.services.art_movement_service import AsyncArtMovementService
+
+        mongomock_db["art_movements"].insert_one(dict(sample_movement_data))
+
+        active = run(AsyncArtMovementService.get_active_movements(2022))
+        assert [m["id"] for m in active] == ["test-movement-1"]
+
+        assert run(AsyncArtMovementService.add_artist_to_movement("test-movement-1", "artist-1")) is True
+        stats = run(AsyncArtMovementService.get_movement_statistics("test-movement-1"))
+        assert stats["key_artists_count"] == 1
+        assert stats["duration"] == 5
+
+
+@pytest.mark.unit
+class TestRecordLoader:
+    """请求级按ID批量加载"""
+
+    def test_concurrent_lookups_share_one_query(self, mongomock_db):
+        from app.services.artist_service import AsyncArtistService
+        from app.utils.record_loader import request_scope, request_loader
+
+        mongomock_db["artists"].insert_many([{"id": f"a{i}", "name": f"Artist {i}"} for i in range(3)])
+
+        async def scenario():
+            with request_scope():
+                responses = await asyncio.gather(*(
+                    AsyncArtistService.get_by_id(artist_id) for artist_id in ["a0", "a1", "a0", "missing"]
+                ))
+                again = await AsyncArtistService.get_by_id("a1")
+                loader = request_loader("artists", AsyncArtistService._fetch_by_ids)
+                return responses, again, loader.batches
+
+        responses, again, batches = run(scenario())
+
+        assert [response.code for response in responses] == [200, 200, 200, 404]
+        assert responses[0].data == responses[2].data and responses[0].data is not responses[2].data
+        assert again.data["name"] == "Artist 1"
+        assert batches == 1
+
+    def test_writes_refresh_loaded_records(self, mongomock_db):
+        from app.services.artwork_service import AsyncArtworkService
+        from app.utils.record_loader import request_scope
+
+        mongomock_db["artworks"].insert_one({"id": "w1", "title": "Study", "artist_id": "a1", "movement_ids": []})
+
+        async def scenario():
+            with request_scope():
+                await AsyncArtworkService.get_by_id("w1")
+                await AsyncArtworkService.update("w1", {"title": "Final"})
+                updated = await AsyncArtworkService.get_by_id("w1")
+                await AsyncArtworkService.add_artwork_to_movement("w1", "m1")
+                moved = await AsyncArtworkService.get_by_id("w1")
+                await AsyncArtworkService.delete("w1")
+                deleted = await AsyncArtworkService.get_by_id("w1")
+                return updated, moved, deleted
+
+        updated, moved, deleted = run(scenario())
+
+        assert updated.data["title"] == "Final"
+        assert moved.data["movement_ids"] == ["m1"]
+        assert deleted.code == 404
+
+
+@pytest.mark.api
+class TestAsyncRoutes:
+    """路由使用异步服务"""
+
+    def test_artist_routes(self, app, mongomock_db, sample_artist_data, assert_paginated_response):
+        """艺术家列表和详情接口"""
+        from fastapi.testclient import TestClient
+
+        mongomock_db["artists"].insert_one(dict(sample_artist_data))
+
+        with TestClient(app) as client:
+            response = client.get("/api/v1/artists/", params={"pageSize": 5})
+            assert response.status_code == 200
+            assert_paginated_response(response.json())
+            assert response.json()["data"][0]["id"] == "test-artist-1"
+
+            response = client.get("/api/v1/artists/test-artist-1")
+            assert response.json()["data"]["name"] == "Test Artist"
+
+            response = client.get("/api/v1/artists/", params={"after": "bogus"})
+            assert response.status_code == 400
+
+    def test_list_routes_serialize_once(self, app, mongomock_db, sample_artist_data):
+        """列表接口直接编码记录，OpenAPI 仍使用响应模型"""
+        from datetime import datetime
+        from bson import ObjectId
+        from fastapi.testclient import TestClient
+        from app.utils.json_response import FastJSONResponse
+
+        mongomock_db["artists"].insert_one({**sample_artist_data, "created_at": datetime(2024, 1, 2, 3, 4, 5)})
+
+        with TestClient(app) as client:
+            body = client.get("/api/v1/artists/").json()
+            assert body["total"] == 1
+            assert body["data"][0]["created_at"] == "2024-01-02T03:04:05"
+            assert "_id" not in body["data"][0]
+
+            schema = client.get("/openapi.json").json()
+            response_schema = schema["paths"]["/api/v1/artists/"]["get"]["responses"]["200"]
+            assert "PaginatedResponse" in response_schema["content"]["application/json"]["schema"]["$ref"]
+
+        object_id = ObjectId()
+        assert FastJSONResponse({"id": object_id}).body == f'{{"id":"{object_id}"}}'.encode()
@@ -0,0 +1,82 @@
+"""
+批量写入测试 - bulk_create 与数据生成接口
+"""
+
+import asyncio
+
+import pytest
+from pymongo import ASCENDING
+
+from app.services.artist_service import ArtistService, AsyncArtistService
+from app.utils.collection_versions import COLLECTION_VERSIONS
+
+
+def _artist(artist_id, name=None):
+    return {"id": artist_id, "name": name or f"Artist {artist_id}", "is_fictional": False}
+
+
+@pytest.mark.unit
+class TestBulkCreate:
+    """bulk_create 测试"""
+
+    def test_maps_errors_to_records(self, mongomock_db):
+        """验证失败、批次内重复和已存在的ID都按原始下标返回"""
+        mongomock_db["artists"].insert_one(_artist("existing"))
+
+        records = [_artist("a1"), {"id": "bad"}, _artist("a1"), _artist("existing"), _artist("a2")]
+        response = ArtistService.bulk_create(records)
+
+        assert response.success
+        assert response.data["created_ids"] == ["a1", "a2"]
+        assert [(e["index"], e["code"]) for e in response.data["errors"]] == [(1, 400), (2, 409), (3, 409)]
+        assert mongomock_db["artists"].count_documents({}) == 3
+
+    def test_duplicate_key_write_errors(self, mongomock_db, monkeypatch):
+        """前置检查未发现的重复ID由 insert_many 的 writeErrors 映射回记录"""
+        mongomock_db["artists"].create_index([("id", ASCENDING)], unique=True)
+        mongomock_db["artists"].insert_one(_artist("raced"))
+        monkeypatch.setattr(ArtistService, "_find_existing_ids", classmethod(lambda cls, collection, ids: set()))
+
+        response = ArtistService.bulk_create([_artist("b1"), _artist("raced"), _artist("b2")])
+
+        assert response.data["created_ids"] == ["b1", "b2"]
+        assert response.data["errors"][0]["index"] == 1
+        assert response.data["errors"][0]["code"] == 409
+
+    def test_bumps_version_once_and_indexes_records(self, mongomock_db):
+        """整批只递增一次集合版本号，已构建的搜索索引和社交网络图仍逐条更新"""
+        ArtistService.build_search_index()
+        ArtistService.build_social_graph()
+        version = COLLECTION_VERSIONS.get("artists")
+
+        ArtistService.bulk_create([_artist("d1", "Zyxwv"), _artist("d2"), _artist("d3")])
+
+        assert COLLECTION_VERSIONS.get("artists") == version + 1
+        assert ArtistService.SEARCH_INDEX.is_built("artist")
+        assert [hit["id"] for hit in ArtistService.SEARCH_INDEX.search("zyxwv")] == ["d1"]
+        assert "d3" in ArtistService.SOCIAL_GRAPH
+
+    def test_async_bulk_create(self, mongomock_db):
+        mongomock_db["artists"].insert_one(_artist("existing"))
+
+        response = asyncio.run(AsyncArtistService.bulk_create([_artist("c1"), _artist("existing")]))
+
+        assert response.data["created_count"] == 1
+        assert response.data["errors"][0]["id"] == "existing"
+        assert mongomock_db["artists"].find_one({"id": "c1"})["name"] == "Artist c1"
+
+
+@pytest.mark.api
+class TestDataGenerationBulk:
+    """数据生成接口使用批量写入"""
+
+    def test_generate_artists(self, app, mongomock_db):
+        from fastapi.testclient import TestClient
+
+        with TestClient(app) as client:
+            response = client.post("/api/v1/data-generation/artists", json={"count": 3, "fictional": True})
+
+        data = response.json()["data"]
+        assert data["created_count"] == 3
+        assert data["errors"] == []
+        assert mongomock_db["artists"].count_documents({"is_fictional": True}) == 3
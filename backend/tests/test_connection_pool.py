@@ -0,0 +1,59 @@
+"""
+连接池配置与监控测试
+"""
+
+import pytest
+from pymongo import monitoring
+
+import app.db.mongodb as mongodb
+from app.db.mongodb import ConnectionPoolMonitor, get_client_options
+
+
+ADDRESS = ("db.example", 27017)
+
+
+@pytest.mark.unit
+class TestConnectionPool:
+    """连接池测试"""
+
+    def test_monitor_tracks_connections(self):
+        monitor = ConnectionPoolMonitor("test")
+        monitor.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 1))
+        monitor.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 2))
+        monitor.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 1))
+        monitor.connection_closed(monitoring.ConnectionClosedEvent(ADDRESS, 2, "idle"))
+
+        stats = monitor.get_stats()["db.example:27017"]
+        assert stats["open"] == 1
+        assert stats["checked_out"] == 1
+        assert stats["available"] == 0
+        assert stats["created_total"] == 2
+        assert stats["closed_total"] == 1
+
+        monitor.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 1))
+        assert monitor.get_stats()["db.example:27017"]["available"] == 1
+
+    def test_client_options(self):
+        options = get_client_options("options_test", "secondaryPreferred")
+        assert options["maxPoolSize"] == mongodb.MONGODB_MAX_POOL_SIZE
+        assert options["readPreference"] == "secondaryPreferred"
+        assert options["event_listeners"] == [mongodb.get_pool_monitor("options_test")]
+
+    def test_read_only_settings_default_to_primary(self, monkeypatch):
+        import importlib
+        from app.core import config
+
+        monkeypatch.delenv("MONGODB_READONLY_URI", raising=False)
+        monkeypatch.delenv("MONGODB_READONLY_READ_PREFERENCE", raising=False)
+        try:
+            reloaded = importlib.reload(config)
+            assert reloaded.MONGODB_READONLY_URI == reloaded.MONGODB_URI
+            assert reloaded.MONGODB_READONLY_READ_PREFERENCE == reloaded.MONGODB_READ_PREFERENCE
+        finally:
+            monkeypatch.undo()
+            importlib.reload(config)
+
+    def test_read_client_reuses_primary_when_unconfigured(self, monkeypatch):
+        monkeypatch.setattr(mongodb, "MONGODB_READONLY_URI", mongodb.MONGODB_URI)
+        monkeypatch.setattr(mongodb, "MONGODB_READONLY_READ_PREFERENCE", mongodb.MONGODB_READ_PREFERENCE)
+        assert mongodb.get_read_client() is mongodb.get_client()
@@ -0,0 +1,118 @@
+"""
+CSV 流式导入测试
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from app.services.artist_service import ArtistService
+from app.utils.import_jobs import ImportJobManager
+
+
+def _write_csv(tmp_path, lines):
+    path = tmp_path / "artists.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.unit
+class TestChunkedCSVImport:
+    """分块导入测试"""
+
+    def test_chunked_import_skips_bad_rows(self, mongomock_db, tmp_path):
+        csv_path = _write_csv(tmp_path, [
+            "id,name,birth_year,nationality",
+            "a1, Alice ,1900,",
+            "a2,Bob,,French",
+            "a3,,1950,Dutch",
+            "a4,Dora,1960,  ",
+            ",Eve,1970,Spanish",
+        ])
+        progress = []
+
+        response = ArtistService.import_from_csv(csv_path, chunk_size=2, progress_callback=progress.append)
+
+        assert response.success
+        assert response.data["rows_processed"] == 5
+        assert response.data["inserted_count"] == 4
+        assert response.data["errors"] == [{"line": 4, "errors": ["Column 'name' contains null values"]}]
+        assert [p["chunk"] for p in progress] == [0, 1, 2]
+        assert progress[-1]["inserted_count"] == 4
+
+        alice = mongomock_db["artists"].find_one({"id": "a1"}, {"_id": 0})
+        assert alice["name"] == "Alice"
+        assert "nationality" not in alice
+        assert "birth_year" not in mongomock_db["artists"].find_one({"id": "a2"})
+        assert mongomock_db["artists"].find_one({"name": "Eve"})["id"]
+
+    def test_missing_required_column(self, mongomock_db, tmp_path):
+        csv_path = _write_csv(tmp_path, ["id,nationality", "a1,French"])
+
+        response = ArtistService.import_from_csv(csv_path, clear_existing=True)
+
+        assert not response.success
+        assert response.code == 400
+        assert "Missing required column: 'name'" in response.error_details["validation_errors"]
+
+
+@pytest.mark.api
+class TestCSVUploadJobs:
+    """上传后台导入任务测试"""
+
+    def test_upload_creates_import_job(self, app, mongomock_db, tmp_path, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        monkeypatch.setattr("app.api.v1.endpoints.data.DATA_DIR", str(tmp_path))
+        content = "id,title,artist_id,year\nw1,Sunrise,a1,1872\nw2,,a1,1873\n"
+
+        with TestClient(app) as client:
+            response = client.post(
+                "/api/v1/data/upload-csv",
+                params={"collection": "artworks"},
+                files={"file": ("works.csv", content, "text/csv")}
+            )
+            assert response.status_code == 202
+            job_id = response.json()["job_id"]
+
+            # TestClient 在返回响应后同步执行后台任务
+            job = client.get(f"/api/v1/data/import-jobs/{job_id}").json()["data"]
+
+            assert client.get("/api/v1/data/import-jobs/missing").status_code == 404
+            assert client.post(
+                "/api/v1/data/upload-csv",
+                params={"collection": "users"},
+                files={"file": ("works.csv", content, "text/csv")}
+            ).status_code == 400
+
+        assert job["status"] == "completed"
+        assert job["progress"]["inserted_count"] == 1
+        assert job["result"]["errors"][0]["line"] == 3
+        assert mongomock_db["artworks"].find_one({"id": "w1"})["title"] == "Sunrise"
+        assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.unit
+class TestImportJobRetention:
+    """导入任务的过期与数量上限"""
+
+    def test_prunes_finished_jobs(self, monkeypatch):
+        monkeypatch.setattr(ImportJobManager, "_jobs", {})
+        monkeypatch.setattr(ImportJobManager, "MAX_JOBS", 3)
+        monkeypatch.setattr(ImportJobManager, "TTL_SECONDS", 60)
+
+        running = ImportJobManager.create_job("artists", "running.csv")["job_id"]
+        ImportJobManager._update(running, status=ImportJobManager.RUNNING)
+        expired, older, newer = (ImportJobManager.create_job("artists", f"{n}.csv")["job_id"] for n in range(3))
+        for job_id in (expired, older, newer):
+            ImportJobManager._update(job_id, status=ImportJobManager.COMPLETED)
+        ImportJobManager._jobs[expired]["updated_at"] -= timedelta(seconds=120)
+        ImportJobManager._jobs[running]["updated_at"] -= timedelta(seconds=120)
+
+        # 过期的已结束任务在查询时清除，未结束的任务保留
+        assert ImportJobManager.get_job(expired) is None
+        assert ImportJobManager.get_job(running)["status"] == "running"
+
+        # 超过上限时先清除最早结束的任务
+        latest = ImportJobManager.create_job("artists", "latest.csv")["job_id"]
+        assert set(ImportJobManager._jobs) == {running, newer, latest}
@@ -0,0 +1,106 @@
+"""
+区间树与艺术运动时期查询测试
+"""
+
+import random
+
+import pytest
+
+from app.models.art_movement import ArtMovement
+from app.services.art_movement_service import ArtMovementService
+from app.utils.interval_tree import IntervalTree
+
+
+@pytest.mark.unit
+class TestIntervalTree:
+    """IntervalTree 测试"""
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(3)
+        intervals = []
+        for i in range(300):
+            start = rng.choice([None, rng.randint(1400, 2000)])
+            end = rng.choice([None, (start or 1400) + rng.randint(0, 80)])
+            intervals.append((start, end, i))
+        tree = IntervalTree(intervals)
+
+        def overlaps(start, end, low, high):
+            return (start is None or start <= high) and (end is None or end >= low)
+
+        for _ in range(200):
+            low = rng.randint(1380, 2020)
+            high = low + rng.randint(0, 60)
+            expected = sorted(i for start, end, i in intervals if overlaps(start, end, low, high))
+            assert sorted(tree.overlap(low, high)) == expected
+            assert sorted(tree.stab(low)) == sorted(i for start, end, i in intervals if overlaps(start, end, low, low))
+
+    def test_unbounded_queries(self):
+        tree = IntervalTree([(1860, 1890, "a"), (1905, None, "b"), (None, 1500, "c"), (1950, 1900, "invalid")])
+
+        assert len(tree) == 3
+        assert sorted(tree.overlap(None, None)) == ["a", "b", "c"]
+        assert sorted(tree.overlap(1880, None)) == ["a", "b"]
+        assert tree.stab(1700) == []
+
+
+@pytest.mark.unit
+class TestMovementPeriodQueries:
+    """艺术运动时期查询走区间树并随写入刷新"""
+
+    def test_period_index_follows_writes(self, mongomock_db):
+        ArtMovementService.create({"id": "m1", "name": "Impressionism", "start_year": 1860, "end_year": 1890})
+        ArtMovementService.create({"id": "m2", "name": "Cubism", "start_year": 1907, "end_year": 1914})
+        ArtMovementService.create({"id": "m3", "name": "Contemporary", "start_year": 1970})
+
+        assert [m["id"] for m in ArtMovementService.get_movements_by_period(1880, 1910)] == ["m1", "m2"]
+        assert [m["id"] for m in ArtMovementService.get_active_movements(2000)] == ["m3"]
+
+        ArtMovementService.update("m2", {"start_year": 1920, "end_year": 1930})
+        ArtMovementService.create({"id": "m4", "name": "Fauvism", "start_year": 1904, "end_year": 1908})
+        assert [m["id"] for m in ArtMovementService.get_movements_by_period(1880, 1910)] == ["m1", "m4"]
+
+        ArtMovementService.add_artist_to_movement("m1", "artist-1")
+        assert ArtMovementService.get_active_movements(1870)[0]["key_artists"] == ["artist-1"]
+
+        ArtMovementService.delete("m1")
+        assert ArtMovementService.get_active_movements(1870) == []
+
+    def test_same_semantics_as_model(self, mongomock_db):
+        movements = [
+            {"id": "m1", "name": "A", "start_year": 1800, "end_year": 1850},
+            {"id": "m2", "name": "B", "end_year": 1820},
+            {"id": "m3", "name": "C", "start_year": 1840},
+        ]
+        mongomock_db["art_movements"].insert_many([dict(movement) for movement in movements])
+
+        expected = ArtMovement.get_movements_by_period([ArtMovement.from_dict(m) for m in movements], 1810, 1845)
+
+        result = ArtMovementService.get_movements_by_period(1810, 1845)
+        assert [m["id"] for m in result] == ["m2", "m1", "m3"]
+        assert {m["id"] for m in result} == {movement.id for movement in expected}
+
+    def test_nan_years_are_unbounded(self, mongomock_db):
+        mongomock_db["art_movements"].insert_many([
+            {"id": "m1", "name": "A", "start_year": float("nan"), "end_year": 1860},
+            {"id": "m2", "name": "B", "start_year": 1840, "end_year": 1870},
+        ])
+
+        active = ArtMovementService.get_active_movements(1850)
+        assert [m["id"] for m in active] == ["m1", "m2"]
+        assert active[0]["start_year"] is None and "_id" not in active[0]
+
+    def test_stale_build_is_not_kept(self, mongomock_db):
+        from app.utils.collection_versions import COLLECTION_VERSIONS
+
+        mongomock_db["art_movements"].insert_one({"id": "m1", "name": "A", "start_year": 1800, "end_year": 1850})
+        index = ArtMovementService.PERIOD_INDEX
+        version = index.current_version()
+
+        # 加载期间发生写入：重建结果只返回给调用方
+        COLLECTION_VERSIONS.bump("art_movements")
+        index.clear()
+        tree = index.build([(1800, 1850, "m1")], version)
+        assert len(tree) == 1 and not index.built
+
+        index.build([(1800, 1850, "m1")], index.current_version())
+        assert index.built
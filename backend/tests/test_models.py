@@ -0,0 +1,88 @@
+"""
+数据模型测试 - 编译后的字段定义、扩展字段和序列化
+"""
+
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.models.art_movement import ArtMovement
+from app.models.artist import Artist
+from app.models.artwork import Artwork
+
+
+@pytest.mark.unit
+class TestSlottedModels:
+    """__slots__ 模型"""
+
+    def test_from_dict_converts_without_mutating_input(self):
+        """from_dict 不修改输入，NaN 转为 None，字符串时间戳转为 datetime"""
+        object_id = ObjectId()
+        data = {
+            "_id": object_id, "name": "Monet", "birth_year": float("nan"),
+            "created_at": "2024-01-02T03:04:05Z", "tags": None
+        }
+        snapshot = dict(data)
+
+        artist = Artist.from_dict(data)
+
+        assert data == snapshot
+        assert artist.id == str(object_id)
+        assert artist.birth_year is None
+        assert artist.created_at == datetime.fromisoformat("2024-01-02T03:04:05+00:00")
+        assert artist.tags == [] and artist.notable_works == []
+        assert isinstance(artist.updated_at, datetime)
+        assert not hasattr(artist, "__dict__")
+
+    def test_extension_fields(self):
+        """未声明的字段保存在 extra 中，可以像属性一样读取并随 to_dict 输出"""
+        artwork = Artwork.from_dict({"title": "Water Lilies", "artist_id": "monet", "medium": "oil", "score": float("nan")})
+
+        assert artwork.medium == "oil"
+        assert artwork.extra == {"medium": "oil", "score": None}
+        assert artwork.to_dict()["medium"] == "oil"
+        assert not hasattr(artwork, "missing")
+
+        movement = ArtMovement.from_dict({"name": "Impressionism"})
+        assert movement._extra is None
+        movement.extra["origin"] = "France"
+        assert movement.origin == "France"
+
+    def test_search_field_and_array_values(self):
+        """服务层写入的搜索字段保存在槽中且不输出；扩展字段中的数组不做 NaN 判断"""
+        import numpy as np
+
+        artist = Artist.from_dict({"name": "Monet", "name_lower": "monet"})
+        assert artist.name_lower == "monet" and artist._extra is None
+        assert "name_lower" not in artist.to_dict()
+
+        artwork = Artwork.from_dict({"title": "Water Lilies", "artist_id": "monet", "embedding": np.zeros(3)})
+        assert artwork.embedding.shape == (3,)
+
+    def test_required_fields_and_to_dict(self):
+        """缺少必填字段时 from_dict 抛出 ValueError，构造函数抛出 TypeError"""
+        with pytest.raises(ValueError, match="Artwork data must contain 'artist_id' field"):
+            Artwork.from_dict({"title": "Untitled"})
+        with pytest.raises(TypeError):
+            Artist(birth_year=1840)
+
+        created = datetime(2024, 1, 1)
+        artist = Artist(id=ObjectId("0123456789abcdef01234567"), name="Monet", created_at=created)
+        result = artist.to_dict()
+        assert result["id"] == "0123456789abcdef01234567"
+        assert result["created_at"] == "2024-01-01T00:00:00"
+        assert result["is_fictional"] is False
+
+    def test_patch_validation(self):
+        """部分更新只运行涉及被修改字段的校验，组合校验需要同组的其余字段"""
+        assert ArtMovement.patch_context_fields(["end_year"]) == ["start_year"]
+        assert ArtMovement.patch_context_fields(["start_year", "end_year"]) == []
+        assert Artist.patch_context_fields(["nationality"]) == []
+
+        patch = Artwork.from_patch({"year": 1872})
+        assert patch.title is None and patch.validate_data(["year"]) == []
+        assert Artwork.from_patch({"title": " "}).validate_data(["title"]) == ["Artwork title is required"]
+
+        movement = ArtMovement.from_patch({"start_year": 1900, "end_year": 1880})
+        assert movement.validate_data(["end_year"]) == ["Start year cannot be greater than end year"]
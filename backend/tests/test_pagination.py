@@ -0,0 +1,310 @@
+"""
+分页功能测试 - 游标分页
+"""
+
+import asyncio
+
+import pytest
+
+
+def _seed_artists(db, count=25):
+    """写入测试艺术家，birth_year 有重复值以覆盖次级排序"""
+    db["artists"].insert_many([
+        {
+            "id": f"artist-{i:03d}",
+            "name": f"Artist {i}",
+            "birth_year": 1800 + (i // 3) if i % 7 else None,
+            "is_fictional": i % 2 == 0
+        }
+        for i in range(count)
+    ])
+
+
+def _collect_pages(service, params_kwargs):
+    """沿 next_cursor 翻页，返回所有记录ID"""
+    from app.utils.query_params import QueryParams
+
+    ids = []
+    after = None
+    for _ in range(50):
+        params = QueryParams(**params_kwargs, pagination="cursor", after=after)
+        response = service.get_all(params)
+        ids.extend(record["id"] for record in response.data)
+        if not response.has_next:
+            assert response.next_cursor is None
+            break
+        after = response.next_cursor
+    return ids
+
+
+@pytest.mark.unit
+class TestCursorPagination:
+    """游标分页测试"""
+
+    def test_cursor_pages_cover_all_records_in_id_order(self, mongomock_db):
+        """默认按 id 翻页，结果不重不漏"""
+        from app.services.artist_service import ArtistService
+
+        _seed_artists(mongomock_db)
+        ids = _collect_pages(ArtistService, {"pageSize": 10})
+
+        assert ids == sorted(f"artist-{i:03d}" for i in range(25))
+
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    def test_cursor_pages_with_sort_field_and_nulls(self, mongomock_db, order):
+        """按含重复值和空值的字段排序时与一次性排序结果一致"""
+        from app.services.artist_service import ArtistService
+
+        _seed_artists(mongomock_db)
+        direction = 1 if order == "asc" else -1
+        expected = [
+            doc["id"] for doc in mongomock_db["artists"].find().sort([("birth_year", direction), ("id", direction)])
+        ]
+
+        ids = _collect_pages(ArtistService, {"pageSize": 4, "sortBy": "birth_year", "order": order})
+
+        assert ids == expected
+
+    def test_cursor_respects_filters(self, mongomock_db):
+        """游标条件与筛选条件组合"""
+        from app.services.artist_service import ArtistService
+
+        _seed_artists(mongomock_db)
+        ids = _collect_pages(ArtistService, {"pageSize": 3, "isFictional": True})
+
+        assert ids == sorted(f"artist-{i:03d}" for i in range(0, 25, 2))
+
+    def test_invalid_cursor_rejected(self, mongomock_db):
+        """无效或与排序不匹配的游标抛出 ValueError"""
+        from app.services.artist_service import ArtistService
+        from app.utils.query_params import QueryParams
+
+        _seed_artists(mongomock_db)
+        with pytest.raises(ValueError):
+            ArtistService.get_all(QueryParams(after="not-a-cursor"))
+
+        first = ArtistService.get_all(QueryParams(pagination="cursor", pageSize=5))
+        with pytest.raises(ValueError):
+            ArtistService.get_all(QueryParams(after=first.next_cursor, sortBy="name"))
+
+
+@pytest.mark.unit
+class TestCountModes:
+    """总数统计模式测试"""
+
+    def test_exact_count_is_default(self, mongomock_db):
+        """默认精确统计"""
+        from app.services.artist_service import ArtistService
+        from app.utils.query_params import QueryParams
+
+        _seed_artists(mongomock_db)
+        response = ArtistService.get_all(QueryParams(pageSize=10))
+
+        assert response.count_mode == "exact"
+        assert response.total == 25
+        assert response.total_pages == 3
+        assert response.has_next is True
+
+    def test_estimated_count(self, mongomock_db):
+        """估算模式：无筛选读取元数据，有筛选时封顶统计"""
+        from app.services.artist_service import ArtistService
+        from app.utils.query_params import QueryParams
+
+        _seed_artists(mongomock_db)
+        response = ArtistService.get_all(QueryParams(count="estimated", pageSize=10, page=3))
+        assert response.count_mode == "estimated"
+        assert response.total == 25
+        assert response.has_next is False
+
+        response = ArtistService.get_all(QueryParams(count="estimated", isFictional=True))
+        assert response.total == 13
+
+    def test_no_count_uses_lookahead(self, mongomock_db):
+        """不统计模式通过多取一条判断是否有下一页"""
+        from app.services.artist_service import ArtistService
+        from app.utils.query_params import QueryParams
+
+        _seed_artists(mongomock_db)
+        response = ArtistService.get_all(QueryParams(count="none", pageSize=10, page=2))
+        assert response.count_mode == "none"
+        assert response.total is None
+        assert len(response.data) == 10
+        assert response.has_next is True
+        assert response.has_prev is True
+
+        response = ArtistService.get_all(QueryParams(count="none", pageSize=10, page=3))
+        assert len(response.data) == 5
+        assert response.has_next is False
+
+    def test_invalid_count_mode_rejected(self, mongomock_db):
+        """不支持的统计模式抛出 ValueError"""
+        from app.services.artist_service import ArtistService
+        from app.utils.query_params import QueryParams
+
+        with pytest.raises(ValueError):
+            ArtistService.get_all(QueryParams(count="approximate"))
+
+    def test_invalid_pagination_mode_rejected(self, app, mongomock_db):
+        """不支持的分页模式抛出 ValueError，接口返回 400"""
+        from fastapi.testclient import TestClient
+        from app.services.artist_service import ArtistService
+        from app.utils.query_params import QueryParams
+
+        with pytest.raises(ValueError):
+            ArtistService.get_all(QueryParams(pagination="keyset"))
+
+        with TestClient(app) as client:
+            assert client.get("/api/v1/artists/", params={"pagination": "keyset"}).status_code == 400
+            assert client.get("/api/v1/artists/", params={"pagination": "CURSOR"}).status_code == 200
+
+
+@pytest.mark.unit
+class TestListFilters:
+    """列表筛选条件组合"""
+
+    def test_filters_combined_with_and(self):
+        from app.utils.query_params import QueryParams, QueryParamsParser
+
+        params = QueryParams(search="monet", searchMode="prefix", tags="a,b", yearFrom=1800, yearTo=1900, isFictional=False)
+        filter_dict = QueryParamsParser.build_mongo_filter(params, year_field="birth_year")
+
+        assert filter_dict == {"$and": [
+            {"name_lower": {"$regex": "^monet"}},
+            {"tags": {"$in": ["a", "b"]}},
+            {"birth_year": {"$gte": 1800, "$lte": 1900}},
+            {"is_fictional": False}
+        ]}
+
+    def test_year_filter_keeps_search(self, mongomock_db):
+        from app.services.artist_service import ArtistService
+        from app.services.artwork_service import ArtworkService
+        from app.utils.query_params import QueryParams
+
+        _seed_artists(mongomock_db)
+        mongomock_db["artworks"].insert_many([
+            {"id": "w1", "title": "Artist Study", "year": 1805, "birth_year": 1950},
+            {"id": "w2", "title": "Landscape", "year": 1805},
+        ])
+
+        params = QueryParams(search="Artist 1", searchMode="regex", yearFrom=1803, yearTo=1804)
+        response = ArtistService.get_all(params)
+        assert sorted(record["id"] for record in response.data) == ["artist-010", "artist-011", "artist-012", "artist-013"]
+
+        # 年份只按作品自己的 year 字段筛选
+        params = QueryParams(search="Artist", searchMode="regex", yearTo=1900)
+        assert [record["id"] for record in ArtworkService.get_all(params).data] == ["w1"]
+
+
+@pytest.mark.unit
+class TestIncludeRelations:
+    """include 参数的批量关联展开"""
+
+    def _seed(self, db):
+        db["artworks"].insert_many([
+            {"id": f"w{i}", "title": f"Work {i}", "artist_id": f"a{i % 2}", "movement_ids": ["m1"]}
+            for i in range(4)
+        ])
+        db["art_movements"].insert_one({"id": "m1", "name": "Impressionism", "name_lower": "impressionism"})
+        db["artists"].insert_many([
+            {"id": "a0", "name": "A0", "notable_works": ["w2", "missing", "w0"], "associated_movements": ["m1"]},
+            {"id": "a1", "name": "A1", "notable_works": []},
+        ])
+
+    def test_list_expands_with_one_query_per_relation(self, mongomock_db, monkeypatch):
+        from app.services import base_service
+        from app.services.artwork_service import ArtworkService
+        from app.utils.query_params import QueryParams
+
+        self._seed(mongomock_db)
+        opened = []
+        # 启用查询缓存时，要写入缓存的查询从主节点读取
+        get_collection = base_service.get_collection
+        monkeypatch.setattr(
+            base_service, "get_collection",
+            lambda name: opened.append(name) or get_collection(name)
+        )
+
+        response = ArtworkService.get_all(QueryParams(include="artist,movements", fields="title"))
+
+        assert opened == ["artworks", "artists", "art_movements"]
+        first = response.data[0]
+        assert first["artist_id"] == "a0"
+        assert [artist["id"] for artist in first["included"]["artist"]] == ["a0"]
+        assert first["included"]["movements"] == [{"id": "m1", "name": "Impressionism"}]
+
+    def test_get_by_id_keeps_reference_order(self, mongomock_db):
+        from app.services.artist_service import ArtistService, AsyncArtistService
+
+        self._seed(mongomock_db)
+
+        record = ArtistService.get_by_id("a0", include=["notableWorks"]).data
+        assert [work["id"] for work in record["included"]["notableWorks"]] == ["w2", "w0"]
+
+        record = asyncio.run(AsyncArtistService.get_by_id("a1", include=["notableWorks", "associatedMovements"])).data
+        assert record["included"] == {"notableWorks": [], "associatedMovements": []}
+
+        with pytest.raises(ValueError):
+            ArtistService.get_by_id("a0", include=["paintings"])
+
+
+@pytest.mark.unit
+class TestListViews:
+    """列表视图的默认字段投影"""
+
+    def _seed(self, db):
+        db["artworks"].insert_many([
+            {"id": f"w{i}", "title": f"Work {i}", "year": 1900 + i, "artist_id": "a0",
+             "description": "long text", "style_vector": [0.1] * 64}
+            for i in range(3)
+        ])
+        db["artists"].insert_one({
+            "id": "a0", "name": "A0", "bio": "bio", "notable_works": ["w0"],
+            "fictional_meta": {"origin_project": "AIDA", "origin_story": "story"},
+            "agent": {"enabled": True, "prompt_seed": "seed", "connected_network_ids": ["a1"]}
+        })
+
+    def test_card_is_the_default_list_view(self, mongomock_db):
+        from app.services.artist_service import ArtistService
+        from app.services.artwork_service import ArtworkService
+        from app.utils.query_params import QueryParams
+
+        self._seed(mongomock_db)
+
+        artwork = ArtworkService.get_all(QueryParams()).data[0]
+        assert "style_vector" not in artwork
+        assert artwork["description"] == "long text"
+
+        artist = ArtistService.get_all().data[0]
+        assert artist["fictional_meta"] == {"origin_project": "AIDA"}
+        assert artist["agent"] == {"enabled": True, "connected_network_ids": ["a1"]}
+
+    def test_views_and_explicit_fields(self, mongomock_db):
+        from app.services.artwork_service import ArtworkService
+        from app.utils.query_params import QueryParams
+
+        self._seed(mongomock_db)
+
+        summary = ArtworkService.get_all(QueryParams(view="summary")).data[0]
+        assert summary == {"id": "w0", "title": "Work 0", "artist_id": "a0", "year": 1900}
+
+        assert len(ArtworkService.get_all(QueryParams(view="detail")).data[0]["style_vector"]) == 64
+        assert "style_vector" in ArtworkService.get_all(QueryParams(fields="style_vector")).data[0]
+
+        with pytest.raises(ValueError):
+            ArtworkService.get_all(QueryParams(view="poster"))
+
+    def test_views_keep_cursor_and_relation_fields(self, mongomock_db, monkeypatch):
+        from app.services.artwork_service import ArtworkService
+        from app.utils.query_params import QueryParams
+
+        self._seed(mongomock_db)
+
+        ids = _collect_pages(ArtworkService, {"view": "summary", "sortBy": "year", "pageSize": 2})
+        assert ids == ["w0", "w1", "w2"]
+
+        # 排除式投影中被排除的字段在需要时取消排除
+        monkeypatch.setattr(
+            ArtworkService, "LIST_VIEWS", {**ArtworkService.LIST_VIEWS, "card": {"style_vector": 0, "artist_id": 0}}
+        )
+        record = ArtworkService.get_all(QueryParams(include="artist")).data[0]
+        assert [artist["id"] for artist in record["included"]["artist"]] == ["a0"]
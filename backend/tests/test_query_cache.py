@@ -0,0 +1,190 @@
+"""
+查询缓存测试 - 进程内 LRU、共享层和写入失效
+"""
+
+import asyncio
+import fnmatch
+import time
+
+import pytest
+
+from app.utils.collection_versions import COLLECTION_VERSIONS
+from app.utils.query_cache import LRUCache, QueryCache, RedisCache
+
+
+class FakeRedis:
+    """实现 RedisCache 所用命令的内存替身"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode("utf-8") if isinstance(value, str) else value
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key) or 0) + 1).encode("utf-8")
+
+    def scan_iter(self, match):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.mark.unit
+class TestLRUCache:
+    """进程内缓存"""
+
+    def test_eviction_and_expiry(self):
+        cache = LRUCache(max_entries=2, ttl=60)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")
+        cache.set("c", {"v": 3})
+
+        assert cache.get("b") == (False, None)
+        hit, value = cache.get("a")
+        assert hit and value == {"v": 1}
+        value["v"] = 99
+        assert cache.get("a")[1] == {"v": 1}
+
+        cache.ttl = 0
+        cache.set("d", 1)
+        time.sleep(0.001)
+        assert cache.get("d") == (False, None)
+        assert cache.stats()["evictions"] == 2
+
+
+@pytest.mark.unit
+class TestQueryCache:
+    """版本号失效和共享层"""
+
+    def test_version_bump_invalidates_both_tiers(self):
+        redis = FakeRedis()
+        cache = QueryCache(LRUCache(16, 60), RedisCache(redis, ttl=60))
+        payload = {"filter": {"is_fictional": False}}
+
+        hit, _, key = cache.lookup(["cache_test"], "cache_test.list", payload)
+        assert not hit
+        cache.store(key, [{"id": "a"}])
+        assert cache.lookup(["cache_test"], "cache_test.list", payload)[:2] == (True, [{"id": "a"}])
+
+        # 另一进程：本地缓存为空，从共享层命中
+        other = QueryCache(LRUCache(16, 60), RedisCache(redis, ttl=60))
+        assert other.lookup(["cache_test"], "cache_test.list", payload)[:2] == (True, [{"id": "a"}])
+        assert other.stats()["shared_hits"] == 1
+
+        # 任一进程写入后共享层版本号递增
+        cache.on_collection_changed("cache_test")
+        other.local.clear()
+        assert other.lookup(["cache_test"], "cache_test.list", payload)[0] is False
+
+        COLLECTION_VERSIONS.bump("cache_test")
+        assert cache.lookup(["cache_test"], "cache_test.list", payload)[0] is False
+        assert cache.stats()["by_kind"]["cache_test.list"] == {"local_hits": 1, "shared_hits": 0, "misses": 2}
+
+    def test_shared_tier_failures_fall_back(self):
+        class BrokenRedis(FakeRedis):
+            def mget(self, keys):
+                raise ConnectionError("down")
+
+        cache = QueryCache(LRUCache(16, 60), RedisCache(BrokenRedis(), ttl=60))
+        hit, _, key = cache.lookup(["cache_test"], "cache_test.list", {})
+        cache.store(key, [1])
+
+        assert not hit and key.shared is None
+        assert cache.lookup(["cache_test"], "cache_test.list", {})[:2] == (True, [1])
+        assert cache.stats()["shared"]["errors"] == 2
+
+
+@pytest.mark.unit
+class TestServiceCaching:
+    """服务层读缓存与写入失效"""
+
+    def test_reads_are_served_from_cache_until_a_write(self, mongomock_db):
+        from app.services.artist_service import ArtistService, AsyncArtistService
+        from app.services.base_service import BaseService
+        from app.utils.query_params import QueryParams
+
+        ArtistService.create({"id": "a1", "name": "Monet"})
+        ArtistService.get_all(QueryParams(pageSize=5))
+        ArtistService.get_real_artists()
+
+        # 绕过服务层写入：缓存结果不变
+        mongomock_db["artists"].insert_one({"id": "a2", "name": "Manet"})
+        assert ArtistService.get_all(QueryParams(pageSize=5)).total == 1
+        assert len(asyncio.run(AsyncArtistService.get_real_artists())) == 1
+
+        ArtistService.update("a1", {"name": "Claude Monet"})
+        response = asyncio.run(AsyncArtistService.get_all(QueryParams(pageSize=5)))
+        assert response.total == 2 and response.data[0]["name"] == "Claude Monet"
+        assert len(ArtistService.get_real_artists()) == 2
+
+        stats = BaseService.QUERY_CACHE.stats()["by_kind"]
+        assert stats["artists.get_all"]["local_hits"] == 1
+        assert stats["artists.get_real_artists"]["local_hits"] == 1
+
+    def test_cache_is_filled_from_primary(self, mongomock_db, monkeypatch):
+        """从节点落后时不会把旧数据以新版本号缓存；未启用缓存时仍使用只读客户端"""
+        import mongomock
+        from app.services import base_service
+        from app.services.artist_service import ArtistService, AsyncArtistService
+        from app.utils.query_params import QueryParams
+
+        secondary = mongomock.MongoClient()["lagging_secondary"]
+        monkeypatch.setattr(base_service, "get_read_collection", lambda name: secondary[name])
+        monkeypatch.setattr(base_service, "get_async_read_collection", lambda name: pytest.fail("read from secondary"))
+
+        ArtistService.create({"id": "a1", "name": "Monet"})
+        assert ArtistService.get_all(QueryParams(pageSize=5)).total == 1
+        assert [artist["id"] for artist in ArtistService.get_real_artists()] == ["a1"]
+        assert len(asyncio.run(AsyncArtistService.get_real_artists())) == 1
+
+        monkeypatch.setattr(base_service.BaseService.QUERY_CACHE, "enabled", False)
+        assert ArtistService.get_all(QueryParams(pageSize=5)).total == 0
+
+    def test_migrate_and_reset_invalidate_services(self, mongomock_db):
+        """迁移和重置后递增所有集合的版本号并清空进程内索引"""
+        from app.api.v1.endpoints.database_management import _invalidate_services
+        from app.services.art_movement_service import ArtMovementService
+        from app.services.artwork_service import ArtworkService
+
+        ArtworkService.create({"id": "w1", "title": "Impression", "artist_id": "a1", "style_vector": [1, 0]})
+        ArtMovementService.get_active_movements(1870)
+        ArtworkService.build_style_index()
+        versions = {name: COLLECTION_VERSIONS.get(name) for name in ("artists", "artworks", "art_movements")}
+
+        _invalidate_services()
+
+        assert all(COLLECTION_VERSIONS.get(name) > version for name, version in versions.items())
+        assert not ArtworkService.STYLE_INDEX.built
+        assert not ArtMovementService.PERIOD_INDEX.built
+
+    def test_included_relations_follow_related_writes(self, mongomock_db):
+        from app.services.artist_service import ArtistService
+        from app.services.artwork_service import ArtworkService
+
+        ArtistService.create({"id": "a1", "name": "Monet", "notable_works": ["w1"]})
+        ArtworkService.create({"id": "w1", "title": "Impression", "artist_id": "a1"})
+        ArtistService.get_by_id("a1", include=["notableWorks"])
+
+        ArtworkService.update("w1", {"title": "Impression, Sunrise"})
+        record = ArtistService.get_by_id("a1", include=["notableWorks"]).data
+
+        assert record["included"]["notableWorks"][0]["title"] == "Impression, Sunrise"
+
+    def test_relation_methods_invalidate(self, mongomock_db):
+        from app.services.art_movement_service import AsyncArtMovementService
+
+        mongomock_db["art_movements"].insert_one({"id": "m1", "name": "Impressionism", "key_artists": []})
+        assert asyncio.run(AsyncArtMovementService.get_movements_by_artist("a1")) == []
+
+        asyncio.run(AsyncArtMovementService.add_artist_to_movement("m1", "a1"))
+
+        assert [m["id"] for m in asyncio.run(AsyncArtMovementService.get_movements_by_artist("a1"))] == ["m1"]
@@ -0,0 +1,71 @@
+"""
+记录后处理测试 - 按集合和字段投影编译的处理流程
+"""
+
+import pytest
+
+from app.core.config import ARTISTS_COLLECTION
+from app.utils.record_processor import exclude_internal_fields, record_processor
+
+
+@pytest.mark.unit
+class TestRecordProcessor:
+    """编译后的处理流程"""
+
+    def test_projection_decides_what_is_left_to_do(self):
+        """投影已排除的字段不再处理，未投影的浮点字段不再检查"""
+        full = record_processor(ARTISTS_COLLECTION)
+        assert full.strip_fields == ("_id", "name_lower")
+        assert full.float_fields == ("birth_year", "death_year")
+
+        projected = record_processor(ARTISTS_COLLECTION, exclude_internal_fields())
+        assert projected.strip_fields == ()
+
+        selected = record_processor(ARTISTS_COLLECTION, exclude_internal_fields({"name": 1, "birth_year": 1}))
+        assert selected.strip_fields == ()
+        assert selected.float_fields == ("birth_year",)
+
+        # 同一查询形状复用同一个实例
+        assert record_processor(ARTISTS_COLLECTION, exclude_internal_fields()) is projected
+
+    def test_exclude_internal_fields(self):
+        """包含式投影只排除 _id，其余情况排除全部内部字段"""
+        assert exclude_internal_fields({"name": 1}) == {"name": 1, "_id": 0}
+        assert exclude_internal_fields() == {"_id": 0, "name_lower": 0}
+
+        relevance = {"score": {"$meta": "textScore"}}
+        assert exclude_internal_fields(relevance) == {**relevance, "_id": 0, "name_lower": 0}
+
+    def test_process_many(self):
+        """NaN 转为 None，内部字段被删除，其他值保持不变"""
+        records = [
+            {"_id": 1, "id": "a", "name_lower": "a", "birth_year": float("nan"), "score": float("nan")},
+            {"_id": 2, "id": "b", "birth_year": 1900, "death_year": None}
+        ]
+        processed = record_processor(ARTISTS_COLLECTION).process_many(iter(records))
+
+        assert processed[0]["birth_year"] is None
+        assert "_id" not in processed[0] and "name_lower" not in processed[0]
+        assert processed[0]["score"] != processed[0]["score"]
+        assert processed[1] == {"id": "b", "birth_year": 1900, "death_year": None}
+
+
+@pytest.mark.unit
+class TestServiceProjection:
+    """服务层由数据库排除内部字段"""
+
+    def test_lists_exclude_internal_fields(self, mongomock_db, sample_artist_data):
+        """列表查询结果不含 _id 和搜索字段，年份 NaN 转为 None"""
+        from app.services.artist_service import ArtistService
+        from app.utils.query_params import QueryParams
+
+        mongomock_db["artists"].insert_one({**sample_artist_data, "name_lower": "test artist", "death_year": float("nan")})
+
+        artist = ArtistService.get_all(QueryParams()).data[0]
+        assert "_id" not in artist and "name_lower" not in artist
+        assert artist["death_year"] is None
+
+        artist = ArtistService.get_all(QueryParams(fields="name,death_year")).data[0]
+        assert artist == {"name": "Test Artist", "death_year": None}
+
+        assert "_id" not in ArtistService.get_real_artists()[0]
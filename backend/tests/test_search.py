@@ -0,0 +1,154 @@
+"""
+搜索模式、前缀搜索字段和跨实体搜索测试
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.art_movement_service import ArtMovementService
+from app.services.artist_service import ArtistService
+from app.services.artwork_service import ArtworkService
+from app.services.search_service import SearchService, AsyncSearchService
+from app.utils.query_params import QueryParams, QueryParamsParser
+from app.utils.search_index import InvertedIndex, tokenize
+
+
+@pytest.mark.unit
+class TestSearchFilter:
+    """搜索条件构建"""
+
+    def test_text_mode_combines_text_and_prefix(self):
+        search_filter = QueryParamsParser.build_search_filter("Mo.net", "text")
+
+        assert search_filter == {"$or": [
+            {"$text": {"$search": "Mo.net"}},
+            {"name_lower": {"$regex": r"^mo\.net"}}
+        ]}
+
+    def test_prefix_mode_normalizes_query(self):
+        search_filter = QueryParamsParser.build_search_filter("  ＭＯＮ ", "prefix")
+
+        assert search_filter == {"name_lower": {"$regex": "^mon"}}
+
+    def test_regex_mode_uses_service_fields(self):
+        search_filter = QueryParamsParser.build_search_filter("mon", "regex", ["name", "bio"])
+
+        assert search_filter == {"$or": [
+            {"name": {"$regex": "mon", "$options": "i"}},
+            {"bio": {"$regex": "mon", "$options": "i"}}
+        ]}
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            QueryParamsParser.parse_search_mode("fuzzy")
+
+    def test_list_query_sorts_by_relevance_in_text_mode(self):
+        plan = ArtistService._build_list_query(QueryParams(search="monet", searchMode="text"))
+
+        assert plan["sort"] == [("search_score", {"$meta": "textScore"})]
+        assert plan["projection"]["search_score"] == {"$meta": "textScore"}
+
+        plan = ArtistService._build_list_query(QueryParams(search="monet", searchMode="text", sortBy="name"))
+        assert plan["sort"] == [("name", 1)]
+
+
+@pytest.mark.unit
+class TestPrefixSearchField:
+    """name_lower 字段的维护"""
+
+    def test_field_follows_writes_and_is_hidden(self, mongomock_db):
+        response = ArtistService.create({"id": "a1", "name": "Claude Monet"})
+        assert "name_lower" not in response.data
+
+        stored = mongomock_db["artists"].find_one({"id": "a1"})
+        assert stored["name_lower"] == "claude monet"
+
+        ArtistService.update("a1", {"name": "Édouard Manet"})
+        stored = mongomock_db["artists"].find_one({"id": "a1"})
+        assert stored["name_lower"] == "édouard manet"
+
+    def test_prefix_search(self, mongomock_db):
+        for artist_id, name in [("a1", "Claude Monet"), ("a2", "Édouard Manet"), ("a3", "Paul Cézanne")]:
+            ArtistService.create({"id": artist_id, "name": name})
+
+        results = ArtistService.search_artists("édouard", mode="prefix")
+
+        assert [artist["id"] for artist in results] == ["a2"]
+        assert "name_lower" not in results[0]
+
+
+@pytest.mark.unit
+class TestInvertedIndex:
+    """分词与 BM25 倒排索引"""
+
+    def test_tokenize_mixed_text(self):
+        assert tokenize("Édouard Manet 印象派") == ["edouard", "manet", "印", "象", "派", "印象", "象派"]
+
+    def test_bm25_prefers_focused_documents(self):
+        index = InvertedIndex()
+        index.build("artist", [
+            ("a1", {"monet": 10.0, "claude": 10.0}, "Claude Monet"),
+            ("a2", {"monet": 1.0, "painter": 1.0, "french": 1.0, "garden": 1.0}, "Other"),
+        ])
+        index.build("artwork", [("w1", {"water": 10.0, "lilies": 10.0}, "Water Lilies")])
+
+        hits = index.search("Monet")
+
+        assert [hit["id"] for hit in hits] == ["a1", "a2"]
+        assert index.search("monet", entities=["artwork"]) == []
+
+        index.remove("artist", "a1")
+        assert [hit["id"] for hit in index.search("monet")] == ["a2"]
+
+
+@pytest.mark.unit
+class TestCrossEntitySearch:
+    """跨实体搜索与写入同步"""
+
+    def test_index_follows_writes(self, mongomock_db):
+        ArtistService.create({"id": "a1", "name": "莫奈", "bio": "法国印象派画家", "tags": ["impressionism"]})
+        ArtworkService.create({"id": "w1", "title": "印象·日出", "artist_id": "a1", "tags": ["impressionism"]})
+
+        results = SearchService.search("印象派")
+        assert [(hit["type"], hit["id"]) for hit in results["hits"]][0] == ("artist", "a1")
+        assert {hit["id"] for hit in results["hits"]} == {"a1", "w1"}
+
+        ArtMovementService.create({"id": "m1", "name": "Impressionism", "start_year": 1860})
+        ArtistService.create({"id": "a2", "name": "Berthe Morisot", "tags": ["impressionism"]})
+        results = SearchService.search("impressionism", types=["movement", "artist"])
+        assert [hit["id"] for hit in results["hits"]] == ["m1", "a2", "a1"]
+
+        ArtistService.update("a1", {"bio": "Painter"})
+        ArtworkService.delete("w1")
+        assert SearchService.search("印象")["hits"] == []
+
+    def test_invalid_type(self, mongomock_db):
+        with pytest.raises(ValueError):
+            SearchService.search("monet", types=["painting"])
+
+    def test_async_search(self, mongomock_db):
+        ArtworkService.create({"id": "w1", "title": "Water Lilies", "artist_id": "a1"})
+
+        results = asyncio.run(AsyncSearchService.search("lilies"))
+
+        assert [hit["title"] for hit in results["hits"]] == ["Water Lilies"]
+
+    def test_write_during_rebuild_is_not_lost(self, mongomock_db):
+        ArtistService.create({"id": "a1", "name": "Claude Monet"})
+        original = ArtistService._search_document
+        writes = []
+
+        def search_document(record):
+            # 重建加载期间落地的写入
+            if not writes:
+                writes.append(ArtistService.create({"id": "a2", "name": "Zyxwv"}))
+            return original(record)
+
+        with patch.object(ArtistService, "_search_document", side_effect=search_document):
+            ArtistService.build_search_index()
+
+        assert not ArtistService.SEARCH_INDEX.is_built("artist")
+        assert [hit["id"] for hit in SearchService.search("zyxwv")["hits"]] == ["a2"]
+        assert ArtistService.SEARCH_INDEX.is_built("artist")
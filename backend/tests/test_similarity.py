@@ -0,0 +1,45 @@
+"""
+批量相似度计算测试
+"""
+
+import numpy as np
+import pytest
+
+from app.models.artwork import Artwork
+from app.utils import similarity
+
+
+@pytest.mark.unit
+class TestSimilarity:
+    """similarity 模块测试"""
+
+    def test_many_to_many_matches_scalar(self):
+        rng = np.random.default_rng(3)
+        queries = rng.normal(size=(4, 6)).tolist()
+        vectors = rng.normal(size=(9, 6)).tolist() + [[0.0] * 6]
+
+        matrix = similarity.VectorMatrix(vectors)
+        scores = matrix.similarity_matrix(similarity.VectorMatrix(queries))
+
+        assert scores.shape == (4, 10)
+        assert scores.dtype == np.float32
+        for i, query in enumerate(queries):
+            for j, vector in enumerate(vectors):
+                assert scores[i, j] == pytest.approx(Artwork.calculate_style_similarity(query, vector), abs=1e-5)
+        np.testing.assert_allclose(matrix.similarity_to(queries[1]), scores[1], atol=1e-6)
+
+    def test_top_k_threshold_semantics(self):
+        scores = np.array([0.2, 0.9, 0.8, 0.95, 0.8], dtype=np.float32)
+
+        indices, values = similarity.top_k(scores, k=3, threshold=0.8, exclude=[3])
+        assert indices.tolist() == [1, 2, 4]
+        assert values.tolist() == pytest.approx([0.9, 0.8, 0.8])
+
+        rows = similarity.top_k_rows(np.vstack([scores, scores[::-1]]), k=1, threshold=0.5)
+        assert [row[0].tolist() for row in rows] == [[3], [1]]
+
+    def test_scalar_wrapper_edge_cases(self):
+        assert Artwork.calculate_style_similarity([], [1.0]) == 0.0
+        assert Artwork.calculate_style_similarity([1.0, 0.0], [1.0]) == 0.0
+        assert Artwork.calculate_style_similarity([0.0, 0.0], [1.0, 1.0]) == 0.0
+        assert similarity.cosine_one_to_many([1, 0], np.array([[1, 0, 0]], dtype=np.float32)).tolist() == [0.0]
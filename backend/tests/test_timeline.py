@@ -0,0 +1,71 @@
+"""
+艺术运动时间线物化与 ETag 测试
+"""
+
+import pytest
+
+from app.services.art_movement_service import ArtMovementService
+
+
+@pytest.mark.unit
+class TestMaterializedTimeline:
+    """时间线物化与失效"""
+
+    def test_timeline_is_compact_and_versioned(self, mongomock_db):
+        ArtMovementService.create({"id": "m2", "name": "Cubism", "start_year": 1907, "end_year": 1914})
+        ArtMovementService.create({"id": "m1", "name": "Impressionism", "start_year": 1860, "key_artists": ["a1", "a2"]})
+
+        timeline, etag = ArtMovementService.get_timeline_snapshot()
+        assert timeline == [
+            {"movement_id": "m1", "name": "Impressionism", "start_year": 1860,
+             "key_artists_count": 2, "representative_works_count": 0},
+            {"movement_id": "m2", "name": "Cubism", "start_year": 1907, "end_year": 1914,
+             "key_artists_count": 0, "representative_works_count": 0},
+        ]
+
+        # 未写入时直接复用物化结果
+        mongomock_db["art_movements"].delete_many({})
+        assert ArtMovementService.get_timeline_snapshot() == (timeline, etag)
+
+        ArtMovementService.create({"id": "m3", "name": "Fauvism", "start_year": 1904})
+        timeline, new_etag = ArtMovementService.get_timeline_snapshot()
+        assert [entry["movement_id"] for entry in timeline] == ["m3"]
+        assert new_etag != etag
+
+        ArtMovementService.add_artwork_to_movement("m3", "w1")
+        assert ArtMovementService.get_movements_timeline()[0]["representative_works_count"] == 1
+
+
+@pytest.mark.api
+class TestTimelineRoute:
+    """时间线接口的条件请求"""
+
+    def test_if_none_match(self, app, mongomock_db):
+        from fastapi.testclient import TestClient
+
+        ArtMovementService.create({"id": "m1", "name": "Impressionism", "start_year": 1860, "end_year": 1890})
+
+        with TestClient(app) as client:
+            response = client.get("/api/v1/art-movements/timeline/")
+            assert response.status_code == 200
+            assert response.json()["data"][0]["movement_id"] == "m1"
+            etag = response.headers["etag"]
+
+            response = client.get("/api/v1/art-movements/timeline/", headers={"If-None-Match": f"W/{etag}"})
+            assert response.status_code == 304
+            assert response.content == b""
+
+            ArtMovementService.update("m1", {"end_year": 1900})
+            response = client.get("/api/v1/art-movements/timeline/", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.json()["data"][0]["end_year"] == 1900
+
+    def test_nan_years_are_null(self, app, mongomock_db):
+        from fastapi.testclient import TestClient
+
+        mongomock_db["art_movements"].insert_one({"id": "m1", "name": "Baroque", "start_year": float("nan"), "end_year": 1750})
+
+        with TestClient(app) as client:
+            response = client.get("/api/v1/art-movements/timeline/")
+            assert response.status_code == 200
+            assert response.json()["data"][0]["start_year"] is None
@@ -0,0 +1,125 @@
+"""
+风格向量索引测试
+"""
+
+import asyncio
+import random
+from unittest.mock import patch
+
+import pytest
+
+from app.models.artwork import Artwork
+from app.services.artwork_service import ArtworkService, AsyncArtworkService
+from app.utils.vector_index import StyleVectorIndex
+
+
+@pytest.mark.unit
+class TestStyleVectorIndex:
+    """StyleVectorIndex 测试"""
+
+    def test_search_matches_scalar_similarity(self):
+        rng = random.Random(7)
+        vectors = {f"v{i}": [rng.uniform(-1, 1) for _ in range(8)] for i in range(50)}
+        index = StyleVectorIndex()
+        index.build(vectors.items())
+
+        query = vectors["v0"]
+        expected = sorted(
+            ((record_id, Artwork.calculate_style_similarity(query, vector))
+             for record_id, vector in vectors.items() if record_id != "v0"),
+            key=lambda item: item[1], reverse=True
+        )
+        expected = [item for item in expected if item[1] >= 0.1][:5]
+
+        result = index.search(query, top_k=5, threshold=0.1, exclude_ids={"v0"})
+
+        assert [record_id for record_id, _ in result] == [record_id for record_id, _ in expected]
+        assert all(abs(a[1] - b[1]) < 1e-5 for a, b in zip(result, expected))
+
+    def test_upsert_and_remove(self):
+        index = StyleVectorIndex()
+        index.build([("a", [1, 0]), ("b", [0, 1]), ("c", [1, 1])])
+
+        index.remove("a")
+        index.upsert("b", [1, 0.1])
+        index.upsert("d", [1, 2, 3])  # 维度不一致，不收录
+        index.upsert("c", [])  # 空向量视为移除
+
+        assert len(index) == 1
+        assert index.search([1, 0], top_k=10) == [("b", pytest.approx(0.995, abs=1e-3))]
+
+
+@pytest.mark.unit
+class TestSimilarArtworks:
+    """相似作品检索与写入同步"""
+
+    def _artwork(self, artwork_id, vector):
+        return {"id": artwork_id, "title": artwork_id, "artist_id": "a1", "style_vector": vector}
+
+    def test_index_follows_writes(self, mongomock_db):
+        for artwork_id, vector in [("w1", [1, 0, 0]), ("w2", [0.9, 0.1, 0]), ("w3", [0, 1, 0])]:
+            ArtworkService.create(self._artwork(artwork_id, vector))
+
+        similar = ArtworkService.get_similar_artworks("w1", threshold=0.5)
+        assert [artwork["id"] for artwork in similar] == ["w2"]
+        assert similar[0]["similarity_score"] == pytest.approx(0.9939, abs=1e-4)
+
+        # 索引构建后的写入通过钩子同步
+        ArtworkService.create(self._artwork("w4", [1, 0, 0.01]))
+        ArtworkService.update_style_vector("w3", [1, 0, 0])
+        ArtworkService.delete("w2")
+
+        similar = ArtworkService.get_similar_artworks("w1", threshold=0.5)
+        assert [artwork["id"] for artwork in similar] == ["w3", "w4"]
+
+    def test_write_during_rebuild_is_not_lost(self, mongomock_db):
+        ArtworkService.create(self._artwork("w1", [1, 0, 0]))
+        index = ArtworkService.STYLE_INDEX
+        original = index._upsert
+        writes = []
+
+        def upsert(record_id, vector):
+            # 重建加载期间落地的写入
+            if not writes:
+                writes.append(ArtworkService.create(self._artwork("w2", [0.9, 0.1, 0])))
+            return original(record_id, vector)
+
+        with patch.object(index, "_upsert", side_effect=upsert):
+            ArtworkService.build_style_index()
+
+        assert not index.built
+        similar = ArtworkService.get_similar_artworks("w1", threshold=0.5)
+        assert [artwork["id"] for artwork in similar] == ["w2"]
+        assert index.built
+
+    def test_async_similar_artworks(self, mongomock_db):
+        mongomock_db["artworks"].insert_many([self._artwork("w1", [1, 0]), self._artwork("w2", [1, 1])])
+
+        similar = asyncio.run(AsyncArtworkService.get_similar_artworks("w1", threshold=0.5, limit=1))
+
+        assert [artwork["id"] for artwork in similar] == ["w2"]
+        assert "_id" not in similar[0]
+
+    def test_batch_endpoint(self, app, mongomock_db):
+        from fastapi.testclient import TestClient
+
+        mongomock_db["artworks"].insert_many([
+            self._artwork("w1", [1, 0]), self._artwork("w2", [0.9, 0.2]), self._artwork("w3", [0, 1])
+        ])
+
+        with TestClient(app) as client:
+            response = client.post("/api/v1/artworks/similar/batch", json={
+                "artwork_ids": ["w1", "missing"],
+                "vectors": [[0.5, 1], [1, 2, 3]],
+                "top_k": 2,
+                "threshold": 0.5
+            })
+            assert client.post("/api/v1/artworks/similar/batch", json={}).status_code == 400
+
+        results = response.json()["data"]
+        assert [r["query_id"] for r in results] == ["w1", "missing", None, None]
+        assert [[n["id"] for n in r["neighbors"]] for r in results] == [["w2"], [], ["w3", "w2"], []]
+        assert results[1]["found"] is False
+        assert results[3]["found"] is False and "dimension 3" in results[3]["error"]
+        assert results[2]["found"] is True and results[2]["error"] is None
+        assert results[2]["neighbors"][0]["similarity_score"] == pytest.approx(0.8944, abs=1e-4)